@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 패키지
+
+외부 서비스(Pinecone, OpenAI, Upstage) 없이 로컬에서 재현 가능한 성능 측정 도구를 제공합니다.
+"""
@@ -0,0 +1,12 @@
+"""
+인증(세션 조회) 벤치마크
+
+get_current_session의 요청당 인증 오버헤드를 세션 캐시 사용 전후로 비교합니다.
+
+사용 예:
+```
+python -m benchmarks.auth.session_resolution --db-latency-ms 2 --concurrency 1 32
+```
+"""
+
+from benchmarks.auth.session_resolution import AuthBenchmarkResult, run_session_benchmark
@@ -0,0 +1,225 @@
+"""
+세션 조회(get_current_session) 벤치마크
+
+인증이 필요한 요청마다 실행되는 get_current_session의 지연 시간을 모드별로 측정합니다.
+- db: 세션 캐시 비활성화 (캐시 도입 전과 같이 요청마다 DB에서 세션 조회 + 접근 시간 갱신)
+- local: 프로세스 내 LRU 캐시 적중
+- redis: 프로세스 내 캐시를 끄고 Redis 캐시만 사용 (--redis-url 지정 시)
+
+DB는 로컬 대체 구현으로 교체하며, get_active_session의 왕복(SELECT + UPDATE/COMMIT + REFRESH)을
+db_latency_ms x DB_ROUND_TRIPS의 asyncio.sleep으로 모사합니다.
+
+사용 예:
+```
+python -m benchmarks.auth.session_resolution --db-latency-ms 2 --concurrency 1 32 --requests 2000
+```
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+from unittest import mock
+from uuid import uuid4
+
+import numpy as np
+from loguru import logger
+
+from common.core import deps
+from common.models.user import Session, User
+from common.services.session_cache import SessionCache
+
+# get_active_session의 DB 왕복 수 (세션+사용자 조회, 접근 시간 갱신 커밋, refresh)
+DB_ROUND_TRIPS = 3
+
+MODES = ("db", "local", "redis")
+
+
+@dataclass
+class AuthBenchmarkResult:
+    """모드 x 동시성 수준별 측정 결과"""
+    mode: str
+    concurrency: int
+    num_requests: int
+    p50_us: float
+    p95_us: float
+    mean_us: float
+    qps: float
+    db_queries: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class _StandInDB:
+    """AsyncSessionLocal 대체 (연결 없이 컨텍스트만 제공)"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _StandInUserService:
+    """UserService 대체: 세션 조회에 DB 왕복 지연을 모사"""
+    db_latency_ms = 0.0
+    queries = 0
+    sessions: Dict[str, Session] = {}
+
+    def __init__(self, db):
+        self.db = db
+
+    async def get_active_session(self, session_id: str) -> Optional[Session]:
+        _StandInUserService.queries += 1
+        for _ in range(DB_ROUND_TRIPS):
+            await asyncio.sleep(self.db_latency_ms / 1000)
+        session = self.sessions.get(session_id)
+        if session:
+            session.touch()
+        return session
+
+
+def _make_sessions(count: int) -> Dict[str, Session]:
+    sessions = {}
+    for i in range(count):
+        user = User(id=uuid4(), email=f"user{i}@example.com", name=f"user{i}", is_active=True, is_superuser=False)
+        session = Session(id=uuid4(), user_id=user.id, user_email=user.email, is_anonymous=False,
+                          last_accessed_at=datetime.now(timezone.utc))
+        session.user = user
+        sessions[str(session.id)] = session
+    return sessions
+
+
+@contextmanager
+def stand_in_auth(session_cache: Optional[SessionCache]):
+    """get_current_session이 사용하는 DB/사용자 서비스/세션 캐시를 대체"""
+    with mock.patch.object(deps, "AsyncSessionLocal", _StandInDB), \
+            mock.patch.object(deps, "UserService", _StandInUserService), \
+            mock.patch.object(deps, "get_session_cache", lambda: session_cache):
+        yield
+
+
+async def _replay(session_ids: Sequence[str], num_requests: int, concurrency: int) -> tuple:
+    """세션 ID를 순환하며 get_current_session을 호출하고 (요청별 지연(us), 소요 시간) 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def _run(session_id: str):
+        async with semaphore:
+            start = time.perf_counter()
+            await deps.get_current_session(session_id=session_id)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    requests = list(itertools.islice(itertools.cycle(session_ids), num_requests))
+    started = time.perf_counter()
+    await asyncio.gather(*(_run(session_id) for session_id in requests))
+    return latencies, time.perf_counter() - started
+
+
+async def run_session_benchmark(
+    modes: Sequence[str] = ("db", "local"),
+    concurrency_levels: Sequence[int] = (1, 32),
+    num_requests: int = 1000,
+    num_sessions: int = 100,
+    db_latency_ms: float = 1.0,
+    redis_url: Optional[str] = None,
+) -> List[AuthBenchmarkResult]:
+    """
+    모드/동시성 수준별로 get_current_session 지연 시간 측정
+
+    캐시 모드는 측정 전에 모든 세션을 한 번씩 조회해 캐시를 채웁니다.
+    """
+    _StandInUserService.db_latency_ms = db_latency_ms
+    _StandInUserService.sessions = _make_sessions(num_sessions)
+    session_ids = list(_StandInUserService.sessions)
+    results: List[AuthBenchmarkResult] = []
+
+    for mode in modes:
+        if mode == "db":
+            session_cache = None
+        elif mode == "local":
+            session_cache = SessionCache(redis=None, local_ttl=3600)
+        elif mode == "redis":
+            if not redis_url:
+                logger.warning("redis 모드는 --redis-url이 필요합니다. 건너뜁니다.")
+                continue
+            from redis.asyncio import Redis
+            session_cache = SessionCache(redis=Redis.from_url(redis_url, decode_responses=True), local_ttl=0)
+        else:
+            raise ValueError(f"지원하지 않는 모드: {mode} (지원: {', '.join(MODES)})")
+
+        with stand_in_auth(session_cache):
+            if session_cache is not None:
+                await _replay(session_ids, len(session_ids), concurrency=8)
+            for concurrency in concurrency_levels:
+                _StandInUserService.queries = 0
+                latencies, elapsed = await _replay(session_ids, num_requests, concurrency)
+                results.append(AuthBenchmarkResult(
+                    mode=mode,
+                    concurrency=concurrency,
+                    num_requests=num_requests,
+                    p50_us=float(np.percentile(latencies, 50)),
+                    p95_us=float(np.percentile(latencies, 95)),
+                    mean_us=float(np.mean(latencies)),
+                    qps=num_requests / elapsed if elapsed > 0 else 0.0,
+                    db_queries=_StandInUserService.queries,
+                ))
+
+        if session_cache is not None and session_cache.redis is not None:
+            for session_id in session_ids:
+                await session_cache.invalidate(session_id)
+            await session_cache.redis.aclose()
+    return results
+
+
+def format_results(results: Sequence[AuthBenchmarkResult]) -> str:
+    """측정 결과를 표 형식 문자열로 변환"""
+    header = f"{'mode':<8}{'conc':>6}{'p50(us)':>12}{'p95(us)':>12}{'mean(us)':>12}{'qps':>12}{'db_q':>8}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.mode:<8}{r.concurrency:>6}{r.p50_us:>12.1f}{r.p95_us:>12.1f}{r.mean_us:>12.1f}"
+            f"{r.qps:>12.1f}{r.db_queries:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="get_current_session 요청당 인증 오버헤드 벤치마크")
+    parser.add_argument("--modes", nargs="+", default=["db", "local", "redis"], choices=MODES)
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 32])
+    parser.add_argument("--requests", type=int, default=1000, help="동시성 수준별 요청 수")
+    parser.add_argument("--sessions", type=int, default=100, help="서로 다른 세션 수")
+    parser.add_argument("--db-latency-ms", type=float, default=1.0, help="DB 왕복 1회 지연(ms)")
+    parser.add_argument("--redis-url", help="redis 모드에 사용할 Redis URL")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 요청별 로그는 측정에 영향을 주므로 경고 이상만 출력
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    results = asyncio.run(run_session_benchmark(
+        modes=args.modes,
+        concurrency_levels=args.concurrency,
+        num_requests=args.requests,
+        num_sessions=args.sessions,
+        db_latency_ms=args.db_latency_ms,
+        redis_url=args.redis_url,
+    ))
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([result.to_dict() for result in results], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+검색(Retriever) 벤치마크
+
+기록된 코퍼스(청크 텍스트, 벡터, 쿼리)를 로컬 대체 구현(벡터 스토어, 임베딩, 리랭커)으로 재생하여
+SemanticRetriever, HybridRetriever, ContextualBM25Retriever, TableModeSemanticRetriever의
+지연 시간(p50/p95/p99), 동시 처리량(QPS), 코퍼스 크기별 메모리 사용량을 측정합니다.
+
+사용 예:
+```
+python -m benchmarks.retrieval.runner --corpus corpus.json --sizes 1000 10000 --concurrency 1 8 32
+```
+"""
+
+from benchmarks.retrieval.corpus import RecordedChunk, RecordedCorpus, RecordedQuery
+from benchmarks.retrieval.runner import BenchmarkResult, run_benchmark
+from benchmarks.retrieval.stand_ins import (
+    HashingEmbedder,
+    LocalReranker,
+    LocalVectorStoreManager,
+    offline_retrievers,
+)
@@ -0,0 +1,198 @@
+"""
+벤치마크용 기록 코퍼스
+
+청크 텍스트, 메타데이터, 벡터와 쿼리(및 쿼리 벡터)를 JSON 파일로 저장하고 다시 읽어옵니다.
+벡터가 없는 청크/쿼리는 벤치마크 시 HashingEmbedder로 임베딩합니다.
+
+파일 형식:
+```
+{
+  "dimension": 3072,
+  "chunks": [{"id": "...", "text": "...", "metadata": {"document_id": "..."}, "vector": [...]}],
+  "queries": [{"text": "...", "vector": [...], "document_ids": ["..."], "relevant_chunk_ids": ["..."]}]
+}
+```
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+
+@dataclass
+class RecordedChunk:
+    """기록된 청크"""
+    id: str
+    text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    vector: Optional[List[float]] = None
+
+
+@dataclass
+class RecordedQuery:
+    """기록된 쿼리"""
+    text: str
+    vector: Optional[List[float]] = None
+    document_ids: List[str] = field(default_factory=list)  # 테이블 모드 검색 대상 문서
+    relevant_chunk_ids: List[str] = field(default_factory=list)  # 품질 지표(precision/nDCG/MRR) 계산용 정답 청크
+
+
+@dataclass
+class RecordedCorpus:
+    """벤치마크 재생용 코퍼스"""
+    chunks: List[RecordedChunk]
+    queries: List[RecordedQuery]
+    dimension: int = 256
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "RecordedCorpus":
+        """JSON 파일에서 코퍼스 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            chunks=[RecordedChunk(**chunk) for chunk in data.get("chunks", [])],
+            queries=[RecordedQuery(**query) for query in data.get("queries", [])],
+            dimension=data.get("dimension", 256),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """코퍼스를 JSON 파일로 저장"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "dimension": self.dimension,
+                "chunks": [asdict(chunk) for chunk in self.chunks],
+                "queries": [asdict(query) for query in self.queries],
+            }, f, ensure_ascii=False)
+        logger.info(f"코퍼스 저장 완료: {path} (청크 {len(self.chunks)}개, 쿼리 {len(self.queries)}개)")
+
+    @property
+    def document_ids(self) -> List[str]:
+        """코퍼스에 포함된 문서 ID 목록 (등장 순서)"""
+        return list(dict.fromkeys(str(chunk.metadata.get("document_id", "")) for chunk in self.chunks))
+
+    def scaled(self, num_chunks: int, seed: int = 42) -> "RecordedCorpus":
+        """
+        지정한 청크 수의 코퍼스를 반환합니다.
+
+        기록된 청크보다 적으면 앞에서부터 자르고, 많으면 청크를 복제합니다.
+        복제본은 문서 ID에 복제 번호를 붙여 별도 문서로 취급하고, 벡터에는 작은 잡음을 더해
+        완전히 같은 벡터가 반복되지 않게 합니다.
+
+        Args:
+            num_chunks: 목표 청크 수
+            seed: 잡음 생성 시드
+        """
+        if num_chunks <= len(self.chunks):
+            return RecordedCorpus(chunks=self.chunks[:num_chunks], queries=self.queries, dimension=self.dimension)
+
+        rng = np.random.default_rng(seed)
+        chunks = list(self.chunks)
+        replica = 1
+        while len(chunks) < num_chunks:
+            for chunk in self.chunks:
+                if len(chunks) >= num_chunks:
+                    break
+                vector = None
+                if chunk.vector is not None:
+                    noisy = np.asarray(chunk.vector, dtype=np.float32) + rng.normal(0, 0.01, len(chunk.vector)).astype(np.float32)
+                    vector = (noisy / (np.linalg.norm(noisy) + 1e-12)).tolist()
+                metadata = dict(chunk.metadata)
+                metadata["document_id"] = f"{metadata.get('document_id', '')}-r{replica}"
+                chunks.append(RecordedChunk(id=f"{chunk.id}-r{replica}", text=chunk.text, metadata=metadata, vector=vector))
+            replica += 1
+        return RecordedCorpus(chunks=chunks, queries=self.queries, dimension=self.dimension)
+
+    @classmethod
+    def synthetic(cls, num_documents: int = 50, chunks_per_document: int = 20,
+                  num_queries: int = 50, dimension: int = 256, seed: int = 42) -> "RecordedCorpus":
+        """
+        기록된 코퍼스가 없을 때 사용할 합성 코퍼스를 생성합니다. (벡터는 HashingEmbedder로 계산)
+
+        Args:
+            num_documents: 문서 수
+            chunks_per_document: 문서당 청크 수
+            num_queries: 쿼리 수
+            dimension: 임베딩 차원
+            seed: 난수 시드
+        """
+        rng = random.Random(seed)
+        companies = ["삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "NAVER", "카카오", "셀트리온", "POSCO홀딩스"]
+        topics = ["영업이익", "매출액", "HBM", "파운드리", "전기차", "배터리", "광고", "바이오시밀러", "철강", "수출"]
+        verbs = ["증가했다", "감소했다", "회복될 전망이다", "시장 예상을 상회했다", "둔화되었다", "확대될 것으로 보인다"]
+
+        chunks = []
+        for doc_index in range(num_documents):
+            document_id = f"doc-{doc_index:05d}"
+            company = companies[doc_index % len(companies)]
+            for chunk_index in range(chunks_per_document):
+                sentences = [
+                    f"{company}의 {rng.choice(topics)}은 전년 대비 {rng.randint(1, 60)}% {rng.choice(verbs)}."
+                    for _ in range(rng.randint(3, 8))
+                ]
+                chunks.append(RecordedChunk(
+                    id=f"{document_id}-{chunk_index}",
+                    text=" ".join(sentences),
+                    metadata={"document_id": document_id, "chunk_index": chunk_index, "company": company},
+                ))
+
+        queries = []
+        for _ in range(num_queries):
+            company, topic = rng.choice(companies), rng.choice(topics)
+            # 해당 기업 문서 중 주제가 언급된 청크를 정답으로 사용
+            relevant = [
+                chunk for chunk in chunks
+                if chunk.metadata["company"] == company and f"{company}의 {topic}" in chunk.text
+            ]
+            # 테이블 모드 검색 대상은 정답 청크가 있는 문서 (없으면 해당 기업 문서)
+            candidate_documents = list(dict.fromkeys(chunk.metadata["document_id"] for chunk in relevant)) or \
+                list(dict.fromkeys(chunk.metadata["document_id"] for chunk in chunks if chunk.metadata["company"] == company))
+            queries.append(RecordedQuery(
+                text=f"{company} {topic} 전망은?",
+                document_ids=rng.sample(candidate_documents, min(3, len(candidate_documents))),
+                relevant_chunk_ids=[chunk.id for chunk in relevant],
+            ))
+        return cls(chunks=chunks, queries=queries, dimension=dimension)
+
+    @classmethod
+    def record(cls, vs_manager, queries: List[str], top_k: int = 50,
+               filters: Optional[Dict] = None) -> "RecordedCorpus":
+        """
+        실제 VectorStoreManager(Pinecone)에서 쿼리별 검색 결과와 벡터를 기록합니다.
+
+        Args:
+            vs_manager: 초기화된 VectorStoreManager
+            queries: 기록할 쿼리 목록
+            top_k: 쿼리당 기록할 청크 수
+            filters: 검색 필터
+        """
+        chunks: Dict[str, RecordedChunk] = {}
+        recorded_queries = []
+        for query in queries:
+            embedding = vs_manager.create_embeddings_single_query(query)
+            response = vs_manager.index.query(
+                vector=embedding,
+                top_k=top_k,
+                include_values=True,
+                include_metadata=True,
+                namespace=vs_manager.namespace,
+                filter=filters,
+            )
+            document_ids = []
+            for match in response["matches"]:
+                metadata = dict(match.get("metadata") or {})
+                text = metadata.pop("text", "")
+                chunks.setdefault(match["id"], RecordedChunk(
+                    id=match["id"], text=text, metadata=metadata, vector=list(match["values"])
+                ))
+                document_ids.append(str(metadata.get("document_id", "")))
+            recorded_queries.append(RecordedQuery(
+                text=query, vector=embedding, document_ids=list(dict.fromkeys(document_ids))[:5]
+            ))
+        dimension = vs_manager.embedding_model_config.dimension
+        logger.info(f"코퍼스 기록 완료: 쿼리 {len(queries)}개, 청크 {len(chunks)}개")
+        return cls(chunks=list(chunks.values()), queries=recorded_queries, dimension=dimension)
@@ -0,0 +1,148 @@
+"""
+검색 부하 테스트 (워커당 QPS, 동기 검색 경로 대비 비동기 검색 경로)
+
+하나의 이벤트 루프(FastAPI 워커 1개)에서 동시 요청을 재생하여 워커당 처리량을 비교합니다.
+- before: 검색기가 이벤트 루프에서 동기 임베딩/벡터 검색을 호출 (요청이 하나씩 순서대로 처리됨)
+- after: 비동기 임베딩 + 비동기 벡터 검색 + 루프 밖 MMR 계산 (동시 요청이 겹쳐서 처리됨)
+
+임베딩/벡터 스토어의 네트워크 지연은 embed_latency_ms, search_latency_ms로 모사합니다.
+
+사용 예:
+```
+python -m benchmarks.retrieval.load_test --concurrency 1 8 32 --search-latency-ms 30 --embed-latency-ms 20
+```
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from benchmarks.retrieval.corpus import RecordedCorpus
+from benchmarks.retrieval.runner import run_benchmark
+
+# 벡터 스토어 검색 경로를 사용하는 검색기
+LOAD_TEST_RETRIEVERS = ("semantic", "table_mode")
+
+
+@dataclass
+class LoadTestResult:
+    """검색기 x 동시성 수준별 워커당 QPS 비교 결과"""
+    retriever: str
+    concurrency: int
+    qps_before: float
+    qps_after: float
+    p95_ms_before: float
+    p95_ms_after: float
+
+    @property
+    def speedup(self) -> float:
+        return self.qps_after / self.qps_before if self.qps_before else 0.0
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), "speedup": self.speedup}
+
+
+async def run_load_test(
+    corpus: RecordedCorpus,
+    retrievers: Sequence[str] = LOAD_TEST_RETRIEVERS,
+    concurrency_levels: Sequence[int] = (1, 8, 32),
+    num_requests: int = 64,
+    top_k: int = 5,
+    search_latency_ms: float = 30.0,
+    embed_latency_ms: float = 20.0,
+) -> List[LoadTestResult]:
+    """
+    동기(before)/비동기(after) 검색 경로의 워커당 QPS를 측정합니다.
+
+    Args:
+        corpus: 기록된 코퍼스
+        retrievers: 측정할 검색기 이름 목록 (LOAD_TEST_RETRIEVERS 참고)
+        concurrency_levels: 동시 요청 수 목록
+        num_requests: 동시성 수준별 요청 수
+        top_k: 검색 결과 수
+        search_latency_ms: 벡터 스토어 검색 지연 모사 (ms)
+        embed_latency_ms: 임베딩 API 지연 모사 (ms)
+
+    Returns:
+        List[LoadTestResult]: 측정 결과 목록
+    """
+    common = dict(
+        retrievers=retrievers,
+        concurrency_levels=concurrency_levels,
+        num_requests=num_requests,
+        top_k=top_k,
+        search_latency_ms=search_latency_ms,
+        embed_latency_ms=embed_latency_ms,
+        warmup=1,
+    )
+    before = await run_benchmark(corpus, blocking_io=True, **common)
+    after = await run_benchmark(corpus, blocking_io=False, **common)
+
+    results = []
+    for old, new in zip(before, after):
+        result = LoadTestResult(
+            retriever=new.retriever,
+            concurrency=new.concurrency,
+            qps_before=old.qps,
+            qps_after=new.qps,
+            p95_ms_before=old.p95_ms,
+            p95_ms_after=new.p95_ms,
+        )
+        results.append(result)
+        logger.info(
+            f"[부하 테스트] {result.retriever} c={result.concurrency} "
+            f"qps {result.qps_before:.1f} -> {result.qps_after:.1f} (x{result.speedup:.1f})"
+        )
+    return results
+
+
+def format_load_test(results: Sequence[LoadTestResult]) -> str:
+    """측정 결과를 표 형식 문자열로 변환"""
+    header = f"{'retriever':<12}{'conc':>6}{'qps(before)':>13}{'qps(after)':>12}{'speedup':>9}{'p95(before)':>13}{'p95(after)':>12}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.retriever:<12}{r.concurrency:>6}{r.qps_before:>13.1f}{r.qps_after:>12.1f}"
+            f"{r.speedup:>9.1f}{r.p95_ms_before:>13.1f}{r.p95_ms_after:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="검색 경로 워커당 QPS 부하 테스트 (동기 vs 비동기)")
+    parser.add_argument("--corpus", help="기록된 코퍼스 JSON 경로 (없으면 합성 코퍼스 사용)")
+    parser.add_argument("--retrievers", nargs="+", default=list(LOAD_TEST_RETRIEVERS), choices=LOAD_TEST_RETRIEVERS)
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=64, help="동시성 수준별 요청 수")
+    parser.add_argument("--search-latency-ms", type=float, default=30.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=20.0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 검색기 내부 로그는 측정에 영향을 주므로 경고 이상만 출력
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    corpus = RecordedCorpus.load(args.corpus) if args.corpus else RecordedCorpus.synthetic()
+    results = asyncio.run(run_load_test(
+        corpus,
+        retrievers=args.retrievers,
+        concurrency_levels=args.concurrency,
+        num_requests=args.requests,
+        search_latency_ms=args.search_latency_ms,
+        embed_latency_ms=args.embed_latency_ms,
+    ))
+    print(format_load_test(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([result.to_dict() for result in results], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
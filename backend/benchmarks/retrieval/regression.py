@@ -0,0 +1,319 @@
+"""
+검색 지연 시간/품질 회귀 테스트
+
+고정된 쿼리 세트를 검색기별로 로컬 대체 구현 위에서 실행하여 품질 지표(precision@k, recall@k, nDCG@k, MRR)와
+지연 시간 분포(p50/p95/p99)를 함께 기록하고, 저장된 기준값(baseline)과 비교합니다.
+p95 지연 시간이 허용 범위를 넘어 늘어나거나 nDCG가 허용 범위를 넘어 떨어지면 실패합니다.
+(성능 개선 작업이 검색 품질을 몰래 떨어뜨리지 않도록 확인)
+
+지연 시간은 기준값을 기록한 장비와 실행 장비의 속도 차이를 보정하기 위해, 같은 실행에서 측정한 고정 작업량의
+보정 시간(calibration_ms) 비율로 기준 p95를 환산한 뒤 비교합니다. 허용 범위도 측정 잡음을 고려해 넉넉하게 둡니다.
+
+품질 지표는 evaluation.metrics.retrieval_metrics 구현을 사용하며, 정답 청크(relevant_chunk_ids)가 있는 쿼리만 집계합니다.
+문서 필터를 사용하는 테이블 모드는 필터 대상 문서(document_ids) 안의 정답 청크만 정답으로 사용합니다.
+
+사용 예:
+```
+# 기준값 기록
+python -m benchmarks.retrieval.regression --baseline benchmarks/retrieval/baseline.json --update-baseline
+# 기준값과 비교 (회귀 시 종료 코드 1)
+python -m benchmarks.retrieval.regression --baseline benchmarks/retrieval/baseline.json --p95-tolerance 0.5 --ndcg-tolerance 0.02
+```
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+from benchmarks.retrieval.corpus import RecordedCorpus
+from benchmarks.retrieval.runner import RETRIEVER_NAMES, _build_retriever
+from benchmarks.retrieval.stand_ins import HashingEmbedder, LocalVectorStoreManager, offline_retrievers
+from evaluation.metrics.retrieval_metrics import (
+    calculate_mrr,
+    calculate_ndcg_at_k,
+    calculate_precision_at_k,
+    calculate_recall_at_k,
+)
+
+
+@dataclass
+class RegressionTolerance:
+    """회귀 판정 허용 범위"""
+    p95_latency_ratio: float = 0.5  # 보정한 기준 p95 대비 허용 증가율 (0.5 = 50%)
+    p95_latency_floor_ms: float = 2.0  # 측정 잡음을 고려한 최소 허용 증가량 (ms)
+    ndcg_drop: float = 0.02  # nDCG 허용 하락폭 (절대값)
+
+
+@dataclass
+class QualityLatencyResult:
+    """검색기별 품질 + 지연 시간 측정 결과"""
+    retriever: str
+    top_k: int
+    num_queries: int
+    precision_at_k: float
+    recall_at_k: float
+    ndcg_at_k: float
+    mrr: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    calibration_ms: Optional[float] = None  # 같은 실행에서 측정한 고정 작업량 소요 시간 (장비 속도 보정용)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _chunk_ids(result) -> List[str]:
+    """검색 결과(RetrievalResult)에서 청크 ID 목록 추출 (순위 순)"""
+    return [str(doc.metadata.get("chunk_id", "")) for doc in result.documents]
+
+
+def measure_calibration_ms(rounds: int = 7) -> float:
+    """
+    장비 속도 보정용 고정 작업량(문자열 해싱/정렬/벡터 연산)의 소요 시간 중앙값(ms)을 측정합니다.
+
+    검색기 측정과 같은 실행에서 측정하므로, 기준값을 기록한 장비와의 속도 차이를 p95 비교 시 보정할 수 있습니다.
+    """
+    vectors = np.random.default_rng(0).random((2000, 256))
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        sorted(hash(f"청크-{i % 997}-{i}") for i in range(20000))
+        np.argsort(vectors @ vectors[0])[:10]
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def _relevant_chunk_ids(name: str, query, chunk_documents: Dict[str, str]) -> set:
+    """검색기별 정답 청크 (테이블 모드는 필터 대상 문서 안의 정답 청크만)"""
+    relevant = set(query.relevant_chunk_ids)
+    if name == "table_mode":
+        document_ids = set(query.document_ids)
+        relevant = {chunk_id for chunk_id in relevant if chunk_documents.get(chunk_id) in document_ids}
+    return relevant
+
+
+async def run_regression_suite(
+    corpus: RecordedCorpus,
+    retrievers: Sequence[str] = RETRIEVER_NAMES,
+    top_k: int = 5,
+    repeats: int = 3,
+    min_score: float = 0.0,
+    search_latency_ms: float = 0.0,
+    embed_latency_ms: float = 0.0,
+    rerank_latency_ms: float = 0.0,
+    warmup: int = 3,
+) -> List[QualityLatencyResult]:
+    """
+    검색기별로 고정 쿼리 세트의 품질 지표와 지연 시간 분포를 측정합니다.
+
+    쿼리는 순차 실행(동시성 1)하고, 지연 시간은 쿼리 세트를 repeats회 반복한 요청별 값으로 계산합니다.
+    품질 지표는 첫 번째 반복의 검색 결과로 계산합니다.
+
+    Args:
+        corpus: 기록된 코퍼스 (쿼리별 relevant_chunk_ids 필요)
+        retrievers: 측정할 검색기 이름 목록 (RETRIEVER_NAMES 참고)
+        top_k: 검색 결과 수 (품질 지표의 k)
+        repeats: 지연 시간 측정을 위한 쿼리 세트 반복 횟수
+        min_score: SemanticRetriever 최소 점수
+        search_latency_ms: 벡터 스토어 검색 지연 모사 (ms)
+        embed_latency_ms: 임베딩 API 지연 모사 (ms)
+        rerank_latency_ms: 리랭킹 API 지연 모사 (ms)
+        warmup: 측정 전 실행할 워밍업 쿼리 수
+
+    Returns:
+        List[QualityLatencyResult]: 검색기별 측정 결과
+    """
+    labeled_queries = [query for query in corpus.queries if query.relevant_chunk_ids]
+    if not labeled_queries:
+        raise ValueError("정답 청크(relevant_chunk_ids)가 있는 쿼리가 없습니다.")
+
+    results: List[QualityLatencyResult] = []
+    chunk_documents = {chunk.id: str(chunk.metadata.get("document_id", "")) for chunk in corpus.chunks}
+    calibration_ms = measure_calibration_ms()
+    embedder = HashingEmbedder.from_corpus(corpus, embed_latency_ms=embed_latency_ms)
+    with offline_retrievers(embedder, rerank_latency_ms=rerank_latency_ms):
+        for name in retrievers:
+            vs_manager = LocalVectorStoreManager(corpus, embedder, search_latency_ms=search_latency_ms)
+            call = await _build_retriever(name, corpus, vs_manager, top_k, min_score)
+
+            for query in labeled_queries[:warmup]:
+                await call(query)
+
+            latencies: List[float] = []
+            scores = {"precision": [], "recall": [], "ndcg": [], "mrr": []}
+            for repeat in range(repeats):
+                for query in labeled_queries:
+                    start = time.perf_counter()
+                    result = await call(query)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    if repeat > 0:
+                        continue
+
+                    retrieved = _chunk_ids(result)
+                    relevant = _relevant_chunk_ids(name, query, chunk_documents)
+                    scores["precision"].append(calculate_precision_at_k(relevant, retrieved, top_k))
+                    scores["recall"].append(calculate_recall_at_k(relevant, retrieved, top_k))
+                    scores["ndcg"].append(calculate_ndcg_at_k({chunk_id: 1.0 for chunk_id in relevant}, retrieved, top_k))
+                    scores["mrr"].append(calculate_mrr(relevant, retrieved))
+
+            result = QualityLatencyResult(
+                retriever=name,
+                top_k=top_k,
+                num_queries=len(labeled_queries),
+                precision_at_k=float(np.mean(scores["precision"])),
+                recall_at_k=float(np.mean(scores["recall"])),
+                ndcg_at_k=float(np.mean(scores["ndcg"])),
+                mrr=float(np.mean(scores["mrr"])),
+                p50_ms=float(np.percentile(latencies, 50)),
+                p95_ms=float(np.percentile(latencies, 95)),
+                p99_ms=float(np.percentile(latencies, 99)),
+                mean_ms=float(np.mean(latencies)),
+                calibration_ms=calibration_ms,
+            )
+            results.append(result)
+            logger.info(
+                f"[회귀 테스트] {name} ndcg@{top_k}={result.ndcg_at_k:.3f} mrr={result.mrr:.3f} "
+                f"p95={result.p95_ms:.2f}ms"
+            )
+    return results
+
+
+def compare_to_baseline(
+    results: Sequence[QualityLatencyResult],
+    baseline: Dict[str, Dict],
+    tolerance: RegressionTolerance = RegressionTolerance(),
+) -> List[str]:
+    """
+    측정 결과를 기준값과 비교하여 회귀 목록을 반환합니다.
+
+    기준값과 측정 결과에 모두 calibration_ms가 있으면 기준 p95를 보정 시간 비율로 환산한 뒤 비교합니다.
+
+    Args:
+        results: 측정 결과
+        baseline: 검색기 이름 -> 기준 측정 결과(dict)
+        tolerance: 허용 범위
+
+    Returns:
+        List[str]: 회귀 설명 목록 (비어 있으면 통과)
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.retriever)
+        if base is None:
+            logger.warning(f"[회귀 테스트] 기준값 없음: {result.retriever}")
+            continue
+
+        speed_ratio = 1.0
+        if result.calibration_ms and base.get("calibration_ms"):
+            speed_ratio = result.calibration_ms / base["calibration_ms"]
+        expected_p95 = base["p95_ms"] * speed_ratio
+        allowed_p95 = expected_p95 + max(expected_p95 * tolerance.p95_latency_ratio, tolerance.p95_latency_floor_ms)
+        if result.p95_ms > allowed_p95:
+            regressions.append(
+                f"{result.retriever}: p95 지연 시간 {expected_p95:.2f}ms(보정 기준) -> {result.p95_ms:.2f}ms (허용 {allowed_p95:.2f}ms)"
+            )
+
+        allowed_ndcg = base["ndcg_at_k"] - tolerance.ndcg_drop
+        if result.ndcg_at_k < allowed_ndcg:
+            regressions.append(
+                f"{result.retriever}: nDCG@{result.top_k} {base['ndcg_at_k']:.4f} -> {result.ndcg_at_k:.4f} (허용 {allowed_ndcg:.4f})"
+            )
+    return regressions
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, Dict]:
+    """기준값 파일 로드 (검색기 이름 -> 측정 결과)"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {result["retriever"]: result for result in data.get("results", [])}
+
+
+def save_baseline(results: Sequence[QualityLatencyResult], path: Union[str, Path], metadata: Optional[Dict] = None) -> None:
+    """측정 결과를 기준값 파일로 저장"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "metadata": metadata or {},
+            "results": [result.to_dict() for result in results],
+        }, f, ensure_ascii=False, indent=2)
+    logger.info(f"기준값 저장 완료: {path}")
+
+
+def format_regression(results: Sequence[QualityLatencyResult], baseline: Optional[Dict[str, Dict]] = None) -> str:
+    """측정 결과(및 기준값)를 표 형식 문자열로 변환"""
+    header = f"{'retriever':<16}{'p@k':>8}{'r@k':>8}{'ndcg@k':>9}{'mrr':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'base p95':>10}{'base ndcg':>11}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        base = (baseline or {}).get(r.retriever, {})
+        base_p95 = f"{base['p95_ms']:>10.2f}" if base else f"{'-':>10}"
+        base_ndcg = f"{base['ndcg_at_k']:>11.4f}" if base else f"{'-':>11}"
+        lines.append(
+            f"{r.retriever:<16}{r.precision_at_k:>8.3f}{r.recall_at_k:>8.3f}{r.ndcg_at_k:>9.4f}{r.mrr:>8.3f}"
+            f"{r.p50_ms:>10.2f}{r.p95_ms:>10.2f}{base_p95}{base_ndcg}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="검색 지연 시간/품질 회귀 테스트 (기준값 비교)")
+    parser.add_argument("--corpus", help="기록된 코퍼스 JSON 경로 (없으면 합성 코퍼스 사용)")
+    parser.add_argument("--retrievers", nargs="+", default=list(RETRIEVER_NAMES), choices=RETRIEVER_NAMES)
+    parser.add_argument("--baseline", required=True, help="기준값 JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="비교하지 않고 측정 결과를 기준값으로 저장")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=3, help="지연 시간 측정을 위한 쿼리 세트 반복 횟수")
+    parser.add_argument("--search-latency-ms", type=float, default=0.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0)
+    parser.add_argument("--rerank-latency-ms", type=float, default=0.0)
+    parser.add_argument("--p95-tolerance", type=float, default=0.5, help="보정한 기준 p95 대비 허용 증가율")
+    parser.add_argument("--p95-floor-ms", type=float, default=2.0, help="p95 지연 시간 최소 허용 증가량 (ms)")
+    parser.add_argument("--ndcg-tolerance", type=float, default=0.02, help="nDCG 허용 하락폭")
+    args = parser.parse_args(argv)
+
+    # 검색기 내부 로그는 측정에 영향을 주므로 경고 이상만 출력
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    corpus = RecordedCorpus.load(args.corpus) if args.corpus else RecordedCorpus.synthetic()
+    results = asyncio.run(run_regression_suite(
+        corpus,
+        retrievers=args.retrievers,
+        top_k=args.top_k,
+        repeats=args.repeats,
+        search_latency_ms=args.search_latency_ms,
+        embed_latency_ms=args.embed_latency_ms,
+        rerank_latency_ms=args.rerank_latency_ms,
+    ))
+
+    if args.update_baseline:
+        print(format_regression(results))
+        save_baseline(results, args.baseline, metadata={"corpus": args.corpus or "synthetic", "top_k": args.top_k})
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    print(format_regression(results, baseline))
+    regressions = compare_to_baseline(results, baseline, RegressionTolerance(
+        p95_latency_ratio=args.p95_tolerance,
+        p95_latency_floor_ms=args.p95_floor_ms,
+        ndcg_drop=args.ndcg_tolerance,
+    ))
+    if regressions:
+        print("\n회귀 발견:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("\n회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
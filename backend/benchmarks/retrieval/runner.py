@@ -0,0 +1,261 @@
+"""
+검색 벤치마크 실행기
+
+기록된 코퍼스를 크기별로 확장하고, 검색기별로 인덱스를 구성한 뒤 동시성 수준별로 쿼리를 재생합니다.
+
+측정 항목:
+- 지연 시간: 요청별 p50/p95/p99/평균 (ms)
+- 처리량: 동시성 수준별 QPS
+- 메모리: 인덱스(벡터 행렬, BM25, 문맥 임베딩) 구성 시 할당된 메모리 (tracemalloc 기준, MB)
+
+사용 예:
+```
+python -m benchmarks.retrieval.runner --sizes 1000 10000 --concurrency 1 8 --search-latency-ms 30 --output result.json
+```
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from benchmarks.retrieval.corpus import RecordedCorpus, RecordedQuery
+from benchmarks.retrieval.stand_ins import HashingEmbedder, LocalVectorStoreManager, offline_retrievers
+from common.services.retrievers.contextual_bm25 import ContextualBM25Config, ContextualBM25Retriever
+from common.services.retrievers.hybrid import HybridRetriever, HybridRetrieverConfig
+from common.services.retrievers.models import DocumentWithScore
+from common.services.retrievers.semantic import SemanticRetriever, SemanticRetrieverConfig
+from common.services.retrievers.tablemode_semantic import TableModeSemanticRetriever
+
+# 지원하는 검색기 이름
+RETRIEVER_NAMES = ("semantic", "hybrid", "hybrid_rerank", "contextual_bm25", "table_mode")
+
+# 쿼리 -> 검색 코루틴
+SearchCall = Callable[[RecordedQuery], Awaitable]
+
+
+@dataclass
+class BenchmarkResult:
+    """검색기 x 코퍼스 크기 x 동시성 수준별 측정 결과"""
+    retriever: str
+    corpus_size: int
+    concurrency: int
+    num_requests: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    qps: float
+    index_memory_mb: float
+    build_seconds: float
+    errors: int = 0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _document_from_chunk(chunk) -> DocumentWithScore:
+    return DocumentWithScore(page_content=chunk.text, metadata={**chunk.metadata, "chunk_id": chunk.id}, score=0.0)
+
+
+async def _build_retriever(name: str, corpus: RecordedCorpus, vs_manager: LocalVectorStoreManager,
+                           top_k: int, min_score: float) -> SearchCall:
+    """검색기를 생성하고 인덱스를 구성한 뒤 쿼리별 검색 함수를 반환"""
+    semantic_config = SemanticRetrieverConfig(top_k=top_k, min_score=min_score)
+
+    if name == "semantic":
+        retriever = SemanticRetriever(semantic_config, vs_manager)
+        return lambda query: retriever.retrieve(query.text, top_k)
+
+    if name == "table_mode":
+        retriever = TableModeSemanticRetriever(semantic_config, vs_manager)
+        return lambda query: retriever.retrieve(
+            query.text, top_k, filters={"document_id": {"$in": query.document_ids}}
+        )
+
+    bm25_config = ContextualBM25Config(top_k=top_k)
+    documents = [_document_from_chunk(chunk) for chunk in corpus.chunks]
+
+    if name == "contextual_bm25":
+        retriever = ContextualBM25Retriever(bm25_config)
+        await retriever.add_documents(documents)
+        return lambda query: retriever.retrieve(query.text, top_k)
+
+    if name in ("hybrid", "hybrid_rerank"):
+        retriever = HybridRetriever(
+            HybridRetrieverConfig(top_k=top_k, semantic_config=semantic_config, contextual_bm25_config=bm25_config),
+            vs_manager,
+        )
+        if name == "hybrid_rerank":
+            return lambda query: retriever.retrieve_vector_then_rerank(query.text, top_k)
+        await retriever.contextual_bm25_retriever.add_documents(documents)
+        return lambda query: retriever.retrieve(query.text, top_k)
+
+    raise ValueError(f"지원하지 않는 검색기: {name} (지원: {', '.join(RETRIEVER_NAMES)})")
+
+
+async def _replay(call: SearchCall, queries: Sequence[RecordedQuery], num_requests: int,
+                  concurrency: int) -> Tuple[List[float], float, int]:
+    """쿼리를 동시성 수준에 맞춰 재생하고 (요청별 지연 시간, 전체 소요 시간, 오류 수) 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def _run(query: RecordedQuery):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(query)
+            except Exception as e:
+                errors += 1
+                logger.warning(f"벤치마크 검색 오류: {str(e)}")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    requests = list(itertools.islice(itertools.cycle(queries), num_requests))
+    started = time.perf_counter()
+    await asyncio.gather(*(_run(query) for query in requests))
+    return latencies, time.perf_counter() - started, errors
+
+
+async def run_benchmark(
+    corpus: RecordedCorpus,
+    retrievers: Sequence[str] = RETRIEVER_NAMES,
+    corpus_sizes: Optional[Sequence[int]] = None,
+    concurrency_levels: Sequence[int] = (1, 8),
+    num_requests: int = 100,
+    top_k: int = 5,
+    min_score: float = 0.0,
+    search_latency_ms: float = 0.0,
+    embed_latency_ms: float = 0.0,
+    rerank_latency_ms: float = 0.0,
+    warmup: int = 3,
+    blocking_io: bool = False,
+) -> List[BenchmarkResult]:
+    """
+    검색 벤치마크를 실행합니다.
+
+    Args:
+        corpus: 기록된 코퍼스
+        retrievers: 측정할 검색기 이름 목록 (RETRIEVER_NAMES 참고)
+        corpus_sizes: 측정할 코퍼스 크기(청크 수) 목록. None이면 코퍼스 전체 크기
+        concurrency_levels: 동시 요청 수 목록
+        num_requests: 동시성 수준별 요청 수
+        top_k: 검색 결과 수
+        min_score: SemanticRetriever 최소 점수 (해싱 임베딩은 점수가 낮으므로 기본 0.0)
+        search_latency_ms: 벡터 스토어 검색 지연 모사 (ms)
+        embed_latency_ms: 임베딩 API 지연 모사 (ms)
+        rerank_latency_ms: 리랭킹 API 지연 모사 (ms)
+        warmup: 측정 전 실행할 워밍업 쿼리 수
+        blocking_io: True이면 벡터 스토어 비동기 검색도 이벤트 루프를 막는 동기 호출로 실행 (이전 동작 비교용)
+
+    Returns:
+        List[BenchmarkResult]: 측정 결과 목록
+    """
+    if not corpus.queries:
+        raise ValueError("코퍼스에 쿼리가 없습니다.")
+
+    results: List[BenchmarkResult] = []
+    embedder = HashingEmbedder.from_corpus(corpus, embed_latency_ms=embed_latency_ms)
+    with offline_retrievers(embedder, rerank_latency_ms=rerank_latency_ms):
+        for size in corpus_sizes or [len(corpus.chunks)]:
+            sized_corpus = corpus.scaled(size)
+            for name in retrievers:
+                # 인덱스 구성 메모리/시간 측정
+                tracemalloc.start()
+                build_started = time.perf_counter()
+                vs_manager = LocalVectorStoreManager(
+                    sized_corpus, embedder, search_latency_ms=search_latency_ms, blocking_io=blocking_io
+                )
+                call = await _build_retriever(name, sized_corpus, vs_manager, top_k, min_score)
+                build_seconds = time.perf_counter() - build_started
+                index_memory, _ = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                for query in corpus.queries[:warmup]:
+                    await call(query)
+
+                for concurrency in concurrency_levels:
+                    latencies, elapsed, errors = await _replay(call, corpus.queries, num_requests, concurrency)
+                    result = BenchmarkResult(
+                        retriever=name,
+                        corpus_size=len(sized_corpus.chunks),
+                        concurrency=concurrency,
+                        num_requests=num_requests,
+                        p50_ms=float(np.percentile(latencies, 50)),
+                        p95_ms=float(np.percentile(latencies, 95)),
+                        p99_ms=float(np.percentile(latencies, 99)),
+                        mean_ms=float(np.mean(latencies)),
+                        qps=num_requests / elapsed if elapsed > 0 else 0.0,
+                        index_memory_mb=index_memory / (1024 * 1024),
+                        build_seconds=build_seconds,
+                        errors=errors,
+                    )
+                    results.append(result)
+                    logger.info(
+                        f"[벤치마크] {name} size={result.corpus_size} c={concurrency} "
+                        f"p50={result.p50_ms:.1f}ms p95={result.p95_ms:.1f}ms p99={result.p99_ms:.1f}ms "
+                        f"qps={result.qps:.1f} mem={result.index_memory_mb:.1f}MB"
+                    )
+    return results
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """측정 결과를 표 형식 문자열로 변환"""
+    header = f"{'retriever':<16}{'size':>8}{'conc':>6}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'qps':>10}{'mem(MB)':>10}{'err':>5}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.retriever:<16}{r.corpus_size:>8}{r.concurrency:>6}{r.p50_ms:>10.2f}{r.p95_ms:>10.2f}"
+            f"{r.p99_ms:>10.2f}{r.qps:>10.1f}{r.index_memory_mb:>10.1f}{r.errors:>5}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="검색기 지연 시간/처리량/메모리 벤치마크")
+    parser.add_argument("--corpus", help="기록된 코퍼스 JSON 경로 (없으면 합성 코퍼스 사용)")
+    parser.add_argument("--retrievers", nargs="+", default=list(RETRIEVER_NAMES), choices=RETRIEVER_NAMES)
+    parser.add_argument("--sizes", nargs="+", type=int, help="코퍼스 크기(청크 수) 목록")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8])
+    parser.add_argument("--requests", type=int, default=100, help="동시성 수준별 요청 수")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--search-latency-ms", type=float, default=0.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0)
+    parser.add_argument("--rerank-latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 검색기 내부 로그는 측정에 영향을 주므로 경고 이상만 출력
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    corpus = RecordedCorpus.load(args.corpus) if args.corpus else RecordedCorpus.synthetic()
+    results = asyncio.run(run_benchmark(
+        corpus,
+        retrievers=args.retrievers,
+        corpus_sizes=args.sizes,
+        concurrency_levels=args.concurrency,
+        num_requests=args.requests,
+        top_k=args.top_k,
+        search_latency_ms=args.search_latency_ms,
+        embed_latency_ms=args.embed_latency_ms,
+        rerank_latency_ms=args.rerank_latency_ms,
+    ))
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([result.to_dict() for result in results], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""
+벤치마크용 로컬 대체 구현
+
+외부 서비스를 호출하지 않고 검색기를 실행하기 위한 구현체입니다.
+- HashingEmbedder: 기록된 벡터가 있으면 사용하고, 없으면 문자 bigram 해싱 임베딩 생성
+- LocalVectorStoreManager: VectorStoreManager의 검색 인터페이스를 NumPy 전수 검색으로 구현
+- LocalReranker: 임베딩 코사인 유사도 기반 리랭커
+- offline_retrievers: ContextualBM25Retriever의 토크나이저/임베딩 서비스와 HybridRetriever의 리랭커를
+  로컬 구현으로 교체하는 컨텍스트 매니저
+
+네트워크 지연은 search_latency_ms, embed_latency_ms로 모사합니다.
+동기 메서드는 time.sleep(실제 동기 Pinecone/OpenAI 호출처럼 이벤트 루프를 막음),
+비동기 메서드는 asyncio.sleep을 사용합니다.
+blocking_io=True이면 비동기 메서드도 time.sleep으로 이벤트 루프를 막아,
+검색기가 이벤트 루프에서 동기 검색을 호출하던 이전 동작을 재현합니다. (부하 테스트 비교용)
+"""
+
+import asyncio
+import re
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from unittest import mock
+
+import numpy as np
+from langchain_community.vectorstores.utils import maximal_marginal_relevance
+from langchain_core.documents import Document as LangchainDocument
+
+from benchmarks.retrieval.corpus import RecordedCorpus
+from common.services.retrievers.models import DocumentWithScore, RetrievalResult
+from common.services.vector_store_manager import mmr_select
+
+
+class HashingEmbedder:
+    """기록된 벡터 조회 + 문자 bigram 해싱 임베딩"""
+
+    def __init__(self, dimension: int = 256, recorded: Optional[Dict[str, List[float]]] = None,
+                 embed_latency_ms: float = 0.0):
+        self.dimension = dimension
+        self.recorded = recorded or {}
+        self.embed_latency_ms = embed_latency_ms
+
+    @classmethod
+    def from_corpus(cls, corpus: RecordedCorpus, embed_latency_ms: float = 0.0) -> "HashingEmbedder":
+        """코퍼스에 기록된 청크/쿼리 벡터를 조회 테이블로 사용하는 임베더 생성"""
+        recorded = {chunk.text: chunk.vector for chunk in corpus.chunks if chunk.vector is not None}
+        recorded.update({query.text: query.vector for query in corpus.queries if query.vector is not None})
+        return cls(corpus.dimension, recorded, embed_latency_ms)
+
+    def _hash_embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        normalized = re.sub(r"\s+", "", text.lower())
+        for i in range(len(normalized) - 1):
+            h = zlib.crc32(normalized[i:i + 2].encode("utf-8"))
+            vector[h % self.dimension] += 1.0 if (h >> 16) & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """텍스트 목록 임베딩 (지연 시간 모사 없음)"""
+        return [self.recorded.get(text) or self._hash_embed(text) for text in texts]
+
+    def embed_sync(self, texts: List[str]) -> List[List[float]]:
+        """동기 임베딩 API 호출 모사"""
+        if self.embed_latency_ms:
+            time.sleep(self.embed_latency_ms / 1000)
+        return self.embed(texts)
+
+    async def embed_async(self, texts: List[str]) -> List[List[float]]:
+        """비동기 임베딩 API 호출 모사"""
+        if self.embed_latency_ms:
+            await asyncio.sleep(self.embed_latency_ms / 1000)
+        return self.embed(texts)
+
+
+class LocalEmbeddingService:
+    """ContextualBM25Retriever가 사용하는 EmbeddingService 대체 구현"""
+
+    def __init__(self, embedder: HashingEmbedder):
+        self.embedder = embedder
+
+    def create_embeddings_batch_sync(self, texts: List[str], user_id: str = None, project_type: str = None) -> List[List[float]]:
+        return self.embedder.embed_sync(texts)
+
+    async def create_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        return await self.embedder.embed_async(texts)
+
+
+class LocalTokenizer:
+    """HuggingFace 토크나이저 대체 구현 (공백 단위 토큰화)"""
+
+    def tokenize(self, text: str) -> List[str]:
+        return re.findall(r"\w+", text.lower())
+
+
+class _LocalEmbeddingModelConfig:
+    def __init__(self, dimension: int):
+        self.name = "local-benchmark"
+        self.dimension = dimension
+
+
+class LocalVectorStoreManager:
+    """
+    VectorStoreManager 검색 인터페이스의 로컬 구현 (NumPy 전수 검색, 내적 점수)
+
+    메타데이터 필터는 Pinecone 형식 중 {"field": value}, {"field": {"$eq": value}},
+    {"field": {"$in": [...]}}를 지원합니다.
+    """
+
+    def __init__(self, corpus: RecordedCorpus, embedder: HashingEmbedder,
+                 search_latency_ms: float = 0.0, namespace: str = "benchmark", blocking_io: bool = False):
+        self.namespace = namespace
+        self.user_id = None
+        self.project_type = None
+        self.embedder = embedder
+        self.search_latency_ms = search_latency_ms
+        self.blocking_io = blocking_io
+        self.embedding_model_config = _LocalEmbeddingModelConfig(corpus.dimension)
+
+        self.documents = [
+            LangchainDocument(page_content=chunk.text, metadata={**chunk.metadata, "chunk_id": chunk.id})
+            for chunk in corpus.chunks
+        ]
+        vectors = embedder.embed([chunk.text for chunk in corpus.chunks])
+        self.matrix = np.asarray(vectors, dtype=np.float32)
+        # 필터 대상 필드별 값 배열 (np.isin으로 마스크 계산)
+        self._field_values: Dict[str, np.ndarray] = {}
+        for key in {key for chunk in corpus.chunks for key in chunk.metadata}:
+            self._field_values[key] = np.array(
+                [str(chunk.metadata.get(key, "")) for chunk in corpus.chunks], dtype=object
+            )
+
+    def _mask(self, filters: Optional[Dict]) -> Optional[np.ndarray]:
+        if not filters:
+            return None
+        mask = np.ones(len(self.documents), dtype=bool)
+        for key, condition in filters.items():
+            values = self._field_values.get(key)
+            if values is None:
+                return np.zeros(len(self.documents), dtype=bool)
+            if isinstance(condition, dict) and "$in" in condition:
+                mask &= np.isin(values, [str(v) for v in condition["$in"]])
+            else:
+                target = condition.get("$eq") if isinstance(condition, dict) else condition
+                mask &= values == str(target)
+        return mask
+
+    def _query(self, embedding: List[float], top_k: int, filters: Optional[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        scores = self.matrix @ np.asarray(embedding, dtype=np.float32)
+        mask = self._mask(filters)
+        if mask is not None:
+            scores = np.where(mask, scores, -np.inf)
+        top_k = min(top_k, len(scores))
+        if top_k <= 0:
+            return np.array([], dtype=int), np.array([], dtype=np.float32)
+        indices = np.argpartition(-scores, top_k - 1)[:top_k]
+        indices = indices[np.argsort(-scores[indices])]
+        indices = indices[np.isfinite(scores[indices])]
+        return indices, scores[indices]
+
+    def _results(self, indices: np.ndarray, scores: np.ndarray) -> List[Tuple[LangchainDocument, float]]:
+        return [(self.documents[i], float(score)) for i, score in zip(indices, scores)]
+
+    def _mmr(self, embedding: List[float], top_k: int, fetch_k: int, lambda_mult: float,
+             filters: Optional[Dict]) -> List[Tuple[LangchainDocument, float]]:
+        indices, _ = self._query(embedding, fetch_k, filters)
+        if len(indices) == 0:
+            return []
+        # langchain Pinecone 벡터 스토어와 같은 MMR 선택 후 점수는 0.0으로 반환
+        selected = maximal_marginal_relevance(
+            np.array([embedding], dtype=np.float32),
+            self.matrix[indices],
+            k=top_k,
+            lambda_mult=lambda_mult,
+        )
+        return [(self.documents[indices[i]], 0.0) for i in selected]
+
+    async def _search_latency_async(self) -> None:
+        if not self.search_latency_ms:
+            return
+        if self.blocking_io:
+            time.sleep(self.search_latency_ms / 1000)
+        else:
+            await asyncio.sleep(self.search_latency_ms / 1000)
+
+    def create_embeddings_single_query(self, query: str) -> List[float]:
+        return self.embedder.embed_sync([query])[0]
+
+    async def create_embeddings_single_query_async(self, query: str) -> List[float]:
+        if self.blocking_io:
+            return self.create_embeddings_single_query(query)
+        return (await self.embedder.embed_async([query]))[0]
+
+    def search(self, query: str, top_k: int, threshold: float = 0.2, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        embedding = self.create_embeddings_single_query(query)
+        if self.search_latency_ms:
+            time.sleep(self.search_latency_ms / 1000)
+        return self._results(*self._query(embedding, top_k, filters))
+
+    async def search_async(self, query: str, top_k: int, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        embedding = await self.create_embeddings_single_query_async(query)
+        return await self.search_by_vector_async(embedding, top_k, filters)
+
+    async def search_by_vector_async(self, embedding: List[float], top_k: int, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        await self._search_latency_async()
+        return self._results(*self._query(embedding, top_k, filters))
+
+    def search_mmr(self, query: str, top_k: int, fetch_k: int, lambda_mult: float, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        embedding = self.create_embeddings_single_query(query)
+        if self.search_latency_ms:
+            time.sleep(self.search_latency_ms / 1000)
+        return self._mmr(embedding, top_k, fetch_k, lambda_mult, filters)
+
+    async def search_mmr_async(self, query: str, top_k: int, fetch_k: int, lambda_mult: float, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        embedding = await self.create_embeddings_single_query_async(query)
+        return await self.search_mmr_by_vector_async(embedding, top_k, fetch_k, lambda_mult, filters)
+
+    async def search_mmr_by_vector_async(self, embedding: List[float], top_k: int, fetch_k: int, lambda_mult: float, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        await self._search_latency_async()
+        if self.blocking_io:
+            return self._mmr(embedding, top_k, fetch_k, lambda_mult, filters)
+        indices, _ = self._query(embedding, fetch_k, filters)
+        if len(indices) == 0:
+            return []
+        selected = await asyncio.to_thread(mmr_select, embedding, self.matrix[indices], top_k, lambda_mult)
+        return [(self.documents[indices[i]], 0.0) for i in selected]
+
+
+class LocalReranker:
+    """Reranker 대체 구현 (임베딩 코사인 유사도로 재정렬)"""
+
+    embedder: Optional[HashingEmbedder] = None
+    rerank_latency_ms: float = 0.0
+
+    def __init__(self, config=None):
+        self.config = config
+
+    async def rerank(self, query: str, documents: List[DocumentWithScore], top_k: Optional[int] = None) -> RetrievalResult:
+        if self.rerank_latency_ms:
+            await asyncio.sleep(self.rerank_latency_ms / 1000)
+        _top_k = top_k or 10
+        query_vector = np.asarray(self.embedder.embed([query])[0], dtype=np.float32)
+        doc_vectors = np.asarray(self.embedder.embed([doc.page_content for doc in documents]), dtype=np.float32)
+        scores = doc_vectors @ query_vector
+        order = np.argsort(-scores)[:_top_k]
+        result_documents = [
+            DocumentWithScore(
+                page_content=documents[i].page_content,
+                metadata={**documents[i].metadata, "rerank_score": float(scores[i])},
+                score=float(scores[i]),
+            )
+            for i in order
+        ]
+        return RetrievalResult(
+            documents=result_documents,
+            query_analysis={"type": "local_rerank", "total_candidates": len(documents), "returned": len(result_documents)},
+        )
+
+
+@contextmanager
+def offline_retrievers(embedder: HashingEmbedder, rerank_latency_ms: float = 0.0):
+    """
+    검색기가 내부에서 생성하는 외부 의존성을 로컬 구현으로 교체합니다.
+
+    - ContextualBM25Retriever: AutoTokenizer, EmbeddingService
+    - HybridRetriever.retrieve_vector_then_rerank: Reranker
+    """
+    reranker_cls = type("BenchmarkReranker", (LocalReranker,), {
+        "embedder": embedder, "rerank_latency_ms": rerank_latency_ms
+    })
+    with mock.patch("common.services.retrievers.contextual_bm25.AutoTokenizer.from_pretrained",
+                    return_value=LocalTokenizer()), \
+         mock.patch("common.services.retrievers.contextual_bm25.EmbeddingService",
+                    side_effect=lambda *args, **kwargs: LocalEmbeddingService(embedder)), \
+         mock.patch("common.services.retrievers.hybrid.Reranker", reranker_cls):
+        yield
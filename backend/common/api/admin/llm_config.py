@@ -4,14 +4,15 @@ LLM 설정 관리 API 모듈
 이 모듈은 LLM 설정을 관리하기 위한 API 엔드포인트를 제공합니다.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
 from common.core.deps import get_admin_user
 from common.models.user import User
 from common.services.llm_config import llm_config_manager
-from common.services.agent_llm import get_agent_llm, agent_llm_cache
+from common.services.agent_llm import get_agent_llm, agent_llm_cache, provider_health
+from common.services.llm_response_cache import get_llm_response_cache
 
 # 라우터 생성
 router = APIRouter(
@@ -29,6 +30,9 @@ class LLMConfigSchema(BaseModel):
     max_tokens: Optional[int] = Field(None, description="최대 생성 토큰 수")
     top_p: Optional[float] = Field(None, description="토큰 확률 임계값 (0.0 ~ 1.0)")
     api_key_env: Optional[str] = Field(None, description="API 키 환경 변수 이름")
+    deadline_seconds: Optional[float] = Field(None, description="에이전트 호출 마감 시간(초), 없으면 폴백 설정의 기본값 사용")
+    hedging: Optional[bool] = Field(None, description="헤지 요청 사용 여부, 없으면 폴백 설정의 hedging.enabled 사용")
+    response_cache: Optional[Union[bool, Dict[str, Any]]] = Field(None, description="응답 캐시 사용 여부 또는 옵션(ttl, max_entries), temperature=0일 때만 적용")
 
 class AgentLLMConfigSchema(BaseModel):
     """에이전트별 LLM 설정 스키마"""
@@ -41,11 +45,29 @@ class FallbackProviderSchema(BaseModel):
     model_name: str = Field(..., description="모델 이름")
     temperature: float = Field(0.0, description="생성 다양성 조절")
 
+class HedgingSettingsSchema(BaseModel):
+    """헤지 요청 설정 스키마"""
+    enabled: bool = Field(False, description="헤지 요청 활성화 여부")
+    quantile: float = Field(0.95, description="헤지 지연 계산에 사용할 지연시간 분위수")
+    initial_delay_seconds: float = Field(5.0, description="지연시간 표본이 부족할 때의 헤지 지연(초)")
+    min_delay_seconds: float = Field(0.5, description="최소 헤지 지연(초)")
+    max_delay_seconds: float = Field(15.0, description="최대 헤지 지연(초)")
+
+class CircuitBreakerSettingsSchema(BaseModel):
+    """회로 차단기 설정 스키마"""
+    window_size: int = Field(50, description="통계에 사용할 최근 호출 수")
+    failure_threshold: float = Field(0.5, description="차단 실패율 임계값")
+    min_requests: int = Field(5, description="차단 판단에 필요한 최소 호출 수")
+    open_seconds: float = Field(30.0, description="차단 유지 시간(초)")
+
 class FallbackSettingsSchema(BaseModel):
     """폴백 설정 스키마"""
     enabled: bool = Field(True, description="폴백 활성화 여부")
     max_retries: int = Field(3, description="최대 재시도 횟수")
     providers: List[FallbackProviderSchema] = Field([], description="폴백 제공자 목록")
+    default_deadline_seconds: Optional[float] = Field(None, description="에이전트 호출 기본 마감 시간(초)")
+    hedging: HedgingSettingsSchema = Field(default_factory=HedgingSettingsSchema, description="헤지 요청 설정")
+    circuit_breaker: CircuitBreakerSettingsSchema = Field(default_factory=CircuitBreakerSettingsSchema, description="회로 차단기 설정")
 
 class FullLLMConfigSchema(BaseModel):
     """전체 LLM 설정 스키마"""
@@ -197,6 +219,20 @@ async def update_fallback_settings(
             detail=f"폴백 설정 업데이트 실패: {str(e)}"
         )
 
+@router.get("/provider-health")
+async def get_provider_health_stats(current_user: User = Depends(get_admin_user)) -> Dict[str, Any]:
+    """
+    제공자별 지연시간/오류 통계와 회로 차단기 상태 가져오기
+    """
+    return {key: health.snapshot() for key, health in provider_health.items()}
+
+@router.get("/response-cache-stats")
+async def get_response_cache_stats(current_user: User = Depends(get_admin_user)) -> Dict[str, Any]:
+    """
+    에이전트별 LLM 응답 캐시 적중/미스 횟수와 절약한 토큰 수 가져오기 (현재 프로세스 기준)
+    """
+    return get_llm_response_cache().get_stats()
+
 @router.get("/path")
 async def get_config_path(current_user: User = Depends(get_admin_user)) -> Dict[str, str]:
     """
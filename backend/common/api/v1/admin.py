@@ -1,7 +1,8 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import HTMLResponse
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import HTMLResponse, StreamingResponse
 from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -31,6 +32,26 @@ async def verify_admin(session: Session = Depends(get_current_session)):
         )
     return session
 
+def _resolve_pinecone_namespace(namespace: str) -> tuple:
+    """namespace 이름을 (실제 Pinecone namespace, 프로젝트 이름)으로 변환"""
+    valid_namespaces = {
+        "doceasy": settings.PINECONE_NAMESPACE_DOCEASY,
+        "stockeasy": settings.PINECONE_NAMESPACE_STOCKEASY,
+        "stockeasy_telegram": settings.PINECONE_NAMESPACE_STOCKEASY_TELEGRAM
+    }
+    if namespace not in valid_namespaces:
+        raise HTTPException(
+            status_code=400,
+            detail=f"유효하지 않은 namespace입니다: {namespace}"
+        )
+    real_project_name = "doceasy" if namespace == "doceasy" else "stockeasy"
+    return valid_namespaces[namespace], real_project_name
+
+def _is_list_unsupported_error(error: Exception) -> bool:
+    """Pinecone list가 지원되지 않는 인덱스(PodSpec)에서 발생한 오류인지 여부"""
+    message = str(error).lower()
+    return getattr(error, "status", None) == 400 or "pod" in message or "not supported" in message
+
 @router.get("/pinecone/{namespace}", response_model=List[Dict[str, Any]])
 async def get_pinecone_data(
     namespace: str,
@@ -38,31 +59,11 @@ async def get_pinecone_data(
 ):
     """특정 namespace의 Pinecone DB 데이터를 반환합니다."""
     try:
-        
-        
-        
-            
-        # namespace 유효성 검사
-        valid_namespaces = {
-            "doceasy": settings.PINECONE_NAMESPACE_DOCEASY,
-            "stockeasy": settings.PINECONE_NAMESPACE_STOCKEASY,
-            "stockeasy_telegram": settings.PINECONE_NAMESPACE_STOCKEASY_TELEGRAM
-        }
-        
-        if namespace not in valid_namespaces:
-            raise HTTPException(
-                status_code=400,
-                detail=f"유효하지 않은 namespace입니다: {namespace}"
-            )
-            
-        # 실제 namespace 값 사용
-        actual_namespace = valid_namespaces[namespace]
+        # namespace 유효성 검사 및 실제 namespace 값 변환
+        actual_namespace, real_project_name = _resolve_pinecone_namespace(namespace)
         
         logger.info(f"Pinecone 데이터 조회 시작 - namespace: {actual_namespace}")
         
-        real_project_name = "stockeasy"
-        if namespace == "doceasy":  
-            real_project_name = "doceasy"
         # VectorStoreManager 초기화
         embedding_service = EmbeddingService()
         vector_store = VectorStoreManager(embedding_model_type=embedding_service.get_model_type(),
@@ -117,6 +118,97 @@ async def get_pinecone_data(
             detail=f"Pinecone 데이터 조회 실패: {str(e)}"
         )
 
+@router.get("/pinecone/{namespace}/browse")
+async def browse_pinecone_namespace(
+    namespace: str,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (처음부터 조회 시 생략)"),
+    prefix: Optional[str] = Query(None, description="벡터 ID 접두사"),
+    filter_json: Optional[str] = Query(None, alias="filter", description='Pinecone 문법의 메타데이터 필터 JSON (예: {"document_id": "..."})'),
+    fields: Optional[str] = Query(None, description="응답에 포함할 메타데이터 키 (쉼표 구분, 생략 시 전체)"),
+    page_size: int = Query(100, ge=1, le=100, description="Pinecone list/fetch 배치 크기"),
+    limit: int = Query(1000, ge=1, le=100000, description="응답당 최대 레코드 수"),
+    max_scan: int = Query(100000, ge=1, le=1000000, description="응답당 최대 조회 ID 수 (필터가 드물게 일치할 때 응답 시간 제한)"),
+    session: Session = Depends(verify_admin)
+):
+    """특정 namespace의 Pinecone 벡터를 커서 기반으로 페이지 단위 조회하여 NDJSON으로 스트리밍합니다.
+
+    각 줄은 {"type": "vector", "id", "metadata"} 레코드이며, 마지막 줄은
+    {"type": "end", "next_cursor", "returned", "scanned"} 입니다.
+    next_cursor를 cursor로 넘기면 이어서 조회하며, null이면 마지막 페이지입니다.
+    limit/max_scan은 배치 단위로 확인하므로 최대 page_size만큼 초과할 수 있습니다.
+    Pinecone list는 serverless 인덱스만 지원하므로, PodSpec 인덱스는 스트리밍 전에 400 오류를 반환합니다.
+    """
+    actual_namespace, real_project_name = _resolve_pinecone_namespace(namespace)
+
+    metadata_filter = None
+    if filter_json:
+        try:
+            metadata_filter = json.loads(filter_json)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"필터 JSON 파싱 실패: {str(e)}")
+        if not isinstance(metadata_filter, dict):
+            raise HTTPException(status_code=400, detail="필터는 JSON 객체여야 합니다.")
+    selected_fields = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+
+    embedding_service = EmbeddingService()
+    vector_store = VectorStoreManager(embedding_model_type=embedding_service.get_model_type(),
+                                      project_name=real_project_name,
+                                      namespace=actual_namespace)
+    if not vector_store.index:
+        raise HTTPException(
+            status_code=500,
+            detail="Pinecone 인덱스 초기화 실패"
+        )
+
+    # ID 목록 조회(list_paginated) 가능 여부를 스트리밍 전에 확인 (PodSpec 인덱스는 list 미지원)
+    try:
+        await asyncio.to_thread(vector_store.list_ids_page, prefix, 1, cursor)
+    except Exception as e:
+        logger.error(f"Pinecone ID 목록 조회 실패 - namespace: {actual_namespace}, 오류: {str(e)}")
+        if _is_list_unsupported_error(e):
+            raise HTTPException(
+                status_code=400,
+                detail=f"이 namespace의 인덱스는 ID 목록 조회(list)를 지원하지 않습니다 (PodSpec 인덱스). "
+                       f"/admin/pinecone/{namespace} 조회를 사용하세요. 원인: {str(e)}"
+            )
+        raise HTTPException(status_code=502, detail=f"Pinecone ID 목록 조회 실패: {str(e)}")
+
+    logger.info(f"Pinecone 데이터 탐색 시작 - namespace: {actual_namespace}, cursor: {cursor}, filter: {metadata_filter}")
+
+    async def ndjson_generator():
+        returned = 0
+        scanned = 0
+        next_cursor = cursor
+        try:
+            async for records, next_token, page_scanned in vector_store.iter_vector_pages_async(
+                prefix=prefix,
+                page_size=page_size,
+                pagination_token=cursor,
+                filters=metadata_filter
+            ):
+                next_cursor = next_token
+                scanned += page_scanned
+                lines = []
+                for record in records:
+                    metadata = record["metadata"]
+                    if selected_fields is not None:
+                        metadata = {key: metadata[key] for key in selected_fields if key in metadata}
+                    lines.append(json.dumps({"type": "vector", "id": record["id"], "metadata": metadata}, ensure_ascii=False, default=str))
+                if lines:
+                    returned += len(lines)
+                    yield "\n".join(lines) + "\n"
+                if returned >= limit or scanned >= max_scan:
+                    break
+        except Exception as e:
+            logger.error(f"Pinecone 데이터 탐색 중 오류 발생: {str(e)}", exc_info=True)
+            yield json.dumps({"type": "error", "error": str(e), "next_cursor": next_cursor}, ensure_ascii=False) + "\n"
+            return
+
+        logger.info(f"Pinecone 데이터 탐색 완료 - 반환 {returned}개, 조회 {scanned}개")
+        yield json.dumps({"type": "end", "next_cursor": next_cursor, "returned": returned, "scanned": scanned}) + "\n"
+
+    return StreamingResponse(ndjson_generator(), media_type="application/x-ndjson")
+
 @router.get("", response_class=HTMLResponse)
 async def admin_page(
     request: Request,
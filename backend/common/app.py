@@ -56,6 +56,13 @@ async def lifespan(app: FastAPI):
         logger.info("토큰 사용량 추적 큐가 종료되었습니다")
     except Exception as e:
         logger.error(f"토큰 사용량 추적 큐 종료 실패: {str(e)}")
+    
+    try:
+        # 비동기 Redis 커넥션 풀 종료
+        from common.core.redis import async_redis_client
+        await async_redis_client.close()
+    except Exception as e:
+        logger.error(f"Redis 커넥션 풀 종료 실패: {str(e)}")
         
     logger.info("애플리케이션 종료됨")
 
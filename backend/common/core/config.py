@@ -53,6 +53,11 @@ class CommonSettings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     SESSION_EXPIRY_DAYS: int = 30  # 30 days for session expiry
+    # 세션 조회 캐시 (프로세스 내 LRU + Redis)
+    SESSION_CACHE_ENABLED: bool = True
+    SESSION_CACHE_LOCAL_TTL: float = 10.0  # 프로세스 내 캐시 유지 시간(초) - 다른 워커의 무효화가 반영되는 최대 지연
+    SESSION_CACHE_REDIS_TTL: int = 300  # Redis 캐시 유지 시간(초)
+    SESSION_CACHE_MAX_ENTRIES: int = 10000
     JWT_SECRET: str
 
     # AI Model Settings - from .env
@@ -61,11 +66,36 @@ class CommonSettings(BaseSettings):
     UPSTAGE_API_KEY: str
     CLAUDE_API_KEY: str 
 
+    # 임베딩 요청 동시성/속도 제한 (제공자별로 프로세스 내에서 공유)
+    EMBEDDING_MAX_CONCURRENCY: int = 4  # 동시에 진행할 배치 요청 수
+    EMBEDDING_MAX_RETRIES: int = 3  # 배치별 재시도 횟수 (429, 5xx, 연결 오류)
+    OPENAI_EMBEDDING_TPM: int = 1000000
+    OPENAI_EMBEDDING_RPM: int = 3000
+    UPSTAGE_EMBEDDING_TPM: int = 300000
+    UPSTAGE_EMBEDDING_RPM: int = 100
+    GOOGLE_EMBEDDING_RPM: int = 600
+
     # Redis 설정
     REDIS_HOST: str 
     REDIS_PORT: int 
     REDIS_URL: str
     REDIS_CACHE_EXPIRE: int = int(os.getenv("REDIS_CACHE_EXPIRE", "3600"))  # 1시간
+    REDIS_MAX_CONNECTIONS: int = 50  # 비동기 클라이언트(AsyncRedisClient) 공유 커넥션 풀 크기
+    REDIS_POOL_TIMEOUT: int = 5  # 공유 커넥션 풀이 가득 찼을 때 연결 반환을 기다리는 시간 (초)
+    DOCUMENT_STATUS_STREAM_TIMEOUT: int = 600  # 문서 상태 스트림(SSE) 최대 유지 시간 (초)
+    DOCUMENT_STATUS_STREAM_MAX_SUBSCRIPTIONS: int = 100  # 프로세스당 동시 문서 상태 구독 수 (구독 전용 커넥션 풀 크기)
+    DOCUMENT_STATUS_TTL: int = 86400  # Redis 문서 상태(doc_status) 유지 시간 (초, 1일)
+    # 대화 이력 저장소 (redis: 워커 간 공유, memory: 프로세스 내 LRU)
+    CONVERSATION_HISTORY_BACKEND: str = os.getenv("CONVERSATION_HISTORY_BACKEND", "redis")
+    CONVERSATION_HISTORY_MAX_TURNS: int = 10
+    CONVERSATION_HISTORY_TTL: int = 86400  # 1일
+    CONVERSATION_HISTORY_MAX_SESSIONS: int = 1000  # 로컬 LRU 최대 세션 수
+    # 에이전트 LLM 응답 캐시 (temperature=0 호출만, 기본 비활성화)
+    # 켜면 agent_llm_config.json에 response_cache가 설정된 에이전트(telegram_collector,
+    # question_analyzer_agent 등)의 응답이 캐시됩니다.
+    LLM_RESPONSE_CACHE_ENABLED: bool = False
+    LLM_RESPONSE_CACHE_TTL: int = 86400  # 1일
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 2000  # 에이전트별 최대 캐시 항목 수
     CELERY_BROKER_URL: str 
     CELERY_RESULT_BACKEND: str 
     
@@ -152,6 +182,8 @@ class CommonSettings(BaseSettings):
     # 추가 필드
     DEBUG: bool = False
     UPLOAD_DIR: str = "./uploads"
+    UPLOAD_MAX_CONCURRENCY: int = 4  # 다중 파일 업로드 시 동시에 처리(텍스트 추출)할 파일 수
+    UPLOAD_SPOOL_DIR: Optional[str] = None  # 업로드 파일 임시 저장 경로 (None이면 시스템 임시 디렉토리)
     CACHE_DIR: str = "./cache"
     GOOGLE_CLOUD_LOCATION: str = "us"
     OPENAI_MODEL_NAME: str = "gpt-4o-mini"
@@ -174,8 +206,23 @@ class CommonSettings(BaseSettings):
     CHUNK_OVERLAP:int
     # 임베딩 설정. 아직 안씀
     KAKAO_EMBEDDING_MODEL_PATH:str = "common/external/kf-deberta"
+    # 로컬 임베딩 엔진 (BGE-M3 등 sentence-transformers 모델)
+    LOCAL_EMBEDDING_DEVICE: str = "cpu"
+    LOCAL_EMBEDDING_BACKEND: str = "torch"  # torch 또는 onnx
+    LOCAL_EMBEDDING_QUANTIZE: bool = False  # CPU에서 int8 동적 양자화
+    LOCAL_EMBEDDING_MAX_BATCH_SIZE: int = 256  # 한 번에 모아서 처리할 최대 텍스트 수
+    LOCAL_EMBEDDING_BATCH_WAIT_MS: float = 5.0  # 동시 요청을 모으기 위한 대기 시간(ms)
+    LOCAL_EMBEDDING_ENCODE_BATCH_SIZE: int = 32
 
     # STOCKEASY
+    STOCKEASY_SPECULATIVE_RETRIEVAL: bool = False  # 종목이 지정된 질문은 질문 분석과 동시에 텔레그램/리포트 검색 시작
+    STOCKEASY_SPECULATIVE_STRICT_QUERY: bool = False  # 최종 검색 쿼리가 예측 검색 쿼리와 다르면 예측 검색 폐기
+    STOCKEASY_CONDENSE_ON_ARRIVAL: bool = True  # 검색 에이전트 결과가 도착하면 바로 소형 모델로 압축 (지식 통합/요약은 압축본 사용)
+    STOCKEASY_CONDENSE_MIN_CHARS: int = 4000  # 이보다 짧은 검색 결과는 압축하지 않고 원문 사용
+    STOCKEASY_CONDENSE_MAX_CONCURRENCY: int = 3  # 요청당 동시 압축 LLM 호출 수
+    STOCKEASY_CONDENSE_TIMEOUT: float = 15.0  # 압축 LLM 호출 마감 시간(초), 초과 시 원문 사용
+    STOCKEASY_SEARCH_QUORUM: int = 0  # 이 수 이상의 검색 에이전트가 성공하면 마감 시간 이후 나머지를 기다리지 않음 (0이면 모두 대기)
+    STOCKEASY_SEARCH_DEADLINE: float = 20.0  # 병렬 검색 마감 시간(초, 병렬 검색 시작 기준)
 
     # STOCKEASY
     TELEGRAM_CHANNEL_IDS: List[Dict[str, Any]] = []
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from common.core.database import get_db_async
 from common.core.database import AsyncSessionLocal
 from common.services.user import UserService
+from common.services.session_cache import get_session_cache
 from common.services.vector_store_manager import VectorStoreManager
 
 from common.models.user import Session
@@ -34,20 +35,33 @@ async def get_db():
 
 async def get_current_session(
     session_id: Optional[str] = Cookie(None),
-    response: Response = None,
-    db: AsyncSession = Depends(get_db_async)
+    response: Response = None
 ) -> Session:
-    """현재 세션 가져오기"""
-    try:
-        logger.info(f'세션 처리 시작 - 세션 ID: {session_id}')
-        user_service = UserService(db)
+    """
+    현재 세션 가져오기
 
+    세션 캐시(프로세스 내 LRU + Redis)에 있으면 DB를 조회하지 않고 반환하며,
+    캐시 미스일 때만 DB 세션을 열어 세션을 검증한 뒤 캐시에 저장합니다.
+    반환되는 세션은 DB 세션에 연결되어 있지 않으므로 속성 조회 용도로만 사용해야 합니다.
+    """
+    try:
         # 기존 세션이 있는 경우
         if session_id:
-            session = await user_service.get_active_session(session_id)
-            if session:
-                logger.info(f'유효한 세션 확인: {session.id}')
-                return session
+            session_cache = get_session_cache()
+            if session_cache:
+                session = await session_cache.get(session_id)
+                if session:
+                    logger.debug(f'캐시된 세션 확인: {session.id}')
+                    return session
+
+            logger.info(f'세션 처리 시작 - 세션 ID: {session_id}')
+            async with AsyncSessionLocal() as db:
+                session = await UserService(db).get_active_session(session_id)
+                if session:
+                    logger.info(f'유효한 세션 확인: {session.id}')
+                    if session_cache:
+                        await session_cache.set(session_id, session)
+                    return session
         logger.warning('세션이 없거나 만료됨')
         #status_code = status.HTTP_401_UNAUTHORIZED
         raise AuthenticationRedirectException(f'{settings.INTELLIO_URL}/error')
@@ -62,8 +76,7 @@ async def get_current_session(
         )
 
 async def get_current_user_uuid(
-    session: Session = Depends(get_current_session),
-    db: AsyncSession = Depends(get_db_async)
+    session: Session = Depends(get_current_session)
 ) -> Session:
     """현재 인증된 사용자 가져오기"""
     if not session or not session.is_authenticated or not session.user:
@@ -1,8 +1,18 @@
-"""Redis 클라이언트 구현"""
+"""Redis 클라이언트 구현
 
-from typing import Optional, Any, Dict
+- RedisClient: Celery 워커 등 동기 코드용 클라이언트
+- AsyncRedisClient: FastAPI 요청 처리용 비동기 클라이언트 (프로세스 내 공유 커넥션 풀)
+
+문서 상태는 doc_status:{문서ID} 키에 DOCUMENT_STATUS_TTL 동안 저장하고, 같은 파이프라인에서
+doc_status_events:{문서ID} 채널로 변경 이벤트를 발행합니다. 클라이언트는 폴링 대신 채널을 구독해
+상태 변경을 받을 수 있습니다. (구독은 공유 풀과 분리된 구독 전용 커넥션 풀 사용)
+"""
+
+from contextlib import asynccontextmanager
+from typing import Optional, Any, AsyncIterator, Dict, Sequence, Tuple
 import json
 from redis import Redis
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis as AsyncRedis
 from common.core.config import settings
 from datetime import datetime
 from uuid import UUID
@@ -24,12 +34,50 @@ DOCUMENT_STATUS = {
     'DELETED': 'DELETED'
 }
 
+
+class SubscriptionLimitError(Exception):
+    """동시 구독 수가 DOCUMENT_STATUS_STREAM_MAX_SUBSCRIPTIONS를 넘은 경우"""
+
+
+def _dumps_value(value: Any) -> str:
+    """Redis 저장용 문자열 변환 (dict/list는 JSON)"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def _loads_value(value: Optional[str]) -> Optional[Any]:
+    """Redis 값 복원 (JSON이 아니면 문자열 그대로)"""
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except (TypeError, json.JSONDecodeError):
+        return value
+
+
+def _build_document_status(doc_status: str, metadata: Optional[dict] = None, error: Optional[str] = None) -> Dict[str, Any]:
+    """doc_status 키에 저장하는 문서 상태 데이터 생성"""
+    status_data = {
+        'status': doc_status,
+        'updated_at': datetime.now(tz.tzutc()).isoformat()
+    }
+    if metadata:
+        status_data['metadata'] = metadata
+    if error:
+        status_data['error_message'] = error
+    return status_data
+
+
 class RedisClient:
     # Redis 키 접두사 상수
     TASK_STATUS_PREFIX = "task_status:"
     BATCH_STATUS_PREFIX = "batch_status:"
     DOCUMENT_STATUS_PREFIX = "doc_status:"
     DOCUMENT_PROGRESS_PREFIX = "doc_progress:"
+    DOCUMENT_STATUS_CHANNEL_PREFIX = "doc_status_events:"
     
     def __init__(self):
         logger.info(f"[RedisClient] Redis URL: {settings.REDIS_URL}")
@@ -46,12 +94,7 @@ class RedisClient:
             self.redis.delete(key)
             
             # 값을 JSON 문자열로 변환
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-            elif not isinstance(value, str):
-                value = str(value)
-                
-            self.redis.set(key, value, ex=expire)
+            self.redis.set(key, _dumps_value(value), ex=expire)
             return True
         except Exception as e:
             logger.error(f"Redis set_key error: {str(e)}")
@@ -60,14 +103,7 @@ class RedisClient:
     def get_key(self, key: str) -> Optional[Any]:
         """Redis에서 값을 조회"""
         try:
-            value = self.redis.get(key)
-            if value is None:
-                return None
-                
-            try:
-                return json.loads(value)
-            except (TypeError, json.JSONDecodeError):
-                return value
+            return _loads_value(self.redis.get(key))
         except Exception as e:
             logger.error(f"Redis get_key error: {str(e)}")
             return None
@@ -96,6 +132,42 @@ class RedisClient:
         except Exception as e:
             logger.error(f"Redis incr error: {str(e)}")
             return None
+
+    def incr_with_total(self, key: str, amount: int, total_key: str) -> Tuple[Optional[int], Optional[Any]]:
+        """key를 amount만큼 증가시키고 total_key 값을 함께 조회 (한 번의 파이프라인 왕복)
+
+        Returns:
+            Tuple[Optional[int], Optional[Any]]: (증가 후의 값, total_key 값). 실패시 (None, None).
+        """
+        try:
+            with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(key, amount)
+                pipe.get(total_key)
+                current, total = pipe.execute()
+            return current, _loads_value(total)
+        except Exception as e:
+            logger.error(f"Redis incr_with_total error: {str(e)}")
+            return None, None
+
+    def store_document_status(self, document_id: str, status_data: Dict[str, Any]) -> bool:
+        """문서 상태 저장 및 상태 변경 이벤트 발행 (한 번의 파이프라인 왕복)"""
+        try:
+            document_id = str(document_id)
+            with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(
+                    self._make_key(self.DOCUMENT_STATUS_PREFIX, document_id),
+                    json.dumps(status_data),
+                    ex=settings.DOCUMENT_STATUS_TTL
+                )
+                pipe.publish(
+                    self._make_key(self.DOCUMENT_STATUS_CHANNEL_PREFIX, document_id),
+                    json.dumps({'document_id': document_id, **status_data})
+                )
+                pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis store_document_status error: {str(e)}")
+            return False
             
     def set_task_status(self, task_id: str, status: str, result: Optional[Any] = None) -> bool:
         """Celery 작업 상태 저장"""
@@ -116,15 +188,7 @@ class RedisClient:
 
     def set_document_status(self, document_id: str, status: str, error_message: Optional[str] = None) -> bool:
         """문서 상태 설정"""
-        status_data = {
-            'status': status,
-            'updated_at': datetime.now(tz.tzutc()).isoformat()
-        }
-        if error_message:
-            status_data['error_message'] = error_message
-            
-        key = self._make_key(self.DOCUMENT_STATUS_PREFIX, str(document_id))
-        return self.set_key(key, status_data)
+        return self.store_document_status(document_id, _build_document_status(status, error=error_message))
 
     def get_document_status(self, document_id: str) -> Optional[Dict[str, Any]]:
         """문서 상태 조회"""
@@ -140,18 +204,7 @@ class RedisClient:
     ) -> bool:
         """문서 상태 업데이트"""
         try:
-            status_data = {
-                'status': doc_status,
-                'updated_at': datetime.now(tz.tzutc()).isoformat()
-            }
-            
-            if metadata:
-                status_data['metadata'] = metadata
-            if error:
-                status_data['error_message'] = error
-                
-            key = self._make_key(self.DOCUMENT_STATUS_PREFIX, str(doc_id))
-            return self.set_key(key, status_data)
+            return self.store_document_status(doc_id, _build_document_status(doc_status, metadata, error))
             
         except Exception as e:
             logger.error(f"Redis update_document_status error: {str(e)}")
@@ -168,5 +221,225 @@ class RedisClient:
         return self.update_document_status(doc_id, doc_status, metadata, error)
 
 
+class AsyncRedisClient:
+    """비동기 Redis 클라이언트 (FastAPI 요청 처리용)
+
+    커넥션 풀은 첫 사용 시 생성해 프로세스 내 모든 요청이 공유합니다.
+    세션 캐시, 대화 이력, LLM 응답 캐시 등 다른 비동기 Redis 사용처도 get_client()로 같은 풀을 사용합니다.
+    풀이 가득 차면 REDIS_POOL_TIMEOUT초 동안 반환된 연결을 기다립니다.
+    여러 키 조회는 MGET, 여러 명령은 파이프라인으로 한 번에 전송합니다.
+    상태 변경 구독은 오래 연결을 점유하므로 별도의 구독 전용 풀을 사용하고 동시 구독 수를 제한합니다.
+    """
+    DOCUMENT_STATUS_PREFIX = RedisClient.DOCUMENT_STATUS_PREFIX
+    DOCUMENT_STATUS_CHANNEL_PREFIX = RedisClient.DOCUMENT_STATUS_CHANNEL_PREFIX
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_subscriptions: Optional[int] = None
+    ):
+        """
+        Args:
+            redis_url: Redis 서버 URL (None이면 settings.REDIS_URL)
+            max_connections: 커넥션 풀 최대 연결 수 (None이면 settings.REDIS_MAX_CONNECTIONS)
+            max_subscriptions: 동시 구독 수 (None이면 settings.DOCUMENT_STATUS_STREAM_MAX_SUBSCRIPTIONS)
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.max_connections = max_connections or settings.REDIS_MAX_CONNECTIONS
+        self.max_subscriptions = max_subscriptions or settings.DOCUMENT_STATUS_STREAM_MAX_SUBSCRIPTIONS
+        self.active_subscriptions = 0
+        self._redis: Optional[AsyncRedis] = None
+        self._pubsub_redis: Optional[AsyncRedis] = None
+
+    @property
+    def redis(self) -> AsyncRedis:
+        if self._redis is None:
+            pool = BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                decode_responses=True
+            )
+            self._redis = AsyncRedis(connection_pool=pool)
+        return self._redis
+
+    def get_client(self) -> AsyncRedis:
+        """공유 커넥션 풀을 사용하는 비동기 Redis 클라이언트 반환 (decode_responses=True)"""
+        return self.redis
+
+    @property
+    def pubsub_redis(self) -> AsyncRedis:
+        """구독 전용 클라이언트 (공유 풀이 장시간 구독으로 고갈되지 않도록 분리)"""
+        if self._pubsub_redis is None:
+            pool = ConnectionPool.from_url(
+                self.redis_url, max_connections=self.max_subscriptions, decode_responses=True
+            )
+            self._pubsub_redis = AsyncRedis(connection_pool=pool)
+        return self._pubsub_redis
+
+    def _make_key(self, prefix: str, key: str) -> str:
+        """Redis 키 생성"""
+        return f"{prefix}{key}"
+
+    async def set_key(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
+        """Redis에 키-값 쌍을 저장"""
+        try:
+            await self.redis.set(key, _dumps_value(value), ex=expire)
+            return True
+        except Exception as e:
+            logger.error(f"Redis async set_key error: {str(e)}")
+            return False
+
+    async def get_key(self, key: str) -> Optional[Any]:
+        """Redis에서 값을 조회"""
+        try:
+            return _loads_value(await self.redis.get(key))
+        except Exception as e:
+            logger.error(f"Redis async get_key error: {str(e)}")
+            return None
+
+    async def get_keys(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """여러 키를 한 번의 MGET으로 조회 (없는 키는 None)"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            values = await self.redis.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis async get_keys error: {str(e)}")
+            return {key: None for key in keys}
+        return {key: _loads_value(value) for key, value in zip(keys, values)}
+
+    async def delete_key(self, *keys: str) -> bool:
+        """Redis에서 키를 삭제 (여러 키는 한 번의 DEL)"""
+        if not keys:
+            return True
+        try:
+            await self.redis.delete(*keys)
+            return True
+        except Exception as e:
+            logger.error(f"Redis async delete_key error: {str(e)}")
+            return False
+
+    async def incr(self, key: str, amount: int = 1) -> Optional[int]:
+        """키의 값을 지정된 양만큼 증가 (실패시 None)"""
+        try:
+            return await self.redis.incr(key, amount)
+        except Exception as e:
+            logger.error(f"Redis async incr error: {str(e)}")
+            return None
+
+    async def set_document_status(
+        self,
+        document_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+        metadata: Optional[dict] = None
+    ) -> bool:
+        """문서 상태 저장 및 상태 변경 이벤트 발행 (한 번의 파이프라인 왕복)"""
+        document_id = str(document_id)
+        status_data = _build_document_status(status, metadata, error_message)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(
+                    self._make_key(self.DOCUMENT_STATUS_PREFIX, document_id),
+                    json.dumps(status_data),
+                    ex=settings.DOCUMENT_STATUS_TTL
+                )
+                pipe.publish(
+                    self._make_key(self.DOCUMENT_STATUS_CHANNEL_PREFIX, document_id),
+                    json.dumps({'document_id': document_id, **status_data})
+                )
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis async set_document_status error: {str(e)}")
+            return False
+
+    async def get_document_status(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """문서 상태 조회"""
+        return await self.get_key(self._make_key(self.DOCUMENT_STATUS_PREFIX, str(document_id)))
+
+    async def get_document_statuses(self, document_ids: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 문서의 상태를 한 번의 MGET으로 조회 (문서ID -> 상태 데이터, 없으면 None)"""
+        document_ids = [str(document_id) for document_id in document_ids]
+        values = await self.get_keys([self._make_key(self.DOCUMENT_STATUS_PREFIX, document_id) for document_id in document_ids])
+        return {
+            document_id: values.get(self._make_key(self.DOCUMENT_STATUS_PREFIX, document_id))
+            for document_id in document_ids
+        }
+
+    async def delete_document_status(self, document_id: str) -> bool:
+        """문서 상태 삭제 및 DELETED 이벤트 발행"""
+        document_id = str(document_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(self._make_key(self.DOCUMENT_STATUS_PREFIX, document_id))
+                pipe.publish(
+                    self._make_key(self.DOCUMENT_STATUS_CHANNEL_PREFIX, document_id),
+                    json.dumps({'document_id': document_id, **_build_document_status(DOCUMENT_STATUS['DELETED'])})
+                )
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis async delete_document_status error: {str(e)}")
+            return False
+
+    @asynccontextmanager
+    async def subscribe_document_status(
+        self,
+        document_ids: Sequence[str],
+        idle_timeout: float = 1.0
+    ) -> AsyncIterator[AsyncIterator[Optional[Dict[str, Any]]]]:
+        """문서 상태 변경 이벤트 구독
+
+        컨텍스트에 들어가는 시점에 구독이 완료되므로, 구독 후 현재 상태를 조회하면 그 사이의 변경도 놓치지 않습니다.
+        반환하는 이터레이터는 이벤트({'document_id', 'status', 'updated_at', ...})를 내보내며,
+        idle_timeout 동안 이벤트가 없으면 None을 내보냅니다. (연결 확인/종료 조건 확인용)
+        동시 구독 수가 max_subscriptions에 도달하면 SubscriptionLimitError가 발생합니다. (폴링 조회로 대체)
+
+        사용 예:
+            async with async_redis_client.subscribe_document_status(ids) as events:
+                async for event in events:
+                    ...
+        """
+        if self.active_subscriptions >= self.max_subscriptions:
+            raise SubscriptionLimitError(f"문서 상태 동시 구독 수 초과 ({self.max_subscriptions}개)")
+        channels = [self._make_key(self.DOCUMENT_STATUS_CHANNEL_PREFIX, str(document_id)) for document_id in document_ids]
+        self.active_subscriptions += 1
+        pubsub = self.pubsub_redis.pubsub()
+        try:
+            await pubsub.subscribe(*channels)
+        except Exception:
+            self.active_subscriptions -= 1
+            await pubsub.aclose()
+            raise
+
+        async def events() -> AsyncIterator[Optional[Dict[str, Any]]]:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=idle_timeout)
+                yield _loads_value(message['data']) if message else None
+
+        try:
+            yield events()
+        finally:
+            self.active_subscriptions -= 1
+            try:
+                await pubsub.unsubscribe(*channels)
+                await pubsub.aclose()
+            except Exception as e:
+                logger.warning(f"Redis 문서 상태 구독 해제 실패: {str(e)}")
+
+    async def close(self) -> None:
+        """커넥션 풀 종료 (공유 풀, 구독 전용 풀)"""
+        for attr in ("_redis", "_pubsub_redis"):
+            redis = getattr(self, attr)
+            if redis is not None:
+                setattr(self, attr, None)
+                await redis.aclose(close_connection_pool=True)
+
+
 # Redis 클라이언트 인스턴스 생성
 redis_client = RedisClient()
+async_redis_client = AsyncRedisClient()
@@ -6,7 +6,8 @@
 """
 
 import time
-from typing import Dict, Any, Optional, Callable, List, Tuple, Union, Awaitable
+from collections import deque
+from typing import Dict, Any, Optional, Callable, List, Tuple, Union, Awaitable, Deque
 from loguru import logger
 from functools import lru_cache
 import asyncio
@@ -14,8 +15,138 @@ import asyncio
 from langchain_core.language_models import BaseChatModel
 from langchain_core.callbacks import BaseCallbackHandler
 
+from common.core.config import settings
 from common.services.llm_config.llm_config_manager import get_agent_llm_config, llm_config_manager
 from common.services.llm_factory import LLMFactory
+from common.services.llm_response_cache import get_llm_response_cache
+
+
+class ProviderHealth:
+    """
+    제공자(provider + 모델)별 최근 지연시간/오류 통계와 회로 차단기
+
+    - 최근 window_size 건의 성공 지연시간과 성공/실패 결과를 보관합니다.
+    - 최근 결과의 실패율이 failure_threshold 이상이면 open_seconds 동안 호출을 차단(open)합니다.
+    - 차단 시간이 지나면 한 건의 시험 호출(half_open)만 허용하고, 성공하면 다시 닫습니다(closed).
+    """
+
+    def __init__(
+        self,
+        key: str,
+        window_size: int = 50,
+        failure_threshold: float = 0.5,
+        min_requests: int = 5,
+        open_seconds: float = 30.0
+    ):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self.latencies: Deque[float] = deque(maxlen=window_size)
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.state = "closed"
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self.stats = {"successes": 0, "failures": 0, "cancelled": 0, "rejected": 0, "opened": 0}
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (half_open 상태에서는 시험 호출 한 건만 허용)"""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.open_seconds:
+                self.stats["rejected"] += 1
+                return False
+            self.state = "half_open"
+            self._probe_in_flight = False
+
+        if self.state == "half_open":
+            if self._probe_in_flight:
+                self.stats["rejected"] += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self, latency: float) -> None:
+        """성공 호출의 지연시간 기록 (half_open이면 차단 해제)"""
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.stats["successes"] += 1
+        if self.state != "closed":
+            logger.info(f"[회로 차단기] 복구: {self.key}")
+            self.state = "closed"
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """실패(오류/마감 시간 초과) 기록 후 실패율이 높으면 차단"""
+        self.outcomes.append(False)
+        self.stats["failures"] += 1
+        if self.state == "half_open":
+            self._open()
+        elif self.state == "closed" and len(self.outcomes) >= self.min_requests and self.failure_rate() >= self.failure_threshold:
+            self._open()
+
+    def record_cancelled(self) -> None:
+        """헤지 경쟁에서 져서 취소된 호출 (성공/실패 통계에는 반영하지 않음)"""
+        self.stats["cancelled"] += 1
+        if self.state == "half_open":
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self.stats["opened"] += 1
+        logger.warning(f"[회로 차단기] 차단: {self.key}, 실패율={self.failure_rate():.2f}, {self.open_seconds}초 동안 호출 제외")
+
+    def failure_rate(self) -> float:
+        """최근 결과의 실패율"""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def latency_quantile(self, quantile: float = 0.95) -> Optional[float]:
+        """최근 성공 지연시간의 분위수 (표본이 min_requests 미만이면 None)"""
+        if len(self.latencies) < self.min_requests:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(quantile * len(ordered)))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 조회용 요약"""
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 4),
+            "p50_latency": self.latency_quantile(0.5),
+            "p95_latency": self.latency_quantile(0.95),
+            "samples": len(self.latencies),
+            **self.stats
+        }
+
+
+# 제공자별 상태 (프로세스 전역, 에이전트 간 공유)
+provider_health: Dict[str, ProviderHealth] = {}
+
+def get_provider_health(config: Dict[str, Any], breaker_settings: Optional[Dict[str, Any]] = None) -> ProviderHealth:
+    """
+    LLM 설정에 해당하는 제공자 상태 반환 (없으면 생성)
+
+    Args:
+        config: LLM 설정 (provider, model_name)
+        breaker_settings: 회로 차단기 설정 (fallback_settings.circuit_breaker)
+    """
+    key = f"{config.get('provider', '')}:{config.get('model_name', '')}"
+    if key not in provider_health:
+        breaker_settings = breaker_settings or {}
+        provider_health[key] = ProviderHealth(
+            key,
+            window_size=breaker_settings.get("window_size", 50),
+            failure_threshold=breaker_settings.get("failure_threshold", 0.5),
+            min_requests=breaker_settings.get("min_requests", 5),
+            open_seconds=breaker_settings.get("open_seconds", 30.0)
+        )
+    return provider_health[key]
+
 
 class AgentLLM:
     """에이전트별 LLM 관리 클래스"""
@@ -33,6 +164,8 @@ class AgentLLM:
         self.llm_streaming: Optional[BaseChatModel] = None
         self.streaming_callback: Optional[Callable[[str], None]] = None
         self.fallback_settings = llm_config_manager.get_fallback_settings()
+        # 폴백 제공자별 LLM 인스턴스 (fallback_settings.providers 인덱스 기준)
+        self._fallback_llms: Dict[int, BaseChatModel] = {}
         
         logger.info(f"AgentLLM 초기화: {agent_name}, provider={self.llm_config.get('provider')}, model={self.llm_config.get('model_name')}")
         
@@ -73,6 +206,7 @@ class AgentLLM:
             # 설정 새로고침
             self.llm_config = get_agent_llm_config(self.agent_name)
             self.fallback_settings = llm_config_manager.get_fallback_settings()
+            self._fallback_llms = {}
             
             # LLM 생성 (폴백 포함)
             self.llm = self._create_llm_with_fallback()
@@ -195,10 +329,59 @@ class AgentLLM:
             logger.error(f"모든 폴백 시도 실패: {self.agent_name}")
             raise last_exception
     
+    def _get_response_cache_options(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        응답 캐시 사용 여부 확인 후 캐시 옵션(ttl, max_entries) 반환
+        
+        에이전트 설정의 response_cache(true 또는 옵션 딕셔너리)로 개별 활성화하며,
+        temperature가 0이 아니거나 스트리밍/콜백 설정이 있는 호출은 캐시하지 않습니다.
+        
+        Returns:
+            캐시 옵션 (캐시를 사용하지 않으면 None)
+        """
+        options = self.llm_config.get("response_cache")
+        if not options or not settings.LLM_RESPONSE_CACHE_ENABLED:
+            return None
+        if self.llm_config.get("temperature", 0) != 0 or self.llm_config.get("streaming"):
+            return None
+        if kwargs.get("temperature", 0) != 0 or kwargs.get("stream") or "callbacks" in kwargs or kwargs.get("config"):
+            return None
+        return options if isinstance(options, dict) else {}
+    
+    def _make_response_cache_key(self, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """응답 캐시 키 생성 (토큰 추적 인자 제외)"""
+        call_kwargs = {key: value for key, value in kwargs.items() if key not in ("user_id", "project_type", "db")}
+        return get_llm_response_cache().make_key(self.agent_name, self.get_model_name(), args, call_kwargs)
+    
     def invoke_with_fallback(self, *args, **kwargs) -> Any:
         """
         폴백 메커니즘을 사용하여 LLM 동기 호출
         
+        에이전트 설정에서 response_cache가 활성화된 temperature=0 호출은 응답 캐시를 먼저 조회합니다.
+        캐시 적중 시에는 LLM을 호출하지 않으므로 토큰 사용량도 기록하지 않습니다.
+        cache_validator(응답 -> bool)를 지정하면 검증을 통과한 응답만 캐시에 저장하고,
+        검증에 실패한 캐시 항목은 미스로 처리합니다. (예: 구조화된 출력 파싱 실패 응답)
+        """
+        cache_validator = kwargs.pop("cache_validator", None)
+        cache_options = self._get_response_cache_options(kwargs)
+        if cache_options is None:
+            return self._invoke_with_fallback(*args, **kwargs)
+        
+        cache = get_llm_response_cache()
+        cache_key = self._make_response_cache_key(args, kwargs)
+        cached = cache.get(self.agent_name, cache_key)
+        if cached is not None and (cache_validator is None or cache_validator(cached)):
+            return cached
+        
+        result = self._invoke_with_fallback(*args, **kwargs)
+        if cache_validator is None or cache_validator(result):
+            cache.set(self.agent_name, cache_key, result, ttl=cache_options.get("ttl"), max_entries=cache_options.get("max_entries"))
+        return result
+    
+    def _invoke_with_fallback(self, *args, **kwargs) -> Any:
+        """
+        폴백 메커니즘을 사용하여 LLM 동기 호출
+        
         주 LLM이 실패하면 폴백 LLM을 차례로 시도합니다.
         
         Args:
@@ -367,7 +550,34 @@ class AgentLLM:
         """
         폴백 메커니즘을 사용하여 LLM 비동기 호출
         
+        에이전트 설정에서 response_cache가 활성화된 temperature=0 호출은 응답 캐시를 먼저 조회합니다.
+        캐시 적중 시에는 LLM을 호출하지 않으므로 토큰 사용량도 기록하지 않습니다.
+        cache_validator(응답 -> bool)를 지정하면 검증을 통과한 응답만 캐시에 저장하고,
+        검증에 실패한 캐시 항목은 미스로 처리합니다. (예: 구조화된 출력 파싱 실패 응답)
+        """
+        cache_validator = kwargs.pop("cache_validator", None)
+        cache_options = self._get_response_cache_options(kwargs)
+        if cache_options is None:
+            return await self._ainvoke_with_fallback(*args, **kwargs)
+        
+        cache = get_llm_response_cache()
+        cache_key = self._make_response_cache_key(args, kwargs)
+        cached = await cache.aget(self.agent_name, cache_key)
+        if cached is not None and (cache_validator is None or cache_validator(cached)):
+            return cached
+        
+        result = await self._ainvoke_with_fallback(*args, **kwargs)
+        if cache_validator is None or cache_validator(result):
+            await cache.aset(self.agent_name, cache_key, result, ttl=cache_options.get("ttl"), max_entries=cache_options.get("max_entries"))
+        return result
+    
+    async def _ainvoke_with_fallback(self, *args, **kwargs) -> Any:
+        """
+        폴백 메커니즘을 사용하여 LLM 비동기 호출
+        
         주 LLM이 실패하면 폴백 LLM을 차례로 시도합니다.
+        fallback_settings.hedging이 활성화되어 있으면 응답이 늦을 때 폴백 LLM을 동시에 호출(헤지)하고,
+        에이전트별 마감 시간(deadline_seconds)과 제공자별 회로 차단기를 적용합니다. (_ainvoke_hedged 참고)
         
         Args:
             *args: LLM.ainvoke에 전달할 위치 인자
@@ -377,6 +587,7 @@ class AgentLLM:
             LLM 응답
             
         Raises:
+            asyncio.TimeoutError: 마감 시간 초과
             Exception: 모든 폴백이 실패하면 마지막 예외 발생
         """
         # 토큰 사용량 추적을 위한 매개변수 추출
@@ -428,171 +639,254 @@ class AgentLLM:
                 # 추적 없이 호출
                 return await self.get_llm().ainvoke(*args, **kwargs)
 
-        # 폴백 활성화 시 재시도 로직
-        last_exception = None
-        base_providers = [None]  # None은 원래 설정
+        # 폴백 활성화 시 헤지/마감 시간 기반 호출
+        result, winner_config = await self._ainvoke_hedged(args, kwargs, user_id=user_id, project_type=project_type)
+        
+        # 토큰 추적 필요시: 최종 채택된(승리한) 호출의 모델 이름과 사용량만 기록
+        if use_token_tracking:
+            async with track_token_usage(
+                user_id=user_id,
+                project_type=project_type,
+                token_type="llm",
+                model_name=winner_config.get("model_name"),
+                db_getter=db
+            ) as tracker:
+                usage_info = self._extract_usage_info(result)
+                if usage_info:
+                    # 추출된 토큰 정보 사용
+                    tracker.add_tokens(
+                        prompt_tokens=usage_info['prompt_tokens'],
+                        completion_tokens=usage_info['completion_tokens'],
+                        total_tokens=usage_info['total_tokens']
+                    )
+                else:
+                    logger.warning("[토큰 추적][비동기] usage_metadata를 찾을 수 없습니다.")
+        
+        return result
+    
+    def _get_deadline_seconds(self) -> Optional[float]:
+        """
+        에이전트 호출 마감 시간(초) 반환
+        
+        에이전트 설정의 deadline_seconds를 우선 사용하고, 없으면 fallback_settings.default_deadline_seconds를 사용합니다.
+        """
+        deadline = self.llm_config.get("deadline_seconds") or self.fallback_settings.get("default_deadline_seconds")
+        return float(deadline) if deadline else None
+    
+    def _get_candidates(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        호출 후보 목록 반환 [(인덱스, 설정)]
+        
+        인덱스 -1은 에이전트 기본 설정, 0 이상은 fallback_settings.providers의 인덱스입니다.
+        """
         fallback_providers = self.fallback_settings.get("providers", [])
         max_retries = self.fallback_settings.get("max_retries", 3)
-        providers_to_try = base_providers + fallback_providers[:max_retries-1]
+        return [(-1, self.llm_config)] + list(enumerate(fallback_providers[:max_retries-1]))
+    
+    def _get_candidate_llm(self, candidate_idx: int) -> BaseChatModel:
+        """후보 인덱스에 해당하는 LLM 인스턴스 반환 (폴백 LLM은 인덱스별로 재사용)"""
+        if candidate_idx < 0:
+            return self.get_llm()
+        if candidate_idx not in self._fallback_llms:
+            fallback_config = self.fallback_settings.get("providers", [])[candidate_idx]
+            self._fallback_llms[candidate_idx] = LLMFactory.create_llm_from_config(fallback_config)
+        return self._fallback_llms[candidate_idx]
+    
+    @staticmethod
+    def _get_hedge_delay(health: ProviderHealth, hedging: Dict[str, Any]) -> float:
+        """
+        헤지 요청 지연(초) 계산
         
-        for provider_idx, provider_config in enumerate(providers_to_try):
-            try:
-                # 재시도 간격
-                if provider_idx > 0:
-                    await asyncio.sleep(1.0)  # 비동기 대기
+        진행 중인 제공자의 최근 지연시간 분위수(기본 p95)를 min/max 범위로 제한해 사용하고,
+        표본이 부족하면 initial_delay_seconds를 사용합니다.
+        """
+        delay = health.latency_quantile(hedging.get("quantile", 0.95))
+        if delay is None:
+            return hedging.get("initial_delay_seconds", 5.0)
+        return min(max(delay, hedging.get("min_delay_seconds", 0.5)), hedging.get("max_delay_seconds", 15.0))
+    
+    @staticmethod
+    async def _timed_ainvoke(llm: BaseChatModel, health: ProviderHealth, args: tuple, kwargs: dict) -> Any:
+        """
+        LLM 비동기 호출 후 결과에 따라 제공자 상태(지연시간/오류)를 기록
+        
+        취소된 호출은 취소한 쪽(_ainvoke_hedged)에서 사유(헤지 경쟁/마감 시간)에 맞게 한 번만 기록합니다.
+        """
+        started = time.monotonic()
+        try:
+            result = await llm.ainvoke(*args, **kwargs)
+        except Exception:
+            health.record_failure()
+            raise
+        health.record_success(time.monotonic() - started)
+        return result
+    
+    async def _ainvoke_hedged(
+        self,
+        args: tuple,
+        kwargs: dict,
+        user_id: Any = None,
+        project_type: Optional[str] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        헤지 요청과 마감 시간을 적용한 비동기 호출
+        
+        - 회로 차단기가 열린 제공자는 건너뜁니다.
+        - 호출이 실패하면 대기 없이 다음 후보를 호출합니다.
+        - 헤지가 활성화되어 있으면 진행 중인 호출이 p95 기반 지연 안에 끝나지 않을 때 다음 후보를 동시에 호출하고,
+          먼저 성공한 응답을 채택한 뒤 나머지 호출은 취소합니다.
+        - 마감 시간이 지나면 진행 중인 호출을 모두 취소하고 실패로 기록합니다.
+        - 헤지는 에이전트 설정의 hedging(true/false)을 우선 사용하고, 없으면 fallback_settings.hedging.enabled를 따릅니다.
+        
+        Returns:
+            (LLM 응답, 응답한 제공자 설정)
+            
+        Raises:
+            asyncio.TimeoutError: 마감 시간 초과
+            Exception: 모든 후보가 실패하면 마지막 예외 발생
+        """
+        hedging = self.fallback_settings.get("hedging", {})
+        hedging_enabled = bool(self.llm_config.get("hedging", hedging.get("enabled", False)))
+        breaker_settings = self.fallback_settings.get("circuit_breaker", {})
+        candidates = self._get_candidates()
+        
+        loop = asyncio.get_running_loop()
+        deadline_seconds = self._get_deadline_seconds()
+        deadline = loop.time() + deadline_seconds if deadline_seconds else None
+        
+        pending: Dict[asyncio.Task, Tuple[int, Dict[str, Any], ProviderHealth]] = {}
+        next_candidate = 0
+        latest_health: Optional[ProviderHealth] = None
+        last_exception: Optional[BaseException] = None
+        timed_out = False
+        
+        def launch_next() -> None:
+            """다음 후보 호출 시작 (차단되었거나 생성에 실패한 후보는 건너뜀)"""
+            nonlocal next_candidate, latest_health, last_exception
+            while next_candidate < len(candidates):
+                candidate_idx, config = candidates[next_candidate]
+                next_candidate += 1
+                health = get_provider_health(config, breaker_settings)
+                if not health.allow_request():
+                    logger.info(f"[회로 차단기] 차단된 제공자 건너뜀: {self.agent_name}, {health.key}")
+                    continue
+                try:
+                    llm = self._get_candidate_llm(candidate_idx)
+                except Exception as e:
+                    logger.warning(f"폴백 LLM 생성 실패: {self.agent_name}, {health.key}, 오류: {str(e)}")
+                    health.record_failure()
+                    last_exception = e
+                    continue
                 
-                # 로깅
-                if provider_idx == 0:
-                    logger.info(f"기본 LLM으로 비동기 호출: {self.agent_name}, provider={self.llm_config.get('provider')}, userid={user_id}, project_type={project_type}")
+                if candidate_idx < 0:
+                    logger.info(f"기본 LLM으로 비동기 호출: {self.agent_name}, provider={config.get('provider')}, userid={user_id}, project_type={project_type}")
                 else:
-                    logger.info(f"폴백 LLM으로 비동기 호출 시도 ({provider_idx}/{max_retries}): provider={provider_config.get('provider')}")
+                    logger.info(f"폴백 LLM으로 비동기 호출 시도 ({candidate_idx+1}/{len(candidates)-1}): provider={config.get('provider')}, 진행 중 호출={len(pending)}")
+                task = asyncio.ensure_future(self._timed_ainvoke(llm, health, args, kwargs))
+                pending[task] = (candidate_idx, config, health)
+                latest_health = health
+                return
+        
+        try:
+            while True:
+                if not pending:
+                    if next_candidate >= len(candidates):
+                        break
+                    launch_next()
+                    continue
                 
-                # 토큰 추적 필요시
-                if use_token_tracking:
-                    # 현재 설정에 맞는 모델 이름 가져오기
-                    model_name = self.get_model_name() if provider_idx == 0 else provider_config.get("model_name")
-                    
-                    async with track_token_usage(
-                        user_id=user_id,
-                        project_type=project_type,
-                        token_type="llm",
-                        model_name=model_name,
-                        db_getter=db
-                    ) as tracker:
-                        # 필요시 LLM 설정 변경
-                        if provider_idx > 0:
-                            # 임시 폴백 LLM 설정
-                            self.llm_config = provider_config
-                            self.llm = None  # 다음 get_llm()에서 새로 생성하게 함
-                        
-                        # 비동기 LLM 호출
-                        current_llm = self.get_llm()
-                        #logger.info(f"[토큰 추적][비동기] agens: {current_llm.name}")
-                        result = await current_llm.ainvoke(*args, **kwargs)
-                        
-                        result_dict = result.model_dump() if hasattr(result, 'dict') else vars(result)
-                        logger.info(f"[토큰 추적][비동기] agent result[{self.agent_name}] keys: {result_dict.keys()}")
-                        
-                        # API 응답에서 토큰 사용량 추출 시도
-                        usage_info = None
-                        
-                        # 1. 직접 usage_metadata 속성 확인
-                        if hasattr(result, 'usage_metadata'):
-                            usage_info = {
-                                "prompt_tokens": result.usage_metadata.get('input_tokens', 0),
-                                "completion_tokens": result.usage_metadata.get('output_tokens', 0),
-                                "total_tokens": result.usage_metadata.get('total_tokens', 0)
-                            }
-                        # 2. _message 속성에서 확인 (구조화된 출력의 경우)
-                        elif hasattr(result, '_message') and hasattr(result._message, 'usage_metadata'):
-                            logger.info(f"[토큰 추적][비동기] _message 속성에서 usage_metadata 찾음")
-                            usage_info = {
-                                "prompt_tokens": result._message.usage_metadata.get('input_tokens', 0),
-                                "completion_tokens": result._message.usage_metadata.get('output_tokens', 0),
-                                "total_tokens": result._message.usage_metadata.get('total_tokens', 0)
-                            }
-                        # 3. underlying_response 속성에서 확인
-                        elif hasattr(result, 'underlying_response') and hasattr(result.underlying_response, 'usage_metadata'):
-                            logger.info(f"[토큰 추적][비동기] underlying_response 속성에서 usage_metadata 찾음")
-                            usage_info = {
-                                "prompt_tokens": result.underlying_response.usage_metadata.get('input_tokens', 0),
-                                "completion_tokens": result.underlying_response.usage_metadata.get('output_tokens', 0),
-                                "total_tokens": result.underlying_response.usage_metadata.get('total_tokens', 0)
-                            }
-                        # 4. _raw_response 속성에서 확인
-                        elif hasattr(result, '_raw_response') and hasattr(result._raw_response, 'usage_metadata'):
-                            logger.info(f"[토큰 추적][비동기] _raw_response 속성에서 usage_metadata 찾음")
-                            usage_info = {
-                                "prompt_tokens": result._raw_response.usage_metadata.get('input_tokens', 0),
-                                "completion_tokens": result._raw_response.usage_metadata.get('output_tokens', 0),
-                                "total_tokens": result._raw_response.usage_metadata.get('total_tokens', 0)
-                            }
-                        # 5. _original_message 속성에서 확인 (구조화된 출력 개선)
-                        elif hasattr(result, '_original_message') and hasattr(result._original_message, 'usage_metadata'):
-                            logger.info(f"[토큰 추적][비동기] _original_message 속성에서 usage_metadata 찾음")
-                            usage_info = {
-                                "prompt_tokens": result._original_message.usage_metadata.get('input_tokens', 0),
-                                "completion_tokens": result._original_message.usage_metadata.get('output_tokens', 0),
-                                "total_tokens": result._original_message.usage_metadata.get('total_tokens', 0)
-                            }
-                        # 6. 마지막으로 모든 속성을 검사하여 usage_metadata 찾기
-                        else:
-                            # 디버깅을 위해 모든 속성 로깅
-                            all_attrs = dir(result)
-                            logger.info(f"[토큰 추적][비동기] result의 모든 속성: {all_attrs}")
-                            
-                            # 특정 속성들이 있는지 확인하고 로깅
-                            for attr_name in all_attrs:
-                                if attr_name.startswith('_') and not attr_name.startswith('__'):
-                                    attr_value = getattr(result, attr_name, None)
-                                    if attr_value is not None:
-                                        logger.info(f"[토큰 추적][비동기] 속성 {attr_name}의 타입: {type(attr_value)}")
-                                        
-                                        # 숨겨진 속성에서 usage_metadata 확인
-                                        if hasattr(attr_value, 'usage_metadata'):
-                                            logger.info(f"[토큰 추적][비동기] {attr_name}.usage_metadata 찾음!")
-                                            usage_info = {
-                                                "prompt_tokens": attr_value.usage_metadata.get('input_tokens', 0),
-                                                "completion_tokens": attr_value.usage_metadata.get('output_tokens', 0),
-                                                "total_tokens": attr_value.usage_metadata.get('total_tokens', 0)
-                                            }
-                                            break
-                        
-                        if usage_info:
-                            # 추출된 토큰 정보 사용
-                            tracker.add_tokens(
-                                prompt_tokens=usage_info['prompt_tokens'],
-                                completion_tokens=usage_info['completion_tokens'],
-                                total_tokens=usage_info['total_tokens']
-                            )
-                        else:
-                            logger.warning("[토큰 추적][비동기] usage_metadata를 찾을 수 없습니다.")
-                        
-                        # 원래 LLM 설정 복원 (폴백 사용 후)
-                        if provider_idx > 0:
-                            self.llm_config = get_agent_llm_config(self.agent_name)
-                            self.llm = None  # 다음 get_llm()에서 새로 생성하게 함
-                        
-                        return result
-                else:
-                    # 토큰 추적 없이 호출
-                    # 필요시 LLM 설정 변경
-                    if provider_idx > 0:
-                        # 임시 폴백 LLM 설정
-                        self.llm_config = provider_config
-                        self.llm = None  # 다음 get_llm()에서 새로 생성하게 함
-                    
-                    # 비동기 LLM 호출
-                    result = await self.get_llm().ainvoke(*args, **kwargs)
-                    
-                    # 원래 LLM 설정 복원 (폴백 사용 후)
-                    if provider_idx > 0:
-                        self.llm_config = get_agent_llm_config(self.agent_name)
-                        self.llm = None  # 다음 get_llm()에서 새로 생성하게 함
-                    
-                    return result
-                    
-            except Exception as e:
-                # 에러 로깅
-                if provider_idx == 0:
-                    logger.info(f"기본 LLM 비동기 호출 실패: {self.agent_name}, provider={self.llm_config.get('provider')}, 오류: {str(e)}")
-                else:
-                    logger.info(f"폴백 LLM 비동기 호출 실패 ({provider_idx}/{max_retries}): provider={provider_config.get('provider')}, 오류: {str(e)}")
+                # 다음 후보가 남아 있으면 헤지 지연만큼만 대기
+                timeout = None
+                if hedging_enabled and next_candidate < len(candidates):
+                    timeout = self._get_hedge_delay(latest_health, hedging)
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    timeout = remaining if timeout is None else min(timeout, remaining)
                 
-                # 마지막 예외 저장 및 설정 복원
-                last_exception = e
+                done, _ = await asyncio.wait(pending.keys(), timeout=max(timeout, 0) if timeout is not None else None, return_when=asyncio.FIRST_COMPLETED)
                 
-                # 폴백 호출 후 원래 설정 복원
-                if provider_idx > 0:
-                    self.llm_config = get_agent_llm_config(self.agent_name)
-                    self.llm = None
+                for task in done:
+                    candidate_idx, config, health = pending.pop(task)
+                    if task.cancelled():
+                        # 외부에서 취소된 호출 (exception() 호출 시 CancelledError 발생)
+                        health.record_cancelled()
+                        continue
+                    if task.exception() is None:
+                        if candidate_idx >= 0:
+                            logger.info(f"폴백 LLM 응답 채택: {self.agent_name}, {health.key}")
+                        return task.result(), config
+                    last_exception = task.exception()
+                    logger.info(f"LLM 비동기 호출 실패: {self.agent_name}, {health.key}, 오류: {str(last_exception)}")
+                
+                if done:
+                    continue
                 
+                if deadline is not None and loop.time() >= deadline:
+                    # 진행 중인 호출은 finally에서 취소 후 실패로 기록
+                    timed_out = True
+                    logger.error(f"LLM 비동기 호출 마감 시간 초과: {self.agent_name}, {deadline_seconds}초")
+                    raise asyncio.TimeoutError(f"{self.agent_name} LLM 호출이 마감 시간({deadline_seconds}초)을 초과했습니다.")
+                
+                # 헤지 지연 경과: 진행 중인 호출은 유지한 채 다음 후보 호출
+                logger.info(f"[헤지] 응답 지연으로 다음 제공자 동시 호출: {self.agent_name}, 진행 중={latest_health.key}")
+                launch_next()
+        finally:
+            # 채택되지 않은 호출을 취소하고 종료를 기다린 뒤, 취소된 호출만 사유에 맞게 한 번씩 기록
+            # (취소 전에 스스로 끝난 호출은 _timed_ainvoke에서 이미 성공/실패로 기록됨)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            for task, (_, _, health) in pending.items():
+                if not task.cancelled():
+                    continue
+                if timed_out:
+                    health.record_failure()
+                else:
+                    health.record_cancelled()
+        
         # 모든 시도 실패
         logger.error(f"모든 LLM 비동기 호출 시도 실패: {self.agent_name}")
         if last_exception:
             raise last_exception
         else:
-            raise RuntimeError(f"모든 비동기 LLM 호출 시도가 알 수 없는 이유로 실패했습니다.")
+            raise RuntimeError(f"모든 비동기 LLM 호출 시도가 실패했습니다. (회로 차단기로 모든 제공자가 제외됨)")
+    
+    @staticmethod
+    def _extract_usage_info(result: Any) -> Optional[Dict[str, int]]:
+        """
+        LLM 응답에서 토큰 사용량 추출
+        
+        구조화된 출력 등으로 감싸진 응답은 내부 메시지의 usage_metadata를 찾습니다.
+        """
+        def to_usage_info(usage_metadata) -> Optional[Dict[str, int]]:
+            if not usage_metadata:
+                return None
+            return {
+                "prompt_tokens": usage_metadata.get('input_tokens', 0),
+                "completion_tokens": usage_metadata.get('output_tokens', 0),
+                "total_tokens": usage_metadata.get('total_tokens', 0)
+            }
+        
+        # 1. 직접 usage_metadata 속성 확인
+        if hasattr(result, 'usage_metadata'):
+            return to_usage_info(result.usage_metadata)
+        
+        # 2. 감싸진 응답(구조화된 출력 등)의 내부 메시지 확인
+        for attr_name in ('_message', 'underlying_response', '_raw_response', '_original_message'):
+            inner = getattr(result, attr_name, None)
+            if inner is not None and hasattr(inner, 'usage_metadata'):
+                logger.info(f"[토큰 추적][비동기] {attr_name} 속성에서 usage_metadata 찾음")
+                return to_usage_info(inner.usage_metadata)
+        
+        # 3. 마지막으로 숨겨진 속성을 검사하여 usage_metadata 찾기
+        for attr_name in dir(result):
+            if attr_name.startswith('_') and not attr_name.startswith('__'):
+                attr_value = getattr(result, attr_name, None)
+                if attr_value is not None and hasattr(attr_value, 'usage_metadata'):
+                    logger.info(f"[토큰 추적][비동기] {attr_name}.usage_metadata 찾음!")
+                    return to_usage_info(attr_value.usage_metadata)
+        return None
     
     def get_config(self) -> Dict[str, Any]:
         """
@@ -654,6 +948,46 @@ class AgentLLM:
                 self.schema = schema
                 self.kwargs = kwargs
             
+            def _parse_response(self, raw_response):
+                """LLM 응답 내용을 schema로 파싱 (실패 시 예외 발생)"""
+                content = raw_response.content if hasattr(raw_response, 'content') else str(raw_response)
+                
+                # Markdown 코드 블록 제거 - 다양한 패턴 처리
+                import re
+                # 전체 문자열이 코드 블록으로 감싸진 경우
+                content = re.sub(r'^```(?:json)?\s*\n?(.*?)\n?```\s*$', r'\1', content, flags=re.DOTALL)
+                # 시작 부분에 ```json이 있는 경우
+                content = re.sub(r'^```(?:json)?\s*\n?', '', content, flags=re.DOTALL)
+                # 끝 부분에 ``` 가 있는 경우
+                content = re.sub(r'\n?```\s*$', '', content, flags=re.DOTALL)
+                # 문자열 앞뒤 공백 제거
+                content = content.strip()
+                
+                logger.info(f"[구조화된 출력] 파싱 시도: {type(self.schema)}")
+                
+                # Pydantic 모델로 파싱
+                if hasattr(self.schema, 'model_validate_json'):
+                    parsed_response = self.schema.model_validate_json(content)
+                elif hasattr(self.schema, 'parse_raw'):  # Pydantic v1 지원
+                    parsed_response = self.schema.parse_raw(content)
+                else:
+                    # JSON으로 파싱한 후 객체 생성
+                    import json
+                    data = json.loads(content)
+                    parsed_response = self.schema(**data)
+                
+                # 원본 메타데이터 보존을 위해 Pydantic 모델에 _original_message 속성 추가
+                setattr(parsed_response, '_original_message', raw_response)
+                return parsed_response
+            
+            def _is_parsable(self, raw_response) -> bool:
+                """응답 캐시 저장 전 검증: schema로 파싱되는 응답만 캐시"""
+                try:
+                    self._parse_response(raw_response)
+                    return True
+                except Exception:
+                    return False
+            
             async def ainvoke(self, *args, **kwargs):
                 llm = self.agent_llm.get_llm()
                 
@@ -682,40 +1016,13 @@ class AgentLLM:
                     user_id=user_id,
                     project_type=project_type,
                     db=db,
+                    cache_validator=self._is_parsable,
                     **kwargs
                 )
                 logger.info(f"[구조화된 출력][ainvoke] type : {type(raw_response)}")
                 # 2단계: 응답 내용을 수동으로 Pydantic 모델로 파싱
                 try:
-                    content = raw_response.content if hasattr(raw_response, 'content') else str(raw_response)
-                    
-                    # Markdown 코드 블록 제거 - 다양한 패턴 처리
-                    import re
-                    # 전체 문자열이 코드 블록으로 감싸진 경우
-                    content = re.sub(r'^```(?:json)?\s*\n?(.*?)\n?```\s*$', r'\1', content, flags=re.DOTALL)
-                    # 시작 부분에 ```json이 있는 경우
-                    content = re.sub(r'^```(?:json)?\s*\n?', '', content, flags=re.DOTALL)
-                    # 끝 부분에 ``` 가 있는 경우
-                    content = re.sub(r'\n?```\s*$', '', content, flags=re.DOTALL)
-                    # 문자열 앞뒤 공백 제거
-                    content = content.strip()
-                    
-                    logger.info(f"[구조화된 출력] 파싱 시도: {type(self.schema)}")
-                    
-                    # Pydantic 모델로 파싱
-                    if hasattr(self.schema, 'model_validate_json'):
-                        parsed_response = self.schema.model_validate_json(content)
-                    elif hasattr(self.schema, 'parse_raw'):  # Pydantic v1 지원
-                        parsed_response = self.schema.parse_raw(content)
-                    else:
-                        # JSON으로 파싱한 후 객체 생성
-                        import json
-                        data = json.loads(content)
-                        parsed_response = self.schema(**data)
-                    
-                    # 원본 메타데이터 보존을 위해 Pydantic 모델에 _original_message 속성 추가
-                    setattr(parsed_response, '_original_message', raw_response)
-                    
+                    parsed_response = self._parse_response(raw_response)
                     logger.info(f"[구조화된 출력] 파싱 성공: {type(parsed_response)}")
                     return parsed_response
                     
@@ -752,6 +1059,7 @@ class AgentLLM:
                     user_id=user_id,
                     project_type=project_type,
                     db=db,
+                    cache_validator=self._is_parsable,
                     **kwargs
                 )
 
@@ -759,35 +1067,7 @@ class AgentLLM:
                 
                 # 2단계: 응답 내용을 수동으로 Pydantic 모델로 파싱
                 try:
-                    content = raw_response.content if hasattr(raw_response, 'content') else str(raw_response)
-                    
-                    # Markdown 코드 블록 제거 - 다양한 패턴 처리
-                    import re
-                    # 전체 문자열이 코드 블록으로 감싸진 경우
-                    content = re.sub(r'^```(?:json)?\s*\n?(.*?)\n?```\s*$', r'\1', content, flags=re.DOTALL)
-                    # 시작 부분에 ```json이 있는 경우
-                    content = re.sub(r'^```(?:json)?\s*\n?', '', content, flags=re.DOTALL)
-                    # 끝 부분에 ``` 가 있는 경우
-                    content = re.sub(r'\n?```\s*$', '', content, flags=re.DOTALL)
-                    # 문자열 앞뒤 공백 제거
-                    content = content.strip()
-                    
-                    logger.info(f"[구조화된 출력] 파싱 시도: {type(self.schema)}")
-                    
-                    # Pydantic 모델로 파싱
-                    if hasattr(self.schema, 'model_validate_json'):
-                        parsed_response = self.schema.model_validate_json(content)
-                    elif hasattr(self.schema, 'parse_raw'):  # Pydantic v1 지원
-                        parsed_response = self.schema.parse_raw(content)
-                    else:
-                        # JSON으로 파싱한 후 객체 생성
-                        import json
-                        data = json.loads(content)
-                        parsed_response = self.schema(**data)
-                    
-                    # 원본 메타데이터 보존을 위해 Pydantic 모델에 _original_message 속성 추가
-                    setattr(parsed_response, '_original_message', raw_response)
-                    
+                    parsed_response = self._parse_response(raw_response)
                     logger.info(f"[구조화된 출력] 파싱 성공: {type(parsed_response)}")
                     return parsed_response
                     
@@ -0,0 +1,311 @@
+"""
+프롬프트 컨텍스트 패킹 모듈
+
+검색된 문서(리포트, 텔레그램 메시지 등)를 에이전트별 토큰 예산 안에 맞춰 프롬프트 컨텍스트로 구성합니다.
+- 점수(score) 순으로 정렬하여 예산 안에서 우선순위가 높은 문서부터 채움
+- 거의 동일한 문단(리포트 재인용, 재전송 메시지 등)은 한 번만 포함
+- 예산을 넘는 마지막 문서는 남은 토큰만큼 잘라서 포함
+- 원본 대비 절약된 토큰 수를 통계로 반환하여 에이전트 메트릭에 기록
+
+토큰 수는 tiktoken으로 계산합니다. OpenAI 모델은 모델별 인코딩을 사용하고,
+로컬 토크나이저가 없는 Gemini, Claude 모델은 cl100k_base 인코딩으로 근사합니다.
+
+사용 예:
+```
+packer = ContextPacker.for_agent("report_analyzer_agent")
+packed = packer.pack(reports, text_key="content", score_key="score")
+formatted_reports = format_report_contents(packed.items)
+```
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import tiktoken
+from loguru import logger
+
+from common.services.llm_config.llm_config_manager import get_agent_llm_config
+
+# 에이전트 설정에 context_token_budget이 없을 때 사용할 기본 예산
+DEFAULT_CONTEXT_TOKEN_BUDGET = 12000
+
+
+@lru_cache(maxsize=16)
+def get_encoding_for_model(model_name: str) -> "tiktoken.Encoding":
+    """
+    모델 이름에 맞는 tiktoken 인코딩을 반환합니다. (프로세스 단위 캐시)
+
+    Args:
+        model_name: LLM 모델 이름
+
+    Returns:
+        tiktoken 인코딩 객체
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # Gemini, Claude 등 tiktoken에 없는 모델은 cl100k_base로 근사
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@dataclass
+class PackedContext:
+    """컨텍스트 패킹 결과"""
+    items: List[Dict[str, Any]]                 # 예산 안에 포함된 문서 (점수 순)
+    original_tokens: int = 0                    # 패킹 전 전체 문서 토큰 수
+    packed_tokens: int = 0                      # 패킹 후 포함된 문서 토큰 수
+    duplicate_count: int = 0                    # 중복으로 제외된 문서 수
+    dropped_count: int = 0                      # 예산 초과로 제외된 문서 수
+    truncated_count: int = 0                    # 잘려서 포함된 문서 수
+    token_budget: int = 0                       # 적용된 토큰 예산
+
+    @property
+    def saved_tokens(self) -> int:
+        """패킹으로 절약된 토큰 수"""
+        return max(self.original_tokens - self.packed_tokens, 0)
+
+    def to_metrics(self, num_calls: int = 1) -> Dict[str, Any]:
+        """
+        에이전트 메트릭에 기록할 통계를 반환합니다.
+
+        Args:
+            num_calls: 같은 컨텍스트를 공유하는 LLM 호출 수 (요청당 절약 토큰 계산용)
+        """
+        return {
+            "token_budget": self.token_budget,
+            "original_tokens": self.original_tokens,
+            "packed_tokens": self.packed_tokens,
+            "saved_tokens": self.saved_tokens,
+            "prompt_tokens_saved": self.saved_tokens * num_calls,
+            "item_count": len(self.items),
+            "duplicate_count": self.duplicate_count,
+            "dropped_count": self.dropped_count,
+            "truncated_count": self.truncated_count,
+        }
+
+
+@dataclass
+class PackedSections:
+    """섹션 단위 컨텍스트 패킹 결과"""
+    sections: Dict[str, str] = field(default_factory=dict)  # 섹션 이름 -> 패킹된 텍스트
+    original_tokens: int = 0
+    packed_tokens: int = 0
+    duplicate_count: int = 0
+    token_budget: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        """패킹으로 절약된 토큰 수"""
+        return max(self.original_tokens - self.packed_tokens, 0)
+
+    def to_metrics(self, num_calls: int = 1) -> Dict[str, Any]:
+        """에이전트 메트릭에 기록할 통계를 반환합니다."""
+        return {
+            "token_budget": self.token_budget,
+            "original_tokens": self.original_tokens,
+            "packed_tokens": self.packed_tokens,
+            "saved_tokens": self.saved_tokens,
+            "prompt_tokens_saved": self.saved_tokens * num_calls,
+            "duplicate_count": self.duplicate_count,
+        }
+
+
+class ContextPacker:
+    """토큰 예산 기반 컨텍스트 패커"""
+
+    # 중복 판정에서 제외할 짧은 문단 기준 (구분선, 제목 등)
+    MIN_DEDUP_CHARS = 40
+
+    def __init__(self, model_name: str, token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET,
+                 dedup_threshold: float = 0.9, min_truncated_tokens: int = 100,
+                 encoding: Optional["tiktoken.Encoding"] = None):
+        """
+        Args:
+            model_name: 토큰 계산에 사용할 모델 이름
+            token_budget: 컨텍스트에 사용할 최대 토큰 수
+            dedup_threshold: 중복으로 판정할 shingle 자카드 유사도 기준 (0~1)
+            min_truncated_tokens: 잘라서라도 포함할 최소 남은 토큰 수
+            encoding: 토큰 계산에 사용할 인코딩 (기본값: model_name의 tiktoken 인코딩)
+        """
+        self.model_name = model_name
+        self.token_budget = token_budget
+        self.dedup_threshold = dedup_threshold
+        self.min_truncated_tokens = min_truncated_tokens
+        self.encoding = encoding or get_encoding_for_model(model_name)
+
+    @classmethod
+    def for_agent(cls, agent_name: str, **kwargs) -> "ContextPacker":
+        """
+        에이전트 LLM 설정(agent_llm_config.json)의 모델과 context_token_budget으로 패커를 생성합니다.
+
+        Args:
+            agent_name: 에이전트 이름
+        """
+        config = get_agent_llm_config(agent_name)
+        token_budget = config.get("context_token_budget", DEFAULT_CONTEXT_TOKEN_BUDGET)
+        return cls(config.get("model_name", ""), token_budget=token_budget, **kwargs)
+
+    def count_tokens(self, text: str) -> int:
+        """텍스트의 토큰 수 계산"""
+        if not text:
+            return 0
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """텍스트를 최대 토큰 수에 맞게 자름 (max_tokens가 0 이하이면 빈 문자열)"""
+        if max_tokens <= 0:
+            return ""
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[:max_tokens]) + " ...(생략)"
+
+    @staticmethod
+    def _shingles(text: str, size: int = 5) -> frozenset:
+        """공백을 제거한 문자 n-gram 집합 (한글 어절 변형에도 안정적)"""
+        normalized = re.sub(r"\s+", "", text.lower())
+        if len(normalized) <= size:
+            return frozenset([normalized])
+        return frozenset(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+
+    def _is_duplicate(self, shingles: frozenset, kept: List[frozenset]) -> bool:
+        """이미 포함된 문단과 거의 동일한지 확인"""
+        for other in kept:
+            union = len(shingles | other)
+            if union and len(shingles & other) / union >= self.dedup_threshold:
+                return True
+        return False
+
+    def pack(self, items: List[Dict[str, Any]], text_key: str = "content",
+             score_key: str = "score", overhead_tokens: int = 30) -> PackedContext:
+        """
+        문서 목록을 토큰 예산에 맞게 패킹합니다.
+
+        Args:
+            items: 문서 딕셔너리 목록
+            text_key: 본문 키
+            score_key: 정렬에 사용할 점수 키 (없으면 원래 순서 유지)
+            overhead_tokens: 문서당 제목/출처/날짜 등 포맷팅에 추가되는 토큰 추정치
+
+        Returns:
+            PackedContext: 예산 안에 포함된 문서(점수 순)와 통계
+        """
+        result = PackedContext(items=[], token_budget=self.token_budget)
+        # 점수 내림차순 정렬 (동점이면 원래 순서 유지)
+        ranked = sorted(items, key=lambda item: item.get(score_key) or 0.0, reverse=True)
+
+        kept_shingles: List[frozenset] = []
+        remaining = self.token_budget
+        for item in ranked:
+            text = item.get(text_key) or ""
+            tokens = self.count_tokens(text) + overhead_tokens
+            result.original_tokens += tokens
+
+            if len(text) >= self.MIN_DEDUP_CHARS:
+                shingles = self._shingles(text)
+                if self._is_duplicate(shingles, kept_shingles):
+                    result.duplicate_count += 1
+                    continue
+            else:
+                shingles = None
+
+            if tokens <= remaining:
+                packed_item = item
+            elif remaining - overhead_tokens >= self.min_truncated_tokens:
+                # 남은 예산만큼 잘라서 포함
+                packed_item = dict(item)
+                packed_item[text_key] = self.truncate(text, remaining - overhead_tokens)
+                tokens = remaining
+                result.truncated_count += 1
+            else:
+                result.dropped_count += 1
+                continue
+
+            if shingles is not None:
+                kept_shingles.append(shingles)
+            result.items.append(packed_item)
+            result.packed_tokens += tokens
+            remaining -= tokens
+
+        if result.saved_tokens:
+            logger.info(
+                f"[ContextPacker] {self.model_name}: {result.original_tokens} -> {result.packed_tokens} 토큰 "
+                f"(중복 {result.duplicate_count}, 제외 {result.dropped_count}, 잘림 {result.truncated_count})"
+            )
+        return result
+
+    def pack_sections(self, sections: Dict[str, Tuple[str, float]]) -> PackedSections:
+        """
+        여러 에이전트 결과 섹션을 중요도에 비례한 토큰 예산으로 패킹합니다.
+
+        중요도가 높은 섹션부터 문단 단위 중복을 제거하고, 예산보다 짧은 섹션이 남긴 토큰은
+        나머지 섹션에 다시 배분합니다. 중요도가 0인 섹션은 다른 섹션이 모두 예산 안에 들어간 뒤
+        남은 토큰만 사용합니다.
+
+        Args:
+            sections: 섹션 이름 -> (텍스트, 중요도, None이면 1)
+
+        Returns:
+            PackedSections: 섹션별 패킹된 텍스트와 통계
+        """
+        result = PackedSections(token_budget=self.token_budget)
+
+        # 1) 중요도 순으로 문단 단위 중복 제거
+        kept_shingles: List[frozenset] = []
+        deduped: Dict[str, Tuple[str, float, int]] = {}
+        for name, (text, importance) in sorted(sections.items(), key=lambda kv: kv[1][1], reverse=True):
+            text = text or ""
+            result.original_tokens += self.count_tokens(text)
+            paragraphs = []
+            for paragraph in text.split("\n"):
+                if len(paragraph) >= self.MIN_DEDUP_CHARS:
+                    shingles = self._shingles(paragraph)
+                    if self._is_duplicate(shingles, kept_shingles):
+                        result.duplicate_count += 1
+                        continue
+                    kept_shingles.append(shingles)
+                paragraphs.append(paragraph)
+            deduped_text = "\n".join(paragraphs)
+            weight = 1.0 if importance is None else max(float(importance), 0.0)
+            deduped[name] = (deduped_text, weight, self.count_tokens(deduped_text))
+
+        # 2) 중요도 비례 예산 배분 (짧은 섹션이 남긴 예산은 재배분)
+        allocations: Dict[str, int] = {}
+        pending = dict(deduped)
+        remaining = self.token_budget
+        while pending:
+            total_weight = sum(weight for _, weight, _ in pending.values())
+            if total_weight > 0:
+                shares = {name: remaining * weight / total_weight for name, (_, weight, _) in pending.items()}
+            else:
+                # 중요도 0인 섹션만 남으면 남은 예산을 균등 배분
+                shares = {name: remaining / len(pending) for name in pending}
+            fitted = {
+                name: tokens for name, (_, _, tokens) in pending.items()
+                if tokens <= shares[name]
+            }
+            if not fitted:
+                # 남은 섹션은 모두 비례 예산으로 잘라서 포함
+                for name, share in shares.items():
+                    allocations[name] = int(share)
+                break
+            for name, tokens in fitted.items():
+                allocations[name] = tokens
+                remaining -= tokens
+                pending.pop(name)
+
+        for name in sections:
+            text, _, tokens = deduped[name]
+            budget = allocations.get(name, tokens)
+            packed_text = text if tokens <= budget else self.truncate(text, budget)
+            result.sections[name] = packed_text
+            result.packed_tokens += min(tokens, budget)
+
+        if result.saved_tokens:
+            logger.info(
+                f"[ContextPacker] {self.model_name}: 섹션 {result.original_tokens} -> {result.packed_tokens} 토큰 "
+                f"(중복 문단 {result.duplicate_count})"
+            )
+        return result
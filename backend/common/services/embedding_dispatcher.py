@@ -0,0 +1,363 @@
+"""
+임베딩 요청 디스패처
+
+임베딩 API 호출을 토큰 수 기준 배치로 나누고, 여러 배치를 동시에 요청합니다.
+- 토큰 수/텍스트 수 기준 배치 구성 (입력 순서 유지)
+- 설정된 수만큼 요청을 동시에 진행 (async: 세마포어, sync: 스레드 풀)
+- 분당 토큰(TPM)/요청(RPM) 제한을 API 키 단위 공유 RateLimiter로 적용
+- 일시적 오류(429, 5xx, 연결/타임아웃)는 실패한 배치만 지수 백오프로 재시도
+- 결과 임베딩은 입력 순서대로 재조립
+
+OpenAI, Upstage, Google 임베딩 제공자가 같은 디스패처를 사용합니다.
+
+사용 예:
+```
+dispatcher = EmbeddingDispatcher(
+    max_concurrency=4,
+    rate_limiter=get_rate_limiter("openai", tokens_per_minute=1_000_000, requests_per_minute=3000),
+)
+batches = build_batches_from_counts(texts, provider.count_tokens_batch(texts), max_batch_tokens=50_000)
+
+async def _embed(batch_texts):
+    response = await client.embeddings.create(model=model_name, input=batch_texts)
+    return BatchEmbeddingResult([item.embedding for item in response.data],
+                                response.usage.prompt_tokens, response.usage.total_tokens)
+
+result = await dispatcher.dispatch(batches, _embed)
+embeddings = result.embeddings
+```
+"""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import openai
+from loguru import logger
+
+
+@dataclass
+class EmbeddingBatch:
+    """한 번의 API 요청으로 보낼 텍스트 묶음"""
+    texts: List[str]
+    tokens: int = 0  # 추정 토큰 수 (속도 제한 계산용)
+    token_counts: List[int] = field(default_factory=list)  # 텍스트별 토큰 수 (재사용용)
+
+
+@dataclass
+class BatchEmbeddingResult:
+    """배치 하나의 임베딩 결과"""
+    embeddings: List[List[float]]
+    prompt_tokens: int = 0
+    total_tokens: int = 0
+
+
+@dataclass
+class DispatchResult:
+    """전체 요청의 임베딩 결과 (입력 순서)"""
+    embeddings: List[List[float]] = field(default_factory=list)
+    prompt_tokens: int = 0
+    total_tokens: int = 0
+    num_batches: int = 0
+    retries: int = 0
+
+
+def build_batches_from_counts(
+    texts: List[str],
+    token_counts: List[int],
+    max_batch_tokens: int,
+    max_batch_size: int = 100
+) -> List[EmbeddingBatch]:
+    """
+    미리 계산한 토큰 수로 텍스트를 입력 순서대로 토큰 수/텍스트 수 제한에 맞는 배치로 나눕니다.
+
+    한 텍스트가 max_batch_tokens를 넘으면 단독 배치로 보냅니다.
+
+    Args:
+        texts: 임베딩할 텍스트 목록
+        token_counts: 텍스트별 토큰 수 (texts와 같은 순서)
+        max_batch_tokens: 배치당 최대 토큰 수
+        max_batch_size: 배치당 최대 텍스트 수
+
+    Returns:
+        List[EmbeddingBatch]: 배치 목록
+    """
+    batches: List[EmbeddingBatch] = []
+    current: List[str] = []
+    current_counts: List[int] = []
+    current_tokens = 0
+    for text, tokens in zip(texts, token_counts):
+        if current and (current_tokens + tokens > max_batch_tokens or len(current) >= max_batch_size):
+            batches.append(EmbeddingBatch(texts=current, tokens=current_tokens, token_counts=current_counts))
+            current = []
+            current_counts = []
+            current_tokens = 0
+        current.append(text)
+        current_counts.append(tokens)
+        current_tokens += tokens
+    if current:
+        batches.append(EmbeddingBatch(texts=current, tokens=current_tokens, token_counts=current_counts))
+    return batches
+
+
+def build_token_batches(
+    texts: List[str],
+    count_tokens: Callable[[str], int],
+    max_batch_tokens: int,
+    max_batch_size: int = 100
+) -> List[EmbeddingBatch]:
+    """
+    텍스트별 토큰 수 계산 함수로 배치를 구성합니다. (build_batches_from_counts 참고)
+
+    Args:
+        texts: 임베딩할 텍스트 목록
+        count_tokens: 토큰 수 계산 함수
+        max_batch_tokens: 배치당 최대 토큰 수
+        max_batch_size: 배치당 최대 텍스트 수
+    """
+    return build_batches_from_counts(texts, [count_tokens(text) for text in texts], max_batch_tokens, max_batch_size)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """재시도할 일시적 오류인지 확인 (429, 5xx, 연결/타임아웃)"""
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError))
+
+
+class RateLimiter:
+    """
+    분당 토큰(TPM)/요청(RPM) 제한 (토큰 버킷)
+
+    스레드와 이벤트 루프에서 함께 사용할 수 있도록 예약은 threading.Lock으로 보호하고,
+    대기는 호출 측(asyncio.sleep 또는 time.sleep)에서 수행합니다.
+    """
+
+    def __init__(self, tokens_per_minute: Optional[int] = None, requests_per_minute: Optional[int] = None):
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self._token_allowance = float(tokens_per_minute or 0)
+        self._request_allowance = float(requests_per_minute or 0)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """허용량이 있으면 차감하고 0을, 없으면 대기할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._updated_at = now
+
+            wait = 0.0
+            if self.tokens_per_minute:
+                self._token_allowance = min(
+                    float(self.tokens_per_minute),
+                    self._token_allowance + elapsed * self.tokens_per_minute / 60
+                )
+                # 한 배치가 분당 한도보다 크면 버킷이 가득 찼을 때 보냄
+                tokens = min(tokens, self.tokens_per_minute)
+                if self._token_allowance < tokens:
+                    wait = max(wait, (tokens - self._token_allowance) * 60 / self.tokens_per_minute)
+            if self.requests_per_minute:
+                self._request_allowance = min(
+                    float(self.requests_per_minute),
+                    self._request_allowance + elapsed * self.requests_per_minute / 60
+                )
+                if self._request_allowance < 1:
+                    wait = max(wait, (1 - self._request_allowance) * 60 / self.requests_per_minute)
+
+            if wait > 0:
+                return max(wait, 0.01)
+
+            if self.tokens_per_minute:
+                self._token_allowance -= tokens
+            if self.requests_per_minute:
+                self._request_allowance -= 1
+            return 0.0
+
+    async def acquire(self, tokens: int) -> None:
+        """비동기 대기 후 허용량 차감"""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: int) -> None:
+        """동기 대기 후 허용량 차감"""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+
+# API 키(제공자) 단위로 프로세스 내에서 공유하는 RateLimiter
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, tokens_per_minute: Optional[int] = None,
+                     requests_per_minute: Optional[int] = None) -> RateLimiter:
+    """
+    이름별로 공유되는 RateLimiter를 반환합니다. (최초 생성 시의 제한값 사용)
+
+    Args:
+        name: 제한 단위 이름 (예: "openai", "upstage")
+        tokens_per_minute: 분당 토큰 제한 (None이면 제한 없음)
+        requests_per_minute: 분당 요청 제한 (None이면 제한 없음)
+    """
+    with _rate_limiters_lock:
+        if name not in _rate_limiters:
+            _rate_limiters[name] = RateLimiter(tokens_per_minute, requests_per_minute)
+        return _rate_limiters[name]
+
+
+class EmbeddingDispatcher:
+    """배치 임베딩 요청을 동시에 보내고 입력 순서대로 결과를 모으는 디스패처"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 20.0,
+        name: str = "embedding"
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 진행할 최대 요청 수
+            rate_limiter: 공유 속도 제한 (None이면 제한 없음)
+            max_retries: 배치별 최대 재시도 횟수
+            retry_base_delay: 재시도 기본 대기 시간(초), 시도마다 2배 증가
+            retry_max_delay: 재시도 최대 대기 시간(초)
+            name: 로그에 표시할 이름
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.name = name
+
+    def _retry_delay(self, attempt: int) -> float:
+        delay = min(self.retry_base_delay * (2 ** attempt), self.retry_max_delay)
+        return delay + random.uniform(0, delay * 0.1)
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        return attempt < self.max_retries and is_retryable_error(error)
+
+    @staticmethod
+    def _check_result(batch: EmbeddingBatch, result: BatchEmbeddingResult) -> BatchEmbeddingResult:
+        if len(result.embeddings) != len(batch.texts):
+            raise ValueError(f"임베딩 수 불일치: 입력 {len(batch.texts)}개, 결과 {len(result.embeddings)}개")
+        return result
+
+    @staticmethod
+    def _merge(results: List[BatchEmbeddingResult], retries: int) -> DispatchResult:
+        merged = DispatchResult(num_batches=len(results), retries=retries)
+        for result in results:
+            merged.embeddings.extend(result.embeddings)
+            merged.prompt_tokens += result.prompt_tokens
+            merged.total_tokens += result.total_tokens
+        return merged
+
+    async def dispatch(
+        self,
+        batches: List[EmbeddingBatch],
+        embed_fn: Callable[[List[str]], Awaitable[BatchEmbeddingResult]]
+    ) -> DispatchResult:
+        """
+        배치를 비동기로 동시에 요청합니다.
+
+        Args:
+            batches: 입력 순서대로 구성된 배치 목록
+            embed_fn: 텍스트 목록을 받아 BatchEmbeddingResult를 반환하는 코루틴 함수
+
+        Returns:
+            DispatchResult: 입력 순서의 임베딩과 토큰 사용량
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        retries = 0
+
+        async def _run(index: int, batch: EmbeddingBatch) -> BatchEmbeddingResult:
+            nonlocal retries
+            async with semaphore:
+                attempt = 0
+                while True:
+                    if self.rate_limiter:
+                        await self.rate_limiter.acquire(batch.tokens)
+                    try:
+                        return self._check_result(batch, await embed_fn(batch.texts))
+                    except Exception as e:
+                        if not self._should_retry(e, attempt):
+                            raise
+                        delay = self._retry_delay(attempt)
+                        attempt += 1
+                        retries += 1
+                        logger.warning(f"[{self.name}] 배치 #{index + 1} 재시도 {attempt}/{self.max_retries} ({delay:.1f}초 후): {str(e)}")
+                        await asyncio.sleep(delay)
+
+        tasks = [asyncio.create_task(_run(index, batch)) for index, batch in enumerate(batches)]
+        try:
+            results = await asyncio.gather(*tasks)
+        except Exception:
+            # 한 배치가 최종 실패하면 남은 요청은 취소
+            for task in tasks:
+                task.cancel()
+            raise
+        return self._merge(results, retries)
+
+    def dispatch_sync(
+        self,
+        batches: List[EmbeddingBatch],
+        embed_fn: Callable[[List[str]], BatchEmbeddingResult]
+    ) -> DispatchResult:
+        """
+        배치를 스레드 풀에서 동시에 요청합니다. (Celery 워커 등 동기 환경용)
+
+        Args:
+            batches: 입력 순서대로 구성된 배치 목록
+            embed_fn: 텍스트 목록을 받아 BatchEmbeddingResult를 반환하는 함수
+
+        Returns:
+            DispatchResult: 입력 순서의 임베딩과 토큰 사용량
+        """
+        retries = 0
+        retries_lock = threading.Lock()
+
+        def _run(index: int, batch: EmbeddingBatch) -> BatchEmbeddingResult:
+            nonlocal retries
+            attempt = 0
+            while True:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire_sync(batch.tokens)
+                try:
+                    return self._check_result(batch, embed_fn(batch.texts))
+                except Exception as e:
+                    if not self._should_retry(e, attempt):
+                        raise
+                    delay = self._retry_delay(attempt)
+                    attempt += 1
+                    with retries_lock:
+                        retries += 1
+                    logger.warning(f"[{self.name}] 배치 #{index + 1} 재시도 {attempt}/{self.max_retries} ({delay:.1f}초 후): {str(e)}")
+                    time.sleep(delay)
+
+        if len(batches) <= 1 or self.max_concurrency == 1:
+            results = [_run(index, batch) for index, batch in enumerate(batches)]
+            return self._merge(results, retries)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches)),
+                                      thread_name_prefix=self.name)
+        try:
+            futures = [executor.submit(_run, index, batch) for index, batch in enumerate(batches)]
+            results = [future.result() for future in futures]
+        except Exception:
+            # 한 배치가 최종 실패하면 시작하지 않은 요청은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=False)
+        return self._merge(results, retries)
@@ -20,6 +20,14 @@ import tenacity
 import re
 import torch
 from uuid import UUID
+from common.services.embedding_dispatcher import (
+    BatchEmbeddingResult,
+    DispatchResult,
+    EmbeddingBatch,
+    EmbeddingDispatcher,
+    build_batches_from_counts,
+    get_rate_limiter,
+)
 from common.services.token_usage_service import save_token_usage, ProjectType, TokenType, track_token_usage_sync, track_token_usage_bg, TokenUsageQueue
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as SQLAlchemySession
@@ -182,18 +190,41 @@ class TokenCounter:
     
     # 토크나이저 객체 캐싱
     _upstage_tokenizer = None
+    # 모델별 tiktoken 인코딩 캐싱
+    _openai_encodings: Dict[str, Any] = {}
+    
+    @staticmethod
+    def get_openai_encoding(model: str = "text-embedding-ada-002"):
+        """모델별 tiktoken 인코딩 반환 (프로세스 단위 캐싱)"""
+        encoding = TokenCounter._openai_encodings.get(model)
+        if encoding is None:
+            encoding = tiktoken.encoding_for_model(model)
+            TokenCounter._openai_encodings[model] = encoding
+        return encoding
     
     @staticmethod
     def count_tokens_openai(text: str, model: str = "text-embedding-ada-002") -> int:
         """OpenAI 모델의 토큰 수 계산"""
         try:
-            encoding = tiktoken.encoding_for_model(model)
+            encoding = TokenCounter.get_openai_encoding(model)
             return len(encoding.encode(text))
         except Exception as e:
             logger.warning(f"토큰 카운팅 실패 (OpenAI): {str(e)}")
             # 실패시 문자 길이로 대략적 계산 (안전을 위해 약간 높게)
             return len(text.split()) * 2
 
+    @staticmethod
+    def count_tokens_openai_batch(texts: List[str], model: str = "text-embedding-ada-002") -> List[int]:
+        """OpenAI 모델의 토큰 수를 텍스트 목록 단위로 한 번에 계산 (tiktoken encode_batch)"""
+        if not texts:
+            return []
+        try:
+            encoding = TokenCounter.get_openai_encoding(model)
+            return [len(tokens) for tokens in encoding.encode_batch(texts)]
+        except Exception as e:
+            logger.warning(f"배치 토큰 카운팅 실패 (OpenAI), 개별 계산으로 진행: {str(e)}")
+            return [TokenCounter.count_tokens_openai(text, model) for text in texts]
+
     @staticmethod
     def count_tokens_google(text: str) -> int:
         """Google 모델의 토큰 수 계산
@@ -233,6 +264,22 @@ class TokenCounter:
             # 실패시 단어 기반으로 대략적으로 계산
             return len(text.split()) * 2
 
+    @staticmethod
+    def count_tokens_upstage_batch(texts: List[str]) -> List[int]:
+        """Upstage 모델의 토큰 수를 텍스트 목록 단위로 한 번에 계산 (tokenizers encode_batch)"""
+        if not texts:
+            return []
+        if TokenCounter._upstage_tokenizer is None:
+            # 토크나이저 로드 (실패 시 개별 계산의 대체 방식 사용)
+            first_count = TokenCounter.count_tokens_upstage(texts[0])
+            if TokenCounter._upstage_tokenizer is None:
+                return [first_count] + [len(text.split()) * 2 for text in texts[1:]]
+        try:
+            return [len(enc.ids) for enc in TokenCounter._upstage_tokenizer.encode_batch(texts)]
+        except Exception as e:
+            logger.warning(f"Upstage 배치 토큰 카운팅 실패, 개별 계산으로 진행: {str(e)}")
+            return [TokenCounter.count_tokens_upstage(text) for text in texts]
+
 class EmbeddingProvider(ABC):
     """임베딩 제공자의 추상 기본 클래스"""
     
@@ -240,6 +287,10 @@ class EmbeddingProvider(ABC):
         self.model_name = model_name
         self.max_tokens = max_tokens
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """텍스트 목록의 토큰 수를 한 번에 계산 (배치 토크나이저가 있는 제공자는 재정의)"""
+        return [self.count_tokens(text) for text in texts]
+    
     def split_text_by_tokens(self, text: str) -> List[str]:
         """토큰 제한을 초과하는 텍스트를 분할"""
         try:
@@ -255,9 +306,11 @@ class EmbeddingProvider(ABC):
         current_chunk = []
         current_tokens = 0
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-            tokens = self.count_tokens(sentence)
+        # 문장별 토큰 수를 한 번에 계산
+        sentences = [sentence.strip() for sentence in sentences]
+        sentence_tokens = self.count_tokens_batch(sentences)
+
+        for sentence, tokens in zip(sentences, sentence_tokens):
 
             if tokens > self.max_tokens:
                 logger.warning(f"문장이 토큰 제한({self.max_tokens}) 초과: {tokens} tokens, 문장 길이로 분할 시도.")
@@ -284,7 +337,9 @@ class EmbeddingProvider(ABC):
 
     def validate_and_split_texts(self, texts: List[str]) -> List[List[str]]:
         """범용 토큰 검증 및 분할 (전체 토큰 합만 체크)"""
-        total_tokens = sum(self.count_tokens(text) for text in texts)
+        # 텍스트별 토큰 수는 한 번만 계산하여 총합과 배치 구성에 함께 사용
+        token_counts = self.count_tokens_batch(texts)
+        total_tokens = sum(token_counts)
         logger.info(f"범용 토큰 총합: {total_tokens}. 제한: {self.max_tokens}")
         if total_tokens <= self.max_tokens:
             return [texts]  # 전체 토큰이 제한 이내면 그대로 반환
@@ -294,12 +349,11 @@ class EmbeddingProvider(ABC):
         current_batch = []
         current_tokens = 0
         
-        for text in texts:
+        for text, tokens in zip(texts, token_counts):
             text = text.strip()
             if not text:
                 continue
                 
-            tokens = self.count_tokens(text)
             if current_tokens + tokens <= self.max_tokens:
                 current_batch.append(text)
                 current_tokens += tokens
@@ -355,20 +409,46 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         self.async_client = AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY
         )
-        self.encoder = tiktoken.encoding_for_model(model_name)
+        self.encoder = TokenCounter.get_openai_encoding(model_name)
         
         # 마지막 토큰 사용량 저장 속성
         self.last_token_usage = None
         
         # 임베딩 요청 배치 크기 제한
         self.max_batch_size = 100  # OpenAI 권장 배치 크기
+        self.max_batch_tokens = 50000  # 요청당 토큰 수 (API 한도 300,000보다 작게 나눠 동시 요청)
+        
+        # 배치 동시 요청 디스패처 (API 키 단위 속도 제한 공유)
+        self.dispatcher = EmbeddingDispatcher(
+            max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+            rate_limiter=get_rate_limiter("openai", settings.OPENAI_EMBEDDING_TPM, settings.OPENAI_EMBEDDING_RPM),
+            max_retries=settings.EMBEDDING_MAX_RETRIES,
+            name="openai-embedding"
+        )
 
     def count_tokens(self, text: str) -> int:
         return TokenCounter.count_tokens_openai(text, self.model_name)
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        return TokenCounter.count_tokens_openai_batch(texts, self.model_name)
         
     def get_embeddings_obj(self) -> Tuple[Embeddings, Embeddings]:
         return self.client, self.client
     
+    def _build_batches(self, texts: List[str]) -> List[EmbeddingBatch]:
+        """토큰 수 기준 배치 구성 (토큰 수는 한 번에 계산)"""
+        return build_batches_from_counts(texts, self.count_tokens_batch(texts), self.max_batch_tokens, self.max_batch_size)
+    
+    def _set_last_token_usage(self, result: DispatchResult, completion_tokens: Optional[int]) -> None:
+        """마지막 토큰 사용량 저장 (호환성 유지)"""
+        if result.total_tokens > 0:
+            self.last_token_usage = {
+                "prompt_tokens": result.prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": result.total_tokens,
+                "total_cost": 0.0
+            }
+    
     @track_token_usage_bg(token_type="embedding")
     async def create_embeddings_async(
         self, 
@@ -378,48 +458,34 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         project_type: Optional[str] = None,
         db: Optional[AsyncSession] = None
     ) -> List[List[float]]:
-        """비동기적으로 임베딩 생성"""
+        """비동기적으로 임베딩 생성 (배치 동시 요청, 결과는 입력 순서)"""
         if not texts:
             return []
             
-        all_embeddings = []
-        batches = [texts[i:i + self.max_batch_size] for i in range(0, len(texts), self.max_batch_size)]
-        
-        # 토큰 사용량 누적을 위한 변수들
-        total_tokens = 0
-        total_prompt_tokens = 0
+        batches = self._build_batches(texts)
         
-        for batch in batches:
-            try:
-                # 비동기 클라이언트로 임베딩 생성
-                response = await self.async_client.embeddings.create(
-                    model=self.model_name,
-                    input=batch
-                )
-                
-                # 임베딩 데이터 추출
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
-                
-                # 토큰 사용량 누적 (내부 추적용)
-                total_tokens += response.usage.total_tokens
-                total_prompt_tokens += response.usage.prompt_tokens
-                logger.info(f"OpenAI[Async] 임베딩 토큰 사용량: {response.usage.total_tokens} (누적 {total_tokens})")
-                
-            except Exception as e:
-                logger.error(f"OpenAI 임베딩 생성 실패: {str(e)}")
-                raise
+        async def _embed_batch(batch: List[str]) -> BatchEmbeddingResult:
+            # 비동기 클라이언트로 임베딩 생성
+            response = await self.async_client.embeddings.create(
+                model=self.model_name,
+                input=batch
+            )
+            logger.info(f"OpenAI[Async] 임베딩 토큰 사용량: {response.usage.total_tokens}")
+            return BatchEmbeddingResult(
+                embeddings=[item.embedding for item in response.data],
+                prompt_tokens=response.usage.prompt_tokens,
+                total_tokens=response.usage.total_tokens
+            )
         
-        # 마지막 토큰 사용량 저장 (호환성 유지)
-        if total_tokens > 0:
-            self.last_token_usage = {
-                "prompt_tokens": total_prompt_tokens,
-                "completion_tokens": None,
-                "total_tokens": total_tokens,
-                "total_cost": 0.0
-            }
+        try:
+            result = await self.dispatcher.dispatch(batches, _embed_batch)
+        except Exception as e:
+            logger.error(f"OpenAI 임베딩 생성 실패: {str(e)}")
+            raise
         
-        return all_embeddings
+        logger.info(f"OpenAI[Async] 임베딩 완료: {len(texts)}개 텍스트, {result.num_batches} 배치, 토큰 {result.total_tokens} (재시도 {result.retries})")
+        self._set_last_token_usage(result, completion_tokens=None)
+        return result.embeddings
     
     def create_embeddings(
         self, 
@@ -428,12 +494,30 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         user_id: Optional[UUID] = None, 
         project_type: Optional[str] = None
     ) -> List[List[float]]:
-        """동기적으로 임베딩 생성"""
+        """동기적으로 임베딩 생성 (배치 동시 요청, 결과는 입력 순서)"""
         if not texts:
             return []
             
-        all_embeddings = []
-        batches = [texts[i:i + self.max_batch_size] for i in range(0, len(texts), self.max_batch_size)]
+        batches = self._build_batches(texts)
+        
+        def _embed_batch(batch: List[str]) -> BatchEmbeddingResult:
+            response = self.client.embeddings.create(
+                model=self.model_name,
+                input=batch
+            )
+            logger.info(f"OpenAI[Sync] 임베딩 토큰 사용량: {response.usage.total_tokens}")
+            return BatchEmbeddingResult(
+                embeddings=[item.embedding for item in response.data],
+                prompt_tokens=response.usage.prompt_tokens,
+                total_tokens=response.usage.total_tokens
+            )
+        
+        def _dispatch() -> DispatchResult:
+            try:
+                return self.dispatcher.dispatch_sync(batches, _embed_batch)
+            except Exception as e:
+                logger.error(f"OpenAI 임베딩 생성 실패: {str(e)}")
+                raise
         
         # 토큰 사용량 추적을 위한 컨텍스트 매니저 사용
         if user_id and project_type:
@@ -447,77 +531,19 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
                 model_name=self.model_name,
                 db_getter=SessionLocal  # 동기 세션 팩토리 직접 전달
             ) as tracker:
-                # 토큰 사용량 누적을 위한 변수들
-                total_tokens = 0
-                total_prompt_tokens = 0
-                
-                for batch in batches:
-                    try:
-                        response = self.client.embeddings.create(
-                            model=self.model_name,
-                            input=batch
-                        )
-                        
-                        batch_embeddings = [item.embedding for item in response.data]
-                        all_embeddings.extend(batch_embeddings)
-                        
-                        # 토큰 사용량 추적기에 토큰 추가
-                        tracker.add_tokens(
-                            prompt_tokens=response.usage.prompt_tokens,
-                            total_tokens=response.usage.total_tokens
-                        )
-                        
-                        # 마지막 토큰 사용량 기록 (호환성 유지)
-                        total_tokens += response.usage.total_tokens
-                        total_prompt_tokens += response.usage.prompt_tokens
-                        logger.info(f"OpenAI[Sync] 임베딩 토큰 사용량: {response.usage.total_tokens} (누적 {total_tokens})")
-                    
-                    except Exception as e:
-                        logger.error(f"OpenAI 임베딩 생성 실패: {str(e)}")
-                        raise
-                
-                # 마지막 토큰 사용량 저장 (호환성 유지)
-                if total_tokens > 0:
-                    self.last_token_usage = {
-                        "prompt_tokens": total_prompt_tokens,
-                        "completion_tokens": 0,
-                        "total_tokens": total_tokens,
-                        "total_cost": 0.0
-                    }
+                result = _dispatch()
+                # 토큰 사용량 추적기에 토큰 추가
+                tracker.add_tokens(
+                    prompt_tokens=result.prompt_tokens,
+                    total_tokens=result.total_tokens
+                )
         else:
             # user_id나 project_type이 없는 경우 토큰 추적 없이 실행
-            total_tokens = 0
-            total_prompt_tokens = 0
-            
-            for batch in batches:
-                try:
-                    response = self.client.embeddings.create(
-                        model=self.model_name,
-                        input=batch
-                    )
-                    
-                    batch_embeddings = [item.embedding for item in response.data]
-                    all_embeddings.extend(batch_embeddings)
-                    
-                    # 토큰 사용량 누적
-                    total_tokens += response.usage.total_tokens
-                    total_prompt_tokens += response.usage.prompt_tokens
-                    logger.info(f"OpenAI[Sync] 임베딩 토큰 사용량: {response.usage.total_tokens} (누적 {total_tokens})")
-                
-                except Exception as e:
-                    logger.error(f"OpenAI 임베딩 생성 실패: {str(e)}")
-                    raise
-            
-            # 토큰 사용량 저장
-            if total_tokens > 0:
-                self.last_token_usage = {
-                    "prompt_tokens": total_prompt_tokens,
-                    "completion_tokens": 0,
-                    "total_tokens": total_tokens,
-                    "total_cost": 0.0
-                }
+            result = _dispatch()
         
-        return all_embeddings
+        logger.info(f"OpenAI[Sync] 임베딩 완료: {len(texts)}개 텍스트, {result.num_batches} 배치, 토큰 {result.total_tokens} (재시도 {result.retries})")
+        self._set_last_token_usage(result, completion_tokens=0)
+        return result.embeddings
 
 class UpstageEmbeddingProvider(EmbeddingProvider):
     def __init__(self, model_name: str, max_tokens: int = 8191):
@@ -529,6 +555,18 @@ class UpstageEmbeddingProvider(EmbeddingProvider):
         
         # 마지막 토큰 사용량 저장 속성
         self.last_token_usage = None
+        
+        # 배치 제한: 요청당 최대 100개 텍스트, 총 토큰 204,800 미만
+        self.max_batch_size = 100
+        self.max_batch_tokens = 100000
+        
+        # 배치 동시 요청 디스패처 (API 키 단위 속도 제한 공유)
+        self.dispatcher = EmbeddingDispatcher(
+            max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+            rate_limiter=get_rate_limiter("upstage", settings.UPSTAGE_EMBEDDING_TPM, settings.UPSTAGE_EMBEDDING_RPM),
+            max_retries=settings.EMBEDDING_MAX_RETRIES,
+            name="upstage-embedding"
+        )
 
     # embedding-query : Solar-based Query Embedding model with a 4k context limit. This model is optimized for embedding user's question in information-seeking tasks such as retrieval & reranking.
     # embedding-passage : Solar-based Passage Embedding model with a 4k context limit. This model is optimized for embedding documents or texts to be searched.
@@ -540,10 +578,36 @@ class UpstageEmbeddingProvider(EmbeddingProvider):
     def count_tokens(self, text: str) -> int:
         return TokenCounter.count_tokens_upstage(text)
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        return TokenCounter.count_tokens_upstage_batch(texts)
+    
     def get_embeddings_obj(self) -> Tuple[Embeddings, Embeddings]:
         """임베딩 객체 반환, [Sync, Async]"""
         return self.client, self.client
     
+    def _build_batches(self, texts: List[str]) -> List[EmbeddingBatch]:
+        """토큰 수 기준 배치 구성 (토큰 수는 한 번에 계산)"""
+        return build_batches_from_counts(texts, self.count_tokens_batch(texts), self.max_batch_tokens, self.max_batch_size)
+    
+    def _set_last_token_usage(self, result: DispatchResult, completion_tokens: Optional[int]) -> None:
+        """마지막 토큰 사용량 저장 (호환성 유지)"""
+        if result.total_tokens > 0:
+            self.last_token_usage = {
+                "prompt_tokens": result.prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": result.total_tokens,
+                "total_cost": 0.0
+            }
+    
+    @staticmethod
+    def _extract_embeddings(response) -> List[List[float]]:
+        """응답에서 임베딩 추출 및 null 임베딩 검사"""
+        batch_embeddings = [item.embedding for item in response.data]
+        for i, embedding in enumerate(batch_embeddings):
+            if embedding is None:
+                logger.warning(f"Null 임베딩 발견: 항목 #{i}")
+        return batch_embeddings
+    
     @track_token_usage_bg(token_type="embedding")
     async def create_embeddings_async(
         self, 
@@ -553,73 +617,42 @@ class UpstageEmbeddingProvider(EmbeddingProvider):
         project_type: Optional[str] = None,
         db: Optional[AsyncSession] = None
     ) -> List[List[float]]:
-        """비동기적으로 Upstage 임베딩 생성"""
+        """비동기적으로 Upstage 임베딩 생성 (배치 동시 요청, 결과는 입력 순서)"""
         if not texts:
             return []
             
-        all_embeddings = []
+        # 지원되는 모델: embedding-query 또는 embedding-passage
+        model_name = "embedding-query" if embeddings_task_type == "RETRIEVAL_QUERY" else "embedding-passage"
         
-        # 토큰 사용량 누적을 위한 변수들
-        total_tokens = 0
-        total_prompt_tokens = 0
-        
-        # Text 분할 필요 시 처리
-        batches = self.validate_and_split_texts(texts)
+        # 토큰 수 기준 배치 구성
+        batches = self._build_batches(texts)
         logger.info(f"Upstage 임베딩 생성 시작 (비동기): {len(batches)} 배치")
         
-        for batch_idx, batch in enumerate(batches):
-            try:
-                logger.debug(f"Upstage 임베딩 배치 처리 (비동기) #{batch_idx+1}/{len(batches)}: {len(batch)} 텍스트")
-                
-                # 지원되는 모델: embedding-query 또는 embedding-passage
-                model_name = "embedding-query" if embeddings_task_type == "RETRIEVAL_QUERY" else "embedding-passage"
-                logger.debug(f"Upstage API 요청 (비동기) - 모델: {model_name}, 입력 텍스트 수: {len(batch)}")
-                
-                # 비동기 클라이언트로 임베딩 생성
-                response = await self.async_client.embeddings.create(
-                    model=model_name,
-                    input=batch
-                )
-                
-                # 응답 구조 로깅
-                if batch_idx == 0:  # 첫 번째 배치만 상세 로깅
-                    logger.debug(f"Upstage API 응답 구조 (비동기): {dir(response)}")
-                    if hasattr(response, 'data') and response.data:
-                        logger.debug(f"응답 데이터 첫 항목 구조 (비동기): {dir(response.data[0])}")
-                
-                # 임베딩 데이터 추출
-                batch_embeddings = [item.embedding for item in response.data]
-                logger.debug(f"추출된 임베딩 수 (비동기): {len(batch_embeddings)}")
-                
-                # null 임베딩 검사
-                for i, embedding in enumerate(batch_embeddings):
-                    if embedding is None:
-                        logger.warning(f"Null 임베딩 발견 (비동기): 배치 #{batch_idx+1}, 항목 #{i}")
-                
-                all_embeddings.extend(batch_embeddings)
-                
-                # 토큰 사용량 누적 (내부 추적용)
-                total_tokens += response.usage.total_tokens
-                total_prompt_tokens += response.usage.prompt_tokens
-                logger.info(f"Upstage[Async] 임베딩 토큰 사용량: {response.usage.total_tokens} (누적 {total_tokens})")
-                
-            except Exception as e:
-                logger.error(f"Upstage 임베딩 생성 실패 (비동기, 배치 #{batch_idx+1}): {str(e)}", exc_info=True)
-                if isinstance(e, AttributeError) and "object has no attribute 'embedding'" in str(e):
-                    logger.error("응답 데이터 구조가 예상과 다릅니다. 응답 구조를 확인하세요.")
-                raise
+        async def _embed_batch(batch: List[str]) -> BatchEmbeddingResult:
+            logger.debug(f"Upstage API 요청 (비동기) - 모델: {model_name}, 입력 텍스트 수: {len(batch)}")
+            # 비동기 클라이언트로 임베딩 생성
+            response = await self.async_client.embeddings.create(
+                model=model_name,
+                input=batch
+            )
+            logger.info(f"Upstage[Async] 임베딩 토큰 사용량: {response.usage.total_tokens}")
+            return BatchEmbeddingResult(
+                embeddings=self._extract_embeddings(response),
+                prompt_tokens=response.usage.prompt_tokens,
+                total_tokens=response.usage.total_tokens
+            )
         
-        # 마지막 토큰 사용량 저장 (호환성 유지)
-        if total_tokens > 0:
-            self.last_token_usage = {
-                "prompt_tokens": total_prompt_tokens,
-                "completion_tokens": None,
-                "total_tokens": total_tokens,
-                "total_cost": 0.0
-            }
+        try:
+            result = await self.dispatcher.dispatch(batches, _embed_batch)
+        except Exception as e:
+            logger.error(f"Upstage 임베딩 생성 실패 (비동기): {str(e)}", exc_info=True)
+            if isinstance(e, AttributeError) and "object has no attribute 'embedding'" in str(e):
+                logger.error("응답 데이터 구조가 예상과 다릅니다. 응답 구조를 확인하세요.")
+            raise
         
-        logger.info(f"Upstage 임베딩 생성 완료 (비동기): 총 {len(all_embeddings)}개 임베딩 생성")
-        return all_embeddings
+        self._set_last_token_usage(result, completion_tokens=None)
+        logger.info(f"Upstage 임베딩 생성 완료 (비동기): 총 {len(result.embeddings)}개 임베딩 생성 (재시도 {result.retries})")
+        return result.embeddings
 
     def create_embeddings(
         self, 
@@ -628,16 +661,42 @@ class UpstageEmbeddingProvider(EmbeddingProvider):
         user_id: Optional[UUID] = None,
         project_type: Optional[str] = None
     ) -> List[List[float]]:
-        """동기적으로 Upstage 임베딩 생성"""
+        """동기적으로 Upstage 임베딩 생성 (배치 동시 요청, 결과는 입력 순서)"""
         if not texts:
             return []
             
-        all_embeddings = []
+        # 지원되는 모델: embedding-query 또는 embedding-passage
+        # embedding-query: 검색 질의용 임베딩
+        # embedding-passage: 문서 임베딩
+        model_name = "embedding-query" if embeddings_task_type == "RETRIEVAL_QUERY" else "embedding-passage"
         
-        # Text 분할 필요 시 처리
-        batches = self.validate_and_split_texts(texts)
+        # 토큰 수 기준 배치 구성
+        batches = self._build_batches(texts)
         logger.info(f"Upstage 임베딩 생성 시작: {len(batches)} 배치")
         
+        def _embed_batch(batch: List[str]) -> BatchEmbeddingResult:
+            logger.debug(f"Upstage API 요청 - 모델: {model_name}, 입력 텍스트 수: {len(batch)}")
+            # OpenAI API 호환 형식으로 호출
+            response = self.client.embeddings.create(
+                model=model_name,
+                input=batch
+            )
+            logger.info(f"Upstage[Sync] 임베딩 토큰 사용량: {response.usage.total_tokens}")
+            return BatchEmbeddingResult(
+                embeddings=self._extract_embeddings(response),
+                prompt_tokens=response.usage.prompt_tokens,
+                total_tokens=response.usage.total_tokens
+            )
+        
+        def _dispatch() -> DispatchResult:
+            try:
+                return self.dispatcher.dispatch_sync(batches, _embed_batch)
+            except Exception as e:
+                logger.error(f"Upstage 임베딩 생성 실패: {str(e)}", exc_info=True)
+                if isinstance(e, AttributeError) and "object has no attribute 'embedding'" in str(e):
+                    logger.error("응답 데이터 구조가 예상과 다릅니다. 응답 구조를 확인하세요.")
+                raise
+        
         # 토큰 사용량 추적을 위한 컨텍스트 매니저 사용
         if user_id and project_type:
             # 동기 DB 세션 팩토리
@@ -650,132 +709,31 @@ class UpstageEmbeddingProvider(EmbeddingProvider):
                 model_name=self.model_name,
                 db_getter=SessionLocal
             ) as tracker:
-                total_tokens = 0
-                total_prompt_tokens = 0
-                
-                for batch_idx, batch in enumerate(batches):
-                    try:
-                        logger.debug(f"Upstage 임베딩 배치 처리 #{batch_idx+1}/{len(batches)}: {len(batch)} 텍스트")
-                        
-                        # 지원되는 모델: embedding-query 또는 embedding-passage
-                        # embedding-query: 검색 질의용 임베딩
-                        # embedding-passage: 문서 임베딩
-                        model_name = "embedding-query" if embeddings_task_type == "RETRIEVAL_QUERY" else "embedding-passage"
-                        logger.debug(f"Upstage API 요청 - 모델: {model_name}, 입력 텍스트 수: {len(batch)}")
-                        
-                        # OpenAI API 호환 형식으로 호출
-                        response = self.client.embeddings.create(
-                            model=model_name,
-                            input=batch
-                        )
-                        
-                        # 응답 구조 로깅
-                        if batch_idx == 0:  # 첫 번째 배치만 상세 로깅
-                            logger.debug(f"Upstage API 응답 구조: {dir(response)}")
-                            if hasattr(response, 'data') and response.data:
-                                logger.debug(f"응답 데이터 첫 항목 구조: {dir(response.data[0])}")
-                        
-                        # 임베딩 데이터 추출
-                        batch_embeddings = [item.embedding for item in response.data]
-                        logger.debug(f"추출된 임베딩 수: {len(batch_embeddings)}")
-                        
-                        # null 임베딩 검사
-                        for i, embedding in enumerate(batch_embeddings):
-                            if embedding is None:
-                                logger.warning(f"Null 임베딩 발견: 배치 #{batch_idx+1}, 항목 #{i}")
-                        
-                        all_embeddings.extend(batch_embeddings)
-                        
-                        # 토큰 사용량 추적기에 토큰 추가
-                        tracker.add_tokens(
-                            prompt_tokens=response.usage.prompt_tokens,
-                            total_tokens=response.usage.total_tokens
-                        )
-                        
-                        # 토큰 사용량 누적 (내부 추적용)
-                        total_tokens += response.usage.total_tokens
-                        total_prompt_tokens += response.usage.prompt_tokens
-                        logger.info(f"Upstage[Sync] 임베딩 토큰 사용량: {response.usage.total_tokens} (누적 {total_tokens})")
-                    
-                    except Exception as e:
-                        logger.error(f"Upstage 임베딩 생성 실패 (배치 #{batch_idx+1}): {str(e)}", exc_info=True)
-                        if isinstance(e, AttributeError) and "object has no attribute 'embedding'" in str(e):
-                            logger.error("응답 데이터 구조가 예상과 다릅니다. 응답 구조를 확인하세요.")
-                        raise
-                
-                # 마지막 토큰 사용량 저장 (호환성 유지)
-                if total_tokens > 0:
-                    self.last_token_usage = {
-                        "prompt_tokens": total_prompt_tokens,
-                        "completion_tokens": 0,
-                        "total_tokens": total_tokens,
-                        "total_cost": 0.0
-                    }
+                result = _dispatch()
+                # 토큰 사용량 추적기에 토큰 추가
+                tracker.add_tokens(
+                    prompt_tokens=result.prompt_tokens,
+                    total_tokens=result.total_tokens
+                )
         else:
             # 토큰 추적 없이 실행
-            total_tokens = 0
-            total_prompt_tokens = 0
-            
-            for batch_idx, batch in enumerate(batches):
-                try:
-                    logger.debug(f"Upstage 임베딩 배치 처리 #{batch_idx+1}/{len(batches)}: {len(batch)} 텍스트")
-                    
-                    # 지원되는 모델: embedding-query 또는 embedding-passage
-                    model_name = "embedding-query" if embeddings_task_type == "RETRIEVAL_QUERY" else "embedding-passage"
-                    logger.debug(f"Upstage API 요청 - 모델: {model_name}, 입력 텍스트 수: {len(batch)}")
-                    
-                    # OpenAI API 직접 호출
-                    response = self.client.embeddings.create(
-                        model=model_name,
-                        input=batch
-                    )
-                    
-                    # 응답 구조 로깅
-                    if batch_idx == 0:  # 첫 번째 배치만 상세 로깅
-                        logger.debug(f"Upstage API 응답 구조: {dir(response)}")
-                        if hasattr(response, 'data') and response.data:
-                            logger.debug(f"응답 데이터 첫 항목 구조: {dir(response.data[0])}")
-                    
-                    # 임베딩 데이터 추출
-                    batch_embeddings = [item.embedding for item in response.data]
-                    logger.debug(f"추출된 임베딩 수: {len(batch_embeddings)}")
-                    
-                    # null 임베딩 검사
-                    for i, embedding in enumerate(batch_embeddings):
-                        if embedding is None:
-                            logger.warning(f"Null 임베딩 발견: 배치 #{batch_idx+1}, 항목 #{i}")
-                    
-                    all_embeddings.extend(batch_embeddings)
-                    
-                    # 토큰 사용량 누적
-                    total_tokens += response.usage.total_tokens
-                    total_prompt_tokens += response.usage.prompt_tokens
-                    logger.info(f"Upstage[Sync] 임베딩 토큰 사용량: {response.usage.total_tokens} (누적 {total_tokens})")
-                
-                except Exception as e:
-                    logger.error(f"Upstage 임베딩 생성 실패 (배치 #{batch_idx+1}): {str(e)}", exc_info=True)
-                    if isinstance(e, AttributeError) and "object has no attribute 'embedding'" in str(e):
-                        logger.error("응답 데이터 구조가 예상과 다릅니다. 응답 구조를 확인하세요.")
-                    raise
-            
-            # 마지막 토큰 사용량 저장 (호환성 유지)
-            if total_tokens > 0:
-                self.last_token_usage = {
-                    "prompt_tokens": total_prompt_tokens,
-                    "completion_tokens": 0,
-                    "total_tokens": total_tokens,
-                    "total_cost": 0.0
-                }
+            result = _dispatch()
         
-        logger.info(f"Upstage 임베딩 생성 완료: 총 {len(all_embeddings)}개 임베딩 생성")
-        return all_embeddings
+        self._set_last_token_usage(result, completion_tokens=0)
+        logger.info(f"Upstage 임베딩 생성 완료: 총 {len(result.embeddings)}개 임베딩 생성 (재시도 {result.retries})")
+        return result.embeddings
 
 class BGE_M3_EmbeddingProvider(EmbeddingProvider):
     def __init__(self, model_name: str, max_tokens: int = 8191):
-        from sentence_transformers import SentenceTransformer
+        from common.services.local_embedding_engine import get_local_embedding_engine
         super().__init__(model_name, max_tokens)
-        self.model = SentenceTransformer(model_name)
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # 모델은 프로세스 단위 공유 엔진에서 한 번만 로드 (동시 요청은 엔진에서 배치 처리)
+        self.engine = get_local_embedding_engine(model_name)
+        self.tokenizer = self.engine.tokenizer
+    
+    @property
+    def model(self):
+        return self.engine.model
         
     def count_tokens(self, text: str) -> int:
         try:
@@ -786,7 +744,14 @@ class BGE_M3_EmbeddingProvider(EmbeddingProvider):
             # 실패시 문자 길이로 대략적 계산
             return len(text.split()) * 2
     
-    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        if not texts:
+            return []
+        try:
+            return [len(ids) for ids in self.tokenizer(texts)["input_ids"]]
+        except Exception as e:
+            logger.warning(f"BGE_M3 토크나이저 배치 토큰 카운팅 실패, 개별 계산으로 진행: {str(e)}")
+            return [self.count_tokens(text) for text in texts]
     
     def get_embeddings_obj(self) -> Tuple[Embeddings, Embeddings]:
         """임베딩 객체 반환, [Sync, Async]"""
@@ -805,8 +770,7 @@ class BGE_M3_EmbeddingProvider(EmbeddingProvider):
             
             all_embeddings = []
             for batch in batches:
-                batch_embeddings = self.model.encode(batch).tolist()
-                all_embeddings.extend(batch_embeddings)
+                all_embeddings.extend(self.engine.encode(batch))
             
             return all_embeddings
         except Exception as e:
@@ -824,10 +788,10 @@ class BGE_M3_EmbeddingProvider(EmbeddingProvider):
             batches = self.validate_and_split_texts(texts)
             logger.info(f"BGE-M3 임베딩 생성 시작 (비동기): {len(batches)} 배치")
             
+            # 공유 엔진이 다른 동시 요청과 함께 배치 처리
             all_embeddings = []
-            for batch in batches:
-                batch_embeddings = await asyncio.to_thread(self.model.encode, batch)
-                all_embeddings.extend(batch_embeddings.tolist())
+            for batch_embeddings in await asyncio.gather(*(self.engine.encode_async(batch) for batch in batches)):
+                all_embeddings.extend(batch_embeddings)
             
             return all_embeddings
         except Exception as e:
@@ -848,6 +812,14 @@ class GoogleEmbeddingProvider(EmbeddingProvider):
             
             self.__class__._is_initialized = True
         self._initialize_model(model_name, max_tokens)
+        
+        # 배치 동시 요청 디스패처 (재시도는 _embed_batch의 tenacity가 담당)
+        self.dispatcher = EmbeddingDispatcher(
+            max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+            rate_limiter=get_rate_limiter("google", None, settings.GOOGLE_EMBEDDING_RPM),
+            max_retries=0,
+            name="google-embedding"
+        )
 
     def _initialize_model(self, model_name, max_tokens):
         """모델 초기화 로직"""
@@ -890,7 +862,7 @@ class GoogleEmbeddingProvider(EmbeddingProvider):
         db: Optional[AsyncSession] = None
     ) -> List[List[float]]:
         """Google Vertex AI는 현재 비동기를 직접 지원하지 않아 동기 메서드를 호출"""
-        return await asyncio.to_thread(self.create_embeddings, texts, embeddings_task_type, user_id, project_type, db)
+        return await asyncio.to_thread(self.create_embeddings, texts, embeddings_task_type, user_id, project_type)
     
     def create_embeddings(
         self, 
@@ -899,14 +871,24 @@ class GoogleEmbeddingProvider(EmbeddingProvider):
         user_id: Optional[UUID] = None, 
         project_type: Optional[str] = None
     ) -> List[List[float]]:
-        """텍스트 임베딩 생성"""
+        """텍스트 임베딩 생성 (배치 동시 요청, 결과는 배치 순서)"""
         if not texts:
             return []
             
-        all_embeddings = []
+        # Google 임베딩은 배치 처리가 필요함 (배치 구성 시 계산한 토큰 수 재사용)
+        batches = self.plan_batches(texts)
+        # 토큰 수 추정 (Google에서는 정확한 토큰 수를 제공하지 않음)
+        estimated_tokens = sum(batch.tokens for batch in batches)
+        
+        def _embed_batch(batch: List[str]) -> BatchEmbeddingResult:
+            return BatchEmbeddingResult(embeddings=self._embed_batch(batch, embeddings_task_type))
         
-        # Google 임베딩은 배치 처리가 필요함
-        batches = self.validate_and_split_texts(texts)
+        def _dispatch() -> DispatchResult:
+            try:
+                return self.dispatcher.dispatch_sync(batches, _embed_batch)
+            except Exception as e:
+                logger.error(f"Google 임베딩 생성 실패: {str(e)}")
+                raise
         
         # 토큰 사용량 추적
         if user_id and project_type:
@@ -920,37 +902,17 @@ class GoogleEmbeddingProvider(EmbeddingProvider):
                 model_name=self.model_name,
                 db_getter=SessionLocal
             ) as tracker:
-                # 토큰 수 추정 및 추적
-                for batch in batches:
-                    try:
-                        # 임베딩 생성
-                        embeddings_batch = self._embed_batch(batch, embeddings_task_type)
-                        all_embeddings.extend(embeddings_batch)
-                        
-                        # 토큰 수 추정 (Google에서는 정확한 토큰 수를 제공하지 않음)
-                        estimated_tokens = sum(self.count_tokens(text) for text in batch)
-                        tracker.add_tokens(
-                            prompt_tokens=estimated_tokens,
-                            total_tokens=estimated_tokens
-                        )
-                        logger.info(f"Google[Sync] 임베딩 토큰 사용량 추정: 약 {estimated_tokens} 토큰")
-                        
-                    except Exception as e:
-                        logger.error(f"Google 임베딩 생성 실패: {str(e)}")
-                        raise
+                result = _dispatch()
+                tracker.add_tokens(
+                    prompt_tokens=estimated_tokens,
+                    total_tokens=estimated_tokens
+                )
+                logger.info(f"Google[Sync] 임베딩 토큰 사용량 추정: 약 {estimated_tokens} 토큰")
         else:
             # 토큰 추적 없이 실행
-            for batch in batches:
-                try:
-                    # 임베딩 생성
-                    embeddings_batch = self._embed_batch(batch, embeddings_task_type)
-                    all_embeddings.extend(embeddings_batch)
-                    
-                except Exception as e:
-                    logger.error(f"Google 임베딩 생성 실패: {str(e)}")
-                    raise
+            result = _dispatch()
         
-        return all_embeddings
+        return result.embeddings
 
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(3), # 최대 3회 재시도
@@ -1005,44 +967,44 @@ class GoogleEmbeddingProvider(EmbeddingProvider):
 
     def validate_and_split_texts(self, texts: List[str]) -> List[List[str]]:
         """구글 모델용 토큰 분할"""
+        return [batch.texts for batch in self.plan_batches(texts)]
+
+    def plan_batches(self, texts: List[str]) -> List[EmbeddingBatch]:
+        """구글 모델용 토큰 분할 (배치별 텍스트와 토큰 수 반환)"""
         #OpenAI 모델은 List[str]이 8191 이내면 됨. 개별 str취급안함. 
         #구글 모델은 List[str]은 20000 토큰, 개별 str당 2048 토큰 이내.
         #str은 청크단위.
         batches = []
         current_batch = []
+        current_counts = []
         current_tokens = 0
 
-        for text in texts:
-            if not text or not text.strip():
-                continue
-
-            text = text.strip()
-            tokens = self.count_tokens(text)
+        def _add(text: str, tokens: int):
+            nonlocal current_batch, current_counts, current_tokens
+            if not current_batch or current_tokens + tokens <= self.max_tokens:
+                current_batch.append(text)
+                current_counts.append(tokens)
+                current_tokens += tokens
+            else:
+                batches.append(EmbeddingBatch(texts=current_batch, tokens=current_tokens, token_counts=current_counts))
+                current_batch = [text]
+                current_counts = [tokens]
+                current_tokens = tokens
 
+        stripped_texts = [text.strip() for text in texts if text and text.strip()]
+        for text, tokens in zip(stripped_texts, self.count_tokens_batch(stripped_texts)):
             if tokens > self.max_tokens:
                 logger.warning(f"텍스트가 토큰 제한({self.max_tokens})을 초과하여 분할 처리함: {tokens} tokens")
                 split_texts = self.split_text_by_tokens(text)
-                for split_text in split_texts:
-                    split_tokens = self.count_tokens(split_text) # 분할된 텍스트의 토큰 수를 계산
-                    if current_tokens + split_tokens <= self.max_tokens:
-                        current_batch.append(split_text)
-                        current_tokens += split_tokens
-                    else:
-                        batches.append(current_batch)
-                        current_batch = [split_text]
-                        current_tokens = split_tokens
+                # 분할된 텍스트의 토큰 수를 계산
+                for split_text, split_tokens in zip(split_texts, self.count_tokens_batch(split_texts)):
+                    _add(split_text, split_tokens)
                 continue # 분할된 텍스트 처리를 완료했으므로 다음 텍스트로 넘어감
 
-            if current_tokens + tokens <= self.max_tokens:
-                current_batch.append(text)
-                current_tokens += tokens
-            else:
-                batches.append(current_batch)
-                current_batch = [text]
-                current_tokens = tokens
+            _add(text, tokens)
 
         if current_batch:
-            batches.append(current_batch)
+            batches.append(EmbeddingBatch(texts=current_batch, tokens=current_tokens, token_counts=current_counts))
 
         return batches
 
@@ -1066,6 +1028,16 @@ class KakaoEmbeddingProvider(EmbeddingProvider):
             logger.warning(f"카카오 토크나이저 토큰 카운팅 실패: {str(e)}")
             # 실패시 문자 길이로 대략적 계산
             return len(text.split()) * 2
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """카카오 토크나이저 배치 모드로 토큰 수 계산"""
+        if not texts:
+            return []
+        try:
+            return [len(ids) for ids in self.tokenizer(texts)["input_ids"]]
+        except Exception as e:
+            logger.warning(f"카카오 토크나이저 배치 토큰 카운팅 실패, 개별 계산으로 진행: {str(e)}")
+            return [self.count_tokens(text) for text in texts]
             
     async def create_embeddings_async(
         self, 
@@ -0,0 +1,259 @@
+"""
+에이전트 LLM 응답 캐시 모듈
+
+temperature=0으로 설정된 에이전트의 LLM 응답을 Redis에 저장해 같은 프롬프트의 반복 호출을 건너뜁니다.
+(인기 질문 분류, 재게시된 텔레그램 메시지 키워드 추출, 같은 리포트 묶음의 투자 의견 추출 등)
+
+- 키: 에이전트 이름 + (모델, temperature, 렌더링된 프롬프트, 호출 옵션)의 sha256
+- 에이전트별 인덱스(ZSET, 마지막 사용 시각)로 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+- 적중/미스 횟수와 절약한 토큰 수를 프로세스 내 통계(stats)와 Redis 해시(llm_cache:stats:<에이전트>)에 기록
+- Redis 오류는 로깅 후 캐시 미스로 처리하므로 LLM 호출 실패로 이어지지 않음
+- 구조화된 출력 호출은 파싱에 성공한 응답만 저장 (AgentLLM의 cache_validator)
+- 전체 스위치 LLM_RESPONSE_CACHE_ENABLED는 기본 비활성화이며, 켜면 에이전트 설정에
+  response_cache가 있는 에이전트에만 적용
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+from loguru import logger
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+from common.core.config import settings
+from common.core.redis import async_redis_client
+
+
+class LLMResponseCache:
+    """Redis 기반 에이전트 LLM 응답 캐시 (동기/비동기 호출 모두 지원)"""
+
+    KEY_PREFIX = "llm_cache:"
+
+    def __init__(self, redis_url: str, ttl: int = 86400, max_entries: int = 2000, redis: Optional[Redis] = None):
+        """
+        Args:
+            redis_url: Redis 서버 URL
+            ttl: 캐시 만료 시간 (초)
+            max_entries: 에이전트별 최대 캐시 항목 수
+            redis: 사용할 비동기 Redis 클라이언트 (None이면 redis_url로 생성)
+        """
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._redis: Optional[Redis] = redis
+        self._sync_redis: Optional[SyncRedis] = None
+        # 에이전트별 통계 (프로세스 내)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def redis(self) -> Redis:
+        if self._redis is None:
+            self._redis = Redis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    @property
+    def sync_redis(self) -> SyncRedis:
+        if self._sync_redis is None:
+            self._sync_redis = SyncRedis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+        return self._sync_redis
+
+    @staticmethod
+    def render_prompt(prompt: Any) -> str:
+        """LLM 입력(문자열, PromptValue, 메시지 목록)을 키 생성용 문자열로 변환"""
+        if hasattr(prompt, "to_messages"):
+            prompt = prompt.to_messages()
+        if isinstance(prompt, str):
+            return prompt
+        if isinstance(prompt, (list, tuple)):
+            return json.dumps(
+                [[message.type, message.content] if isinstance(message, BaseMessage) else message for message in prompt],
+                ensure_ascii=False,
+                default=str
+            )
+        return str(prompt)
+
+    def make_key(self, agent_name: str, model_name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            agent_name: 에이전트 이름
+            model_name: 모델 이름
+            args: LLM 호출 위치 인자 (프롬프트)
+            kwargs: LLM 호출 키워드 인자 (stop 등, 토큰 추적 인자 제외)
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "temperature": 0,
+                "prompt": [self.render_prompt(arg) for arg in args],
+                "options": kwargs,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}{agent_name}:{digest}"
+
+    def _index_key(self, agent_name: str) -> str:
+        return f"{self.KEY_PREFIX}index:{agent_name}"
+
+    def _stats_key(self, agent_name: str) -> str:
+        return f"{self.KEY_PREFIX}stats:{agent_name}"
+
+    @staticmethod
+    def _dumps(message: Any) -> Optional[str]:
+        """응답 메시지 직렬화 (메시지가 아니면 None: 캐시하지 않음)"""
+        if not isinstance(message, BaseMessage):
+            return None
+        return json.dumps(messages_to_dict([message])[0], ensure_ascii=False, default=str)
+
+    @staticmethod
+    def _loads(raw: str) -> BaseMessage:
+        return messages_from_dict([json.loads(raw)])[0]
+
+    def _agent_stats(self, agent_name: str) -> Dict[str, int]:
+        return self.stats.setdefault(agent_name, {
+            "hits": 0,
+            "misses": 0,
+            "errors": 0,
+            "saved_prompt_tokens": 0,
+            "saved_completion_tokens": 0,
+            "saved_total_tokens": 0,
+        })
+
+    def _record_hit(self, agent_name: str, message: BaseMessage) -> int:
+        """적중 기록 후 절약한 총 토큰 수 반환"""
+        stats = self._agent_stats(agent_name)
+        stats["hits"] += 1
+        usage = getattr(message, "usage_metadata", None) or {}
+        stats["saved_prompt_tokens"] += usage.get("input_tokens", 0)
+        stats["saved_completion_tokens"] += usage.get("output_tokens", 0)
+        stats["saved_total_tokens"] += usage.get("total_tokens", 0)
+        return usage.get("total_tokens", 0)
+
+    def _record_error(self, agent_name: str, action: str, error: Exception) -> None:
+        self._agent_stats(agent_name)["errors"] += 1
+        logger.warning(f"[LLM 응답 캐시] Redis {action} 실패 ({agent_name}): {str(error)}")
+
+    async def aget(self, agent_name: str, key: str) -> Optional[BaseMessage]:
+        """캐시된 응답 조회 (미스 또는 Redis 오류 시 None)"""
+        try:
+            raw = await self.redis.get(key)
+            if raw is None:
+                self._agent_stats(agent_name)["misses"] += 1
+                return None
+            message = self._loads(raw)
+            saved_tokens = self._record_hit(agent_name, message)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(self._index_key(agent_name), {key: time.time()})
+                pipe.hincrby(self._stats_key(agent_name), "hits", 1)
+                pipe.hincrby(self._stats_key(agent_name), "saved_total_tokens", saved_tokens)
+                await pipe.execute()
+            logger.info(f"[LLM 응답 캐시] 적중: {agent_name}, 절약 토큰={saved_tokens}")
+            return message
+        except Exception as e:
+            self._record_error(agent_name, "조회", e)
+            return None
+
+    async def aset(self, agent_name: str, key: str, message: Any, ttl: Optional[int] = None, max_entries: Optional[int] = None) -> None:
+        """응답을 저장하고 에이전트별 최대 항목 수를 넘는 오래된 항목 제거"""
+        value = self._dumps(message)
+        if value is None:
+            return
+        ttl = ttl or self.ttl
+        max_entries = max_entries or self.max_entries
+        index_key = self._index_key(agent_name)
+        now = time.time()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, value, ex=ttl)
+                pipe.zadd(index_key, {key: now})
+                pipe.zremrangebyscore(index_key, "-inf", now - ttl)
+                pipe.expire(index_key, ttl)
+                pipe.hincrby(self._stats_key(agent_name), "misses", 1)
+                pipe.zcard(index_key)
+                results = await pipe.execute()
+
+            overflow = results[-1] - max_entries
+            if overflow > 0:
+                evicted = await self.redis.zpopmin(index_key, overflow)
+                if evicted:
+                    await self.redis.delete(*[evicted_key for evicted_key, _ in evicted])
+        except Exception as e:
+            self._record_error(agent_name, "저장", e)
+
+    def get(self, agent_name: str, key: str) -> Optional[BaseMessage]:
+        """캐시된 응답 조회 - 동기 버전 (Celery 작업 등)"""
+        try:
+            raw = self.sync_redis.get(key)
+            if raw is None:
+                self._agent_stats(agent_name)["misses"] += 1
+                return None
+            message = self._loads(raw)
+            saved_tokens = self._record_hit(agent_name, message)
+            with self.sync_redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(self._index_key(agent_name), {key: time.time()})
+                pipe.hincrby(self._stats_key(agent_name), "hits", 1)
+                pipe.hincrby(self._stats_key(agent_name), "saved_total_tokens", saved_tokens)
+                pipe.execute()
+            logger.info(f"[LLM 응답 캐시] 적중: {agent_name}, 절약 토큰={saved_tokens}")
+            return message
+        except Exception as e:
+            self._record_error(agent_name, "조회", e)
+            return None
+
+    def set(self, agent_name: str, key: str, message: Any, ttl: Optional[int] = None, max_entries: Optional[int] = None) -> None:
+        """응답 저장 - 동기 버전 (Celery 작업 등)"""
+        value = self._dumps(message)
+        if value is None:
+            return
+        ttl = ttl or self.ttl
+        max_entries = max_entries or self.max_entries
+        index_key = self._index_key(agent_name)
+        now = time.time()
+        try:
+            with self.sync_redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, value, ex=ttl)
+                pipe.zadd(index_key, {key: now})
+                pipe.zremrangebyscore(index_key, "-inf", now - ttl)
+                pipe.expire(index_key, ttl)
+                pipe.hincrby(self._stats_key(agent_name), "misses", 1)
+                pipe.zcard(index_key)
+                results = pipe.execute()
+
+            overflow = results[-1] - max_entries
+            if overflow > 0:
+                evicted = self.sync_redis.zpopmin(index_key, overflow)
+                if evicted:
+                    self.sync_redis.delete(*[evicted_key for evicted_key, _ in evicted])
+        except Exception as e:
+            self._record_error(agent_name, "저장", e)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """에이전트별 통계 (프로세스 내) 반환"""
+        result = {}
+        for agent_name, stats in self.stats.items():
+            lookups = stats["hits"] + stats["misses"]
+            result[agent_name] = {**stats, "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0}
+        return result
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """프로세스 단위로 공유되는 LLM 응답 캐시 반환"""
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache(
+            redis_url=settings.REDIS_URL,
+            ttl=settings.LLM_RESPONSE_CACHE_TTL,
+            max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+            redis=async_redis_client.get_client(),
+        )
+    return _llm_response_cache
@@ -0,0 +1,218 @@
+"""
+로컬(in-process) 임베딩 엔진
+
+sentence-transformers 임베딩 모델(BGE-M3 등)을 프로세스당 한 번만 로드하여 공유합니다.
+- 모델은 첫 추론 시 추론 스레드에서 한 번만 로드 (제공자 인스턴스마다 복제하지 않음)
+- 동시에 들어온 create_embeddings_async 요청의 텍스트를 짧은 대기 시간(batch_wait_ms) 동안 모아 한 번에 추론
+- 배치 안에서는 텍스트 길이 순으로 정렬하여 패딩을 줄이고, 결과는 입력 순서로 되돌림
+- CPU 전용 서버에서는 ONNX Runtime 또는 int8 동적 양자화 경로를 선택적으로 사용
+
+유료 API 없이 동작하므로 개발/CI 환경의 임베딩 제공자로도 사용할 수 있습니다.
+
+사용 예:
+```
+engine = get_local_embedding_engine("dragonkue/bge-m3-ko")
+embeddings = await engine.encode_async(["삼성전자 1분기 실적"])
+```
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from common.core.config import settings
+from common.services.micro_batcher import AsyncMicroBatcher
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+
+class LocalEmbeddingEngine:
+    """
+    프로세스 단위로 공유되는 로컬 임베딩 엔진
+
+    추론은 단일 전용 스레드에서 순차 실행되며, 동시에 들어온 텍스트를 AsyncMicroBatcher로 모아
+    batch_wait_ms 후(또는 max_batch_size 도달 시) 한 번의 encode로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str = "cpu",
+        backend: str = "torch",
+        quantize: bool = False,
+        max_batch_size: int = 256,
+        batch_wait_ms: float = 5.0,
+        encode_batch_size: int = 32
+    ):
+        """
+        Args:
+            model_name: sentence-transformers 모델 이름 또는 경로
+            device: 실행 장치 (cpu 또는 cuda)
+            backend: 추론 백엔드 (torch 또는 onnx)
+            quantize: CPU에서 int8 동적 양자화 사용 여부
+            max_batch_size: 한 번의 encode로 처리할 최대 텍스트 수
+            batch_wait_ms: 동시 요청을 모으기 위한 대기 시간(ms)
+            encode_batch_size: 모델 forward 한 번에 넣을 텍스트 수
+        """
+        self.model_name = model_name
+        self.device = device
+        self.backend = backend
+        self.quantize = quantize
+        self.max_batch_size = max_batch_size
+        self.batch_wait_ms = batch_wait_ms
+        self.encode_batch_size = encode_batch_size
+        self._model = None
+        self._tokenizer = None
+        self._model_lock = threading.Lock()
+        # 추론은 단일 전용 스레드에서 순차 실행 (모델 인스턴스 공유)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-embedding")
+        self._batcher = AsyncMicroBatcher(
+            self._encode,
+            self._executor,
+            max_batch_size=max_batch_size,
+            batch_wait_ms=batch_wait_ms,
+            item_stat="texts",
+            extra_stats=("requests",)
+        )
+        self.stats = self._batcher.stats
+
+    @property
+    def model(self):
+        """로드된 sentence-transformers 모델 (없으면 로드)"""
+        return self._model or self._load_model()
+
+    @property
+    def tokenizer(self):
+        """토큰 수 계산용 토크나이저 (모델 로드 없이 토크나이저만 로드)"""
+        if self._model is not None:
+            return self._model.tokenizer
+        if self._tokenizer is None:
+            from transformers import AutoTokenizer
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        return self._tokenizer
+
+    def _load_model(self):
+        """설정된 백엔드로 모델 로드 (추론 스레드 또는 최초 호출 스레드에서 한 번만)"""
+        with self._model_lock:
+            if self._model is not None:
+                return self._model
+
+            if SentenceTransformer is None:
+                raise ImportError("sentence-transformers 패키지가 설치되지 않았습니다. pip install sentence-transformers를 실행하세요.")
+
+            if self.backend == "onnx":
+                try:
+                    self._model = self._load_onnx_model()
+                    logger.info(f"로컬 임베딩 ONNX 모델 로드: {self.model_name} (int8: {self.quantize}) [ProcessID: {os.getpid()}]")
+                    return self._model
+                except Exception as e:
+                    logger.warning(f"ONNX 백엔드 로드 실패, torch 백엔드를 사용합니다: {str(e)}")
+
+            model = SentenceTransformer(self.model_name, device=self.device)
+            if self.quantize and self.device == "cpu":
+                import torch
+                model[0].auto_model = torch.quantization.quantize_dynamic(
+                    model[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            self._model = model
+            logger.info(f"로컬 임베딩 모델 로드: {self.model_name} (device: {self.device}, int8: {self.quantize}) [ProcessID: {os.getpid()}]")
+            return self._model
+
+    def _load_onnx_model(self):
+        """ONNX Runtime 백엔드 모델 로드 (optimum[onnxruntime] 필요)"""
+        model = SentenceTransformer(self.model_name, device=self.device, backend="onnx")
+        if not self.quantize:
+            return model
+
+        # int8 동적 양자화 모델을 임시 디렉터리에 내보낸 뒤 다시 로드
+        from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+
+        quantized_dir = tempfile.mkdtemp(prefix="local_embedding_int8_")
+        model.save(quantized_dir)
+        export_dynamic_quantized_onnx_model(model, "avx2", quantized_dir)
+        return SentenceTransformer(
+            quantized_dir,
+            device=self.device,
+            backend="onnx",
+            model_kwargs={"file_name": "onnx/model_qint8_avx2.onnx"}
+        )
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """추론 스레드에서 실행되는 배치 임베딩 (길이 순 정렬 후 입력 순서로 복원)"""
+        model = self._model or self._load_model()
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        vectors = model.encode(
+            [texts[i] for i in order],
+            batch_size=self.encode_batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for position, index in enumerate(order):
+            embeddings[index] = vectors[position].tolist()
+        return embeddings
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        """
+        텍스트 목록을 동기 방식으로 임베딩합니다. (Celery 워커 등 이벤트 루프가 없는 환경)
+
+        추론 스레드를 공유하므로 비동기 요청의 배치와 순서대로 처리됩니다.
+        """
+        if not texts:
+            return []
+        self._batcher.count("requests")
+        return self._batcher.run(texts)
+
+    async def encode_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        텍스트 목록을 임베딩합니다. 동시에 들어온 다른 요청과 함께 한 번의 encode로 처리됩니다.
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+
+        Returns:
+            List[List[float]]: 입력 순서와 같은 순서의 임베딩 목록
+        """
+        if not texts:
+            return []
+        self._batcher.count("requests")
+        return await self._batcher.submit_many(texts)
+
+
+# 설정별 공유 엔진 (프로세스 단위)
+_engines: Dict[Tuple[str, str, str, bool], LocalEmbeddingEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_local_embedding_engine(model_name: str) -> LocalEmbeddingEngine:
+    """
+    (모델, 장치, 백엔드, 양자화) 설정별로 공유되는 로컬 임베딩 엔진을 반환합니다.
+
+    장치/백엔드/양자화/배치 설정은 LOCAL_EMBEDDING_* 환경 변수로 지정합니다.
+
+    Args:
+        model_name: sentence-transformers 모델 이름 또는 경로
+
+    Returns:
+        LocalEmbeddingEngine: 공유 임베딩 엔진
+    """
+    key = (model_name, settings.LOCAL_EMBEDDING_DEVICE, settings.LOCAL_EMBEDDING_BACKEND, settings.LOCAL_EMBEDDING_QUANTIZE)
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = LocalEmbeddingEngine(
+                model_name,
+                device=settings.LOCAL_EMBEDDING_DEVICE,
+                backend=settings.LOCAL_EMBEDDING_BACKEND,
+                quantize=settings.LOCAL_EMBEDDING_QUANTIZE,
+                max_batch_size=settings.LOCAL_EMBEDDING_MAX_BATCH_SIZE,
+                batch_wait_ms=settings.LOCAL_EMBEDDING_BATCH_WAIT_MS,
+                encode_batch_size=settings.LOCAL_EMBEDDING_ENCODE_BATCH_SIZE
+            )
+        return _engines[key]
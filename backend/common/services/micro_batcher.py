@@ -0,0 +1,137 @@
+"""
+비동기 마이크로 배치 처리기
+
+동시에 들어온 요청의 항목을 짧은 대기 시간(batch_wait_ms) 동안 모아 한 번의 배치 함수 호출로 처리합니다.
+- 이벤트 루프별로 대기열을 두고, batch_wait_ms 후(또는 max_batch_size 도달 시) 대기열을 하나의 배치로 처리
+- 크기 도달로 먼저 처리되면 예약해 둔 대기 타이머를 취소해 다음 배치가 일찍 처리되지 않도록 함
+- 배치 함수는 지정한 실행기(모델 추론 전용 스레드 등)에서 실행되어 이벤트 루프를 막지 않음
+- 배치 함수가 실패하면 해당 배치를 기다리는 모든 요청에 예외 전달
+- 통계(stats)는 이벤트 루프와 동기 호출 스레드에서 함께 갱신되므로 잠금 안에서 기록
+
+CrossEncoderScoringService(리랭커)와 LocalEmbeddingEngine(로컬 임베딩)이 사용합니다.
+
+사용 예:
+```
+batcher = AsyncMicroBatcher(model_predict, executor, max_batch_size=64, batch_wait_ms=5, item_stat="pairs")
+scores = await batcher.submit_many([("쿼리", "문서1"), ("쿼리", "문서2")])
+```
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+
+class AsyncMicroBatcher:
+    """
+    동시 요청 항목을 모아 한 번의 배치 함수 호출로 처리하는 비동기 배치 처리기
+
+    process_batch는 항목 목록을 받아 같은 순서의 결과 목록을 반환해야 합니다.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Sequence[Any]],
+        executor: Executor,
+        max_batch_size: int,
+        batch_wait_ms: float,
+        item_stat: str = "items",
+        extra_stats: Iterable[str] = ()
+    ):
+        """
+        Args:
+            process_batch: 실행기에서 실행할 배치 함수 (항목 목록 -> 같은 순서의 결과 목록)
+            executor: 배치 함수를 실행할 실행기
+            max_batch_size: 한 번에 처리할 최대 항목 수
+            batch_wait_ms: 동시 요청을 모으기 위한 대기 시간(ms)
+            item_stat: 처리한 항목 수를 기록할 통계 키
+            extra_stats: 사용하는 쪽에서 count로 기록할 추가 통계 키
+        """
+        self.process_batch = process_batch
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.batch_wait_ms = batch_wait_ms
+        self.item_stat = item_stat
+        self._pending: Dict[asyncio.AbstractEventLoop, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[asyncio.AbstractEventLoop, asyncio.TimerHandle] = {}
+        self._flush_tasks: set = set()
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {"batches": 0, item_stat: 0, **{key: 0 for key in extra_stats}}
+
+    def count(self, key: str, amount: int = 1) -> None:
+        """통계 값 증가 (스레드 안전)"""
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _record_batch(self, size: int) -> None:
+        with self._stats_lock:
+            self.stats["batches"] += 1
+            self.stats[self.item_stat] += size
+
+    def run(self, items: List[Any]) -> List[Any]:
+        """
+        항목 목록을 동기 방식으로 처리합니다. (Celery 워커 등 이벤트 루프가 없는 환경)
+
+        같은 실행기를 사용하므로 비동기 요청의 배치와 순서대로 처리됩니다.
+        """
+        if not items:
+            return []
+        self._record_batch(len(items))
+        return list(self.executor.submit(self.process_batch, items).result())
+
+    async def submit_many(self, items: Sequence[Any]) -> List[Any]:
+        """
+        항목 목록을 대기열에 넣고 결과를 기다립니다. 동시에 들어온 다른 요청과 함께 배치로 처리됩니다.
+
+        Args:
+            items: 처리할 항목 목록
+
+        Returns:
+            List[Any]: 입력 순서와 같은 순서의 결과 목록
+        """
+        if not items:
+            return []
+        loop = asyncio.get_running_loop()
+        futures = []
+        for item in items:
+            future = loop.create_future()
+            self._enqueue(loop, (item, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    def _enqueue(self, loop: asyncio.AbstractEventLoop, entry: Tuple[Any, asyncio.Future]) -> None:
+        """대기열에 항목을 추가하고 필요하면 배치 처리를 예약"""
+        pending = self._pending.setdefault(loop, [])
+        pending.append(entry)
+        if len(pending) >= self.max_batch_size:
+            self._schedule_flush(loop)
+        elif len(pending) == 1:
+            self._timers[loop] = loop.call_later(self.batch_wait_ms / 1000, self._schedule_flush, loop)
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """현재 대기열을 하나의 배치로 떼어내 처리 태스크로 실행"""
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(loop, [])
+        if not batch:
+            return
+        task = loop.create_task(self._flush(loop, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, loop: asyncio.AbstractEventLoop, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """배치를 한 번의 배치 함수 호출로 처리하고 결과를 각 요청에 전달"""
+        self._record_batch(len(batch))
+        try:
+            results = await loop.run_in_executor(self.executor, self.process_batch, [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -6,6 +6,12 @@
 1. Pinecone 리랭킹 API (bge-reranker-v2-m3)
 2. HuggingFace Cross-Encoder
 
+Cross-Encoder 모델은 프로세스당 한 번만 로드되는 공유 스코어링 서비스(CrossEncoderScoringService)를 통해 사용합니다.
+- 추론은 전용 스레드에서 실행되어 이벤트 루프를 막지 않음
+- 동시에 들어온 요청의 (쿼리, 문서) 쌍을 짧은 대기 시간 동안 모아 한 번의 forward로 처리
+- (쿼리 해시, 청크 ID) 단위로 점수를 캐싱
+- CPU 전용 서버에서는 ONNX 또는 int8 동적 양자화 경로를 선택적으로 사용
+
 사용 예:
 ```
 # Pinecone 리랭커 사용
@@ -29,12 +35,17 @@ results = await reranker.rerank(
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import List, Dict, Optional, Any, Union, Tuple
 from pydantic import BaseModel, Field, model_validator
+import hashlib
 import os
+import threading
 from loguru import logger
 
+from common.services.micro_batcher import AsyncMicroBatcher
 from common.services.retrievers.models import DocumentWithScore, RetrievalResult
 
 # Pinecone 리랭킹 의존성
@@ -49,6 +60,12 @@ try:
 except ImportError:
     CrossEncoder = None
 
+# ONNX Runtime 의존성 (선택)
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+except ImportError:
+    ORTModelForSequenceClassification = None
+
 
 class RerankerType(str, Enum):
     """리랭커 타입 열거형"""
@@ -88,6 +105,11 @@ class CrossEncoderRerankerConfig(BaseRerankerConfig):
     model_name: str = Field(default="cross-encoder/ms-marco-MiniLM-L-6-v2", description="Cross-Encoder 모델 이름")
     batch_size: int = Field(default=32, description="배치 크기")
     device: str = Field(default="cpu", description="실행 장치 (cpu 또는 cuda)")
+    backend: str = Field(default="torch", description="추론 백엔드 (torch 또는 onnx)")
+    quantize: bool = Field(default=False, description="CPU에서 int8 동적 양자화 사용 여부")
+    max_batch_pairs: int = Field(default=256, description="한 번의 forward로 처리할 최대 쌍 수")
+    batch_wait_ms: float = Field(default=5.0, description="동시 요청을 모으기 위한 대기 시간(ms)")
+    score_cache_size: int = Field(default=20000, description="(쿼리, 청크) 점수 캐시 최대 크기")
 
 
 class RerankerConfig(BaseModel):
@@ -196,21 +218,202 @@ class PineconeReranker(BaseReranker):
             return RetrievalResult(documents=documents[:_top_k])
 
 
+class _OnnxCrossEncoder:
+    """ONNX Runtime 기반 Cross-Encoder (sentence-transformers CrossEncoder.predict와 같은 인터페이스)"""
+
+    def __init__(self, model_name: str, quantize: bool = False):
+        import torch
+        from transformers import AutoTokenizer
+
+        self._torch = torch
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        if quantize:
+            # int8 동적 양자화 모델로 교체
+            from optimum.onnxruntime import ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            import tempfile
+
+            quantized_dir = tempfile.mkdtemp(prefix="cross_encoder_int8_")
+            self.model.save_pretrained(quantized_dir)
+            quantizer = ORTQuantizer.from_pretrained(quantized_dir)
+            quantizer.quantize(
+                save_dir=quantized_dir,
+                quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            )
+            self.model = ORTModelForSequenceClassification.from_pretrained(
+                quantized_dir, file_name="model_quantized.onnx"
+            )
+
+    def predict(self, pairs: List[Tuple[str, str]], batch_size: int = 32) -> List[float]:
+        scores: List[float] = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            features = self.tokenizer(
+                [pair[0] for pair in batch],
+                [pair[1] for pair in batch],
+                padding=True,
+                truncation=True,
+                return_tensors="pt"
+            )
+            logits = self.model(**features).logits
+            # 단일 라벨 모델은 CrossEncoder 기본 활성화 함수(sigmoid)와 동일하게 변환
+            if logits.shape[-1] == 1:
+                logits = self._torch.sigmoid(logits.squeeze(-1))
+            else:
+                logits = logits[:, -1]
+            scores.extend(float(score) for score in logits.detach().cpu().numpy())
+        return scores
+
+
+class CrossEncoderScoringService:
+    """
+    프로세스 단위로 공유되는 Cross-Encoder 스코어링 서비스
+
+    - 모델은 첫 추론 시 추론 스레드에서 한 번만 로드
+    - 동시에 들어온 쌍을 AsyncMicroBatcher로 모아 batch_wait_ms 후(또는 max_batch_pairs 도달 시) 한 번에 추론
+    - 점수는 (쿼리 해시, 청크 ID) 기준 LRU 캐시에 저장
+    """
+
+    def __init__(self, config: CrossEncoderRerankerConfig):
+        self.config = config
+        self._model = None
+        self._model_lock = threading.Lock()
+        # 추론은 단일 전용 스레드에서 순차 실행 (모델 인스턴스 공유)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cross-encoder")
+        self._score_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._batcher = AsyncMicroBatcher(
+            self._predict,
+            self._executor,
+            max_batch_size=config.max_batch_pairs,
+            batch_wait_ms=config.batch_wait_ms,
+            item_stat="pairs",
+            extra_stats=("cache_hits",)
+        )
+        self.stats = self._batcher.stats
+
+    def _load_model(self):
+        """설정된 백엔드로 모델 로드 (추론 스레드에서 호출)"""
+        with self._model_lock:
+            if self._model is not None:
+                return self._model
+
+            if self.config.backend == "onnx":
+                if ORTModelForSequenceClassification is None:
+                    logger.warning("optimum[onnxruntime] 패키지가 설치되지 않아 torch 백엔드를 사용합니다.")
+                else:
+                    self._model = _OnnxCrossEncoder(self.config.model_name, quantize=self.config.quantize)
+                    logger.info(f"Cross-Encoder ONNX 모델 로드: {self.config.model_name} (int8: {self.config.quantize})")
+                    return self._model
+
+            if CrossEncoder is None:
+                raise ImportError("sentence-transformers 패키지가 설치되지 않았습니다. pip install sentence-transformers를 실행하세요.")
+
+            model = CrossEncoder(self.config.model_name, device=self.config.device)
+            if self.config.quantize and self.config.device == "cpu":
+                import torch
+                model.model = torch.quantization.quantize_dynamic(model.model, {torch.nn.Linear}, dtype=torch.qint8)
+            self._model = model
+            logger.info(f"Cross-Encoder 모델 로드: {self.config.model_name} (device: {self.config.device}, int8: {self.config.quantize}) [ProcessID: {os.getpid()}]")
+            return self._model
+
+    def _predict(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """추론 스레드에서 실행되는 배치 추론"""
+        model = self._model or self._load_model()
+        scores = model.predict(pairs, batch_size=self.config.batch_size)
+        return [float(score) for score in scores]
+
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[float]:
+        with self._cache_lock:
+            score = self._score_cache.get(key)
+            if score is not None:
+                self._score_cache.move_to_end(key)
+            return score
+
+    def _put_cached(self, key: Tuple[str, str], score: float) -> None:
+        with self._cache_lock:
+            self._score_cache[key] = score
+            self._score_cache.move_to_end(key)
+            while len(self._score_cache) > self.config.score_cache_size:
+                self._score_cache.popitem(last=False)
+
+    async def score(self, query: str, items: List[Tuple[str, str]]) -> List[float]:
+        """
+        쿼리와 (청크 ID, 텍스트) 목록의 Cross-Encoder 점수를 계산합니다.
+
+        Args:
+            query: 검색 쿼리
+            items: (청크 ID, 문서 텍스트) 목록
+
+        Returns:
+            List[float]: 입력 순서와 같은 순서의 점수 목록
+        """
+        query_hash = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        scores: List[Optional[float]] = [None] * len(items)
+        waiting: List[Tuple[int, Tuple[str, str], str]] = []
+
+        for index, (chunk_id, text) in enumerate(items):
+            key = (query_hash, chunk_id)
+            cached = self._get_cached(key)
+            if cached is not None:
+                scores[index] = cached
+                self._batcher.count("cache_hits")
+                continue
+            waiting.append((index, key, text))
+
+        if waiting:
+            results = await self._batcher.submit_many([(query, text) for _, _, text in waiting])
+            for (index, key, _), score in zip(waiting, results):
+                self._put_cached(key, score)
+                scores[index] = score
+        return scores
+
+
+# 설정별 공유 스코어링 서비스 (프로세스 단위)
+_scoring_services: Dict[Tuple[str, str, str, bool], CrossEncoderScoringService] = {}
+_scoring_services_lock = threading.Lock()
+
+
+def get_cross_encoder_service(config: CrossEncoderRerankerConfig) -> CrossEncoderScoringService:
+    """
+    (모델, 장치, 백엔드, 양자화) 설정별로 공유되는 Cross-Encoder 스코어링 서비스를 반환합니다.
+
+    Args:
+        config: Cross-Encoder 리랭커 설정
+
+    Returns:
+        CrossEncoderScoringService: 공유 스코어링 서비스
+    """
+    key = (config.model_name, config.device, config.backend, config.quantize)
+    with _scoring_services_lock:
+        if key not in _scoring_services:
+            _scoring_services[key] = CrossEncoderScoringService(config)
+        return _scoring_services[key]
+
+
 class CrossEncoderReranker(BaseReranker):
     """HuggingFace Cross-Encoder를 사용한 리랭커 구현체"""
 
     def __init__(self, config: CrossEncoderRerankerConfig):
         super().__init__(config)
 
-        if CrossEncoder is None:
+        if CrossEncoder is None and not (config.backend == "onnx" and ORTModelForSequenceClassification is not None):
             raise ImportError("sentence-transformers 패키지가 설치되지 않았습니다. pip install sentence-transformers를 실행하세요.")
 
-        self.model = CrossEncoder(
-            config.model_name,
-            device=config.device
-        )
+        # 모델은 프로세스 단위로 공유 (리랭커 생성마다 다시 로드하지 않음)
+        self.scoring_service = get_cross_encoder_service(config)
         self.batch_size = config.batch_size
 
+    @staticmethod
+    def _chunk_id(doc: DocumentWithScore) -> str:
+        """점수 캐시 키로 사용할 청크 ID (없으면 내용 해시)"""
+        metadata = doc.metadata or {}
+        chunk_id = metadata.get("chunk_id") or metadata.get("id")
+        if chunk_id:
+            return str(chunk_id)
+        return hashlib.sha1(doc.page_content.encode("utf-8")).hexdigest()
+
     async def rerank(
         self,
         query: str,
@@ -221,14 +424,11 @@ class CrossEncoderReranker(BaseReranker):
         _top_k = top_k or self.config.top_k
 
         try:
-            # 쿼리-문서 쌍 생성
-            pairs = [[query, doc.page_content] for doc in documents]
+            # 청크 ID-문서 쌍 생성
+            pairs = [(self._chunk_id(doc), doc.page_content) for doc in documents]
 
-            # Cross-Encoder 점수 계산
-            scores = self.model.predict(
-                pairs,
-                batch_size=self.batch_size
-            )
+            # Cross-Encoder 점수 계산 (공유 서비스에서 다른 요청과 함께 배치 추론)
+            scores = await self.scoring_service.score(query, pairs)
 
             # 결과 정렬 및 변환
             scored_docs = list(zip(documents, scores))
@@ -17,6 +17,8 @@ class SemanticRetrieverConfig(RetrieverConfig):
     search_multiplier: int = 1  # top_k에 곱할 배수
     project_type: Optional[str] = None
     user_id: Optional[UUID] = None
+    min_chunks_per_document: int = 2  # 테이블 모드에서 문서당 보장할 최소 청크 수
+    max_concurrent_queries: int = 8  # 테이블 모드 문서별 검색 동시 요청 수
     
 
 class SemanticRetriever(BaseRetriever):
@@ -35,20 +37,29 @@ class SemanticRetriever(BaseRetriever):
         self,
         query: str,
         top_k: Optional[int] = None,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> RetrievalResult:
-        """시맨틱 검색 수행"""
+        """시맨틱 검색 수행 (query_embedding이 주어지면 쿼리 임베딩을 생략)"""
         try:
             # 기본값 설정
             _top_k = top_k or self.config.top_k
             
-            # VectorStoreManager 사용
-            search_results = self.vs_manager.search(
-                query=query,
-                #top_k=_top_k * self.config.search_multiplier,  # 더 많은 결과를 가져와서 필터링
-                top_k = _top_k,
-                filters=filters
-            )
+            if query_embedding is not None:
+                # 미리 계산된 쿼리 임베딩으로 Pinecone 쿼리
+                search_results = await self.vs_manager.search_by_vector_async(
+                    embedding=query_embedding,
+                    top_k=_top_k,
+                    filters=filters
+                )
+            else:
+                # VectorStoreManager 사용 (비동기 임베딩 + Pinecone 쿼리)
+                search_results = await self.vs_manager.search_async(
+                    query=query,
+                    #top_k=_top_k * self.config.search_multiplier,  # 더 많은 결과를 가져와서 필터링
+                    top_k = _top_k,
+                    filters=filters
+                )
 
             #search_results = [(Document, score), (Document, score), ...]
             # Document.metadata는 저장할때 넣었던 metadata와 같은 구조다.
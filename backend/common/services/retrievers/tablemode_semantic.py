@@ -1,4 +1,5 @@
 from typing import List, Dict, Optional, Tuple
+import asyncio
 import logging
 from loguru import logger
 from .models import DocumentWithScore, RetrievalResult
@@ -35,7 +36,8 @@ class TableModeSemanticRetriever(SemanticRetriever):
     ) -> RetrievalResult:
         """테이블 모드 시맨틱 검색 수행
         
-        부모 클래스의 검색 결과를 받아서 테이블 모드에 맞게 처리합니다.
+        필터에 지정된 문서마다 하나의 MMR 검색을 동시에 실행하여, 한 번의 라운드로
+        문서당 최소 min_chunks_per_document개의 청크를 확보합니다.
         
         Args:
             query (str): 검색 쿼리
@@ -46,58 +48,44 @@ class TableModeSemanticRetriever(SemanticRetriever):
             RetrievalResult: 검색 결과
         """
         try:
-            async def _recursive_search(remaining_doc_ids: set, found_docs: List[DocumentWithScore], max_retries: int = 3) -> List[DocumentWithScore]:
-                """재귀적으로 누락된 문서를 검색하는 내부 함수"""
-                if not remaining_doc_ids or max_retries <= 0:
-                    return found_docs
-                
-                doc_count = len(remaining_doc_ids)
-                logger.warning(f"재검색 시도 - remaining_doc_ids: {remaining_doc_ids}")
-                missed_filters = {
-                    "document_id": {"$in": list(remaining_doc_ids)}
-                }
-                logger.warning(f"누락된 문서 재검색 필터 (남은 시도: {max_retries}): {missed_filters}")
-                
-                additional_results = self.vs_manager.search_mmr(
-                    query=query,
-                    filters=missed_filters,
-                    top_k=doc_count*2,
-                    fetch_k=doc_count*4,
-                    lambda_mult=0.2
-                )
-                
-                newly_found_doc_ids = set()
-                for doc, score in additional_results:
-                    doc_id = doc.metadata.get('document_id', None)
-                    if doc_id:
-                        newly_found_doc_ids.add(doc_id)
-                    
-                    new_doc = DocumentWithScore(
-                        page_content=doc.page_content,
-                        metadata=doc.metadata.copy(),
-                        score=score
-                    )
-                    found_docs.append(new_doc)
-                
-                still_missing = remaining_doc_ids - newly_found_doc_ids
-                if still_missing:
-                    return await _recursive_search(still_missing, found_docs, max_retries - 1)
-                return found_docs
-
             #doc easy의 테이블모드 한정 검색이네. 클래스 자체가 그런것.
             # 메타데이터도 문서 아이디만 참고 가능.
             logger.info(f"table 시멘틱 검색 target : {filters}")
             # document_id 리스트 추출
             doc_ids = filters.get("document_id", {}).get("$in", []) if filters else []
             doc_count = len(doc_ids) if doc_ids else 0
-            search_results = self.vs_manager.search_mmr(
-                query=query,
-                top_k=top_k,
-                fetch_k=top_k*2,
-                lambda_mult=0.2,
-                filters=filters
-            )
+            _top_k = top_k or self.config.top_k
+
+            # 쿼리 임베딩은 한 번만 계산하여 모든 문서별 검색에 재사용
+            embedding = await self.vs_manager.create_embeddings_single_query_async(query)
 
+            if doc_count:
+                # 문서별 필터 검색을 동시에 실행하여 한 번에 모든 문서의 청크를 확보
+                # (테이블 모드에서 top_k는 문서 수의 배수로 넘어옴)
+                per_doc_k = max(self.config.min_chunks_per_document, _top_k // doc_count)
+                semaphore = asyncio.Semaphore(self.config.max_concurrent_queries)
+
+                async def _search_document(doc_id: str):
+                    doc_filters = {**filters, "document_id": doc_id}
+                    async with semaphore:
+                        return await self.vs_manager.search_mmr_by_vector_async(
+                            embedding,
+                            top_k=per_doc_k,
+                            fetch_k=per_doc_k*2,
+                            lambda_mult=0.2,
+                            filters=doc_filters
+                        )
+
+                per_doc_results = await asyncio.gather(*(_search_document(doc_id) for doc_id in doc_ids))
+                search_results = [item for results in per_doc_results for item in results]
+            else:
+                search_results = await self.vs_manager.search_mmr_by_vector_async(
+                    embedding,
+                    top_k=_top_k,
+                    fetch_k=_top_k*2,
+                    lambda_mult=0.2,
+                    filters=filters
+                )
 
             #search_results = [(Document, score), (Document, score), ...]
             # Document.metadata는 저장할때 넣었던 metadata와 같은 구조다.
@@ -111,7 +99,6 @@ class TableModeSemanticRetriever(SemanticRetriever):
             documents = []
             found_doc_ids = set()
             
-            # 모든 검색 결과를 처리하여 document_id를 수집
             for doc, score in search_results:
                 doc_id = doc.metadata.get('document_id', None)
                 if doc_id:
@@ -124,20 +111,18 @@ class TableModeSemanticRetriever(SemanticRetriever):
                 )
                 documents.append(new_doc)
 
-            # 누락된 문서 재귀적 검색 - 실제로 문서가 없는 경우에만 수행
+            # 문서별로 검색했으므로 누락된 문서는 실제로 청크가 없는 문서
             missed_doc_ids = set(doc_ids) - found_doc_ids
             if missed_doc_ids:
-                logger.warning(f"누락된 문서 ID 목록: {missed_doc_ids}")
-                logger.warning(f"원본 doc_ids: {doc_ids}")
-                logger.warning(f"찾은 doc_ids: {found_doc_ids}")
-                documents = await _recursive_search(missed_doc_ids, documents)
+                logger.warning(f"검색 결과가 없는 문서 ID 목록: {missed_doc_ids}")
 
             # 쿼리 분석 정보 추가
             query_analysis = {
                 "type": "semantic_mmr",
                 "min_score": self.config.min_score,
                 "total_found": len(search_results),
-                "returned": len(documents)
+                "returned": len(documents),
+                "missing_documents": len(missed_doc_ids)
             }
             
             return RetrievalResult(
@@ -145,12 +130,6 @@ class TableModeSemanticRetriever(SemanticRetriever):
                 query_analysis=query_analysis
             )
             
-        except Exception as e:
-            logger.error(f"시맨틱 검색 중 오류 발생: {str(e)}")
-            raise
-            
-            return result
-            
         except Exception as e:
             logger.error(f"테이블 모드 시맨틱 검색 중 오류 발생: {str(e)}")
             raise
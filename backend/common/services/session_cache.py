@@ -0,0 +1,191 @@
+"""
+세션 조회 캐시 모듈
+
+인증이 필요한 모든 요청(SSE 채팅 스트림, 문서 상태 폴링 등)이 get_current_session에서
+DB 세션을 열고 세션/사용자를 조회하지 않도록, 검증된 세션과 사용자 정보를 캐싱합니다.
+
+- 1단계: 프로세스 내 LRU (짧은 TTL) - 워커 간 무효화 지연을 TTL 이내로 제한
+- 2단계: Redis (TTL) - 모든 워커가 공유하며 로그아웃/세션 삭제 시 즉시 삭제
+- 캐시 항목은 세션 만료 시각(last_accessed_at + SESSION_EXPIRY_DAYS)을 넘기지 않음
+- 캐시에는 비밀번호 해시를 제외한 세션/사용자 필드만 저장하며, 조회 시마다 새 Session 객체(DB 세션에 연결되지 않음)를 반환
+- 캐시 미스일 때만 DB를 조회하므로 세션 접근 시간(last_accessed_at)은 최대 Redis TTL만큼 늦게 갱신됨
+"""
+
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from common.core.config import settings
+from common.core.redis import async_redis_client
+from common.models.user import Session, User
+
+# 캐시에 저장하는 사용자 필드 (hashed_password 제외)
+USER_FIELDS = ("email", "name", "is_active", "is_superuser", "oauth_provider", "oauth_provider_id")
+
+
+class SessionCache:
+    """프로세스 내 LRU + Redis 2단계 세션 조회 캐시"""
+
+    KEY_PREFIX = "session_cache:"
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        local_ttl: float = 10.0,
+        redis_ttl: int = 300,
+        max_entries: int = 10000
+    ):
+        """
+        Args:
+            redis: redis.asyncio 클라이언트 (decode_responses=True), None이면 로컬 LRU만 사용
+            local_ttl: 프로세스 내 캐시 유지 시간 (초)
+            redis_ttl: Redis 캐시 유지 시간 (초)
+            max_entries: 프로세스 내 캐시 최대 항목 수
+        """
+        self.redis = redis
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self.max_entries = max_entries
+        # session_id -> (로컬 만료 시각(monotonic), 세션 정보)
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0, "errors": 0}
+
+    def _make_key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    @staticmethod
+    def to_projection(session: Session) -> Dict[str, Any]:
+        """세션과 사용자 정보를 JSON 직렬화 가능한 딕셔너리로 변환"""
+        expires_at = session.last_accessed_at + timedelta(days=settings.SESSION_EXPIRY_DAYS)
+        user = session.user
+        return {
+            "id": str(session.id),
+            "user_id": str(session.user_id) if session.user_id else None,
+            "user_email": session.user_email,
+            "is_anonymous": session.is_anonymous,
+            "last_accessed_at": session.last_accessed_at.isoformat(),
+            "expires_at": expires_at.timestamp(),
+            "user": {"id": str(user.id), **{field: getattr(user, field) for field in USER_FIELDS}} if user else None,
+        }
+
+    @staticmethod
+    def from_projection(data: Dict[str, Any]) -> Session:
+        """캐시된 정보로 DB 세션에 연결되지 않은 Session 객체 생성"""
+        session = Session(
+            id=UUID(data["id"]),
+            user_id=UUID(data["user_id"]) if data["user_id"] else None,
+            user_email=data["user_email"],
+            is_anonymous=data["is_anonymous"],
+            last_accessed_at=datetime.fromisoformat(data["last_accessed_at"]),
+        )
+        if data["user"]:
+            user_data = data["user"]
+            session.user = User(id=UUID(user_data["id"]), **{field: user_data.get(field) for field in USER_FIELDS})
+        return session
+
+    def _get_local(self, session_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._local.get(session_id)
+        if entry is None:
+            return None
+        local_expires_at, data = entry
+        if local_expires_at < time.monotonic():
+            del self._local[session_id]
+            return None
+        self._local.move_to_end(session_id)
+        return data
+
+    def _set_local(self, session_id: str, data: Dict[str, Any]) -> None:
+        self._local[session_id] = (time.monotonic() + self.local_ttl, data)
+        self._local.move_to_end(session_id)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def get(self, session_id: str) -> Optional[Session]:
+        """
+        캐시된 세션 조회
+
+        Returns:
+            Session: 캐시 적중 시 새 Session 객체, 미스이거나 세션이 만료되었으면 None
+        """
+        session_id = str(session_id)
+        data = self._get_local(session_id)
+        if data is not None:
+            self.stats["local_hits"] += 1
+        elif self.redis is not None:
+            try:
+                raw = await self.redis.get(self._make_key(session_id))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"[SessionCache] Redis 조회 실패: {str(e)}")
+                raw = None
+            if raw is not None:
+                data = json.loads(raw)
+                self.stats["redis_hits"] += 1
+                self._set_local(session_id, data)
+
+        if data is None:
+            self.stats["misses"] += 1
+            return None
+
+        if data["expires_at"] <= time.time():
+            # 만료된 세션은 DB 조회 경로에서 삭제되도록 미스로 처리
+            await self.invalidate(session_id)
+            self.stats["misses"] += 1
+            return None
+        return self.from_projection(data)
+
+    async def set(self, session_id: str, session: Session) -> None:
+        """DB에서 검증된 세션을 캐시에 저장 (세션 만료 시각을 넘지 않는 TTL 적용)"""
+        session_id = str(session_id)
+        data = self.to_projection(session)
+        remaining = data["expires_at"] - time.time()
+        if remaining <= 0:
+            return
+        self._set_local(session_id, data)
+        if self.redis is not None:
+            try:
+                await self.redis.set(self._make_key(session_id), json.dumps(data, ensure_ascii=False), ex=max(1, int(min(self.redis_ttl, remaining))))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"[SessionCache] Redis 저장 실패: {str(e)}")
+
+    async def invalidate(self, session_id: str) -> None:
+        """세션 캐시 삭제 (로그아웃, 세션 변경/삭제 시)"""
+        session_id = str(session_id)
+        self.stats["invalidations"] += 1
+        self._local.pop(session_id, None)
+        if self.redis is not None:
+            try:
+                await self.redis.delete(self._make_key(session_id))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"[SessionCache] Redis 삭제 실패: {str(e)}")
+
+
+_session_cache: Optional[SessionCache] = None
+
+
+def get_session_cache() -> Optional[SessionCache]:
+    """
+    프로세스 단위로 공유되는 세션 캐시를 반환합니다.
+
+    SESSION_CACHE_ENABLED가 False이면 None을 반환합니다.
+    """
+    global _session_cache
+    if not settings.SESSION_CACHE_ENABLED:
+        return None
+    if _session_cache is None:
+        _session_cache = SessionCache(
+            redis=async_redis_client.get_client(),
+            local_ttl=settings.SESSION_CACHE_LOCAL_TTL,
+            redis_ttl=settings.SESSION_CACHE_REDIS_TTL,
+            max_entries=settings.SESSION_CACHE_MAX_ENTRIES,
+        )
+        logger.info("[SessionCache] 세션 캐시 초기화")
+    return _session_cache
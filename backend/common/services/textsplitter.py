@@ -6,8 +6,11 @@ from langchain.text_splitter import (
     TokenTextSplitter,
 )
 from common.core.config import settings
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
+import threading
 
 from loguru import logger
 
@@ -22,6 +25,68 @@ except ImportError:
 # 로컬 kf-deberta 모델 경로 설정
 LOCAL_KF_DEBERTA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "external", "kf-deberta")
 
+# 워커 프로세스 단위 캐시
+# - 토크나이저: 이름(또는 경로) -> HuggingFace 토크나이저 (디스크 로드에 수백 ms 소요)
+# - splitter: (splitter_type, chunk_size, chunk_overlap, tokenizer_name) -> splitter 인스턴스
+_tokenizer_cache: Dict[str, Any] = {}
+_tokenizer_cache_lock = threading.Lock()
+_splitter_cache: Dict[Tuple[str, int, int, Optional[str]], Any] = {}
+
+# 병렬 분할 설정
+# 이 길이 이상의 문서만 프로세스 풀에서 섹션 단위로 병렬 분할
+PARALLEL_SPLIT_MIN_CHARS = 200_000
+# 병렬 분할을 지원하는 splitter (LangChain 기반 splitter만 지원)
+PARALLEL_SPLITTER_TYPES = {"recursive", "recursive_tiktoken", "recursive_kf_deberta", "recursive_huggingface", "character", "token"}
+_process_pool: Optional[ProcessPoolExecutor] = None
+# 프로세스 풀 생성 시의 워커 수 (섹션 수 산정에 사용)
+_process_pool_workers: int = 0
+_process_pool_lock = threading.Lock()
+
+
+def get_huggingface_tokenizer(name_or_path: str):
+    """HuggingFace 토크나이저를 로드하고 프로세스 단위로 캐싱합니다.
+
+    Args:
+        name_or_path (str): 모델 이름 또는 로컬 경로
+
+    Returns:
+        토크나이저 인스턴스
+    """
+    tokenizer = _tokenizer_cache.get(name_or_path)
+    if tokenizer is not None:
+        return tokenizer
+    with _tokenizer_cache_lock:
+        # 다른 스레드가 먼저 로드했는지 다시 확인
+        if name_or_path not in _tokenizer_cache:
+            _tokenizer_cache[name_or_path] = AutoTokenizer.from_pretrained(name_or_path)
+            logger.info(f"HuggingFace 토크나이저 로드 및 캐싱: {name_or_path} [ProcessID: {os.getpid()}]")
+        return _tokenizer_cache[name_or_path]
+
+
+def _get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """병렬 분할용 프로세스 풀 반환 (프로세스 단위로 한 번만 생성)
+
+    Celery 스레드 풀 안에서 fork하지 않도록 spawn 컨텍스트를 사용합니다.
+    """
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is None:
+            workers = max_workers or min(os.cpu_count() or 1, 4)
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            _process_pool_workers = workers
+            logger.info(f"텍스트 분할 프로세스 풀 생성: {workers} workers")
+        return _process_pool
+
+
+def _split_section(args: Tuple[str, int, int, Optional[str], str]) -> List[str]:
+    """프로세스 풀 워커에서 하나의 섹션을 분할 (splitter는 워커 프로세스에서 캐싱됨)"""
+    splitter_type, chunk_size, chunk_overlap, tokenizer_name, section = args
+    splitter = TextSplitter(splitter_type, chunk_size, chunk_overlap, tokenizer_name)
+    return splitter.split_text(section)
+
 
 class TextSplitter:
 
@@ -54,18 +119,25 @@ class TextSplitter:
         self.chunk_overlap = chunk_overlap if chunk_overlap else default_chunk_overlap
         self.tokenizer_name = tokenizer_name
         
+        # splitter 초기화 전에 값 검증 추가
+        if not isinstance(self.chunk_size, int) or not isinstance(self.chunk_overlap, int):
+            logger.error(f"Invalid type - chunk_size: {type(self.chunk_size)}, chunk_overlap: {type(self.chunk_overlap)}")
+            self.chunk_size = int(self.chunk_size) if isinstance(self.chunk_size, str) else self.chunk_size
+            self.chunk_overlap = int(self.chunk_overlap) if isinstance(self.chunk_overlap, str) else self.chunk_overlap
+        
+        # 캐시된 splitter가 있으면 재사용 (토크나이저 재로드 방지)
+        cache_key = (self.splitter_type, self.chunk_size, self.chunk_overlap, self.tokenizer_name)
+        cached_splitter = _splitter_cache.get(cache_key)
+        if cached_splitter is not None:
+            self.splitter = cached_splitter
+            return
+        
         # 디버그를 위한 상세 로깅 추가
         logger.info(f"초기화 값 타입 확인:")
         logger.info(f"chunk_size type: {type(self.chunk_size)}, value: {self.chunk_size}")
         logger.info(f"chunk_overlap type: {type(self.chunk_overlap)}, value: {self.chunk_overlap}")
         
         logger.info(f"TEXT_SPLITTER : {self.splitter_type}, CHUNK_SIZE : {self.chunk_size}, CHUNK_OVERLAP : {self.chunk_overlap}, [ProcessID: {os.getpid()}]")
-
-        # splitter 초기화 전에 값 검증 추가
-        if not isinstance(self.chunk_size, int) or not isinstance(self.chunk_overlap, int):
-            logger.error(f"Invalid type - chunk_size: {type(self.chunk_size)}, chunk_overlap: {type(self.chunk_overlap)}")
-            self.chunk_size = int(self.chunk_size) if isinstance(self.chunk_size, str) else self.chunk_size
-            self.chunk_overlap = int(self.chunk_overlap) if isinstance(self.chunk_overlap, str) else self.chunk_overlap
         
         # splitter 초기화
         if self.splitter_type == "recursive":
@@ -125,7 +197,7 @@ class TextSplitter:
                         raise FileNotFoundError(f"로컬 kf-deberta 경로가 존재하지 않습니다: {LOCAL_KF_DEBERTA_PATH}")
                     
                     # 로컬 모델 로드
-                    tokenizer = AutoTokenizer.from_pretrained(LOCAL_KF_DEBERTA_PATH)
+                    tokenizer = get_huggingface_tokenizer(LOCAL_KF_DEBERTA_PATH)
                     
                     # HuggingFace 토크나이저를 사용한 RecursiveCharacterTextSplitter 생성
                     self.splitter = RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
@@ -176,7 +248,7 @@ class TextSplitter:
                 try:
                     # HuggingFace 토크나이저 초기화
                     logger.info(f"HuggingFace 토크나이저 초기화 시작: {model_name}")
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
+                    tokenizer = get_huggingface_tokenizer(model_name)
                     
                     # HuggingFace 토크나이저를 사용한 RecursiveCharacterTextSplitter 생성
                     self.splitter = RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
@@ -231,16 +303,30 @@ class TextSplitter:
             
         else:
             raise ValueError(f"Unsupported text splitter type: {self.splitter_type}")
+        
+        # 워커 프로세스 수명 동안 재사용
+        self.splitter = _splitter_cache.setdefault(cache_key, self.splitter)
     
-    def split_text(self, text: str) -> List[str]:
+    def split_text(self, text: str, parallel: bool = False, max_workers: Optional[int] = None) -> List[str]:
         """텍스트를 청크로 분할합니다.
 
         Args:
             text (str): 분할할 텍스트
+            parallel (bool): True이고 문서가 PARALLEL_SPLIT_MIN_CHARS 이상이면
+                최상위 섹션 경계(빈 줄)로 나누어 프로세스 풀에서 병렬 분할
+            max_workers (Optional[int]): 병렬 분할 시 최대 워커 수 (최초 풀 생성 시에만 적용)
 
         Returns:
             List[str]: 분할된 텍스트 청크 리스트
         """
+        if (parallel and self.splitter_type in PARALLEL_SPLITTER_TYPES
+                and len(text) >= PARALLEL_SPLIT_MIN_CHARS):
+            try:
+                return self._split_text_parallel(text, max_workers)
+            except Exception as e:
+                # 프로세스 풀을 사용할 수 없는 환경이면 순차 분할로 폴백
+                logger.warning(f"병렬 텍스트 분할 실패, 순차 분할로 진행합니다: {str(e)}")
+        
         if self.splitter_type == "sentencewindow":
             # SentenceWindowNodeParser는 다른 인터페이스를 사용하므로 별도 처리
             from llama_index.core import Document
@@ -256,3 +342,81 @@ class TextSplitter:
         
         # 그외 다른 text splitter는 LangChain 기본 인터페이스를 사용하므로 별도 처리 안함.
         return self.splitter.split_text(text)
+
+    def _split_text_parallel(self, text: str, max_workers: Optional[int] = None) -> List[str]:
+        """큰 문서를 최상위 섹션 경계에서 나누어 프로세스 풀에서 병렬로 분할합니다.
+
+        섹션별 분할 결과는 원래 순서대로 이어 붙이고, 섹션 경계에서는
+        - 앞 섹션의 마지막 청크와 뒤 섹션의 첫 청크를 합쳐도 chunk_size 이하이면 하나로 병합
+        - 그렇지 않으면 앞 청크의 끝부분(chunk_overlap 이내)을 뒤 청크 앞에 붙여 overlap 복원
+
+        Args:
+            text (str): 분할할 텍스트
+            max_workers (Optional[int]): 최대 워커 수
+
+        Returns:
+            List[str]: 분할된 텍스트 청크 리스트
+        """
+        pool = _get_process_pool(max_workers)
+        sections = self._make_sections(text, _process_pool_workers * 2)
+        if len(sections) <= 1:
+            return self.splitter.split_text(text)
+        
+        args = [
+            (self.splitter_type, self.chunk_size, self.chunk_overlap, self.tokenizer_name, section)
+            for section in sections
+        ]
+        # map은 입력 순서대로 결과를 반환
+        section_chunks = list(pool.map(_split_section, args))
+        logger.info(f"병렬 텍스트 분할 완료: {len(text)}자, {len(sections)}개 섹션")
+        
+        length_function = getattr(self.splitter, "_length_function", len)
+        chunks: List[str] = []
+        for current in section_chunks:
+            if not current:
+                continue
+            if not chunks:
+                chunks.extend(current)
+                continue
+            previous = chunks[-1]
+            first = current[0]
+            merged = f"{previous}\n\n{first}"
+            if length_function(merged) <= self.chunk_size:
+                chunks[-1] = merged
+                chunks.extend(current[1:])
+                continue
+            overlap = self._tail_within(previous, self.chunk_overlap, length_function)
+            if overlap and length_function(f"{overlap}\n\n{first}") <= self.chunk_size:
+                first = f"{overlap}\n\n{first}"
+            chunks.append(first)
+            chunks.extend(current[1:])
+        return chunks
+
+    @staticmethod
+    def _make_sections(text: str, num_sections: int) -> List[str]:
+        """텍스트를 빈 줄(최상위 구분자) 경계에서 대략 같은 크기의 섹션으로 나눕니다."""
+        target = max(len(text) // max(num_sections, 1), 1)
+        sections = []
+        start = 0
+        while start < len(text):
+            boundary = text.find("\n\n", start + target)
+            if boundary == -1:
+                sections.append(text[start:])
+                break
+            sections.append(text[start:boundary])
+            start = boundary + 2
+        return [section for section in sections if section.strip()]
+
+    @staticmethod
+    def _tail_within(text: str, max_length: int, length_function) -> str:
+        """텍스트 끝에서부터 단어 단위로 max_length 이내의 꼬리 부분을 반환합니다."""
+        if max_length <= 0:
+            return ""
+        words = text.split(" ")
+        tail: List[str] = []
+        for word in reversed(words):
+            candidate = " ".join([word] + tail)
+            if length_function(candidate) > max_length:
+                break
+            tail.insert(0, word)
+        return " ".join(tail)
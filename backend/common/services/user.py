@@ -10,6 +10,7 @@ from common.core.security import get_password_hash, verify_password
 from common.models.user import User, Session
 from common.schemas.user import UserCreate, UserUpdate, SessionBase, SessionUpdate
 from common.core.config import settings
+from common.services.session_cache import get_session_cache
 import logging
 
 from stockeasy.agents.base import BaseAgent
@@ -200,10 +201,12 @@ class UserService:
         session.touch()  # 접근 시간 갱신
         await self.db.commit()
         await self.db.refresh(session)
+        await self._invalidate_session_cache(session_id)
         return session
 
     async def delete_session(self, session_id: str) -> bool:
         """세션 삭제"""
+        await self._invalidate_session_cache(session_id)
         session = await self.get_session(session_id)
         if not session:
             return False
@@ -212,6 +215,12 @@ class UserService:
         await self.db.commit()
         return True
 
+    async def _invalidate_session_cache(self, session_id: str) -> None:
+        """세션 조회 캐시 무효화 (세션 변경/삭제/로그아웃 시)"""
+        session_cache = get_session_cache()
+        if session_cache:
+            await session_cache.invalidate(session_id)
+
     async def cleanup_expired_sessions(self) -> int:
         """만료된 세션 정리"""
         expiry_date = datetime.now() - timedelta(days=settings.SESSION_EXPIRY_DAYS)
@@ -224,6 +233,7 @@ class UserService:
         logger.info(f'[cleanup_expired_sessions] Found {len(expired_sessions)} expired sessions')
         for session in expired_sessions:
             logger.info(f'[cleanup_expired_sessions] Deleting session: {session}')
+            await self._invalidate_session_cache(session.id)
             await self.db.delete(session)
         
         await self.db.commit()
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
 from langchain_community.vectorstores import Pinecone as PineconeLangchain
 from langchain_core.documents import Document as LangchainDocument
 from pinecone import Pinecone as PineconeClient, PodSpec, ServerlessSpec
@@ -17,6 +17,96 @@ import numpy as np
 from loguru import logger
 #logger = logging.getLogger(__name__)
 
+def mmr_select(query_embedding: List[float], embeddings: np.ndarray, k: int, lambda_mult: float = 0.5) -> List[int]:
+    """
+    MMR(Maximal Marginal Relevance)로 후보 벡터 중 k개를 선택합니다. (코사인 유사도 기준)
+
+    선택된 문서와의 최대 유사도를 누적 갱신하여 후보 수 n에 대해 O(k*n)으로 계산합니다.
+
+    Args:
+        query_embedding: 쿼리 임베딩
+        embeddings: 후보 벡터 행렬 (n x dim)
+        k: 선택할 문서 수
+        lambda_mult: 0~1, 0에 가까울수록 다양성을, 1에 가까울수록 쿼리 유사도를 우선
+
+    Returns:
+        List[int]: 선택된 후보 인덱스 (선택 순서)
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim != 2 or min(k, len(embeddings)) <= 0:
+        return []
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query_norm = norm(query)
+    doc_norms = norm(embeddings, axis=1)
+    doc_norms[doc_norms == 0] = 1.0
+    normalized = embeddings / doc_norms[:, None]
+    query_similarity = normalized @ (query / (query_norm if query_norm else 1.0))
+
+    selected = [int(np.argmax(query_similarity))]
+    max_redundancy = normalized @ normalized[selected[0]]
+    available = np.ones(len(embeddings), dtype=bool)
+    available[selected[0]] = False
+    while len(selected) < min(k, len(embeddings)):
+        scores = lambda_mult * query_similarity - (1 - lambda_mult) * max_redundancy
+        scores[~available] = -np.inf
+        index = int(np.argmax(scores))
+        selected.append(index)
+        available[index] = False
+        np.maximum(max_redundancy, normalized @ normalized[index], out=max_redundancy)
+    return selected
+
+def match_metadata_filter(metadata: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """
+    Pinecone 메타데이터 필터 문법으로 메타데이터 일치 여부를 판단합니다.
+
+    지원 연산자: $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin, $exists, $and, $or
+    (값만 지정하면 $eq로 처리, 리스트 메타데이터는 원소 중 하나라도 일치하면 $eq/$in 일치)
+    """
+    if not filters:
+        return True
+    for key, condition in filters.items():
+        if key == "$and":
+            if not all(match_metadata_filter(metadata, sub_filter) for sub_filter in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(match_metadata_filter(metadata, sub_filter) for sub_filter in condition):
+                return False
+            continue
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        exists = key in metadata
+        value = metadata.get(key)
+        values = value if isinstance(value, list) else [value]
+        for operator, operand in condition.items():
+            if operator == "$exists":
+                matched = exists == bool(operand)
+            elif not exists:
+                matched = operator in ("$ne", "$nin")
+            elif operator == "$eq":
+                matched = operand in values
+            elif operator == "$ne":
+                matched = operand not in values
+            elif operator == "$in":
+                matched = any(item in operand for item in values)
+            elif operator == "$nin":
+                matched = not any(item in operand for item in values)
+            elif operator in ("$gt", "$gte", "$lt", "$lte"):
+                try:
+                    matched = {
+                        "$gt": value > operand,
+                        "$gte": value >= operand,
+                        "$lt": value < operand,
+                        "$lte": value <= operand,
+                    }[operator]
+                except TypeError:
+                    matched = False
+            else:
+                raise ValueError(f"지원하지 않는 필터 연산자: {operator}")
+            if not matched:
+                return False
+    return True
+
 def async_init(func):
     """비동기 초기화를 위한 데코레이터"""
     @wraps(func)
@@ -31,6 +121,9 @@ class VectorStoreManager:
     """벡터 스토어 관리 클래스"""
     _initialized = False
     _initialization_error = None
+    # 존재 여부를 확인한 (API 키, 인덱스 이름) - list_indexes 호출은 프로세스당 한 번만
+    _verified_indexes: set = set()
+    _verified_indexes_lock = Lock()
 
     def __init__(self, embedding_model_type: EmbeddingModelType = None, namespace: str = None, project_name:str = None, user_id:str = None, project_type:ProjectType = None):
         """
@@ -66,6 +159,15 @@ class VectorStoreManager:
         # 동기적으로 초기화 실행
         self._sync_initialize()
 
+    @classmethod
+    async def create_async(cls, *args, **kwargs) -> "VectorStoreManager":
+        """
+        이벤트 루프를 막지 않도록 워커 스레드에서 VectorStoreManager를 생성합니다.
+
+        검색 경로(비동기 함수)에서는 생성자 대신 이 메서드를 사용합니다.
+        """
+        return await asyncio.to_thread(cls, *args, **kwargs)
+
     def _sync_initialize(self):
         """동기 초기화 메서드"""
         try:
@@ -83,8 +185,9 @@ class VectorStoreManager:
                 environment=settings.PINECONE_ENVIRONMENT
             )
 
-            # 인덱스 존재 여부 확인
-            if self.embedding_model_config.name not in self.pinecone_client.list_indexes().names():
+            # 인덱스 존재 여부 확인 (이미 확인한 인덱스는 건너뜀)
+            index_key = (_api_key, self.embedding_model_config.name)
+            if index_key not in self._verified_indexes and self.embedding_model_config.name not in self.pinecone_client.list_indexes().names():
                 
                 try:
                     # 인덱스 생성 - 메트릭을 dotproduct로 변경
@@ -123,6 +226,9 @@ class VectorStoreManager:
                     logger.error(f"Pinecone 인덱스 생성 실패: {str(e)}")
                     raise
 
+            with self._verified_indexes_lock:
+                self._verified_indexes.add(index_key)
+
             # 인덱스 가져오기
             self.index = self.pinecone_client.Index(self.embedding_model_config.name)
             self.vector_store = PineconeLangchain(
@@ -198,7 +304,7 @@ class VectorStoreManager:
         return results
 
     async def search_async(self, query: str, top_k: int, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
-        """벡터 스토어에서 검색 수행"""
+        """벡터 스토어에서 검색 수행 (임베딩과 Pinecone 쿼리 모두 이벤트 루프를 막지 않음)"""
         await self.ensure_initialized()
         logger.info(f"[{self.namespace}] 벡터 스토어 검색 시작 : {query}")
 
@@ -214,12 +320,35 @@ class VectorStoreManager:
         # if filters and 'document_ids' in filters:
         #     filters = {"document_id": {"$in": filters['document_ids']}}
       
-        results = self.vector_store.similarity_search_by_vector_with_score(
+        return await self.search_by_vector_async(embedding, top_k, filters)
+
+    async def search_by_vector_async(self, embedding: List[float], top_k: int, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        """미리 계산한 쿼리 임베딩으로 벡터 스토어 검색 수행"""
+        matches = await asyncio.to_thread(self._query_matches, embedding, top_k, filters)
+        return self._matches_to_documents(matches)
+
+    def _query_matches(self, embedding: List[float], top_k: int, filters: Optional[Dict] = None, include_values: bool = False) -> List:
+        """Pinecone 인덱스 쿼리 (동기, 스레드에서 실행)"""
+        response = self.index.query(
             namespace=self.namespace,
-            embedding=embedding,
-            k=top_k,
+            vector=embedding,
+            top_k=top_k,
             filter=filters,
+            include_metadata=True,
+            include_values=include_values
         )
+        return response["matches"]
+
+    def _matches_to_documents(self, matches: List) -> List[Tuple[LangchainDocument, float]]:
+        """Pinecone 매치를 (Document, score) 목록으로 변환 (langchain Pinecone 벡터 스토어와 같은 형식)"""
+        results = []
+        for match in matches:
+            metadata = dict(match["metadata"] or {})
+            if "text" not in metadata:
+                logger.warning(f"[{self.namespace}] text 메타데이터가 없는 문서 건너뜀: {match['id']}")
+                continue
+            text = metadata.pop("text")
+            results.append((LangchainDocument(page_content=text, metadata=metadata), match["score"]))
         return results
 
     def search_mmr(self, query: str, top_k: int, fetch_k:int, lambda_mult:float, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
@@ -247,6 +376,27 @@ class VectorStoreManager:
             )
         results = [(doc, 0.0) for doc in doc_list]
         return results
+
+    async def search_mmr_async(self, query: str, top_k: int, fetch_k:int, lambda_mult:float, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        """벡터 스토어에서 MMR 검색 수행 (MMR 선택은 NumPy로 이벤트 루프 밖에서 계산)"""
+        await self.ensure_initialized()
+        logger.info(f"[{self.namespace}] 벡터 스토어 검색 시작[MMR] : {query}")
+
+        # 사용자 쿼리 임베딩
+        embedding = await self.create_embeddings_single_query_async(query)
+        return await self.search_mmr_by_vector_async(embedding, top_k, fetch_k, lambda_mult, filters)
+
+    async def search_mmr_by_vector_async(self, embedding: List[float], top_k: int, fetch_k:int, lambda_mult:float, filters: Optional[Dict] = None) -> List[Tuple[LangchainDocument, float]]:
+        """미리 계산한 쿼리 임베딩으로 MMR 검색 수행"""
+        matches = await asyncio.to_thread(self._query_matches, embedding, fetch_k, filters, True)
+        if not matches:
+            return []
+        selected = await asyncio.to_thread(
+            mmr_select, embedding, np.array([match["values"] for match in matches], dtype=np.float32), top_k, lambda_mult
+        )
+        # 동기 search_mmr와 같이 점수는 0.0으로 반환
+        documents = self._matches_to_documents([matches[i] for i in selected])
+        return [(doc, 0.0) for doc, _ in documents]
     
 
     def create_embeddings_single_query(self, query: str) -> List[float]:
@@ -503,4 +653,67 @@ class VectorStoreManager:
             pinecone 응답 객체: Pinecone 검색 응답
         """
         await self.ensure_initialized()
-        return self.query(vector, top_k, filters) 
\ No newline at end of file
+        return await asyncio.to_thread(self.query, vector, top_k, filters)
+
+    def list_ids_page(self, prefix: Optional[str] = None, limit: int = 100, pagination_token: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+        """네임스페이스의 벡터 ID를 한 페이지 조회합니다. (Pinecone list)
+
+        Returns:
+            (벡터 ID 목록, 다음 페이지 토큰 - 마지막 페이지면 None)
+        """
+        kwargs = {"namespace": self.namespace, "limit": limit}
+        if prefix:
+            kwargs["prefix"] = prefix
+        if pagination_token:
+            kwargs["pagination_token"] = pagination_token
+        response = self.index.list_paginated(**kwargs)
+        ids = [vector["id"] for vector in (response.get("vectors") or [])]
+        pagination = response.get("pagination")
+        next_token = pagination.get("next") if pagination else None
+        return ids, next_token or None
+
+    def fetch_metadata(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """벡터 ID 목록의 메타데이터를 조회합니다. (Pinecone fetch, 값 벡터는 제외)"""
+        if not ids:
+            return {}
+        response = self.index.fetch(ids=ids, namespace=self.namespace)
+        return {
+            vector_id: dict(vector.get("metadata") or {})
+            for vector_id, vector in (response.get("vectors") or {}).items()
+        }
+
+    async def iter_vector_pages_async(
+        self,
+        prefix: Optional[str] = None,
+        page_size: int = 100,
+        pagination_token: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str], int]]:
+        """네임스페이스 전체를 ID 페이지 단위로 순회하며 메타데이터를 조회합니다.
+
+        한 번에 한 페이지(page_size개)만 메모리에 올리므로 벡터 수와 관계없이 순회할 수 있습니다.
+        Pinecone list는 ID 접두사만 지원하므로 메타데이터 필터는 조회한 페이지에 적용합니다.
+
+        Args:
+            prefix: 벡터 ID 접두사
+            page_size: 페이지당 ID 수 (최대 100)
+            pagination_token: 이어서 조회할 페이지 토큰 (처음부터 조회 시 None)
+            filters: Pinecone 문법의 메타데이터 필터
+
+        Yields:
+            (필터와 일치하는 레코드 목록 [{"id", "metadata"}], 다음 페이지 토큰, 조회한 ID 수)
+        """
+        await self.ensure_initialized()
+        page_size = max(1, min(page_size, 100))
+        while True:
+            ids, next_token = await asyncio.to_thread(self.list_ids_page, prefix, page_size, pagination_token)
+            metadata_by_id = await asyncio.to_thread(self.fetch_metadata, ids)
+            records = [
+                {"id": vector_id, "metadata": metadata_by_id[vector_id]}
+                for vector_id in ids
+                if vector_id in metadata_by_id and match_metadata_filter(metadata_by_id[vector_id], filters)
+            ]
+            yield records, next_token, len(ids)
+            if not next_token:
+                break
+            pagination_token = next_token
\ No newline at end of file
@@ -6,8 +6,15 @@ import logging
 from common.models.user import Session
 from sse_starlette import EventSourceResponse
 import json
+import asyncio
+import contextlib
+import shutil
+import tempfile
+from pathlib import Path
 from datetime import datetime
 
+from common.core.config import settings
+
 from common.core.database import get_db_async
 from common.core.deps import get_current_session
 
@@ -54,28 +61,14 @@ async def upload_documents(
         await db.commit()
         logger.debug(f"프로젝트 {project_id} 마지막 수정 시간 갱신: {project.updated_at}")
 
-    # 파일 내용을 미리 읽어서 메모리에 저장
-    file_contents = []
-    failed_files = []
-    
-    for file in files:
-        try:
-            content = await file.read()
-            file_contents.append({
-                "filename": file.filename,
-                "content": content,
-                "content_type": file.content_type,
-                "size": len(content)
-            })
-        except Exception as e:
-            logger.exception(f"파일 읽기 실패 {file.filename}: {str(e)}")
-            failed_files.append({
-                "filename": file.filename,
-                "error": f"파일 읽기 실패: {str(e)}"
-            })
+    # 응답 스트림이 시작되기 전에 업로드 파일이 닫히므로, 파일을 청크 단위로 요청별 임시 디렉토리에 복사
+    # (파일 전체를 메모리에 올리지 않음)
+    spool_dir = Path(tempfile.mkdtemp(prefix="upload_", dir=settings.UPLOAD_SPOOL_DIR))
+    spooled_files, failed_files = await spool_upload_files(files, spool_dir)
 
     # 파일 읽기 실패가 있으면 바로 에러 응답
     if len(failed_files) == len(files):
+        shutil.rmtree(spool_dir, ignore_errors=True)
         raise HTTPException(
             status_code=400,
             detail={
@@ -86,25 +79,26 @@ async def upload_documents(
 
     async def event_generator():
         try:
-            # 문서 업로드 처리
+            # 문서 업로드 처리 (최대 UPLOAD_MAX_CONCURRENCY개 파일 동시 처리, 완료 순서대로 진행상황 전송)
             document_service = DocumentService(db)
-            total_files = len(file_contents)
+            total_files = len(spooled_files)
             processed_files = 0
 
-            # 읽은 파일 내용으로 처리 진행
-            for file_data in file_contents:
-                try:
-                    logger.info(f"Processing file: {file_data['filename']}")
-                    document = await document_service.upload_single_document(
-                        project_id=project_id,
-                        user_id=session.user_id,
-                        filename=file_data['filename'],
-                        content=file_data['content'],
-                        content_type=file_data['content_type'],
-                        file_size=file_data['size']
-                    )
+            # 연결 종료로 중단되면 임시 디렉토리를 지우기 전에 처리 중인 작업부터 취소/종료되도록 명시적으로 닫음
+            async with contextlib.aclosing(process_spooled_files(
+                document_service, project_id, session.user_id, spooled_files
+            )) as results:
+                async for file_data, document, error in results:
+                    if error is not None:
+                        logger.error(f"File processing error: {str(error)}")
+                        error_data = {
+                            "filename": file_data['filename'],
+                            "error": str(error)
+                        }
+                        yield json.dumps({'event': 'upload_error', 'data': error_data})
+                        continue
+
                     processed_files += 1
-                    #logger.warning(f"Processed file: {file_data['filename']}")
 
                     # 진행상황 전송
                     progress_data = {
@@ -122,14 +116,6 @@ async def upload_documents(
                     logger.warning(f"Progress data: {result}")
                     yield result
 
-                except Exception as e:
-                    logger.exception(f"File processing error: {str(e)}")
-                    error_data = {
-                        "filename": file_data['filename'],
-                        "error": str(e)
-                    }
-                    yield json.dumps({'event': 'upload_error', 'data': error_data})
-
             # 실패한 파일이 있으면 에러 메시지 전송
             for failed_file in failed_files:
                 yield json.dumps({'event': 'upload_error', 'data': failed_file})
@@ -146,9 +132,88 @@ async def upload_documents(
             logger.error(f"문서 업로드 중 오류 발생: {str(e)}")
             error_data = {"error": str(e)}
             yield json.dumps({'event': 'error', 'data': error_data})
+        finally:
+            shutil.rmtree(spool_dir, ignore_errors=True)
 
     return EventSourceResponse(event_generator())
 
+
+SPOOL_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+async def spool_upload_files(files: List[UploadFile], spool_dir: Path) -> tuple:
+    """업로드 파일을 청크 단위로 임시 디렉토리에 복사
+    
+    Returns:
+        (스풀링된 파일 정보 목록, 실패한 파일 목록)
+    """
+    spooled_files = []
+    failed_files = []
+    for index, file in enumerate(files):
+        try:
+            spool_path = spool_dir / f"{index}"
+            await file.seek(0)
+            with open(spool_path, "wb") as f:
+                await asyncio.to_thread(shutil.copyfileobj, file.file, f, SPOOL_CHUNK_SIZE)
+            spooled_files.append({
+                "filename": file.filename,
+                "path": spool_path,
+                "content_type": file.content_type,
+                "size": spool_path.stat().st_size
+            })
+        except Exception as e:
+            logger.exception(f"파일 읽기 실패 {file.filename}: {str(e)}")
+            failed_files.append({
+                "filename": file.filename,
+                "error": f"파일 읽기 실패: {str(e)}"
+            })
+    return spooled_files, failed_files
+
+
+async def process_spooled_files(
+    document_service: DocumentService,
+    project_id: UUID,
+    user_id: UUID,
+    spooled_files: List[Dict]
+):
+    """스풀링된 파일을 최대 UPLOAD_MAX_CONCURRENCY개씩 동시에 처리하고 완료 순서대로 결과 반환
+    
+    Yields:
+        (파일 정보, 생성된 Document 또는 None, 오류 또는 None)
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.UPLOAD_MAX_CONCURRENCY))
+
+    async def _process(file_data: Dict):
+        async with semaphore:
+            try:
+                logger.info(f"Processing file: {file_data['filename']}")
+                document = await document_service.upload_spooled_document(
+                    project_id=project_id,
+                    user_id=user_id,
+                    filename=file_data['filename'],
+                    spool_path=file_data['path'],
+                    content_type=file_data['content_type'],
+                    file_size=file_data['size']
+                )
+                return file_data, document, None
+            except Exception as e:
+                return file_data, None, e
+            finally:
+                # 처리된 파일은 바로 삭제하여 임시 디스크 사용량 최소화
+                file_data['path'].unlink(missing_ok=True)
+
+    tasks = [asyncio.create_task(_process(file_data)) for file_data in spooled_files]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 클라이언트 연결 종료 등으로 중단되면 남은 작업을 취소하고 종료될 때까지 대기
+        # (호출 측에서 임시 디렉토리를 삭제하거나 DB 세션을 닫기 전에 작업이 멈춰야 함)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: UUID,
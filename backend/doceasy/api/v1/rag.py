@@ -11,9 +11,12 @@ from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import traceback
+import time
 from datetime import datetime
 
+from common.core.config import settings
 from common.core.database import get_db_async
+from common.core.redis import async_redis_client, SubscriptionLimitError
 from common.models.user import Session
 from common.core.deps import get_current_session
 
@@ -477,11 +480,8 @@ async def get_documents_status(
     try:
         logger.info(f"문서 상태 조회 - 문서 ID: {request.document_ids}")
         
-        # 각 문서의 상태 조회
-        statuses = []
-        for doc_id in request.document_ids:
-            status = await rag_service.get_document_status(doc_id)
-            statuses.append(status)
+        # 모든 문서의 상태 일괄 조회 (Redis MGET 1회 + 필요한 문서만 DB 조회 1회)
+        statuses = await rag_service.get_document_statuses(request.document_ids)
         
         logger.info("문서 상태 조회 완료")
         return statuses
@@ -493,6 +493,78 @@ async def get_documents_status(
             detail=f"문서 상태 조회 중 오류 발생: {str(e)}"
         )
 
+# 더 이상 바뀌지 않는 문서 상태 (PARTIAL은 청크 처리 중에도 사용되므로 제외)
+DOCUMENT_FINAL_STATUSES = {"COMPLETED", "ERROR", "DELETED", "NOT_FOUND"}
+
+@router.post("/document-status/stream")
+async def stream_documents_status(
+    request: VerifyAccessRequest,
+    session: Session = Depends(get_current_session),
+    rag_service: RAGService = Depends(deps.get_rag_service)
+) -> EventSourceResponse:
+    """문서들의 상태 변경 스트리밍 (폴링 대신 Redis 상태 변경 채널 구독)
+    
+    현재 상태를 먼저 전송한 뒤 상태가 바뀔 때마다 status 이벤트를 전송하고,
+    모든 문서가 최종 상태가 되거나 DOCUMENT_STATUS_STREAM_TIMEOUT이 지나면 completed 이벤트로 종료합니다.
+    동시 구독 수 제한(DOCUMENT_STATUS_STREAM_MAX_SUBSCRIPTIONS)에 걸리면 error 이벤트(fallback: polling)로 종료합니다.
+    
+    Args:
+        request: 문서 ID 목록을 포함한 요청
+        
+    Returns:
+        EventSourceResponse: 문서 상태 이벤트 스트림
+    """
+    logger.info(f"문서 상태 스트리밍 요청 - 문서 ID: {request.document_ids}")
+    
+    async def generate():
+        try:
+            deadline = time.monotonic() + settings.DOCUMENT_STATUS_STREAM_TIMEOUT
+            async with async_redis_client.subscribe_document_status(request.document_ids) as events:
+                # 구독 완료 후 현재 상태를 조회해 그 사이의 변경도 놓치지 않음
+                statuses = await rag_service.get_document_statuses(request.document_ids)
+                last_statuses = {status["document_id"]: status for status in statuses}
+                for status in statuses:
+                    yield json.dumps({"event": "status", "data": status}, ensure_ascii=False)
+                pending = {doc_id for doc_id, status in last_statuses.items() if status["status"] not in DOCUMENT_FINAL_STATUSES}
+                
+                async for event in events:
+                    if not pending or time.monotonic() > deadline:
+                        break
+                    if not isinstance(event, dict) or event.get("document_id") not in last_statuses:
+                        continue
+                    
+                    doc_id = event["document_id"]
+                    status = RAGService.document_status_from_cache(doc_id, event)
+                    if status is None:
+                        status = (await rag_service.get_document_statuses([doc_id]))[0]
+                    if status == last_statuses[doc_id]:
+                        continue
+                    
+                    last_statuses[doc_id] = status
+                    if status["status"] in DOCUMENT_FINAL_STATUSES:
+                        pending.discard(doc_id)
+                    yield json.dumps({"event": "status", "data": status}, ensure_ascii=False)
+            
+            yield json.dumps({"event": "completed", "data": {"pending": sorted(pending)}}, ensure_ascii=False)
+            logger.info(f"문서 상태 스트리밍 종료 - 미완료 문서: {len(pending)}개")
+            
+        except SubscriptionLimitError as e:
+            logger.warning(f"문서 상태 스트리밍 거부: {str(e)}")
+            yield json.dumps({"event": "error", "data": {"message": str(e), "fallback": "polling"}}, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"문서 상태 스트리밍 중 오류 발생: {str(e)}", exc_info=True)
+            yield json.dumps({"event": "error", "data": {"message": f"문서 상태 조회 중 오류 발생: {str(e)}"}}, ensure_ascii=False)
+    
+    return EventSourceResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "Content-Encoding": "none",
+        }
+    )
+
 @router.post("/chat/stop")
 async def stop_chat_generation(
     request: StopGenerationRequest,
@@ -1,13 +1,15 @@
 from datetime import datetime
+from pathlib import Path
 from uuid import UUID, uuid4
 from typing import Dict, List, Optional, Any
+import asyncio
 from fastapi import UploadFile, BackgroundTasks, HTTPException
 import logging
 import json
 import re
 
 from common.models.user import Session
-from common.core.redis import redis_client
+from common.core.redis import async_redis_client
 from common.services.storage import GoogleCloudStorageService
 
 from doceasy.models.document import Document, DocumentChunk
@@ -50,6 +52,8 @@ class DocumentService:
             credentials_path=settings.GOOGLE_APPLICATION_CREDENTIALS
         )
         self.extractor = DocumentExtractor()
+        # 동시 업로드 처리 시 같은 DB 세션을 순차적으로 사용하기 위한 잠금
+        self._db_lock = asyncio.Lock()
 
 
     def _is_allowed_file(self, content_type: str) -> bool:
@@ -181,10 +185,9 @@ class DocumentService:
                     await self.db.refresh(document)
                     
                     # 13. Redis에 문서 상태 저장
-                    redis_client.set_document_status(
+                    await async_redis_client.set_document_status(
                         str(doc_id),
-                        DOCUMENT_STATUS_UPLOADED,
-                        None
+                        DOCUMENT_STATUS_UPLOADED
                     )
                     
                     documents.append(document)
@@ -266,17 +269,10 @@ class DocumentService:
             logger.error(f"Error getting document: {str(e)}")
             return None
 
-    def get_document_status(self, document_id: UUID) -> Optional[dict]:
+    async def get_document_status(self, document_id: UUID) -> Optional[dict]:
         """문서 상태 조회"""
         try:
-            status_key = redis_client._make_key(
-                redis_client.DOCUMENT_STATUS_PREFIX,
-                str(document_id)
-            )
-            status_data = redis_client.get_key(status_key)
-            if status_data:
-                return json.loads(status_data)
-            return None
+            return await async_redis_client.get_document_status(str(document_id))
         except Exception as e:
             logger.error(f"Error getting document status: {str(e)}")
             return None
@@ -292,12 +288,8 @@ class DocumentService:
             # 2. 스토리지에서 파일 삭제
             await self.storage.delete_file(document.file_path)
             
-            # 3. Redis에서 상태 삭제
-            status_key = redis_client._make_key(
-                redis_client.DOCUMENT_STATUS_PREFIX,
-                str(document_id)
-            )
-            redis_client.delete_key(status_key)
+            # 3. Redis에서 상태 삭제 (구독 중인 클라이언트에 DELETED 이벤트 발행)
+            await async_redis_client.delete_document_status(str(document_id))
             
             # 4. DB에서 문서 삭제
             await self.db.delete(document)
@@ -354,11 +346,11 @@ class DocumentService:
         """문서 상태 업데이트"""
         try:
             # Redis에 문서 상태 저장
-            redis_client.set_document_status(
+            await async_redis_client.set_document_status(
                 document_id,
                 status,
                 error_msg,
-                embedding_ids
+                metadata={"embedding_ids": embedding_ids} if embedding_ids else None
             )
             
             # DB에 문서 상태 저장
@@ -467,40 +459,124 @@ class DocumentService:
                 logger.error(f"Text extraction error: {str(e)}")
                 extracted_text = None
                 
-            # 8. Document 객체 생성
-            document = Document(
-                id=doc_id,
-                project_id=project_id,
-                filename=filename,
-                file_path=file_path,
-                file_type=content_type,
-                file_size=file_size,
-                status=DOCUMENT_STATUS_UPLOADED,
-                extracted_text=extracted_text
-            )
-            
-            # 9. DB 저장
-            self.db.add(document)
-            await self.db.commit()
-            await self.db.refresh(document)
-            
-            # 10. Redis에 문서 상태 저장
-            redis_client.set_document_status(
-                str(doc_id),
-                DOCUMENT_STATUS_UPLOADED,
-                None
+            # 8~11. Document 저장, 상태 기록, 처리 태스크 등록
+            return await self._save_uploaded_document(
+                doc_id, project_id, user_id, filename, file_path, content_type, file_size, extracted_text
             )
             
-            # 11. 문서 처리 태스크 등록
-            self.process_document_sync(doc_id, user_id)
-            
-            return document
-            
         except Exception as e:
             logger.exception(f"File content processing error: {str(e)}")
             await self.db.rollback()
             raise
 
+    async def upload_spooled_document(
+        self,
+        project_id: UUID,
+        user_id: UUID,
+        filename: str,
+        spool_path: Path,
+        content_type: str,
+        file_size: int
+    ) -> Document:
+        """디스크에 스풀링된 업로드 파일을 처리하여 문서를 생성합니다.
+        
+        파일 읽기와 텍스트 추출은 스레드에서 실행하므로 여러 파일을 동시에 처리할 수 있습니다.
+        파일 내용은 추출이 끝나면 해제되므로 메모리 사용량은 동시에 처리 중인 파일 수에만 비례합니다.
+        같은 DocumentService(DB 세션)를 공유하는 동시 호출은 DB 저장 구간만 순차적으로 실행됩니다.
+        
+        Args:
+            project_id: 프로젝트 ID
+            user_id: 사용자 ID
+            filename: 파일 이름
+            spool_path: 스풀링된 파일 경로
+            content_type: 파일 타입
+            file_size: 파일 크기
+            
+        Returns:
+            생성된 Document 객체
+        """
+        logger.info(f"Processing spooled file: {filename}")
+        
+        # 1~3. 파일 타입/크기/이름 검증 (파일을 읽기 전에 수행)
+        if not self._is_allowed_file(content_type):
+            raise ValueError(f"Unsupported file type: {content_type}")
+        if file_size > 100 * 1024 * 1024:  # 100MB 제한
+            raise ValueError(f"File too large: {filename}")
+        if not self._is_valid_filename(filename):
+            raise ValueError(f"Invalid filename: {filename}")
+        if not file_size:
+            raise ValueError("Empty file")
+        
+        # 4. 파일 읽기 + 텍스트 추출 (스레드에서 실행)
+        extracted_text = await asyncio.to_thread(self._extract_spooled_text, spool_path, content_type)
+        
+        # 5. 저장 경로 생성
+        doc_id = uuid4()
+        file_path = f"{project_id}/{doc_id}/{filename}"
+        
+        # 6~9. Document 저장, 상태 기록, 처리 태스크 등록
+        async with self._db_lock:
+            try:
+                return await self._save_uploaded_document(
+                    doc_id, project_id, user_id, filename, file_path, content_type, file_size, extracted_text
+                )
+            except Exception as e:
+                logger.exception(f"Spooled file processing error: {str(e)}")
+                await self.db.rollback()
+                raise
+
+    def _extract_spooled_text(self, spool_path: Path, content_type: str) -> Optional[str]:
+        """스풀링된 파일을 읽어 텍스트 추출 (동기, 스레드에서 실행)"""
+        content = spool_path.read_bytes()
+        try:
+            extracted_text = self.extractor.extract_text(content, content_type)
+            if extracted_text:
+                extracted_text = extracted_text.replace('\x00', '')
+            return extracted_text
+        except Exception as e:
+            logger.error(f"Text extraction error: {str(e)}")
+            return None
+
+    async def _save_uploaded_document(
+        self,
+        doc_id: UUID,
+        project_id: UUID,
+        user_id: UUID,
+        filename: str,
+        file_path: str,
+        content_type: str,
+        file_size: int,
+        extracted_text: Optional[str]
+    ) -> Document:
+        """업로드 문서를 DB에 저장하고 Redis 상태 기록 후 문서 처리 태스크를 등록합니다."""
+        # Document 객체 생성
+        document = Document(
+            id=doc_id,
+            project_id=project_id,
+            filename=filename,
+            file_path=file_path,
+            file_type=content_type,
+            file_size=file_size,
+            status=DOCUMENT_STATUS_UPLOADED,
+            extracted_text=extracted_text
+        )
+        
+        # DB 저장
+        self.db.add(document)
+        await self.db.commit()
+        await self.db.refresh(document)
+        
+        # Redis에 문서 상태 저장
+        await async_redis_client.set_document_status(
+            str(doc_id),
+            DOCUMENT_STATUS_UPLOADED
+        )
+        
+        # 문서 처리 태스크 등록
+        self.process_document_sync(doc_id, user_id)
+        
+        return document
+
     
 
 class DocumentDatabaseManager:
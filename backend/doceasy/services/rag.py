@@ -12,6 +12,7 @@ from loguru import logger
 from requests import Session as RequestsSession
 from common.services.vector_store_manager import VectorStoreManager
 from common.core.config import settings
+from common.core.redis import async_redis_client
 from common.services.retrievers.tablemode_semantic import TableModeSemanticRetriever
 from common.services.embedding import EmbeddingService
 from doceasy.services.prompts import ChatPrompt, TablePrompt, TableHeaderPrompt
@@ -49,6 +50,9 @@ DOCUMENT_STATUS_DELETED = 'DELETED'
 class RAGService:
     """RAG 서비스"""
 
+    # Redis 상태만으로 응답하는 최종 문서 상태 (그 외 상태는 DB로 확인)
+    CACHE_FINAL_STATUSES = {"COMPLETED", "ERROR", "DELETED"}
+
     def __init__(self):
         """RAG 서비스 초기화"""
         self.embedding_service = EmbeddingService()
@@ -312,7 +316,7 @@ class RAGService:
         start_time = time.time()
         
         # VectorStoreManager 인스턴스 생성
-        vs_manager = VectorStoreManager(
+        vs_manager = await VectorStoreManager.create_async(
             embedding_model_type=self.embedding_service.get_model_type(),
             project_name=ProjectType.DOCEASY,
             namespace=settings.PINECONE_NAMESPACE_DOCEASY
@@ -495,7 +499,7 @@ class RAGService:
             
             filtersMetadata = { "document_id": {"$in": document_ids} } if document_ids else None
             
-            vs_manager = VectorStoreManager(embedding_model_type=self.embedding_service.get_model_type(),
+            vs_manager = await VectorStoreManager.create_async(embedding_model_type=self.embedding_service.get_model_type(),
                                             project_name=ProjectType.DOCEASY,
                                             namespace=settings.PINECONE_NAMESPACE_DOCEASY)
 
@@ -1316,6 +1320,98 @@ class RAGService:
                 "is_accessible": False
             }
 
+    @staticmethod
+    def document_status_from_cache(document_id: str, status_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Redis 문서 상태 데이터(doc_status 키 또는 상태 변경 이벤트)로 문서 상태 정보 생성
+
+        COMPLETED/PARTIAL 상태는 임베딩 ID가 있어야 접근 가능하므로, 상태 데이터에 임베딩 ID가 없거나
+        상태 데이터가 없으면 None을 반환합니다. (DB 조회 필요)
+        """
+        if not status_data or not isinstance(status_data, dict) or not status_data.get("status"):
+            return None
+        status = status_data["status"]
+        if status in ['COMPLETED', 'PARTIAL']:
+            if not (status_data.get("metadata") or {}).get("embedding_ids"):
+                return None
+            is_accessible = True
+        else:
+            is_accessible = False
+        return {
+            "document_id": document_id,
+            "status": status,
+            "error_message": status_data.get("error_message"),
+            "is_accessible": is_accessible
+        }
+
+    async def get_document_statuses(self, document_ids: List[str]) -> List[Dict[str, Any]]:
+        """여러 문서의 상태 일괄 조회
+
+        Redis 문서 상태를 한 번의 MGET으로 조회하고, 최종 상태(COMPLETED/ERROR/DELETED)가 아닌 문서
+        (상태 없음, 처리 중, 임베딩 ID가 없는 COMPLETED/PARTIAL)만 한 번의 DB 조회로 확인합니다.
+        워커는 DB를 먼저 갱신하므로, Redis 저장이 실패해 처리 중 상태가 남아 있어도 DB 상태를 반환합니다.
+
+        Args:
+            document_ids: 조회할 문서 ID 목록
+
+        Returns:
+            List[Dict[str, Any]]: 요청 순서대로의 문서 상태 정보 (get_document_status와 같은 형식)
+        """
+        document_ids = [str(document_id) for document_id in document_ids]
+        cached = await async_redis_client.get_document_statuses(document_ids)
+        statuses = {
+            document_id: self.document_status_from_cache(document_id, cached.get(document_id))
+            for document_id in document_ids
+        }
+
+        missing = {}
+        for document_id, status in statuses.items():
+            if status is not None and status["status"] in self.CACHE_FINAL_STATUSES:
+                continue
+            try:
+                missing[document_id] = UUID(document_id)
+            except ValueError:
+                statuses[document_id] = {
+                    "document_id": document_id,
+                    "status": "NOT_FOUND",
+                    "error_message": "문서를 찾을 수 없습니다",
+                    "is_accessible": False
+                }
+        if missing:
+            try:
+                result = await self.db.execute(
+                    select(Document)
+                    .where(Document.id.in_(list(missing.values())))
+                )
+                documents = {document.id: document for document in result.scalars()}
+                for document_id, doc_uuid in missing.items():
+                    document = documents.get(doc_uuid)
+                    if not document:
+                        statuses[document_id] = {
+                            "document_id": document_id,
+                            "status": "NOT_FOUND",
+                            "error_message": "문서를 찾을 수 없습니다",
+                            "is_accessible": False
+                        }
+                        continue
+                    statuses[document_id] = {
+                        "document_id": document_id,
+                        "status": document.status,
+                        "error_message": document.error_message,
+                        "is_accessible": document.status in ['COMPLETED', 'PARTIAL'] and bool(document.embedding_ids)
+                    }
+            except Exception as e:
+                logger.error(f"문서 상태 일괄 조회 중 오류 발생: {str(e)}", exc_info=True)
+                for document_id in missing:
+                    statuses[document_id] = {
+                        "document_id": document_id,
+                        "status": "ERROR",
+                        "error_message": str(e),
+                        "is_accessible": False
+                    }
+
+        logger.debug(f"문서 상태 일괄 조회 - 전체 {len(statuses)}개, DB 조회 {len(missing)}개")
+        return [statuses[document_id] for document_id in document_ids]
+
     async def _process_table_response(self, content: str, query: str, keywords: List[str], query_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """테이블 응답 처리
         
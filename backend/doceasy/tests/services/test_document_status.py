@@ -0,0 +1,80 @@
+"""문서 상태 일괄 조회 테스트
+
+주요 테스트 항목:
+1. Redis의 최종 상태(COMPLETED/ERROR/DELETED)로 판단 가능한 문서는 DB를 조회하지 않음
+2. 상태가 없거나 처리 중이거나 임베딩 ID가 없는 COMPLETED 문서만 한 번의 DB 조회로 확인
+   (Redis 저장 실패로 남은 처리 중 상태는 DB 상태로 대체)
+3. 요청 순서대로 결과 반환, 없는 문서/잘못된 ID는 NOT_FOUND
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from doceasy.services import rag as rag_module
+from doceasy.services.rag import RAGService
+
+
+class _FakeAsyncRedisClient:
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    async def get_document_statuses(self, document_ids):
+        self.calls.append(list(document_ids))
+        return {document_id: self.statuses.get(document_id) for document_id in document_ids}
+
+
+class _FakeDB:
+    def __init__(self, documents):
+        self.documents = documents
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        return SimpleNamespace(scalars=lambda: list(self.documents))
+
+
+@pytest.mark.asyncio
+async def test_document_statuses_query_db_only_for_undecided_documents(monkeypatch):
+    """Redis MGET 한 번과 필요한 문서만 대상으로 한 DB 조회 한 번으로 상태를 반환하는지 확인"""
+    processing, cached_done, uncached, done_without_ids, missing = (str(uuid4()) for _ in range(5))
+    redis = _FakeAsyncRedisClient({
+        processing: {"status": "PROCESSING", "updated_at": "2026-01-01T00:00:00"},
+        cached_done: {"status": "COMPLETED", "metadata": {"embedding_ids": ["c1"]}},
+        done_without_ids: {"status": "COMPLETED"},
+    })
+    monkeypatch.setattr(rag_module, "async_redis_client", redis)
+
+    service = RAGService.__new__(RAGService)
+    service.db = _FakeDB([
+        SimpleNamespace(id=rag_module.UUID(processing), status="COMPLETED", error_message=None, embedding_ids='["c0"]'),
+        SimpleNamespace(id=rag_module.UUID(uncached), status="ERROR", error_message="청크 처리 실패", embedding_ids=None),
+        SimpleNamespace(id=rag_module.UUID(done_without_ids), status="COMPLETED", error_message=None, embedding_ids='["c2"]'),
+    ])
+
+    ids = [missing, processing, "not-a-uuid", cached_done, uncached, done_without_ids]
+    statuses = await service.get_document_statuses(ids)
+
+    assert len(redis.calls) == 1 and service.db.queries == 1
+    assert [status["document_id"] for status in statuses] == ids
+    assert [status["status"] for status in statuses] == ["NOT_FOUND", "COMPLETED", "NOT_FOUND", "COMPLETED", "ERROR", "COMPLETED"]
+    assert [status["is_accessible"] for status in statuses] == [False, True, False, True, False, True]
+    assert statuses[4]["error_message"] == "청크 처리 실패"
+
+
+@pytest.mark.asyncio
+async def test_document_statuses_from_cache_skip_db(monkeypatch):
+    """모든 문서가 Redis에서 최종 상태면 DB를 조회하지 않는지 확인"""
+    doc_id = str(uuid4())
+    monkeypatch.setattr(rag_module, "async_redis_client", _FakeAsyncRedisClient({
+        doc_id: {"status": "ERROR", "error_message": "텍스트 추출 실패"}
+    }))
+    service = RAGService.__new__(RAGService)
+    service.db = _FakeDB([])
+
+    assert await service.get_document_statuses([doc_id]) == [
+        {"document_id": doc_id, "status": "ERROR", "error_message": "텍스트 추출 실패", "is_accessible": False}
+    ]
+    assert service.db.queries == 0
@@ -0,0 +1,90 @@
+"""다중 파일 업로드 처리 테스트
+
+주요 테스트 항목:
+1. 업로드 파일을 임시 디렉토리에 스풀링하고 처리 후 삭제
+2. 파일이 최대 UPLOAD_MAX_CONCURRENCY개씩 동시에 처리되고 완료 순서대로 결과 반환
+3. 스풀링된 파일의 텍스트 추출과 DB 저장
+"""
+
+import asyncio
+import io
+from uuid import uuid4
+
+import pytest
+from fastapi import UploadFile
+
+from doceasy.api.v1 import document as document_api
+from doceasy.services.document import DocumentService
+
+
+class _FakeDocumentService:
+    """처리 시간과 동시 실행 수를 기록하는 DocumentService 대체"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.running = 0
+        self.max_running = 0
+
+    async def upload_spooled_document(self, project_id, user_id, filename, spool_path, content_type, file_size):
+        assert spool_path.read_bytes()
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays[filename])
+            if filename == "broken.pdf":
+                raise ValueError("Invalid file")
+            return filename
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_spooled_files_processed_concurrently_in_completion_order(tmp_path, monkeypatch):
+    """동시 처리 수 제한과 완료 순서 결과 반환, 처리 후 임시 파일 삭제 확인"""
+    monkeypatch.setattr(document_api.settings, "UPLOAD_MAX_CONCURRENCY", 2)
+    delays = {"slow.pdf": 0.2, "fast.pdf": 0.01, "broken.pdf": 0.02, "last.pdf": 0.01}
+    files = [
+        UploadFile(io.BytesIO(f"{name} 내용".encode()), filename=name, headers={"content-type": "application/pdf"})
+        for name in delays
+    ]
+
+    spooled_files, failed_files = await document_api.spool_upload_files(files, tmp_path)
+    assert not failed_files
+    assert [f["size"] for f in spooled_files] == [len(f"{name} 내용".encode()) for name in delays]
+
+    service = _FakeDocumentService(delays)
+    results = [
+        (file_data["filename"], document, error)
+        async for file_data, document, error in document_api.process_spooled_files(service, uuid4(), uuid4(), spooled_files)
+    ]
+
+    assert service.max_running == 2
+    assert [filename for filename, _, _ in results] == ["fast.pdf", "broken.pdf", "last.pdf", "slow.pdf"]
+    assert isinstance(results[1][2], ValueError)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_spooled_document_extracts_text_and_saves(tmp_path):
+    """스풀링된 파일의 텍스트 추출 후 저장 헬퍼에 전달하는지 확인"""
+    service = DocumentService.__new__(DocumentService)
+    service.allowed_mime_types = {"text/plain": "txt"}
+    service._db_lock = asyncio.Lock()
+    service.extractor = type("Extractor", (), {"extract_text": lambda self, content, content_type: content.decode() + "\x00"})()
+    saved = {}
+
+    async def _save(doc_id, project_id, user_id, filename, file_path, content_type, file_size, extracted_text):
+        saved.update(filename=filename, file_path=file_path, extracted_text=extracted_text)
+        return saved
+
+    service._save_uploaded_document = _save
+    spool_path = tmp_path / "0"
+    spool_path.write_bytes("본문".encode())
+    project_id = uuid4()
+
+    await service.upload_spooled_document(project_id, uuid4(), "note.txt", spool_path, "text/plain", spool_path.stat().st_size)
+    assert saved["extracted_text"] == "본문"
+    assert saved["file_path"].startswith(f"{project_id}/") and saved["file_path"].endswith("/note.txt")
+
+    with pytest.raises(ValueError):
+        await service.upload_spooled_document(project_id, uuid4(), "image.png", spool_path, "image/png", 10)
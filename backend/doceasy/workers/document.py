@@ -89,8 +89,7 @@ async def update_document_status_async(session, document_id: str, doc_status: st
         if error:
             status_data['error_message'] = error
             
-        key = f"doc_status:{document_id}"
-        redis_client_for_document.set_key(key, status_data)
+        redis_client_for_document.store_document_status(document_id, status_data)
             
     except Exception as e:
         logger.error(f"Error updating document status: {str(e)}")
@@ -119,8 +118,7 @@ def update_document_status(document_id: str, doc_status: str, metadata: dict = N
         if error:
             status_data['error_message'] = error
             
-        key = f"doc_status:{document_id}"
-        redis_client_for_document.set_key(key, status_data)
+        redis_client_for_document.store_document_status(document_id, status_data)
             
     except Exception as e:
         logger.error(f"상태 업데이트 실패: {str(e)}")
@@ -215,7 +213,8 @@ def process_document_chucking(self, document_id: str, user_id: str = None):
 
             # 청크 생성
             text_splitter = TextSplitter() 
-            chunks = text_splitter.split_text(extracted_text)
+            # 대용량 문서는 섹션 단위로 프로세스 풀에서 병렬 분할
+            chunks = text_splitter.split_text(extracted_text, parallel=True)
 
             # 청크를 PostgreSQL에 저장
             #logger.info(f"청크 삭제 시작: {document_id}")
@@ -464,9 +463,12 @@ def make_embedding_data_batch(self, document_id: str, chunks: List[str], batch_s
         with SessionLocal() as db:
             doc = db.query(Document).filter(Document.id == UUID(document_id)).first()
             if doc:
-                # 문서의 총 청크 수 먼저 확인 및 설정
+                # 처리된 청크 수 증가(원자적)와 문서의 총 청크 수 조회를 한 번의 파이프라인으로 수행
                 total_key = f"total_chunks:{document_id}"
-                total_chunks = redis_client_for_document.get_key(total_key)
+                processed_key = f"processed_chunks:{document_id}"
+                current_processed, total_chunks = redis_client_for_document.incr_with_total(
+                    processed_key, len(chunks), total_key
+                )
                 if not total_chunks:
                     if doc.extracted_text:
                         all_chunks = split_text(doc.extracted_text)
@@ -475,10 +477,6 @@ def make_embedding_data_batch(self, document_id: str, chunks: List[str], batch_s
                 else:
                     total_chunks = int(total_chunks)
 
-                # Redis에서 현재까지 처리된 총 청크 수 확인 및 업데이트
-                processed_key = f"processed_chunks:{document_id}"
-                current_processed = redis_client_for_document.incr(processed_key, len(chunks))  # 원자적 증가
-
                 # 생성된 청크 ID 저장
                 chunk_ids = [v["id"] for v in vectors]
                 try:
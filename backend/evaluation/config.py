@@ -11,6 +11,10 @@ RESULTS_DIR = BASE_DIR / "results"
 # 결과 디렉토리가 없으면 생성
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# 평가 실행 설정 (쿼리/예제 동시 평가 수, 임베딩/LLM 평가 응답 영구 캐시 경로)
+EVALUATION_MAX_CONCURRENCY = int(os.environ.get("EVALUATION_MAX_CONCURRENCY", "8"))
+EVALUATION_CACHE_PATH = RESULTS_DIR / "cache" / "evaluation_cache.sqlite"
+
 # 임베딩 모델 설정
 EMBEDDING_MODELS = {
     "text-embedding-3-small": "openai",
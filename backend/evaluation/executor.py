@@ -0,0 +1,256 @@
+"""
+평가 실행기 및 영구 캐시 모듈
+
+평가 스위트를 다시 실행할 때 변경된 부분만 비용을 지불하도록 합니다.
+- EvaluationCache: 임베딩 벡터와 LLM 평가(judge) 응답을 내용 해시 기준으로 디스크(SQLite)에 저장
+- CachedEmbeddings: LangChain 임베딩 모델 래퍼 (캐시 미스만 한 번의 embed_documents 호출로 처리)
+- CachedJudge: LangChain LLM 래퍼 (프롬프트 + 모델 설정 해시로 응답 캐싱, LCEL 체인에 그대로 사용 가능)
+- EvaluationExecutor: 쿼리/예제 단위 평가를 제한된 동시성으로 실행 (스레드 풀, 입력 순서 유지)
+- prefetch_retrieval: 검색기 호출을 미리 병렬로 실행해 두는 검색기 프록시
+
+사용 예:
+```
+cache = EvaluationCache()
+executor = EvaluationExecutor(max_workers=8)
+embeddings = CachedEmbeddings(OpenAIEmbeddings(), cache)
+judge = CachedJudge(ChatGoogleGenerativeAI(model="models/gemini-2.0-flash", temperature=0), cache)
+results = executor.map(lambda example: evaluate(example, embeddings, judge), examples)
+```
+"""
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+
+from evaluation.config import EVALUATION_CACHE_PATH, EVALUATION_MAX_CONCURRENCY
+
+
+def _model_identity(model: Any) -> str:
+    """캐시 키에 포함할 모델 식별자 (모델 이름 + temperature)"""
+    name = getattr(model, "model_name", None) or getattr(model, "model", None) or type(model).__name__
+    temperature = getattr(model, "temperature", None)
+    return f"{type(model).__name__}:{name}:{temperature}"
+
+
+def _prompt_text(prompt: Any) -> str:
+    """LLM 입력(PromptValue, 메시지 목록, 프롬프트 템플릿, 문자열)을 캐시 키용 문자열로 변환"""
+    if isinstance(prompt, str):
+        return prompt
+    if hasattr(prompt, "to_messages"):
+        prompt = prompt.to_messages()
+    elif hasattr(prompt, "messages"):
+        prompt = prompt.messages
+    if isinstance(prompt, (list, tuple)):
+        return "\n".join(
+            f"{getattr(message, 'type', type(message).__name__)}: {getattr(message, 'content', message)}"
+            for message in prompt
+        )
+    return str(prompt)
+
+
+class EvaluationCache:
+    """내용 해시 기준 영구 캐시 (SQLite, 스레드 안전)"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            path: 캐시 파일 경로 (기본값: results/cache/evaluation_cache.sqlite)
+        """
+        self.path = Path(path or EVALUATION_CACHE_PATH)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)")
+        self._conn.commit()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(namespace: str, *parts: str) -> str:
+        """네임스페이스와 내용으로 캐시 키(sha256) 생성"""
+        digest = hashlib.sha256()
+        for part in (namespace, *parts):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return f"{namespace}:{digest.hexdigest()}"
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, bytes]:
+        """여러 키를 한 번에 조회"""
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start:start + 500])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update(rows)
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(set(keys)) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, bytes]) -> None:
+        """여러 키를 한 번에 저장"""
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", list(items.items()))
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """캐시를 거치는 LangChain 임베딩 모델 래퍼"""
+
+    def __init__(self, model: Embeddings, cache: EvaluationCache):
+        self.model = model
+        self.cache = cache
+        self.identity = _model_identity(model)
+
+    def _embed(self, texts: List[str], embed_fn: Callable[[List[str]], List[List[float]]], kind: str) -> List[List[float]]:
+        keys = [EvaluationCache.make_key("embedding", self.identity, kind, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # 캐시 미스(중복 제외)만 한 번에 임베딩
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        if missing:
+            vectors = embed_fn(list(missing.values()))
+            new_items = {
+                key: np.asarray(vector, dtype=np.float32).tobytes()
+                for key, vector in zip(missing.keys(), vectors)
+            }
+            self.cache.set_many(new_items)
+            cached.update(new_items)
+
+        return [np.frombuffer(cached[key], dtype=np.float32).tolist() for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts, self.model.embed_documents, "document")
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text], lambda texts: [self.model.embed_query(texts[0])], "query")[0]
+
+
+class CachedJudge(Runnable):
+    """
+    캐시를 거치는 LLM 평가자(judge) 래퍼
+
+    temperature=0 평가 프롬프트의 응답을 (모델 설정, 프롬프트) 해시로 캐싱합니다.
+    Runnable이므로 `prompt | judge | StrOutputParser()` 체인과 `judge.invoke(prompt)` 모두 사용할 수 있습니다.
+    """
+
+    def __init__(self, llm: Any, cache: EvaluationCache):
+        self.llm = llm
+        self.cache = cache
+        self.identity = _model_identity(llm)
+
+    def invoke(self, input: Any, config: Optional[Dict] = None, **kwargs) -> AIMessage:
+        key = EvaluationCache.make_key("judge", self.identity, _prompt_text(input))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached.decode("utf-8"))
+
+        response = self.llm.invoke(input, config, **kwargs)
+        content = response.content if hasattr(response, "content") else str(response)
+        if isinstance(content, str):
+            self.cache.set(key, content.encode("utf-8"))
+        return response if isinstance(response, AIMessage) else AIMessage(content=content)
+
+
+class EvaluationExecutor:
+    """제한된 동시성으로 평가 작업을 실행하는 실행기 (스레드 풀)"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: 동시에 실행할 평가 작업 수 (1이면 순차 실행)
+        """
+        self.max_workers = max(1, max_workers or EVALUATION_MAX_CONCURRENCY)
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        on_result: Optional[Callable[[int, Any], None]] = None
+    ) -> List[Any]:
+        """
+        항목별로 fn을 실행하고 입력 순서대로 결과를 반환합니다.
+
+        Args:
+            fn: 항목별 평가 함수 (예외는 호출자에게 전달되므로 fn 안에서 처리)
+            items: 평가할 항목 목록
+            on_result: 완료 순서대로 (인덱스, 결과)를 받는 콜백 (호출 스레드에서 실행, 중간 저장용)
+
+        Returns:
+            List[Any]: 입력 순서와 같은 순서의 결과 목록
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        if self.max_workers == 1 or len(items) <= 1:
+            for index, item in enumerate(items):
+                results[index] = fn(item)
+                if on_result:
+                    on_result(index, results[index])
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items)), thread_name_prefix="evaluation") as pool:
+            futures = {pool.submit(fn, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if on_result:
+                    on_result(index, results[index])
+        return results
+
+
+class _PrefetchedRetriever:
+    """미리 실행한 검색 결과를 반환하는 검색기 프록시 (없는 쿼리는 원래 검색기로 위임)"""
+
+    def __init__(self, retriever: Any, results: Dict[str, Any]):
+        self._retriever = retriever
+        self._results = results
+
+    def get_relevant_documents(self, query: str):
+        if query in self._results:
+            return self._results[query]
+        return self._retriever.get_relevant_documents(query)
+
+    def __getattr__(self, name: str):
+        return getattr(self._retriever, name)
+
+
+def prefetch_retrieval(retriever: Any, queries: Sequence[str], executor: EvaluationExecutor) -> _PrefetchedRetriever:
+    """
+    쿼리별 검색을 병렬로 미리 실행하고, 결과를 반환하는 검색기 프록시를 만듭니다.
+
+    순차 루프로 get_relevant_documents를 호출하는 메트릭 함수에 그대로 넘길 수 있습니다.
+
+    Args:
+        retriever: get_relevant_documents를 제공하는 검색기
+        queries: 검색할 쿼리 목록
+        executor: 평가 실행기
+
+    Returns:
+        검색기 프록시
+    """
+    unique_queries = list(dict.fromkeys(queries))
+    documents = executor.map(retriever.get_relevant_documents, unique_queries)
+    return _PrefetchedRetriever(retriever, dict(zip(unique_queries, documents)))
@@ -0,0 +1,95 @@
+"""
+데이터셋 생성 체크포인트 모듈
+
+데이터셋 생성 결과(파일별 로드 결과, 청크별 생성 쿼리)를 내용 해시 키로 JSONL 파일에 스트리밍 저장합니다.
+- 결과는 완료되는 즉시 한 줄씩 추가 기록되므로 중간에 실패해도 완료된 부분은 보존됨
+- 재실행 시 기존 기록을 읽어 변경되지 않은 입력은 건너뜀 (문서/청크 내용이 바뀌면 키가 바뀌어 다시 생성)
+- 마지막 줄이 중단으로 잘린 경우 해당 줄만 무시
+
+사용 예:
+```
+checkpoint = GenerationCheckpoint("datasets/standard_evaluation.checkpoint.jsonl")
+key = GenerationCheckpoint.make_key("queries", model_name, chunk_text)
+queries = checkpoint.get(key)
+if queries is None:
+    queries = generate(...)
+    checkpoint.put(key, queries)
+```
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class GenerationCheckpoint:
+    """내용 해시 키 기반 JSONL 체크포인트 (추가 기록 전용, 스레드 안전)"""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: 체크포인트 JSONL 파일 경로
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._lock = threading.Lock()
+        self._records: Dict[str, Any] = {}
+        self.stats = {"loaded": 0, "hits": 0, "written": 0}
+        self._load()
+
+    def _load(self) -> None:
+        """기존 체크포인트 기록 로드 (잘린 줄은 무시)"""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._records[record["key"]] = record["value"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+        self.stats["loaded"] = len(self._records)
+
+    @staticmethod
+    def make_key(kind: str, *parts: str) -> str:
+        """기록 종류와 내용으로 키(sha256) 생성"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x00")
+        return f"{kind}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """기록 조회 (없으면 None)"""
+        with self._lock:
+            value = self._records.get(key)
+            if value is not None:
+                self.stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """기록을 메모리와 JSONL 파일에 즉시 추가"""
+        line = json.dumps({"key": key, "value": value}, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._records[key] = value
+            self.stats["written"] += 1
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._records
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """파일 내용 해시 계산"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -3,10 +3,10 @@
 """
 import os
 import json
-import random
 from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 import hashlib
+import heapq
 import glob
 
 from langchain_community.document_loaders import DirectoryLoader, TextLoader, PyPDFLoader
@@ -22,6 +22,8 @@ from pydantic import BaseModel, Field, field_validator
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import DOCS_DIR, DATASETS_DIR, DATASET_CONFIG
+from evaluation.executor import EvaluationExecutor
+from evaluation.generator.checkpoint import GenerationCheckpoint, file_sha256
 
 class GeneratedQuery(BaseModel):
     """생성된 쿼리 모델"""
@@ -35,6 +37,54 @@ class GeneratedQuery(BaseModel):
             raise ValueError("적어도 하나의 관련 문서 인덱스가 있어야 합니다")
         return v
 
+# 청크당 생성할 쿼리 수 (체크포인트 키에 포함되므로 고정)
+QUERIES_PER_CHUNK = 3
+
+# 복잡성 유형별 쿼리 생성 프롬프트
+_COMPLEX_QUERY_FORMAT = """
+    다음 형식으로 JSON 객체를 반환해주세요:
+    ```json
+    {{
+      "question": "두 문서 내용을 모두 활용해야 답할 수 있는 질문",
+      "answer": "문서에서 근거를 찾아 작성한 답변"
+    }}
+    ```
+    """
+
+COMPLEXITY_TEMPLATES = {
+    "multi_hop": """
+    다음 문서들에서 여러 단계의 추론을 거쳐야 답할 수 있는 질문-답변 쌍을 1개 생성해주세요.
+    질문에 답하려면 두 문서의 정보를 연결해야 합니다.
+    
+    문서 내용:
+    {document_content}
+    """ + _COMPLEX_QUERY_FORMAT,
+    "reasoning": """
+    다음 문서들의 내용을 바탕으로 원인, 결과, 의미를 추론해야 하는 질문-답변 쌍을 1개 생성해주세요.
+    
+    문서 내용:
+    {document_content}
+    """ + _COMPLEX_QUERY_FORMAT,
+    "numerical": """
+    다음 문서들에 나오는 수치를 계산하거나 비교해야 답할 수 있는 질문-답변 쌍을 1개 생성해주세요.
+    
+    문서 내용:
+    {document_content}
+    """ + _COMPLEX_QUERY_FORMAT,
+    "comparison": """
+    다음 문서들의 내용을 서로 비교해야 답할 수 있는 질문-답변 쌍을 1개 생성해주세요.
+    
+    문서 내용:
+    {document_content}
+    """ + _COMPLEX_QUERY_FORMAT,
+    "default": """
+    다음 문서들에서 '{complexity_type}' 유형의 복잡한 질문-답변 쌍을 1개 생성해주세요.
+    
+    문서 내용:
+    {document_content}
+    """ + _COMPLEX_QUERY_FORMAT,
+}
+
 class RAGEvaluationDataset(BaseModel):
     """RAG 평가용 데이터셋 모델"""
     name: str = Field(description="데이터셋 이름")
@@ -44,7 +94,8 @@ class RAGEvaluationDataset(BaseModel):
 
 def load_documents_from_directory(
     directory_path: str, 
-    glob_pattern: str = "**/*.pdf"
+    glob_pattern: str = "**/*.pdf",
+    checkpoint: Optional[GenerationCheckpoint] = None
 ) -> List[Document]:
     """
     디렉토리에서 문서를 로드합니다.
@@ -52,6 +103,7 @@ def load_documents_from_directory(
     Args:
         directory_path (str): 문서 디렉토리 경로
         glob_pattern (str): 로드할 파일의 glob 패턴
+        checkpoint (Optional[GenerationCheckpoint]): 파일 내용 해시별 로드 결과 체크포인트 (변경되지 않은 파일은 다시 파싱하지 않음)
         
     Returns:
         List[Document]: 로드된 문서 리스트
@@ -88,7 +140,17 @@ def load_documents_from_directory(
                 print(f"[load_documents_from_directory] 파일 로드 중: {file_path}")
                 file_extension = os.path.splitext(file_path)[1].lower()
                 
-                if file_extension == '.pdf':
+                # 체크포인트에 같은 내용의 파일 로드 결과가 있으면 재사용
+                file_key = GenerationCheckpoint.make_key("document", file_sha256(file_path)) if checkpoint is not None else None
+                cached_pages = checkpoint.get(file_key) if checkpoint is not None else None
+                
+                if cached_pages is not None:
+                    file_documents = [
+                        Document(page_content=page["page_content"], metadata={**page["metadata"], "source": file_path})
+                        for page in cached_pages
+                    ]
+                    print(f"[load_documents_from_directory] 체크포인트 사용 (변경 없음): {file_path}")
+                elif file_extension == '.pdf':
                     loader = PyPDFLoader(file_path=file_path)
                     file_documents = loader.load()
                 elif file_extension in ['.txt', '.md', '.html']:
@@ -99,6 +161,12 @@ def load_documents_from_directory(
                     print(f"[load_documents_from_directory] 지원되지 않는 파일 형식: {file_extension}, 파일: {file_path}")
                     continue
                 
+                if checkpoint is not None and cached_pages is None:
+                    checkpoint.put(file_key, [
+                        {"page_content": doc.page_content, "metadata": dict(doc.metadata)}
+                        for doc in file_documents
+                    ])
+                
                 # 문서 ID 추가
                 for doc in file_documents:
                     doc.metadata["id"] = f"doc_{len(documents)}"
@@ -166,6 +234,39 @@ def split_documents(documents: List[Document], chunk_size: int = 1000, chunk_ove
     
     return split_docs
 
+def _default_checkpoint_path(output_path: Union[str, Path]) -> Path:
+    """출력 파일 옆의 체크포인트 파일 경로 (예: standard_evaluation.checkpoint.jsonl)"""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.checkpoint.jsonl")
+
+def _llm_name(llm: BaseLanguageModel) -> str:
+    """체크포인트 키에 포함할 모델 이름 (모델이 바뀌면 다시 생성)"""
+    return str(getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__)
+
+def _count_queries(chunk_queries: Dict[int, List[Dict[str, Any]]]) -> int:
+    return sum(len(queries) for queries in chunk_queries.values())
+
+def _group_chunks_by_source(split_documents_list: List[Document]) -> Dict[str, List[int]]:
+    """원본 파일별 청크 인덱스 (파일 경로 순, 파일 안에서는 청크 순서 유지)"""
+    groups: Dict[str, List[int]] = {}
+    for idx, doc in enumerate(split_documents_list):
+        source = str(doc.metadata.get("source") or doc.metadata.get("source_doc_id"))
+        groups.setdefault(source, []).append(idx)
+    return {source: groups[source] for source in sorted(groups)}
+
+def _select_stable_chunks(slot: str, chunk_digests: List[str], k: int = 2) -> List[int]:
+    """
+    슬롯별로 청크 내용 해시 순위가 가장 높은 k개 청크 선택 (rendezvous hashing)
+    
+    선택은 청크 목록 전체가 아니라 각 청크 내용에만 의존하므로, 문서를 추가해도
+    새 청크가 순위에 들어가는 슬롯만 선택이 바뀝니다. (바뀐 선택에는 항상 새 청크가 포함됨)
+    """
+    return heapq.nsmallest(
+        k,
+        range(len(chunk_digests)),
+        key=lambda idx: hashlib.blake2b(f"{slot}\x00{chunk_digests[idx]}".encode("utf-8"), digest_size=8).digest()
+    )
+
 def generate_queries_from_doc(
     document: Document, 
     num_queries: int = 3, 
@@ -255,11 +356,16 @@ def generate_synthetic_dataset(
     num_docs_per_sample: int = 5,
     doc_chunk_size: int = 1000,
     doc_chunk_overlap: int = 100,
-    llm: Optional[BaseLanguageModel] = None
+    llm: Optional[BaseLanguageModel] = None,
+    max_concurrency: Optional[int] = None,
+    checkpoint_path: Optional[Union[str, Path]] = None
 ) -> RAGEvaluationDataset:
     """
     합성 평가 데이터셋을 생성합니다.
     
+    파일별 로드 결과와 청크별 생성 쿼리를 내용 해시 키로 체크포인트(JSONL)에 기록하므로,
+    중단 후 재실행하거나 문서를 추가해도 변경된 입력만 LLM으로 생성합니다.
+    
     Args:
         docs_dir (Union[str, Path]): 문서 디렉토리 경로
         output_path (Union[str, Path]): 출력 파일 경로
@@ -269,6 +375,8 @@ def generate_synthetic_dataset(
         doc_chunk_size (int): 문서 청크 크기
         doc_chunk_overlap (int): 문서 청크 오버랩
         llm (Optional[BaseLanguageModel]): 사용할 언어 모델
+        max_concurrency (Optional[int]): 동시에 실행할 LLM 호출 수 (기본값: EVALUATION_MAX_CONCURRENCY)
+        checkpoint_path (Optional[Union[str, Path]]): 체크포인트 파일 경로 (기본값: 출력 파일명.checkpoint.jsonl)
         
     Returns:
         RAGEvaluationDataset: 생성된 데이터셋
@@ -276,8 +384,11 @@ def generate_synthetic_dataset(
     print(f"[generate_synthetic_dataset] 데이터셋 '{dataset_name}' 생성 시작")
     print(f"[generate_synthetic_dataset] 문서 로드 중: {docs_dir}")
     
+    checkpoint = GenerationCheckpoint(checkpoint_path or _default_checkpoint_path(output_path))
+    print(f"[generate_synthetic_dataset] 체크포인트: {checkpoint.path} (기존 기록 {len(checkpoint)}개)")
+    
     # 문서 로드 및 분할
-    raw_documents = load_documents_from_directory(docs_dir, glob_pattern="**/*.pdf")
+    raw_documents = load_documents_from_directory(docs_dir, glob_pattern="**/*.pdf", checkpoint=checkpoint)
     print(f"[generate_synthetic_dataset] 로드된 문서 수: {len(raw_documents)}")
     
     split_documents_list = split_documents(
@@ -322,32 +433,29 @@ def generate_synthetic_dataset(
         print(f"[generate_synthetic_dataset] LLM이 없으므로 기본 ChatOpenAI 모델 초기화 중...")
         llm = ChatOpenAI(model="gpt-4", temperature=0.7)
     
-    # 쿼리 생성
+    # 쿼리 생성 (청크별 결과는 체크포인트에 스트리밍 저장, 변경되지 않은 청크는 재사용)
     print(f"[generate_synthetic_dataset] 쿼리 생성 시작 (목표: {num_samples}개)")
-    query_count = 0
+    executor = EvaluationExecutor(max_concurrency)
+    model_name = _llm_name(llm)
+    chunk_keys = [
+        GenerationCheckpoint.make_key("queries", model_name, QUERIES_PER_CHUNK, doc.page_content)
+        for doc in split_documents_list
+    ]
     
     # 최대 시도 횟수 설정 (각 문서당 최대 시도 수)
     max_attempts_per_doc = 3
     
-    for doc_idx, doc in enumerate(split_documents_list):
-        if query_count >= num_samples:
-            break
-            
+    def generate_chunk_queries(doc_idx: int) -> Tuple[int, List[Dict[str, Any]]]:
+        doc = split_documents_list[doc_idx]
         print(f"[generate_synthetic_dataset] 문서 {doc_idx+1}/{len(split_documents_list)}에서 쿼리 생성 중...")
         
-        # 각 문서에서 최대 num_queries 개의 쿼리 생성 시도
-        num_queries = min(3, num_samples - query_count)
-        
         for attempt in range(max_attempts_per_doc):
             try:
-                queries = generate_queries_from_doc(doc, num_queries=num_queries, llm=llm)
+                queries = generate_queries_from_doc(doc, num_queries=QUERIES_PER_CHUNK, llm=llm)
                 
                 if queries:
-                    # 쿼리 추가
-                    dataset.queries.extend(queries)
-                    query_count += len(queries)
-                    print(f"[generate_synthetic_dataset] 문서 {doc_idx+1}에서 {len(queries)}개 쿼리 생성 성공 (총 {query_count}/{num_samples})")
-                    break
+                    print(f"[generate_synthetic_dataset] 문서 {doc_idx+1}에서 {len(queries)}개 쿼리 생성 성공")
+                    return doc_idx, queries
                 else:
                     print(f"[generate_synthetic_dataset] 문서 {doc_idx+1}에서 쿼리 생성 실패 (시도 {attempt+1}/{max_attempts_per_doc})")
             except Exception as e:
@@ -355,6 +463,74 @@ def generate_synthetic_dataset(
                 
                 if attempt == max_attempts_per_doc - 1:
                     print(f"[generate_synthetic_dataset] 문서 {doc_idx+1}에서 최대 시도 횟수 초과, 다음 문서로 넘어갑니다.")
+        return doc_idx, []
+    
+    chunk_queries: Dict[int, List[Dict[str, Any]]] = {}
+    
+    def store_chunk_queries(_: int, result: Tuple[int, List[Dict[str, Any]]]) -> None:
+        doc_idx, queries = result
+        chunk_queries[doc_idx] = queries
+        # 실패한 청크는 기록하지 않아 재실행 시 다시 시도
+        if queries:
+            checkpoint.put(chunk_keys[doc_idx], [
+                {key: value for key, value in query.items() if key != "relevant_doc_ids"}
+                for query in queries
+            ])
+    
+    # 원본 파일별 쿼리 할당량 (새로 추가된 파일도 항상 할당량만큼 쿼리를 받음)
+    source_groups = _group_chunks_by_source(split_documents_list)
+    base_quota, extra_quota = divmod(num_samples, len(source_groups)) if source_groups else (0, 0)
+    quotas = {source: base_quota + (1 if rank < extra_quota else 0) for rank, source in enumerate(source_groups)}
+    cursors = {source: 0 for source in source_groups}
+    
+    def source_query_count(source: str) -> int:
+        return sum(len(chunk_queries.get(doc_idx, [])) for doc_idx in source_groups[source])
+    
+    def fill_quotas() -> int:
+        """파일별로 할당량을 채울 때까지 청크 순서대로, 체크포인트에 없는 청크만 동시 실행 수 단위로 생성"""
+        generated = 0
+        while True:
+            wave = []
+            for source, chunk_indices in source_groups.items():
+                projected = source_query_count(source)
+                while cursors[source] < len(chunk_indices) and projected < quotas[source] and len(wave) < executor.max_workers:
+                    doc_idx = chunk_indices[cursors[source]]
+                    cursors[source] += 1
+                    cached_queries = checkpoint.get(chunk_keys[doc_idx])
+                    if cached_queries is not None:
+                        chunk_queries[doc_idx] = cached_queries
+                        projected += len(cached_queries)
+                    else:
+                        wave.append(doc_idx)
+                        projected += QUERIES_PER_CHUNK
+            if not wave:
+                return generated
+            executor.map(generate_chunk_queries, wave, on_result=store_chunk_queries)
+            generated += len(wave)
+    
+    generated_chunks = fill_quotas()
+    # 청크가 부족해 할당량을 못 채운 파일의 몫은 청크가 남은 파일에 나누어 할당
+    shortfall = num_samples - sum(min(source_query_count(source), quotas[source]) for source in source_groups)
+    while shortfall > 0:
+        open_sources = [source for source in source_groups if cursors[source] < len(source_groups[source])]
+        if not open_sources:
+            break
+        for source in open_sources:
+            quotas[source] = min(source_query_count(source), quotas[source]) + -(-shortfall // len(open_sources))
+        generated_chunks += fill_quotas()
+        shortfall = num_samples - sum(min(source_query_count(source), quotas[source]) for source in source_groups)
+    
+    # 파일별로 할당량만큼 청크 순서대로 쿼리를 모아 현재 청크 ID로 연결
+    for source, chunk_indices in source_groups.items():
+        source_queries = [
+            {**query, "relevant_doc_ids": [split_documents_list[doc_idx].metadata["id"]]}
+            for doc_idx in chunk_indices
+            for query in chunk_queries.get(doc_idx, [])
+        ]
+        dataset.queries.extend(source_queries[:quotas[source]])
+    dataset.queries = dataset.queries[:num_samples]
+    
+    print(f"[generate_synthetic_dataset] 새로 생성한 청크: {generated_chunks}개, 체크포인트 재사용 청크: {len(chunk_queries) - generated_chunks}개")
     
     print(f"[generate_synthetic_dataset] 데이터셋 생성 완료: {dataset_name} ({len(dataset.queries)}개 쿼리, {len(dataset.documents)}개 문서)")
     
@@ -372,11 +548,15 @@ def generate_complex_dataset(
     complexity_types: List[str] = None,
     doc_chunk_size: int = 1000,
     doc_chunk_overlap: int = 100,
-    llm: Optional[BaseLanguageModel] = None
+    llm: Optional[BaseLanguageModel] = None,
+    max_concurrency: Optional[int] = None,
+    checkpoint_path: Optional[Union[str, Path]] = None
 ) -> RAGEvaluationDataset:
     """
     복잡한 평가 데이터셋을 생성합니다.
     
+    파일별 로드 결과와 쿼리별 생성 결과를 체크포인트(JSONL)에 기록하여 재실행 시 재사용합니다.
+    
     Args:
         docs_dir (str): 문서 디렉토리 경로
         output_path (str): 출력 파일 경로
@@ -386,6 +566,8 @@ def generate_complex_dataset(
         doc_chunk_size (int): 문서 청크 크기
         doc_chunk_overlap (int): 문서 청크 오버랩
         llm (Optional[BaseLanguageModel]): 사용할 언어 모델
+        max_concurrency (Optional[int]): 동시에 실행할 LLM 호출 수 (기본값: EVALUATION_MAX_CONCURRENCY)
+        checkpoint_path (Optional[Union[str, Path]]): 체크포인트 파일 경로 (기본값: 출력 파일명.checkpoint.jsonl)
         
     Returns:
         RAGEvaluationDataset: 생성된 데이터셋
@@ -398,9 +580,11 @@ def generate_complex_dataset(
     
     print(f"[generate_complex_dataset] 복잡성 유형: {complexity_types}")
     
+    checkpoint = GenerationCheckpoint(checkpoint_path or _default_checkpoint_path(output_path))
+    
     # 문서 로드 및 분할
     print(f"[generate_complex_dataset] 문서 로드 중...")
-    raw_documents = load_documents_from_directory(docs_dir, glob_pattern="**/*.pdf")
+    raw_documents = load_documents_from_directory(docs_dir, glob_pattern="**/*.pdf", checkpoint=checkpoint)
     print(f"[generate_complex_dataset] 로드된 문서 수: {len(raw_documents)}")
     
     if len(raw_documents) == 0:
@@ -419,85 +603,126 @@ def generate_complex_dataset(
     if not llm:
         print(f"[generate_complex_dataset] LLM이 없으므로 기본 ChatOpenAI 모델 초기화 중...")
         llm = ChatOpenAI(model="gpt-4", temperature=0.7)
+    model_name = _llm_name(llm)
     
     # 데이터셋 초기화
     print(f"[generate_complex_dataset] 데이터셋 초기화 중...")
-    dataset = RAGEvaluationDataset(name=dataset_name)
+    dataset = RAGEvaluationDataset(
+        name=dataset_name,
+        queries=[],
+        documents=[],
+        metadata={
+            "source_dir": str(docs_dir),
+            "num_samples": num_samples,
+            "complexity_types": complexity_types,
+            "doc_chunk_size": doc_chunk_size,
+            "doc_chunk_overlap": doc_chunk_overlap,
+            "total_documents": len(split_documents_list)
+        }
+    )
     
     # 문서 추가
     print(f"[generate_complex_dataset] 문서를 데이터셋에 추가 중...")
     for doc in split_documents_list:
-        dataset.add_document(doc)
+        dataset.documents.append({
+            "id": doc.metadata["id"],
+            "content": doc.page_content,
+            "metadata": doc.metadata
+        })
     
-    # 쿼리 생성
+    # 쿼리 생성 계획 (유형별 개수 분배 + 쿼리별 문서 선택)
     print(f"[generate_complex_dataset] 복잡한 쿼리 생성 시작 (총 {num_samples}개 목표)...")
     queries_per_type = num_samples // len(complexity_types)
     remaining_queries = num_samples % len(complexity_types)
     
-    generated_queries = 0
-    
-    # 복잡성 유형별 쿼리 생성
+    # 쿼리별 문서 쌍은 청크 내용 해시로 선택하므로 문서를 추가해도 기존 쌍(체크포인트 키)은 대부분 유지됨
+    chunk_digests = [hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest() for doc in split_documents_list]
+    tasks = []
     for complexity_type in complexity_types:
         type_query_count = queries_per_type + (1 if remaining_queries > 0 else 0)
         if remaining_queries > 0:
             remaining_queries -= 1
         
-        print(f"[generate_complex_dataset] '{complexity_type}' 유형 쿼리 {type_query_count}개 생성 중...")
-        
-        # 복잡성 유형별 쿼리 생성 로직
-        type_prompt_template = COMPLEXITY_TEMPLATES.get(complexity_type, COMPLEXITY_TEMPLATES["default"])
+        print(f"[generate_complex_dataset] '{complexity_type}' 유형 쿼리 {type_query_count}개 생성 예정")
         
-        # 각 쿼리 생성
         for i in range(type_query_count):
-            try:
-                # 무작위 문서 선택 (2개)
-                if len(split_documents_list) < 2:
-                    print(f"[generate_complex_dataset] 경고: 문서가 부족합니다. 최소 2개 필요 (현재: {len(split_documents_list)}개)")
-                    selected_docs = split_documents_list[:min(2, len(split_documents_list))]
-                else:
-                    selected_docs = random.sample(split_documents_list, min(2, len(split_documents_list)))
-                
-                # 문서 내용 결합
-                combined_content = "\n\n".join([doc.page_content for doc in selected_docs])
-                
-                print(f"[generate_complex_dataset] '{complexity_type}' 쿼리 {i+1}/{type_query_count} 생성 중...")
-                
-                # 프롬프트 생성
-                prompt = PromptTemplate.from_template(type_prompt_template)
-                
-                # 쿼리 생성
-                chain = prompt | llm | StrOutputParser()
-                result = chain.invoke({
-                    "document_content": combined_content,
-                    "complexity_type": complexity_type
-                })
+            # 문서 2개 선택 (쿼리 슬롯별 청크 내용 해시 순위, 재실행/문서 추가 시에도 같은 쌍 유지)
+            if len(split_documents_list) < 2:
+                print(f"[generate_complex_dataset] 경고: 문서가 부족합니다. 최소 2개 필요 (현재: {len(split_documents_list)}개)")
+                selected_docs = split_documents_list[:min(2, len(split_documents_list))]
+            else:
+                selected_docs = [
+                    split_documents_list[idx]
+                    for idx in _select_stable_chunks(f"{dataset_name}:{complexity_type}:{i}", chunk_digests)
+                ]
+            
+            key = GenerationCheckpoint.make_key(
+                "complex_query", model_name, complexity_type, *[doc.page_content for doc in selected_docs]
+            )
+            tasks.append((complexity_type, i, selected_docs, key))
+    
+    def generate_complex_query(task) -> Optional[Dict[str, Any]]:
+        complexity_type, i, selected_docs, key = task
+        
+        cached_query = checkpoint.get(key)
+        if cached_query is not None:
+            return cached_query
+        
+        try:
+            # 문서 내용 결합
+            combined_content = "\n\n".join([doc.page_content for doc in selected_docs])
+            
+            print(f"[generate_complex_dataset] '{complexity_type}' 쿼리 {i+1} 생성 중...")
+            
+            # 프롬프트 생성
+            type_prompt_template = COMPLEXITY_TEMPLATES.get(complexity_type, COMPLEXITY_TEMPLATES["default"])
+            prompt = PromptTemplate.from_template(type_prompt_template)
+            
+            # 쿼리 생성
+            chain = prompt | llm | StrOutputParser()
+            result = chain.invoke({
+                "document_content": combined_content,
+                "complexity_type": complexity_type
+            })
+            
+            # JSON 추출
+            json_start = result.find('{')
+            json_end = result.rfind('}') + 1
+            
+            if json_start != -1 and json_end != -1:
+                json_str = result[json_start:json_end]
+                query_data = json.loads(json_str)
                 
-                # JSON 추출
-                json_start = result.find('{')
-                json_end = result.rfind('}') + 1
+                # 메타데이터 추가
+                query_data["complexity_type"] = complexity_type
                 
-                if json_start != -1 and json_end != -1:
-                    json_str = result[json_start:json_end]
-                    query_data = json.loads(json_str)
-                    
-                    # 메타데이터 추가
-                    query_data["complexity_type"] = complexity_type
-                    query_data["relevant_doc_ids"] = [doc.metadata["id"] for doc in selected_docs]
-                    
-                    # 데이터셋에 쿼리 추가
-                    dataset.add_query(query_data)
-                    generated_queries += 1
-                    print(f"[generate_complex_dataset] 쿼리 추가 성공: '{query_data.get('question', '')[:50]}...'")
-                else:
-                    print(f"[generate_complex_dataset] JSON 형식을 찾을 수 없음. 응답: {result[:100]}...")
-            except Exception as e:
-                print(f"[generate_complex_dataset] 쿼리 생성 중 오류 발생: {str(e)}")
+                # 완료 즉시 체크포인트에 기록
+                checkpoint.put(key, query_data)
+                print(f"[generate_complex_dataset] 쿼리 생성 성공: '{query_data.get('question', '')[:50]}...'")
+                return query_data
+            else:
+                print(f"[generate_complex_dataset] JSON 형식을 찾을 수 없음. 응답: {result[:100]}...")
+        except Exception as e:
+            print(f"[generate_complex_dataset] 쿼리 생성 중 오류 발생: {str(e)}")
+        return None
+    
+    # 체크포인트에 없는 쿼리만 동시 실행 수 제한 안에서 생성
+    executor = EvaluationExecutor(max_concurrency)
+    results = executor.map(generate_complex_query, tasks)
+    
+    for (_, _, selected_docs, _), query_data in zip(tasks, results):
+        if query_data is not None:
+            dataset.queries.append({
+                **query_data,
+                "relevant_doc_ids": [doc.metadata["id"] for doc in selected_docs]
+            })
     
-    print(f"[generate_complex_dataset] 데이터셋 생성 완료: {generated_queries}개 쿼리, {len(dataset.documents)}개 문서")
+    print(f"[generate_complex_dataset] 데이터셋 생성 완료: {len(dataset.queries)}개 쿼리, {len(dataset.documents)}개 문서")
     
     # 데이터셋 저장
     print(f"[generate_complex_dataset] 데이터셋 저장 중: {output_path}")
-    dataset.save(output_path)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(dataset.model_dump_json(indent=2))
     
     return dataset
 
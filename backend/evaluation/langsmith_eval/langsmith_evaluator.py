@@ -25,6 +25,15 @@ from langchain_openai import OpenAIEmbeddings
 
 # 평가 시스템 설정 불러오기
 from evaluation.config import LANGSMITH_API_KEY, LANGSMITH_PROJECT_PREFIX, RESULTS_DIR
+from evaluation.executor import CachedEmbeddings, CachedJudge, EvaluationCache, EvaluationExecutor
+from evaluation.metrics.text_similarity import (
+    extract_phrases,
+    jaccard_similarity,
+    lcs_length,
+    pairwise_jaccard,
+    rouge_l_f1,
+    token_set
+)
 
 def extract_doc_number(doc_id):
     """문서 ID에서 숫자 부분을 추출"""
@@ -139,9 +148,8 @@ class CorrectnessEvaluator(RunEvaluator):
     def _calculate_semantic_similarity(self, text1: str, text2: str) -> float:
         """의미적 유사도 계산 (임베딩 기반)"""
         try:
-            # 텍스트 임베딩 생성
-            embedding1 = self.embedding_model.embed_query(text1)
-            embedding2 = self.embedding_model.embed_query(text2)
+            # 텍스트 임베딩 생성 (두 텍스트를 한 번의 호출로)
+            embedding1, embedding2 = self.embedding_model.embed_documents([text1, text2])
             
             # 코사인 유사도 계산
             similarity = self._cosine_similarity(embedding1, embedding2)
@@ -152,68 +160,26 @@ class CorrectnessEvaluator(RunEvaluator):
     
     def _cosine_similarity(self, vec1, vec2):
         """코사인 유사도 계산"""
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
-        return dot_product / (norm1 * norm2) if norm1 * norm2 > 0 else 0.0
+        vec1 = np.asarray(vec1, dtype=np.float64)
+        vec2 = np.asarray(vec2, dtype=np.float64)
+        norm = np.linalg.norm(vec1) * np.linalg.norm(vec2)
+        return float(np.dot(vec1, vec2) / norm) if norm > 0 else 0.0
     
     def _calculate_lexical_similarity(self, text1: str, text2: str) -> float:
         """어휘적 유사도 계산 (자카드 유사도)"""
-        # 공백 제거 및 소문자 변환
-        text1 = text1.strip().lower()
-        text2 = text2.strip().lower()
-        
-        # 각 텍스트를 단어 집합으로 변환
-        set1 = set(text1.split())
-        set2 = set(text2.split())
-        
-        # 자카드 유사도 계산: 교집합 크기 / 합집합 크기
-        if not set1 or not set2:
-            return 0.0
-            
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-        
-        return intersection / union if union > 0 else 0.0
+        return jaccard_similarity(text1, text2)
     
     def _calculate_rouge_score(self, text1: str, text2: str) -> float:
         """ROUGE-L 점수 계산 (최장 공통 부분 시퀀스 기반)"""
         try:
-            # 간단한 ROUGE-L 구현
-            words1 = text1.lower().split()
-            words2 = text2.lower().split()
-            
-            # LCS 길이 계산
-            lcs_length = self._lcs_length(words1, words2)
-            
-            # ROUGE-L 계산
-            if not words1 or not words2:
-                return 0.0
-                
-            precision = lcs_length / len(words1) if words1 else 0
-            recall = lcs_length / len(words2) if words2 else 0
-            
-            # F1 점수 계산
-            if precision + recall > 0:
-                return 2 * precision * recall / (precision + recall)
-            return 0.0
+            return rouge_l_f1(text1, text2)
         except Exception as e:
             print(f"ROUGE 점수 계산 중 오류: {e}")
             return 0.0
     
     def _lcs_length(self, seq1, seq2):
         """최장 공통 부분 시퀀스(LCS) 길이 계산"""
-        m, n = len(seq1), len(seq2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if seq1[i-1] == seq2[j-1]:
-                    dp[i][j] = dp[i-1][j-1] + 1
-                else:
-                    dp[i][j] = max(dp[i-1][j], dp[i][j-1])
-        
-        return dp[m][n]
+        return lcs_length(seq1, seq2)
 
 class RelevanceEvaluator(RunEvaluator):
     """관련성 평가기"""
@@ -320,14 +286,12 @@ class RelevanceEvaluator(RunEvaluator):
         """임베딩을 사용한 의미적 관련성 계산"""
         try:
             # 텍스트 임베딩 생성
-            query_embedding = self.embedding_model.embed_query(query)
-            prediction_embedding = self.embedding_model.embed_query(prediction)
+            query_embedding = np.asarray(self.embedding_model.embed_query(query), dtype=np.float64)
+            prediction_embedding = np.asarray(self.embedding_model.embed_query(prediction), dtype=np.float64)
             
             # 코사인 유사도 계산
-            dot_product = sum(a * b for a, b in zip(query_embedding, prediction_embedding))
-            norm1 = sum(a * a for a in query_embedding) ** 0.5
-            norm2 = sum(b * b for b in prediction_embedding) ** 0.5
-            similarity = dot_product / (norm1 * norm2) if norm1 * norm2 > 0 else 0.0
+            norm = np.linalg.norm(query_embedding) * np.linalg.norm(prediction_embedding)
+            similarity = float(np.dot(query_embedding, prediction_embedding) / norm) if norm > 0 else 0.0
             
             return similarity
         except Exception as e:
@@ -364,18 +328,7 @@ class RelevanceEvaluator(RunEvaluator):
     
     def _extract_phrases(self, text: str) -> List[str]:
         """텍스트에서 의미 있는 구문을 추출합니다."""
-        words = text.split()
-        phrases = []
-        
-        # 2단어 구문 추출
-        if len(words) >= 2:
-            phrases.extend([" ".join(words[i:i+2]) for i in range(len(words)-1)])
-        
-        # 3단어 구문 추출 (있는 경우)
-        if len(words) >= 3:
-            phrases.extend([" ".join(words[i:i+3]) for i in range(len(words)-2)])
-            
-        return phrases
+        return list(extract_phrases(text))
 
 class FaithfulnessEvaluator(RunEvaluator):
     """충실도 평가기"""
@@ -481,8 +434,8 @@ class FaithfulnessEvaluator(RunEvaluator):
         prediction_lower = prediction.lower()
         
         # 1. 단어 기반 충실도 (40%)
-        doc_words = set(w for w in doc_content.split() if len(w) > 3)  # 짧은 단어 제외
-        prediction_words = set(w for w in prediction_lower.split() if len(w) > 3)
+        doc_words = set(w for w in token_set(doc_content) if len(w) > 3)  # 짧은 단어 제외
+        prediction_words = set(w for w in token_set(prediction_lower) if len(w) > 3)
         
         if not doc_words or not prediction_words:
             word_score = 0.0
@@ -508,18 +461,7 @@ class FaithfulnessEvaluator(RunEvaluator):
     
     def _extract_phrases(self, text: str) -> List[str]:
         """텍스트에서 의미 있는 구문을 추출합니다."""
-        words = text.split()
-        phrases = []
-        
-        # 2단어 구문 추출
-        if len(words) >= 2:
-            phrases.extend([" ".join(words[i:i+2]) for i in range(len(words)-1)])
-        
-        # 3단어 구문 추출 (있는 경우)
-        if len(words) >= 3:
-            phrases.extend([" ".join(words[i:i+3]) for i in range(len(words)-2)])
-            
-        return phrases
+        return list(extract_phrases(text))
 
 class LangSmithEvaluator:
     """LangSmith를 사용한 RAG 시스템 평가 클래스"""
@@ -529,7 +471,9 @@ class LangSmithEvaluator:
         project_name: str,
         api_key: Optional[str] = None,
         llm: Optional[BaseLanguageModel] = None,
-        evaluators: Optional[List[str]] = None
+        evaluators: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True
     ):
         """
         LangSmith 평가기 초기화
@@ -539,6 +483,8 @@ class LangSmithEvaluator:
             api_key (Optional[str]): LangSmith API 키
             llm (Optional[BaseLanguageModel]): 평가에 사용할 LLM
             evaluators (Optional[List[str]]): 사용할 내장 평가기 리스트
+            max_concurrency (Optional[int]): 동시에 평가할 예제 수 (기본값: EVALUATION_MAX_CONCURRENCY)
+            use_cache (bool): 임베딩/LLM 평가 응답 영구 캐시 사용 여부
         """
         self.api_key = api_key or LANGSMITH_API_KEY
         os.environ["LANGCHAIN_API_KEY"] = self.api_key
@@ -556,6 +502,10 @@ class LangSmithEvaluator:
             "context_recall"
         ]
         
+        # 예제 병렬 실행기 및 임베딩/LLM 평가 응답 캐시
+        self.executor = EvaluationExecutor(max_concurrency)
+        self.cache = EvaluationCache() if use_cache else None
+        
         # 평가기 초기화
         self._init_evaluators(llm)
         
@@ -572,6 +522,14 @@ class LangSmithEvaluator:
             "faithfulness": FaithfulnessEvaluator(llm=llm)
         }
         
+        # 평가기의 임베딩 모델/LLM이 캐시를 거치도록 감싸기 (재실행 시 변경된 예제만 API 호출)
+        if self.cache is not None:
+            for evaluator in self.evaluator_instances.values():
+                if getattr(evaluator, "embedding_model", None) is not None:
+                    evaluator.embedding_model = CachedEmbeddings(evaluator.embedding_model, self.cache)
+                if getattr(evaluator, "llm", None) is not None:
+                    evaluator.llm = CachedJudge(evaluator.llm, self.cache)
+        
     def setup_dataset(
         self, 
         examples: List[RAGEvaluationExample],
@@ -704,11 +662,6 @@ class LangSmithEvaluator:
         examples = list(self.client.list_examples(dataset_id=dataset_id))
         print(f"[evaluate_retrieval] 평가할 예제 수: {len(examples)}")
         
-        # 결과를 저장할 리스트 초기화
-        all_results = []
-        precision_scores = []
-        recall_scores = []
-        
         # 결과 저장을 위한 디렉토리 설정
         timestamp = int(time.time())
         results_filename = f"retrieval_evaluation_{retriever_name}_{timestamp}.json"
@@ -737,7 +690,8 @@ class LangSmithEvaluator:
             except Exception as e:
                 print(f"[evaluate_retrieval] 원본 데이터셋 로드 중 오류: {e}")
         
-        for i, example in enumerate(examples):
+        def evaluate_example(indexed_example) -> Dict[str, Any]:
+            i, example = indexed_example
             query = example.inputs["query"]
             expected_sources = example.outputs.get("expected_sources", [])
             
@@ -826,48 +780,49 @@ class LangSmithEvaluator:
                     "ndcg_at_3": additional_metrics.get("ndcg_at_3", 0.0),
                     "ndcg_at_5": additional_metrics.get("ndcg_at_5", 0.0)
                 }
-                all_results.append(result)
-                
-                # 정밀도 및 재현율 점수 저장
-                precision_scores.append(precision)
-                recall_scores.append(recall)
-                
                 print(f"[evaluate_retrieval] 정밀도: {precision:.2f}, 재현율: {recall:.2f}")
-                
-                # 중간 결과 저장 (주기적으로)
-                if (i + 1) % 10 == 0 or (i + 1) == len(examples):
-                    # 중간 요약 생성
-                    current_avg_precision = sum(precision_scores) / len(precision_scores) if precision_scores else 0
-                    current_avg_recall = sum(recall_scores) / len(recall_scores) if recall_scores else 0
-                    
-                    interim_summary = {
-                        "retriever_name": retriever_name,
-                        "dataset_id": dataset_id,
-                        "examples_processed": i + 1,
-                        "total_examples": len(examples),
-                        "current_avg_precision": current_avg_precision,
-                        "current_avg_recall": current_avg_recall,
-                        "results": all_results
-                    }
-                    
-                    with open(results_file, "w", encoding="utf-8") as f:
-                        json.dump(interim_summary, f, ensure_ascii=False, indent=2, cls=CustomJSONEncoder)
-                    
-                    print(f"[evaluate_retrieval] 중간 결과 저장됨 ({i+1}/{len(examples)}): {results_file}")
+                return result
                 
             except Exception as e:
                 print(f"[evaluate_retrieval] 예제 평가 중 오류 발생: {str(e)}")
                 # 오류 정보 기록하고 다음 예제로 진행
-                result = {
+                return {
                     "query": query,
                     "expected_sources": expected_sources,
                     "error": str(e),
                     "precision": 0.0,
                     "recall": 0.0
                 }
-                all_results.append(result)
-                precision_scores.append(0.0)
-                recall_scores.append(0.0)
+        
+        # 예제를 병렬로 평가하고, 완료된 예제 수 기준으로 중간 결과를 주기적으로 저장
+        completed_results: Dict[int, Dict[str, Any]] = {}
+        
+        def save_interim(index: int, result: Dict[str, Any]) -> None:
+            completed_results[index] = result
+            processed = len(completed_results)
+            if processed % 10 == 0 or processed == len(examples):
+                interim_results = [completed_results[key] for key in sorted(completed_results)]
+                interim_precisions = [r["precision"] for r in interim_results]
+                interim_recalls = [r["recall"] for r in interim_results]
+                
+                interim_summary = {
+                    "retriever_name": retriever_name,
+                    "dataset_id": dataset_id,
+                    "examples_processed": processed,
+                    "total_examples": len(examples),
+                    "current_avg_precision": sum(interim_precisions) / len(interim_precisions),
+                    "current_avg_recall": sum(interim_recalls) / len(interim_recalls),
+                    "results": interim_results
+                }
+                
+                with open(results_file, "w", encoding="utf-8") as f:
+                    json.dump(interim_summary, f, ensure_ascii=False, indent=2, cls=CustomJSONEncoder)
+                
+                print(f"[evaluate_retrieval] 중간 결과 저장됨 ({processed}/{len(examples)}): {results_file}")
+        
+        all_results = self.executor.map(evaluate_example, list(enumerate(examples)), on_result=save_interim)
+        precision_scores = [result["precision"] for result in all_results]
+        recall_scores = [result["recall"] for result in all_results]
         
         # 최종 요약 계산
         avg_precision = sum(precision_scores) / len(precision_scores) if precision_scores else 0
@@ -964,7 +919,8 @@ class LangSmithEvaluator:
         relevance_evaluator = self.evaluator_instances.get("relevance") or RelevanceEvaluator()
         faithfulness_evaluator = self.evaluator_instances.get("faithfulness") or FaithfulnessEvaluator()
         
-        for i, example in enumerate(examples):
+        def evaluate_example(indexed_example):
+            i, example = indexed_example
             query = example.inputs["query"]
             expected_ground_truth = example.outputs.get("ground_truth", "")
             
@@ -1006,18 +962,18 @@ class LangSmithEvaluator:
                 relevance_result = relevance_evaluator.evaluate_run(run_data, example)
                 faithfulness_result = faithfulness_evaluator.evaluate_run(run_data, example)
                 
-                # 결과 저장
-                all_scores["correctness"].append(correctness_result.score)
-                all_scores["relevance"].append(relevance_result.score)
-                all_scores["faithfulness"].append(faithfulness_result.score)
-                
                 print(f"[evaluate_generation] 평가 완료: correctness={correctness_result.score:.2f}, relevance={relevance_result.score:.2f}, faithfulness={faithfulness_result.score:.2f}")
+                return correctness_result.score, relevance_result.score, faithfulness_result.score
                 
             except Exception as e:
                 print(f"[evaluate_generation] 평가 중 오류 발생: {e}")
-                all_scores["correctness"].append(0.0)
-                all_scores["relevance"].append(0.0)
-                all_scores["faithfulness"].append(0.0)
+                return 0.0, 0.0, 0.0
+        
+        # 예제를 병렬로 평가 (결과는 예제 순서대로 저장)
+        for correctness_score, relevance_score, faithfulness_score in self.executor.map(evaluate_example, list(enumerate(examples))):
+            all_scores["correctness"].append(correctness_score)
+            all_scores["relevance"].append(relevance_score)
+            all_scores["faithfulness"].append(faithfulness_score)
         
         # 평균 점수 계산
         summary = {
@@ -1259,15 +1215,8 @@ class LangSmithEvaluator:
         if not text1 or not text2:
             return 0.0
             
-        # 단어 집합 생성
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
         # 자카드 유사도 계산
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        return intersection / union if union > 0 else 0.0
+        return jaccard_similarity(text1, text2)
     
     def _calculate_retrieved_docs_similarity(self, docs1: List, docs2: List) -> float:
         """두 검색 결과 집합 간의 유사도를 계산합니다."""
@@ -1292,18 +1241,12 @@ class LangSmithEvaluator:
             union = len(sources1.union(sources2))
             return intersection / union
             
-        # 소스 정보가 없는 경우 콘텐츠 기반 유사도 계산
-        content_similarities = []
-        
-        for doc1 in docs1:
-            for doc2 in docs2:
-                content1 = doc1.page_content if hasattr(doc1, 'page_content') else str(doc1)
-                content2 = doc2.page_content if hasattr(doc2, 'page_content') else str(doc2)
-                similarity = self._calculate_text_similarity(content1, content2)
-                content_similarities.append(similarity)
+        # 소스 정보가 없는 경우 콘텐츠 기반 유사도 계산 (모든 문서 쌍을 한 번에)
+        contents1 = [doc.page_content if hasattr(doc, 'page_content') else str(doc) for doc in docs1]
+        contents2 = [doc.page_content if hasattr(doc, 'page_content') else str(doc) for doc in docs2]
         
         # 최대 유사도 반환
-        return max(content_similarities) if content_similarities else 0.0
+        return float(pairwise_jaccard(contents1, contents2).max())
         
     def _calculate_precision_recall(self, retrieved_docs, expected_sources, example=None):
         """
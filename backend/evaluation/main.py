@@ -55,6 +55,7 @@ from evaluation.langsmith_eval.langsmith_evaluator import (
     LangSmithEvaluator
 )
 from evaluation.models import RAGEvaluationExample
+from evaluation.executor import CachedJudge, EvaluationCache, EvaluationExecutor, prefetch_retrieval
 
 # 로깅 설정
 logging.basicConfig(
@@ -76,7 +77,8 @@ class RAGEvaluator:
         docs_dir: Optional[Union[str, Path]] = None,
         datasets_dir: Optional[Union[str, Path]] = None,
         results_dir: Optional[Union[str, Path]] = None,
-        use_langsmith: bool = True
+        use_langsmith: bool = True,
+        max_concurrency: Optional[int] = None
     ):
         """
         RAG 평가 시스템 초기화
@@ -86,6 +88,7 @@ class RAGEvaluator:
             datasets_dir (Optional[Union[str, Path]]): 데이터셋 디렉토리 경로
             results_dir (Optional[Union[str, Path]]): 결과 저장 디렉토리 경로
             use_langsmith (bool): LangSmith 사용 여부
+            max_concurrency (Optional[int]): 동시에 평가할 쿼리 수 (기본값: EVALUATION_MAX_CONCURRENCY)
         """
         self.docs_dir = Path(docs_dir or DOCS_DIR)
         self.datasets_dir = Path(datasets_dir or DATASETS_DIR)
@@ -98,6 +101,11 @@ class RAGEvaluator:
         # 기본 LLM 설정
         #self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
         self.llm = ChatGoogleGenerativeAI(model="models/gemini-2.0-flash", temperature=0)
+        
+        # 쿼리 병렬 실행기 및 LLM 평가 응답 캐시 (재실행 시 변경된 쿼리만 LLM 호출)
+        self.executor = EvaluationExecutor(max_concurrency)
+        self.cache = EvaluationCache()
+        self.judge_llm = CachedJudge(self.llm, self.cache)
 
         # LangSmith 설정
         self.use_langsmith = use_langsmith and LANGSMITH_API_KEY
@@ -105,7 +113,8 @@ class RAGEvaluator:
             self.langsmith_evaluator = LangSmithEvaluator(
                 project_name="rag_evaluation",
                 api_key=LANGSMITH_API_KEY,
-                llm=self.llm
+                llm=self.llm,
+                max_concurrency=max_concurrency
             )
         
         logger.info(f"RAG 평가 시스템 초기화 완료")
@@ -368,10 +377,13 @@ class RAGEvaluator:
         queries = [q["query"] for q in dataset.queries]
         relevant_docs = {q["query"]: q["relevant_doc_ids"] for q in dataset.queries}
         
+        # 쿼리별 검색을 병렬로 미리 실행 (메트릭 계산은 미리 받은 결과 사용)
+        prefetched_retriever = prefetch_retrieval(retriever_fn, queries, self.executor)
+        
         # 평가 실행
         if advanced:
             results = evaluate_retrieval_advanced(
-                retriever=retriever_fn,
+                retriever=prefetched_retriever,
                 queries=queries,
                 relevant_docs=relevant_docs,
                 k_values=[1, 3, 5, 10],
@@ -379,7 +391,7 @@ class RAGEvaluator:
             )
         else:
             results = evaluate_retrieval_simple(
-                retriever=retriever_fn,
+                retriever=prefetched_retriever,
                 queries=queries,
                 relevant_docs=relevant_docs,
                 k_values=[1, 3, 5, 10]
@@ -518,22 +530,21 @@ class RAGEvaluator:
         is_e2e = retriever_fn is not None
         eval_type = "e2e" if is_e2e else "generation"
         
-        all_results = []
+        # 문서 ID -> 내용 (쿼리별 참조 문서 조회용)
+        documents_by_id = {}
+        for doc in dataset.documents:
+            documents_by_id.setdefault(doc["id"], doc["content"])
         
-        # 각 쿼리에 대해 평가 수행
-        for query_data in dataset.queries[:10]:  # 처음 10개만 사용
+        # 쿼리별 평가 (검색 + 생성 + LLM 평가)
+        def evaluate_query(query_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             query = query_data["query"]
             ground_truth = query_data["ground_truth"]
             
             # 관련 문서 찾기
             relevant_doc_ids = query_data.get("relevant_doc_ids", [])
-            reference_texts = []
-            
-            for doc_id in relevant_doc_ids:
-                for doc in dataset.documents:
-                    if doc["id"] == doc_id:
-                        reference_texts.append(doc["content"])
-                        break
+            reference_texts = [
+                documents_by_id[doc_id] for doc_id in relevant_doc_ids if doc_id in documents_by_id
+            ]
             
             try:
                 if is_e2e:
@@ -547,12 +558,12 @@ class RAGEvaluator:
                     # 참조 문서로 생성 수행
                     response = generator_fn(query, reference_texts)
                 
-                # 평가
+                # 평가 (LLM 평가 응답은 캐시 사용)
                 result = evaluate_generation_comprehensive(
                     query=query,
                     response=response,
                     reference_texts=reference_texts,
-                    llm=self.llm
+                    llm=self.judge_llm
                 )
                 
                 # 평가 결과에 메타데이터 추가
@@ -563,10 +574,15 @@ class RAGEvaluator:
                 if is_e2e:
                     result["retrieved_texts"] = retrieved_texts
                 
-                all_results.append(result)
+                return result
                 
             except Exception as e:
                 logger.error(f"생성 평가 중 오류 발생: {query}, 오류: {e}")
+                return None
+        
+        # 각 쿼리에 대해 병렬로 평가 수행 (결과는 쿼리 순서대로)
+        results = self.executor.map(evaluate_query, dataset.queries[:10])  # 처음 10개만 사용
+        all_results = [result for result in results if result is not None]
         
         # 종합 결과 계산
         summary = {
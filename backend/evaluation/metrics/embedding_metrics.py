@@ -30,6 +30,35 @@ def get_embedding(text: str, model: Any) -> np.ndarray:
         # 기타 모델의 경우 직접 호출 시도
         return model(text)
 
+def get_embeddings(texts: List[str], model: Any, batch_size: int = 64) -> np.ndarray:
+    """
+    텍스트 목록의 임베딩 행렬을 배치 단위로 생성합니다.
+    
+    Args:
+        texts (List[str]): 임베딩할 텍스트 목록
+        model (Any): 임베딩 모델
+        batch_size (int): 한 번에 임베딩할 텍스트 수
+        
+    Returns:
+        np.ndarray: 임베딩 행렬 (텍스트 수 x 차원)
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    
+    embeddings = []
+    for i in range(0, len(texts), batch_size):
+        batch = texts[i:i + batch_size]
+        if hasattr(model, "embed_documents"):
+            # LangChain 호환 모델
+            embeddings.extend(model.embed_documents(batch))
+        elif hasattr(model, "encode"):
+            # Sentence Transformers 호환 모델
+            embeddings.extend(model.encode(batch, batch_size=batch_size))
+        else:
+            # 기타 모델은 텍스트별로 호출
+            embeddings.extend(get_embedding(text, model) for text in batch)
+    return np.asarray(embeddings, dtype=np.float32)
+
 def calculate_similarity(text_embedding: np.ndarray, query_embedding: np.ndarray) -> float:
     """
     두 임베딩 벡터 간의 코사인 유사도를 계산합니다.
@@ -43,6 +72,80 @@ def calculate_similarity(text_embedding: np.ndarray, query_embedding: np.ndarray
     """
     return float(cosine_similarity([text_embedding], [query_embedding])[0][0])
 
+def _normalize(embeddings: Any) -> np.ndarray:
+    """임베딩 행렬을 행 단위 L2 정규화 (영벡터는 그대로 유지)"""
+    matrix = np.atleast_2d(np.asarray(embeddings, dtype=np.float64))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def similarity_matrix(text_embeddings: Any, query_embeddings: Any) -> np.ndarray:
+    """
+    텍스트와 쿼리 임베딩 간의 코사인 유사도 행렬을 한 번에 계산합니다.
+    
+    Args:
+        text_embeddings: 텍스트 임베딩 행렬 또는 벡터 목록 (n x d)
+        query_embeddings: 쿼리 임베딩 행렬 또는 벡터 목록 (m x d)
+        
+    Returns:
+        np.ndarray: 유사도 행렬 (n x m)
+    """
+    if len(text_embeddings) == 0 or len(query_embeddings) == 0:
+        return np.zeros((len(text_embeddings), len(query_embeddings)), dtype=np.float32)
+    return _normalize(text_embeddings) @ _normalize(query_embeddings).T
+
+def threshold_metrics(
+    related_similarities: np.ndarray,
+    unrelated_similarities: np.ndarray,
+    thresholds: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    모든 임계값에 대한 정밀도, 재현율, F1 점수를 한 번에 계산합니다.
+    
+    정렬된 유사도 배열에서 searchsorted로 임계값 이상인 개수를 구하므로
+    유사도 수 n, 임계값 수 t에 대해 O((n + t) log n)입니다.
+    
+    Args:
+        related_similarities (np.ndarray): 관련 쿼리 유사도 (실제 양성)
+        unrelated_similarities (np.ndarray): 비관련 쿼리 유사도 (실제 음성)
+        thresholds (np.ndarray): 임계값 배열
+        
+    Returns:
+        Dict[str, np.ndarray]: 임계값별 precision, recall, f1 배열
+    """
+    related = np.sort(np.ravel(related_similarities))
+    unrelated = np.sort(np.ravel(unrelated_similarities))
+    
+    # 임계값 이상인 유사도 수 (관련: 참 양성, 비관련: 거짓 양성)
+    true_positives = len(related) - np.searchsorted(related, thresholds, side="left")
+    false_positives = len(unrelated) - np.searchsorted(unrelated, thresholds, side="left")
+    false_negatives = len(related) - true_positives
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        predicted = true_positives + false_positives
+        precision = np.where(predicted > 0, true_positives / np.maximum(predicted, 1), 0.0)
+        actual = true_positives + false_negatives
+        recall = np.where(actual > 0, true_positives / np.maximum(actual, 1), 0.0)
+        total = precision + recall
+        f1 = np.where(total > 0, 2 * precision * recall / np.where(total > 0, total, 1.0), 0.0)
+    
+    return {"precision": precision, "recall": recall, "f1": f1}
+
+def _optimal_threshold(
+    related_similarities: np.ndarray,
+    unrelated_similarities: np.ndarray,
+    start: float = 0.0,
+    end: float = 1.0,
+    step: float = 0.01
+) -> Tuple[float, float]:
+    """유사도 배열에서 F1 점수가 가장 높은 임계값을 찾습니다. (동점이면 가장 낮은 임계값)"""
+    thresholds = np.arange(start, end + step, step)
+    f1 = threshold_metrics(related_similarities, unrelated_similarities, thresholds)["f1"]
+    if len(f1) == 0 or f1.max() <= 0:
+        return 0.0, 0.0
+    best = int(np.argmax(f1))
+    return float(thresholds[best]), float(f1[best])
+
 def find_optimal_threshold(
     text_embeddings: List[np.ndarray], 
     related_query_embeddings: List[np.ndarray], 
@@ -65,55 +168,30 @@ def find_optimal_threshold(
     Returns:
         Tuple[float, float]: 최적 임계값과 해당 F1 점수
     """
-    best_threshold = 0.0
-    best_f1 = 0.0
-    
-    # 모든 관련 쿼리와 텍스트 간의 유사도 계산
-    related_similarities = []
-    for text_emb in text_embeddings:
-        for query_emb in related_query_embeddings:
-            similarity = calculate_similarity(text_emb, query_emb)
-            related_similarities.append(similarity)
-    
-    # 모든 비관련 쿼리와 텍스트 간의 유사도 계산
-    unrelated_similarities = []
-    for text_emb in text_embeddings:
-        for query_emb in unrelated_query_embeddings:
-            similarity = calculate_similarity(text_emb, query_emb)
-            unrelated_similarities.append(similarity)
-    
-    # 다양한 임계값에 대해 F1 점수 계산
-    thresholds = np.arange(start, end + step, step)
-    for threshold in thresholds:
-        # 관련 쿼리 중 임계값보다 높은 유사도를 가진 것(실제 양성 중 예측된 양성)
-        true_positives = sum(1 for s in related_similarities if s >= threshold)
-        
-        # 비관련 쿼리 중 임계값보다 낮은 유사도를 가진 것(실제 음성 중 예측된 음성)
-        true_negatives = sum(1 for s in unrelated_similarities if s < threshold)
-        
-        # 비관련 쿼리 중 임계값보다 높은 유사도를 가진 것(실제 음성 중 예측된 양성)
-        false_positives = len(unrelated_similarities) - true_negatives
-        
-        # 관련 쿼리 중 임계값보다 낮은 유사도를 가진 것(실제 양성 중 예측된 음성)
-        false_negatives = len(related_similarities) - true_positives
-        
-        # 정밀도와 재현율 계산
-        precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
-        recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
-        
-        # F1 점수 계산
-        f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-        
-        # 가장 좋은 F1 점수와 임계값 저장
-        if f1 > best_f1:
-            best_f1 = f1
-            best_threshold = threshold
-    
-    return best_threshold, best_f1
+    # 모든 텍스트 x 관련/비관련 쿼리 유사도를 행렬 연산으로 계산
+    related_similarities = similarity_matrix(text_embeddings, related_query_embeddings)
+    unrelated_similarities = similarity_matrix(text_embeddings, unrelated_query_embeddings)
+    return _optimal_threshold(related_similarities, unrelated_similarities, start, end, step)
+
+def _mean_reciprocal_rank(similarities: np.ndarray, related_query_indices: List[List[int]]) -> float:
+    """유사도 행렬(텍스트 x 쿼리)에서 관련 쿼리 순위의 역수 평균을 계산합니다."""
+    reciprocal_ranks = []
+    query_positions = np.arange(similarities.shape[1])
+    for i, related_indices in enumerate(related_query_indices[:len(similarities)]):
+        if len(related_indices) == 0:
+            continue
+        row = similarities[i]
+        related_scores = row[related_indices]
+        # 순위 = 1 + 더 높은 유사도 수 + 같은 유사도 중 앞선 쿼리 수 (안정 정렬과 동일)
+        higher = (row[None, :] > related_scores[:, None]).sum(axis=1)
+        tied_before = ((row[None, :] == related_scores[:, None])
+                       & (query_positions[None, :] < np.asarray(related_indices)[:, None])).sum(axis=1)
+        reciprocal_ranks.extend(1.0 / (1 + higher + tied_before))
+    return float(np.mean(reciprocal_ranks)) if reciprocal_ranks else 0.0
 
 def calculate_mrr(
     text_embeddings: List[np.ndarray],
-    related_query_embeddings: List[np.ndarray],
+    related_query_indices: List[List[int]],
     all_query_embeddings: List[np.ndarray]
 ) -> float:
     """
@@ -121,35 +199,14 @@ def calculate_mrr(
     
     Args:
         text_embeddings (List[np.ndarray]): 텍스트 임베딩 벡터 목록
-        related_query_embeddings (List[np.ndarray]): 관련 쿼리 임베딩 벡터 목록
+        related_query_indices (List[List[int]]): 텍스트별 관련 쿼리의 all_query_embeddings 내 인덱스 목록
         all_query_embeddings (List[np.ndarray]): 모든 쿼리 임베딩 벡터 목록
         
     Returns:
         float: MRR 점수
     """
-    reciprocal_ranks = []
-    
-    for i, text_emb in enumerate(text_embeddings):
-        # 해당 텍스트와 관련된 쿼리 임베딩
-        related_queries_for_text = related_query_embeddings[i] if i < len(related_query_embeddings) else []
-        
-        # 모든 쿼리와의 유사도 계산 및 순위 매기기
-        similarities = [(j, calculate_similarity(text_emb, query_emb)) 
-                        for j, query_emb in enumerate(all_query_embeddings)]
-        
-        # 유사도 기준 내림차순 정렬
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        # 관련 쿼리의 순위 찾기
-        for related_query_idx in related_queries_for_text:
-            for rank, (query_idx, _) in enumerate(similarities, 1):
-                if query_idx == related_query_idx:
-                    reciprocal_ranks.append(1.0 / rank)
-                    break
-    
-    # MRR 계산
-    mrr = sum(reciprocal_ranks) / len(reciprocal_ranks) if reciprocal_ranks else 0.0
-    return mrr
+    similarities = similarity_matrix(text_embeddings, all_query_embeddings)
+    return _mean_reciprocal_rank(similarities, related_query_indices)
 
 def evaluate_embedding_model(
     texts: List[str], 
@@ -175,48 +232,32 @@ def evaluate_embedding_model(
     """
     print(f"모델 {model_name} 평가 중...")
     
-    # 임베딩 생성
-    text_embeddings = [get_embedding(text, model) for text in texts]
-    related_query_embeddings = [get_embedding(query, model) for query in related_queries]
-    unrelated_query_embeddings = [get_embedding(query, model) for query in unrelated_queries]
-    all_query_embeddings = related_query_embeddings + unrelated_query_embeddings
+    # 임베딩 생성 (텍스트/쿼리를 한 번의 배치 호출로)
+    embeddings = get_embeddings(list(texts) + list(related_queries) + list(unrelated_queries), model)
+    text_embeddings = embeddings[:len(texts)]
+    query_embeddings = embeddings[len(texts):]
     
-    # 관련 쿼리와 비관련 쿼리 간의 유사도 차이 계산
-    related_similarities = []
-    for i, text_emb in enumerate(text_embeddings):
-        for query_emb in related_query_embeddings:
-            related_similarities.append(calculate_similarity(text_emb, query_emb))
+    # 텍스트 x 전체 쿼리(관련 + 비관련) 유사도 행렬을 한 번만 계산
+    similarities = similarity_matrix(text_embeddings, query_embeddings)
+    related_similarities = similarities[:, :len(related_queries)]
+    unrelated_similarities = similarities[:, len(related_queries):]
     
-    unrelated_similarities = []
-    for i, text_emb in enumerate(text_embeddings):
-        for query_emb in unrelated_query_embeddings:
-            unrelated_similarities.append(calculate_similarity(text_emb, query_emb))
-    
-    avg_related_similarity = sum(related_similarities) / len(related_similarities)
-    avg_unrelated_similarity = sum(unrelated_similarities) / len(unrelated_similarities)
+    # 관련 쿼리와 비관련 쿼리 간의 유사도 차이 계산
+    avg_related_similarity = float(related_similarities.mean())
+    avg_unrelated_similarity = float(unrelated_similarities.mean())
     avg_difference = avg_related_similarity - avg_unrelated_similarity
     
     # 최적 임계값 찾기
-    optimal_threshold, f1_score = find_optimal_threshold(
-        text_embeddings, related_query_embeddings, unrelated_query_embeddings
-    )
+    optimal_threshold, f1_score = _optimal_threshold(related_similarities, unrelated_similarities)
     
     # 성공률 계산 (최적 임계값으로 관련/비관련 구분 정확도)
-    success_count = 0
-    total_tests = len(related_similarities) + len(unrelated_similarities)
-    
-    for similarity in related_similarities:
-        if similarity >= optimal_threshold:
-            success_count += 1
-            
-    for similarity in unrelated_similarities:
-        if similarity < optimal_threshold:
-            success_count += 1
-            
+    success_count = int((related_similarities >= optimal_threshold).sum()) + int((unrelated_similarities < optimal_threshold).sum())
+    total_tests = related_similarities.size + unrelated_similarities.size
     success_rate = success_count / total_tests
     
-    # MRR 계산
-    mrr = calculate_mrr(text_embeddings, [related_query_embeddings], all_query_embeddings)
+    # MRR 계산 (모든 텍스트에 대해 관련 쿼리의 전체 쿼리 내 순위)
+    related_indices = list(range(len(related_queries)))
+    mrr = _mean_reciprocal_rank(similarities, [related_indices] * len(texts))
     
     # 다국어 평가 (간단히 구현)
     multilingual_similarity = avg_related_similarity  # 실제로는 다국어 쿼리로 테스트해야 함
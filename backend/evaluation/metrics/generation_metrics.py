@@ -12,6 +12,8 @@ from langchain_core.output_parsers import StrOutputParser
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 
+from evaluation.metrics.text_similarity import pairwise_jaccard, rouge_l_f1
+
 def evaluate_factual_consistency(
     response: str, 
     reference_texts: List[str], 
@@ -479,10 +481,17 @@ def evaluate_generation_comprehensive(
     
     overall_score = sum(weighted_scores.values())
     
+    # 참조 문서와의 어휘 중첩도 (LLM 호출 없는 보조 지표, 종합 점수에는 미반영)
+    lexical_scores = {
+        "rouge_l": max((rouge_l_f1(response, text) for text in reference_texts), default=0.0),
+        "jaccard": float(pairwise_jaccard([response], reference_texts).max()) if reference_texts else 0.0
+    }
+    
     # 종합 결과 생성
     results = {
         "overall_score": overall_score,
         "weighted_scores": weighted_scores,
+        "lexical_scores": lexical_scores,
         "evaluation_time_seconds": end_time - start_time,
         "detailed_results": {
             "factual_consistency": factual_result,
@@ -160,22 +160,27 @@ def measure_retrieval_time(retriever: Any, queries: List[str], n_samples: int =
         n_samples (int): 측정 샘플 수
         
     Returns:
-        Dict[str, float]: 검색 시간 측정 결과 (평균, 최소, 최대)
+        Dict[str, float]: 검색 시간 측정 결과 (평균, 최소, 최대, p50, p95)
     """
     times = []
     
     for query in queries[:n_samples]:
-        start_time = time.time()
+        start_time = time.perf_counter()
         retriever.get_relevant_documents(query)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         query_time = (end_time - start_time) * 1000  # milliseconds
         times.append(query_time)
     
+    if not times:
+        return {"avg_time_ms": 0.0, "min_time_ms": 0.0, "max_time_ms": 0.0, "p50_time_ms": 0.0, "p95_time_ms": 0.0}
+    
     return {
         "avg_time_ms": sum(times) / len(times),
         "min_time_ms": min(times),
-        "max_time_ms": max(times)
+        "max_time_ms": max(times),
+        "p50_time_ms": float(np.percentile(times, 50)),
+        "p95_time_ms": float(np.percentile(times, 95))
     }
 
 def evaluate_retrieval_simple(
@@ -0,0 +1,155 @@
+"""
+텍스트 유사도 계산 모듈 (어휘 기반)
+
+평가기들이 공통으로 사용하는 어휘 기반 유사도 커널을 제공합니다.
+- 토큰화 결과(소문자 + 공백 분리)와 단어 집합, 구문(2~3단어) 목록을 텍스트별로 캐싱
+  (질문/답변 같은 짧은 텍스트만 캐싱하고, 검색 문서를 이어 붙인 긴 텍스트는 캐시에 남기지 않음)
+- ROUGE-L: 비트 병렬 LCS (메모리 O(n/w), 시간 O(m*n/w)) - 긴 답변에서도 DP 테이블을 만들지 않음
+- 자카드 유사도: 단건 계산과 희소 행렬 기반 일괄(pairwise) 계산
+
+사용 예:
+```
+score = rouge_l_f1(prediction, reference)
+matrix = pairwise_jaccard(responses, references)  # (len(responses), len(references))
+```
+"""
+from functools import lru_cache, wraps
+from typing import Callable, Dict, FrozenSet, Hashable, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+from scipy import sparse
+
+# 텍스트별 토큰화 캐시 크기
+_TOKEN_CACHE_SIZE = 8192
+# 캐싱할 최대 텍스트 길이 (문자 수, 이보다 긴 텍스트는 매번 계산)
+_MAX_CACHED_TEXT_LENGTH = 4096
+
+_T = TypeVar("_T")
+
+
+def _cache_short_texts(func: Callable[[str], _T]) -> Callable[[str], _T]:
+    """짧은 텍스트의 결과만 LRU 캐시에 저장하는 데코레이터"""
+    cached = lru_cache(maxsize=_TOKEN_CACHE_SIZE)(func)
+
+    @wraps(func)
+    def wrapper(text: str) -> _T:
+        if len(text) > _MAX_CACHED_TEXT_LENGTH:
+            return func(text)
+        return cached(text)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_cache_short_texts
+def tokenize(text: str) -> Tuple[str, ...]:
+    """소문자 변환 후 공백 기준 토큰화 (짧은 텍스트별 캐싱)"""
+    return tuple(text.lower().split())
+
+
+@_cache_short_texts
+def token_set(text: str) -> FrozenSet[str]:
+    """텍스트의 단어 집합 (짧은 텍스트별 캐싱)"""
+    return frozenset(tokenize(text))
+
+
+@_cache_short_texts
+def extract_phrases(text: str) -> Tuple[str, ...]:
+    """텍스트에서 2단어, 3단어 구문을 추출합니다. (짧은 텍스트별 캐싱)"""
+    words = tokenize(text)
+    phrases = [" ".join(words[i:i+2]) for i in range(len(words) - 1)]
+    phrases.extend(" ".join(words[i:i+3]) for i in range(len(words) - 2))
+    return tuple(phrases)
+
+
+def lcs_length(seq1: Sequence[Hashable], seq2: Sequence[Hashable]) -> int:
+    """
+    최장 공통 부분 시퀀스(LCS) 길이 계산 (비트 병렬 알고리즘)
+
+    긴 시퀀스의 위치를 정수 비트로 표현하고 짧은 시퀀스를 한 번 순회하며 갱신합니다.
+    DP 테이블 없이 O(max(m, n)) 비트만 사용합니다.
+    """
+    if len(seq1) < len(seq2):
+        seq1, seq2 = seq2, seq1
+    if not seq2:
+        return 0
+
+    # 원소별로 seq1에서 나타나는 위치의 비트 마스크
+    match_masks: Dict[Hashable, int] = {}
+    for position, item in enumerate(seq1):
+        match_masks[item] = match_masks.get(item, 0) | (1 << position)
+
+    full_mask = (1 << len(seq1)) - 1
+    state = full_mask
+    for item in seq2:
+        matches = state & match_masks.get(item, 0)
+        state = ((state + matches) | (state - matches)) & full_mask
+
+    # 0인 비트 수가 LCS 길이
+    return len(seq1) - bin(state).count("1")
+
+
+def rouge_l_f1(text1: str, text2: str) -> float:
+    """ROUGE-L F1 점수 (단어 단위 LCS 기반)"""
+    words1 = tokenize(text1)
+    words2 = tokenize(text2)
+    if not words1 or not words2:
+        return 0.0
+
+    lcs = lcs_length(words1, words2)
+    precision = lcs / len(words1)
+    recall = lcs / len(words2)
+    if precision + recall > 0:
+        return 2 * precision * recall / (precision + recall)
+    return 0.0
+
+
+def jaccard_similarity(text1: str, text2: str) -> float:
+    """단어 집합 자카드 유사도"""
+    set1 = token_set(text1)
+    set2 = token_set(text2)
+    if not set1 or not set2:
+        return 0.0
+    intersection = len(set1 & set2)
+    return intersection / (len(set1) + len(set2) - intersection)
+
+
+def _indicator_matrix(texts: Sequence[str], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """텍스트별 단어 포함 여부 희소 행렬 (행: 텍스트, 열: 단어)"""
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, text in enumerate(texts):
+        for word in token_set(text):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(word, len(vocabulary)))
+    data = np.ones(len(rows), dtype=np.float32)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(texts), len(vocabulary) or 1))
+
+
+def pairwise_jaccard(texts1: Sequence[str], texts2: Sequence[str]) -> np.ndarray:
+    """
+    두 텍스트 목록 사이의 모든 쌍에 대한 자카드 유사도를 한 번에 계산합니다.
+
+    Returns:
+        np.ndarray: (len(texts1), len(texts2)) 유사도 행렬 (빈 텍스트가 포함된 쌍은 0)
+    """
+    if not texts1 or not texts2:
+        return np.zeros((len(texts1), len(texts2)))
+
+    vocabulary: Dict[str, int] = {}
+    matrix1 = _indicator_matrix(texts1, vocabulary)
+    matrix2 = _indicator_matrix(texts2, vocabulary)
+    width = len(vocabulary) or 1
+    matrix1.resize((len(texts1), width))
+    matrix2.resize((len(texts2), width))
+
+    intersection = (matrix1 @ matrix2.T).toarray()
+    sizes1 = np.asarray(matrix1.sum(axis=1)).reshape(-1, 1)
+    sizes2 = np.asarray(matrix2.sum(axis=1)).reshape(1, -1)
+    union = sizes1 + sizes2 - intersection
+
+    similarity = np.zeros_like(intersection, dtype=np.float64)
+    valid = (sizes1 > 0) & (sizes2 > 0)
+    np.divide(intersection, union, out=similarity, where=valid & (union > 0))
+    return similarity
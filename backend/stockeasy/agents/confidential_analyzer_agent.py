@@ -32,6 +32,7 @@ from langchain_core.messages import AIMessage
 from common.services.agent_llm import get_llm_for_agent, get_agent_llm
 from common.models.token_usage import ProjectType
 from stockeasy.agents.base import BaseAgent
+from stockeasy.services.query_embedding import embed_search_query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 def format_report_contents(reports: List[ConfidentialData]) -> str:
@@ -135,6 +136,8 @@ class ConfidentialAnalyzerAgent(BaseAgent):
 
             # 벡터DB 검색 쿼리 생성 - question_classification 활용
             search_query = self._make_search_query(query, stock_code, stock_name, classification, state)
+            # 질문 분석 직후 배치로 계산된 쿼리 임베딩 (없으면 검색 시 임베딩)
+            query_embedding = await embed_search_query(state, search_query)
             
             # 검색 매개변수 설정 - 세부 의도와 복잡성에 따라 조정
             k = self._get_report_count(classification)
@@ -147,7 +150,8 @@ class ConfidentialAnalyzerAgent(BaseAgent):
                 k, 
                 threshold, 
                 metadata_filter,
-                user_id=user_id
+                user_id=user_id,
+                query_embedding=query_embedding
             )
             
             # 검색 결과가 없는 경우
@@ -351,6 +355,18 @@ class ConfidentialAnalyzerAgent(BaseAgent):
             "context": {"query": state.get("query", "")}
         })
     
+    def get_search_queries(self, state: Dict[str, Any]) -> List[str]:
+        """질문 분석 결과로 만든 벡터 검색 쿼리 목록 (쿼리 임베딩 선계산용)"""
+        query = state.get("query", "")
+        if not query:
+            return []
+        question_analysis = state.get("question_analysis", {})
+        entities = question_analysis.get("entities", {})
+        classification = question_analysis.get("classification", {})
+        stock_code = entities.get("stock_code", state.get("stock_code"))
+        stock_name = entities.get("stock_name", state.get("stock_name"))
+        return [self._make_search_query(query, stock_code, stock_name, classification, state)]
+
     def _make_search_query(self, query: str, stock_code: Optional[str], 
                           stock_name: Optional[str], classification: Dict[str, Any], 
                           state: Dict[str, Any]) -> str:
@@ -566,7 +582,8 @@ class ConfidentialAnalyzerAgent(BaseAgent):
     @async_retry(retries=3, delay=1.0, exceptions=(Exception,))
     async def _search_reports(self, query: str, k: int = 5, threshold: float = 0.3,
                              metadata_filter: Optional[Dict[str, Any]] = None,
-                             user_id: Optional[Union[str, UUID]] = None) -> List[ConfidentialData]:
+                             user_id: Optional[Union[str, UUID]] = None,
+                             query_embedding: Optional[List[float]] = None) -> List[ConfidentialData]:
         """
         파인콘 DB에서 기업리포트 검색
         
@@ -575,13 +592,14 @@ class ConfidentialAnalyzerAgent(BaseAgent):
             k: 검색할 최대 결과 수
             threshold: 유사도 임계값
             metadata_filter: 메타데이터 필터
+            query_embedding: 미리 계산된 쿼리 임베딩 (None이면 검색 시 임베딩)
             
         Returns:
             검색된 리포트 목록
         """
         try:
             # 벡터 스토어 연결
-            vs_manager = VectorStoreManager(
+            vs_manager = await VectorStoreManager.create_async(
                 embedding_model_type=EmbeddingModelType.OPENAI_3_LARGE,
                 project_name="stockeasy",
                 namespace=settings.PINECONE_NAMESPACE_STOCKEASY_CONFIDENTIAL_NOTE   
@@ -605,7 +623,8 @@ class ConfidentialAnalyzerAgent(BaseAgent):
             retrieval_result: RetrievalResult = await semantic_retriever.retrieve(
                 query=query, 
                 top_k=k * 2,  # 중복 제거를 고려하여 2배로 검색
-                filters=metadata_filter
+                filters=metadata_filter,
+                query_embedding=query_embedding
             )
             
             # 검색 결과 처리
@@ -32,6 +32,7 @@ from common.core.config import settings
 from langchain_core.messages import AIMessage, HumanMessage
 from common.models.token_usage import ProjectType
 from stockeasy.agents.base import BaseAgent
+from stockeasy.services.query_embedding import embed_search_query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 class IndustryAnalyzerAgent(BaseAgent):
@@ -136,8 +137,10 @@ class IndustryAnalyzerAgent(BaseAgent):
                     keywords_list += sector_list
                 
 
-                searched_industry_data = await self._search_reports(query, k=k, threshold=threshold, metadata_filter={"subgroup_list": {"$in":sector_list}} if sector_list else {}, user_id=user_id)
-                searched_industry_data2 = await self._search_reports(query, k=k, threshold=threshold, metadata_filter={"keywords": {"$in":keywords_list}}, user_id=user_id)
+                # 두 검색이 같은 쿼리 임베딩을 사용 (질문 분석 직후 배치로 계산된 임베딩, 없으면 검색 시 임베딩)
+                query_embedding = await embed_search_query(state, query)
+                searched_industry_data = await self._search_reports(query, k=k, threshold=threshold, metadata_filter={"subgroup_list": {"$in":sector_list}} if sector_list else {}, user_id=user_id, query_embedding=query_embedding)
+                searched_industry_data2 = await self._search_reports(query, k=k, threshold=threshold, metadata_filter={"keywords": {"$in":keywords_list}}, user_id=user_id, query_embedding=query_embedding)
                 
                 # 두 검색 결과 병합 및 중복 제거
                 merged_industry_data = self._merge_and_remove_duplicates(searched_industry_data, searched_industry_data2)
@@ -426,6 +429,14 @@ class IndustryAnalyzerAgent(BaseAgent):
                 report["analysis"] = {"error": f"분석 중 오류 발생: {str(e)}"}
             return reports
 
+    def get_search_queries(self, state: Dict[str, Any]) -> List[str]:
+        """질문 분석 결과로 만든 벡터 검색 쿼리 목록 (쿼리 임베딩 선계산용)"""
+        query = state.get("query", "")
+        entities = state.get("question_analysis", {}).get("entities", {})
+        if not query or not (entities.get("stock_code", state.get("stock_code")) or entities.get("stock_name", state.get("stock_name"))):
+            return []
+        return [query]
+
     def _get_report_count(self, classification: Dict[str, Any]) -> int:
         """
         검색할 리포트 수를 결정 - 복잡도 기반
@@ -473,7 +484,8 @@ class IndustryAnalyzerAgent(BaseAgent):
     @async_retry(retries=3, delay=1.0, exceptions=(Exception,))
     async def _search_reports(self, query: str, k: int = 5, threshold: float = 0.22,
                              metadata_filter: Optional[Dict[str, Any]] = None,
-                             user_id: Optional[UUID] = None) -> List[IndustryReportData]:
+                             user_id: Optional[UUID] = None,
+                             query_embedding: Optional[List[float]] = None) -> List[IndustryReportData]:
         """
         파인콘 DB에서 기업리포트 검색
         
@@ -482,13 +494,14 @@ class IndustryAnalyzerAgent(BaseAgent):
             k: 검색할 최대 결과 수
             threshold: 유사도 임계값
             metadata_filter: 메타데이터 필터
+            query_embedding: 미리 계산된 쿼리 임베딩 (None이면 검색 시 임베딩)
             
         Returns:
             검색된 리포트 목록
         """
         try:
             # 벡터 스토어 연결
-            vs_manager = VectorStoreManager(
+            vs_manager = await VectorStoreManager.create_async(
                 embedding_model_type=EmbeddingModelType.OPENAI_3_LARGE,
                 project_name="stockeasy",
                 namespace=settings.PINECONE_NAMESPACE_STOCKEASY_INDUSTRY
@@ -511,7 +524,8 @@ class IndustryAnalyzerAgent(BaseAgent):
             retrieval_result: RetrievalResult = await semantic_retriever.retrieve(
                 query=query, 
                 top_k=k * 2,  # 중복 제거를 고려하여 2배로 검색
-                filters=metadata_filter
+                filters=metadata_filter,
+                query_embedding=query_embedding
             )
             
             # 검색 결과 처리
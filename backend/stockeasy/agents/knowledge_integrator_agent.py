@@ -20,6 +20,7 @@ from langchain_core.output_parsers import JsonOutputParser
 #from pydantic.v1 import BaseModel, Field
 from pydantic import BaseModel, Field
 from common.services.agent_llm import get_llm_for_agent, get_agent_llm
+from common.services.context_packer import ContextPacker
 from stockeasy.prompts.knowledge_integrator_prompts import format_knowledge_integrator_prompt
 from stockeasy.models.agent_io import IntegratedKnowledge, RetrievedTelegramMessage
 
@@ -90,6 +91,8 @@ class KnowledgeIntegratorAgent(BaseAgent):
             
             # 새로운 구조에서 각 에이전트 결과 추출 및 검증
             agent_results = state.get("agent_results", {})
+            # 병렬 검색 마감 시간으로 제외된 에이전트
+            skipped_agents = agent_results.get("parallel_search", {}).get("data", {}).get("skipped_agents", [])
             
             # 중요: 현재 세션이 초기화되었는지 확인 - 세션 ID와 함께 로깅
             session_id = state.get("session_id", "unknown_session")
@@ -128,49 +131,24 @@ class KnowledgeIntegratorAgent(BaseAgent):
             # 검증된 agent_results를 상태에 다시 저장 (중요: 이후 다른 에이전트들이 사용할 수 있게)
             state["agent_results"] = agent_results
             
-            # 텔레그램 검색 결과 추출
-            telegram_results = "정보 없음"
-            if "telegram_retriever" in agent_results:
-                telegram_agent = agent_results["telegram_retriever"]
-                if telegram_agent.get("status") == "success" and telegram_agent.get("data"):
-                    telegram_results = self._format_telegram_results(telegram_agent["data"])
-            
-            # 기업 리포트 결과 추출
-            report_results = "정보 없음"
-            if "report_analyzer" in agent_results:
-                report_agent = agent_results["report_analyzer"]
-                if report_agent.get("status") == "success" and report_agent.get("data"):
-                    report_results = self._format_report_results(report_agent)#report_agent["data"])
-            
-            # 재무 분석 결과 추출
-            financial_results = "정보 없음"
-            if "financial_analyzer" in agent_results:
-                financial_agent = agent_results["financial_analyzer"]
-                if financial_agent.get("status") == "success" and financial_agent.get("data"):
-                    financial_results = self._format_financial_results(financial_agent["data"])
-            
-            # 산업 분석 결과 추출
-            industry_results = "정보 없음"
-            if "industry_analyzer" in agent_results:
-                industry_agent = agent_results["industry_analyzer"]
-                if industry_agent.get("status") == "success" and industry_agent.get("data"):
-                    #logger.info(f"산업 분석 결과: {industry_agent['data']}")
-                    analysis = industry_agent["data"].get("analysis", {})
-                    if analysis:
-                        if isinstance(analysis, dict):
-                            content = analysis.get("llm_response", "")
-                            industry_results = content if content else "산업 분석 결과 없음"
-                        else:
-                            industry_results = self._format_industry_results(analysis)
-                    else:
-                        industry_results = self._format_industry_results(industry_agent["data"])
-
-            confidential_results = "정보 없음"
-            if "confidential_analyzer" in agent_results:
-                confidential_agent = agent_results["confidential_analyzer"]
-                if confidential_agent.get("status") == "success" and confidential_agent.get("data"):
-                    confidential_results = self._format_confidential_results(confidential_agent)
-
+            # 에이전트별 결과 텍스트 (병렬 검색 중 결과 도착 즉시 압축한 압축본이 있으면 원문 대신 사용)
+            integration_partials = state.get("integration_partials", {})
+            condensed_agents = [name for name in agent_results if name in integration_partials]
+            section_results = {}
+            for agent_name in ["telegram_retriever", "report_analyzer", "financial_analyzer",
+                               "industry_analyzer", "confidential_analyzer"]:
+                if agent_name in skipped_agents:
+                    section_results[agent_name] = "정보 없음 (검색 지연으로 제외됨)"
+                elif agent_name in agent_results:
+                    section_results[agent_name] = integration_partials.get(agent_name) or \
+                        self.format_agent_result(agent_name, agent_results[agent_name]) or "정보 없음"
+                else:
+                    section_results[agent_name] = "정보 없음"
+            telegram_results = section_results["telegram_retriever"]
+            report_results = section_results["report_analyzer"]
+            financial_results = section_results["financial_analyzer"]
+            industry_results = section_results["industry_analyzer"]
+            confidential_results = section_results["confidential_analyzer"]
             
             # 검증 결과 로깅
             logger.info(f"쿼리 '{query}'에 대한 검증된 에이전트 결과: {list(agent_results.keys())}")
@@ -185,6 +163,21 @@ class KnowledgeIntegratorAgent(BaseAgent):
             financial_importance = data_importance.get("financial_analyzer", 5)
             industry_importance = data_importance.get("industry_analyzer", 5)
             confidential_importance = data_importance.get("confidential_analyzer", 5)
+            
+            # 에이전트별 결과를 중요도에 비례한 토큰 예산으로 패킹 (에이전트 간 중복 문단 제거)
+            packer = ContextPacker.for_agent("knowledge_integrator_agent")
+            packed_sections = packer.pack_sections({
+                "telegram": (telegram_results, telegram_importance),
+                "report": (report_results, report_importance),
+                "financial": (financial_results, financial_importance),
+                "industry": (industry_results, industry_importance),
+                "confidential": (confidential_results, confidential_importance),
+            })
+            telegram_results = packed_sections.sections["telegram"]
+            report_results = packed_sections.sections["report"]
+            financial_results = packed_sections.sections["financial"]
+            industry_results = packed_sections.sections["industry"]
+            confidential_results = packed_sections.sections["confidential"]
                 
             logger.info(f"KnowledgeIntegratorAgent integrating results for query: {query}")
             
@@ -291,7 +284,10 @@ class KnowledgeIntegratorAgent(BaseAgent):
                 "duration": duration,
                 "status": "completed",
                 "error": None,
-                "model_name": self.model_name
+                "model_name": self.model_name,
+                "context_packing": packed_sections.to_metrics(),
+                "condensed_agents": condensed_agents,
+                "skipped_agents": skipped_agents
             }
             
             # 처리 상태 업데이트
@@ -338,6 +334,42 @@ class KnowledgeIntegratorAgent(BaseAgent):
             state["integrated_response"] = "죄송합니다. 정보를 통합하는 중 오류가 발생했습니다."
             return state
             
+    def format_agent_result(self, agent_name: str, agent_result: Dict[str, Any]) -> Optional[str]:
+        """
+        검색 에이전트 결과를 지식 통합 프롬프트용 텍스트로 정리합니다. (LLM 호출 없는 문자열 정리)
+        
+        병렬 검색 중 각 에이전트 결과가 도착하면 압축 입력을 만들기 위해 호출되며(ParallelSearchAgent),
+        압축본이 없는 에이전트는 process에서 직접 호출합니다.
+        
+        Args:
+            agent_name: 에이전트 이름
+            agent_result: 에이전트 실행 결과 (agent_results 항목)
+            
+        Returns:
+            정리된 텍스트 (성공한 결과가 아니면 None)
+        """
+        if not agent_result or agent_result.get("status") != "success" or not agent_result.get("data"):
+            return None
+        
+        if agent_name == "telegram_retriever":
+            return self._format_telegram_results(agent_result["data"])
+        if agent_name == "report_analyzer":
+            return self._format_report_results(agent_result)
+        if agent_name == "financial_analyzer":
+            return self._format_financial_results(agent_result["data"])
+        if agent_name == "industry_analyzer":
+            #logger.info(f"산업 분석 결과: {agent_result['data']}")
+            analysis = agent_result["data"].get("analysis", {})
+            if analysis:
+                if isinstance(analysis, dict):
+                    content = analysis.get("llm_response", "")
+                    return content if content else "산업 분석 결과 없음"
+                return self._format_industry_results(analysis)
+            return self._format_industry_results(agent_result["data"])
+        if agent_name == "confidential_analyzer":
+            return self._format_confidential_results(agent_result)
+        return None
+
     def _format_telegram_results(self, telegram_data: Dict[str, Any]) -> str:
         """텔레그램 결과를 문자열로 포맷팅"""
         if not telegram_data:
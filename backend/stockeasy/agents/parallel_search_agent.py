@@ -7,13 +7,16 @@
 
 import asyncio
 import copy
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 import time
 from loguru import logger
 
+from common.core.config import settings
 from stockeasy.models.agent_io import AgentState
 from stockeasy.agents.base import BaseAgent
+from stockeasy.services.result_condenser import ResultCondenser
+from stockeasy.services.speculative_retrieval import get_speculative_retrieval_service
 
 
 class ParallelSearchAgent(BaseAgent):
@@ -21,16 +24,25 @@ class ParallelSearchAgent(BaseAgent):
     여러 검색 에이전트를 병렬로 실행하는 에이전트
     """
     
-    def __init__(self, agents: Dict[str, BaseAgent], graph=None):
+    # 에이전트별 실행 시간 지수이동평균 (마감 시간으로 제외한 에이전트의 절감 시간 추정용)
+    _duration_ewma: Dict[str, float] = {}
+    
+    def __init__(self, agents: Dict[str, BaseAgent], graph=None,
+                 result_formatter: Optional[Callable[[str, Dict[str, Any]], Optional[str]]] = None,
+                 result_condenser: Optional[ResultCondenser] = None):
         """
         초기화
         
         Args:
             agents: 검색 에이전트 이름과 인스턴스의 딕셔너리
             graph: 그래프 인스턴스 (콜백 실행용)
+            result_formatter: 에이전트 결과를 지식 통합 프롬프트용 텍스트로 정리하는 함수
+            result_condenser: 정리된 텍스트를 결과 도착 즉시 압축하는 서비스 (None이면 압축하지 않음)
         """
         self.agents = agents
         self.graph = graph  # 그래프 인스턴스 저장
+        self.result_formatter = result_formatter
+        self.result_condenser = result_condenser
         self.search_agent_names = [
             "telegram_retriever", 
             "report_analyzer", 
@@ -66,6 +78,9 @@ class ParallelSearchAgent(BaseAgent):
         # processing_status가 없으면 초기화
         if "processing_status" not in state:
             state["processing_status"] = {}
+        
+        # 지식 통합/요약용 압축본 초기화 (같은 세션의 이전 질문 결과가 남지 않도록)
+        state["integration_partials"] = {}
             
         # 커스텀 프롬프트 템플릿 정보 확인 및 복사
         custom_prompt_templates = {}
@@ -116,6 +131,11 @@ class ParallelSearchAgent(BaseAgent):
         
         logger.info(f"병렬로 실행할 에이전트: {[name for name, _ in search_agents]}")
         
+        # 질문 분석과 동시에 시작한 예측 검색 중 실행할 에이전트의 것만 남기고 취소
+        speculative_service = get_speculative_retrieval_service(state)
+        if speculative_service is not None:
+            speculative_service.resolve(name for name, _ in search_agents)
+        
         # 실행할 에이전트가 없는 경우를 명시적으로 처리
         if not search_agents:
             logger.warning("병렬로 실행할 에이전트가 없습니다.")
@@ -126,7 +146,7 @@ class ParallelSearchAgent(BaseAgent):
             return state
         
         # 각 에이전트를 실행할 비동기 작업 생성
-        tasks = []
+        tasks = {}
         for name, agent in search_agents:
             # 처리 상태 초기화 - 우선 processing 상태로 설정
             state["processing_status"][name] = "processing"
@@ -136,18 +156,24 @@ class ParallelSearchAgent(BaseAgent):
             if custom_prompt_templates:
                 agent_state["custom_prompt_templates"] = custom_prompt_templates
             # 비동기 작업 생성
-            tasks.append(self._run_agent(name, agent, agent_state))
+            tasks[name] = self._run_agent(name, agent, agent_state)
         
-        # 병렬로 모든 에이전트 실행
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 병렬로 에이전트 실행 (정족수 충족 후 마감 시간이 지나면 남은 에이전트는 제외)
+        results, deadline_metrics = await self._run_with_quorum(tasks, state, start_time)
+        skipped_agents = deadline_metrics["skipped_agents"]
         
         # 결과 처리를 위한 변수
         success_count = 0
         failure_count = 0
         
         # 결과 처리
-        for (name, _), result in zip(search_agents, results):
-            if isinstance(result, Exception):
+        for name, _ in search_agents:
+            result = results.get(name)
+            if name in skipped_agents:
+                # 마감 시간으로 제외된 에이전트 (오류로 집계하지 않음)
+                logger.warning(f"에이전트 {name}은 마감 시간({settings.STOCKEASY_SEARCH_DEADLINE}초)까지 완료되지 않아 제외되었습니다.")
+                state["processing_status"][name] = "skipped_deadline"
+            elif isinstance(result, Exception):
                 # 오류 처리
                 failure_count += 1
                 logger.error(f"에이전트 {name} 실행 중 오류 발생: {str(result)}")
@@ -198,7 +224,7 @@ class ParallelSearchAgent(BaseAgent):
             logger.info(f"병합된 agent_results 키: {list(state['agent_results'].keys())}")
         
         # 모든 에이전트가 실패했는지 확인
-        if search_agents and failure_count == len(search_agents):
+        if search_agents and failure_count + len(skipped_agents) == len(search_agents):
             logger.warning("모든 검색 에이전트 실행이 실패했습니다.")
             state["all_search_agents_failed"] = True
         
@@ -238,6 +264,7 @@ class ParallelSearchAgent(BaseAgent):
                 "executed_agents": [name for name, _ in search_agents],
                 "success_count": success_count,
                 "failure_count": failure_count,
+                "skipped_agents": skipped_agents,
                 "execution_time": execution_time,
                 "has_data": has_data
             },
@@ -247,10 +274,144 @@ class ParallelSearchAgent(BaseAgent):
             }
         }
         
-        logger.info(f"ParallelSearchAgent 병렬 처리 완료. 실행 시간: {execution_time:.2f}초, 성공: {success_count}, 실패: {failure_count}")
+        # 요청별 마감 시간 적용 결과 (제외된 에이전트, 절감 시간 추정치) 기록
+        state["metrics"] = state.get("metrics", {})
+        state["metrics"]["parallel_search"] = {
+            "start_time": datetime.fromtimestamp(start_time),
+            "end_time": datetime.fromtimestamp(end_time),
+            "duration": execution_time,
+            "status": "completed",
+            "error": None,
+            **deadline_metrics
+        }
+        
+        logger.info(f"ParallelSearchAgent 병렬 처리 완료. 실행 시간: {execution_time:.2f}초, 성공: {success_count}, 실패: {failure_count}, "
+                    f"제외: {len(skipped_agents)}, 절감 추정: {deadline_metrics['latency_saved']:.2f}초, "
+                    f"압축: {deadline_metrics['condensed_agents']} (검색 후 대기 {deadline_metrics['condense_wait']:.2f}초)")
         
         return state
     
+    async def _run_with_quorum(self, coroutines: Dict[str, Any], state: AgentState, start_time: float):
+        """
+        에이전트들을 병렬로 실행하고 완료되는 순서대로 결과를 수집합니다.
+        
+        - 결과가 도착하면 지식 통합 프롬프트용 텍스트로 정리한 뒤, 나머지 에이전트를 기다리는 동안
+          소형 모델로 압축하는 작업을 바로 시작합니다. (STOCKEASY_CONDENSE_ON_ARRIVAL)
+          압축본은 state["integration_partials"]에 저장되어 지식 통합과 요약에서 원문 대신 사용됩니다.
+        - 성공한 에이전트 수가 정족수(STOCKEASY_SEARCH_QUORUM) 이상이고 마감 시간(STOCKEASY_SEARCH_DEADLINE)이
+          지나면 남은 에이전트를 취소합니다. 정족수를 채우지 못하거나 정족수가 0(기본값)이면 모든 에이전트를 기다립니다.
+        
+        Args:
+            coroutines: 에이전트 이름 -> 실행 코루틴
+            state: 현재 에이전트 상태
+            start_time: 병렬 검색 시작 시각 (time.time())
+            
+        Returns:
+            (에이전트 이름 -> 결과 또는 예외, 마감 시간/압축 적용 지표)
+        """
+        tasks = {asyncio.create_task(coroutine): name for name, coroutine in coroutines.items()}
+        quorum = settings.STOCKEASY_SEARCH_QUORUM
+        quorum = min(quorum, len(tasks)) if quorum > 0 else len(tasks)
+        deadline = start_time + settings.STOCKEASY_SEARCH_DEADLINE
+        condense_on_arrival = (settings.STOCKEASY_CONDENSE_ON_ARRIVAL
+                               and self.result_formatter is not None and self.result_condenser is not None)
+        condense_semaphore = asyncio.Semaphore(max(1, settings.STOCKEASY_CONDENSE_MAX_CONCURRENCY))
+        condense_tasks: Dict[str, asyncio.Task] = {}
+        
+        results: Dict[str, Any] = {}
+        success_count = 0
+        quorum_reached_at = None
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = max(deadline - time.time(), 0) if success_count >= quorum else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    name = tasks[task]
+                    if task.cancelled():
+                        # 에이전트 내부에서 취소된 경우 (exception() 호출 시 CancelledError 발생)
+                        results[name] = RuntimeError(f"에이전트 {name} 실행이 취소되었습니다")
+                        continue
+                    if task.exception() is not None:
+                        results[name] = task.exception()
+                        continue
+                    results[name] = result = task.result()
+                    success_count += 1
+                    elapsed = time.time() - start_time
+                    previous = self._duration_ewma.get(name)
+                    self._duration_ewma[name] = elapsed if previous is None else previous * 0.8 + elapsed * 0.2
+                    if condense_on_arrival:
+                        condense_tasks[name] = asyncio.create_task(
+                            self._condense_result(name, result, state, condense_semaphore)
+                        )
+                if quorum_reached_at is None and success_count >= quorum:
+                    quorum_reached_at = time.time() - start_time
+            
+            skipped_agents = [tasks[task] for task in pending]
+            for task in pending:
+                task.cancel()
+            if pending:
+                # 취소 처리가 끝날 때까지 잠시 대기 (에이전트 내부 정리 작업이 다음 단계와 겹치지 않도록)
+                await asyncio.wait(pending, timeout=1.0)
+            
+            # 제외한 에이전트가 평소만큼 걸렸다면 더 기다렸을 시간 (이전 실행 시간 평균 기준 추정)
+            cut_elapsed = time.time() - start_time
+            latency_saved = max(
+                [max(self._duration_ewma.get(name, cut_elapsed) - cut_elapsed, 0.0) for name in skipped_agents],
+                default=0.0
+            )
+            
+            # 검색이 끝난 뒤에도 진행 중인 압축 작업 대기 (각 작업은 STOCKEASY_CONDENSE_TIMEOUT으로 제한)
+            search_finished_at = time.time()
+            if condense_tasks:
+                await asyncio.gather(*condense_tasks.values())
+            condense_wait = time.time() - search_finished_at
+        finally:
+            for task in condense_tasks.values():
+                if not task.done():
+                    task.cancel()
+        
+        return results, {
+            "quorum": quorum,
+            "deadline": settings.STOCKEASY_SEARCH_DEADLINE,
+            "quorum_reached_at": quorum_reached_at,
+            "skipped_agents": skipped_agents,
+            "latency_saved": latency_saved,
+            "condense_on_arrival": condense_on_arrival,
+            "condensed_agents": [name for name, task in condense_tasks.items() if task.result()],
+            "condense_wait": condense_wait,
+        }
+    
+    async def _condense_result(self, name: str, result: AgentState, state: AgentState,
+                               semaphore: asyncio.Semaphore) -> bool:
+        """
+        도착한 에이전트 결과를 정리/압축해 state["integration_partials"]에 저장합니다.
+        
+        Returns:
+            압축본 저장 여부 (짧은 결과이거나 압축에 실패하면 False, 통합/요약 단계에서 원문 사용)
+        """
+        try:
+            agent_result = result.get("agent_results", {}).get(name)
+            formatted = self.result_formatter(name, agent_result) if agent_result else None
+            if not formatted:
+                return False
+            question_analysis = state.get("question_analysis") or {}
+            stock_name = question_analysis.get("entities", {}).get("stock_name") or state.get("stock_name")
+            user_id = (state.get("user_context") or {}).get("user_id")
+            async with semaphore:
+                condensed = await self.result_condenser.condense(
+                    name, formatted, query=state.get("query", ""), stock_name=stock_name, user_id=user_id
+                )
+            if not condensed:
+                return False
+            state.setdefault("integration_partials", {})[name] = condensed
+            return True
+        except Exception as e:
+            logger.warning(f"에이전트 {name} 결과 압축 실패 (통합/요약 시 원문 사용): {str(e)}")
+            return False
+    
     async def _run_agent(self, name: str, agent: BaseAgent, state: AgentState) -> AgentState:
         """
         개별 에이전트를 실행하는 도우미 함수
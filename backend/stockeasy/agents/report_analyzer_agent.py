@@ -29,6 +29,7 @@ from stockeasy.prompts.report_prompts import (
 )
 from common.core.config import settings
 from common.services.vector_store_manager import VectorStoreManager
+from common.services.context_packer import ContextPacker
 from common.services.retrievers.semantic import SemanticRetriever, SemanticRetrieverConfig
 from common.services.retrievers.models import RetrievalResult
 from common.utils.util import async_retry
@@ -37,6 +38,8 @@ from langchain_core.messages import AIMessage
 from common.services.agent_llm import get_llm_for_agent, get_agent_llm
 from common.models.token_usage import ProjectType
 from stockeasy.agents.base import BaseAgent
+from stockeasy.services.query_embedding import embed_search_query
+from stockeasy.services.speculative_retrieval import filter_retrieval_candidates, take_speculative_retrieval
 from sqlalchemy.ext.asyncio import AsyncSession
 
 def format_report_contents(reports: List[CompanyReportData]) -> str:
@@ -146,13 +149,20 @@ class ReportAnalyzerAgent(BaseAgent):
             threshold = self._calculate_dynamic_threshold(classification)
             metadata_filter = self._create_metadata_filter(stock_code, stock_name, classification, state)
             
+            # 질문 분석과 동시에 시작한 예측 검색 후보 (채택할 수 없으면 None)
+            candidates = await take_speculative_retrieval(state, "report_analyzer", stock_code, metadata_filter, search_query)
+            # 질문 분석 직후 배치로 계산된 쿼리 임베딩 (없으면 검색 시 임베딩)
+            query_embedding = await embed_search_query(state, search_query) if candidates is None else None
+            
             # 기업리포트 검색
             reports:List[CompanyReportData] = await self._search_reports(
                 search_query, 
                 k, 
                 threshold, 
                 metadata_filter,
-                user_id=user_id
+                user_id=user_id,
+                query_embedding=query_embedding,
+                candidates=candidates
             )
             
             # 검색 결과가 없는 경우
@@ -302,7 +312,8 @@ class ReportAnalyzerAgent(BaseAgent):
                 "status": "completed",
                 "error": None,
                 "model_name": self.model_name,
-                "provider": self.provider
+                "provider": self.provider,
+                "context_packing": analysis.get("context_packing") if need_detailed_analysis and isinstance(analysis, dict) else None
             }
             
             logger.info(f"ReportAnalyzerAgent completed in {duration:.2f} seconds, found {len(processed_reports)} reports")
@@ -355,6 +366,37 @@ class ReportAnalyzerAgent(BaseAgent):
             "context": {"query": state.get("query", "")}
         })
     
+    def get_search_queries(self, state: Dict[str, Any]) -> List[str]:
+        """질문 분석 결과로 만든 벡터 검색 쿼리 목록 (쿼리 임베딩 선계산용)"""
+        query = state.get("query", "")
+        if not query:
+            return []
+        question_analysis = state.get("question_analysis", {})
+        entities = question_analysis.get("entities", {})
+        classification = question_analysis.get("classification", {})
+        stock_code = entities.get("stock_code", state.get("stock_code"))
+        stock_name = entities.get("stock_name", state.get("stock_name"))
+        return [self._make_search_query(query, stock_code, stock_name, classification, state)]
+
+    def get_speculative_search(self, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        질문 분석 전에 시작할 예측 검색 매개변수 (화면에서 지정한 종목코드와 원본 질문 기준)
+        
+        분류 결과를 모르므로 가장 큰 검색 수와 가장 낮은 임계값으로 후보를 가져옵니다.
+        """
+        query = state.get("query", "")
+        stock_code = state.get("stock_code")
+        if not query or not stock_code:
+            return None
+        stock_name = state.get("stock_name")
+        return {
+            "query": self._make_search_query(query, stock_code, stock_name, {}, {}),
+            "top_k": self._get_report_count({"complexity": "전문가급"}) * 2,
+            "threshold": self._calculate_dynamic_threshold({"complexity": "전문가급"}),
+            "filters": self._create_metadata_filter(stock_code, stock_name, {}, state),
+            "user_id": state.get("user_context", {}).get("user_id"),
+        }
+
     def _make_search_query(self, query: str, stock_code: Optional[str], 
                           stock_name: Optional[str], classification: Dict[str, Any], 
                           state: Dict[str, Any]) -> str:
@@ -570,7 +612,9 @@ class ReportAnalyzerAgent(BaseAgent):
     @async_retry(retries=3, delay=1.0, exceptions=(Exception,))
     async def _search_reports(self, query: str, k: int = 5, threshold: float = 0.3,
                              metadata_filter: Optional[Dict[str, Any]] = None,
-                             user_id: Optional[Union[str, UUID]] = None) -> List[CompanyReportData]:
+                             user_id: Optional[Union[str, UUID]] = None,
+                             query_embedding: Optional[List[float]] = None,
+                             candidates: Optional[RetrievalResult] = None) -> List[CompanyReportData]:
         """
         파인콘 DB에서 기업리포트 검색
         
@@ -579,38 +623,25 @@ class ReportAnalyzerAgent(BaseAgent):
             k: 검색할 최대 결과 수
             threshold: 유사도 임계값
             metadata_filter: 메타데이터 필터
+            query_embedding: 미리 계산된 쿼리 임베딩 (None이면 검색 시 임베딩)
+            candidates: 예측 검색으로 미리 가져온 후보 (있으면 벡터 검색 생략)
             
         Returns:
             검색된 리포트 목록
         """
         try:
-            # 벡터 스토어 연결
-            vs_manager = VectorStoreManager(
-                embedding_model_type=EmbeddingModelType.OPENAI_3_LARGE,
-                project_name="stockeasy",
-                namespace=settings.PINECONE_NAMESPACE_STOCKEASY
-            )
-
-            # UUID 변환 로직: 문자열이면 UUID로 변환, UUID 객체면 그대로 사용, None이면 None
-            if user_id != "test_user":
-                parsed_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            if candidates is not None:
+                # 예측 검색 후보를 최종 임계값/검색 수로 필터링
+                retrieval_result = filter_retrieval_candidates(candidates, k * 2, threshold)
             else:
-                parsed_user_id = None
-
-            # 시맨틱 검색 설정
-            semantic_retriever = SemanticRetriever(
-                config=SemanticRetrieverConfig(min_score=threshold,
-                                               user_id=parsed_user_id,
-                                               project_type=ProjectType.STOCKEASY),
-                vs_manager=vs_manager
-            )
-            
-            # 검색 수행
-            retrieval_result: RetrievalResult = await semantic_retriever.retrieve(
-                query=query, 
-                top_k=k * 2,  # 중복 제거를 고려하여 2배로 검색
-                filters=metadata_filter
-            )
+                retrieval_result = await self._retrieve_candidates(
+                    query, 
+                    k * 2,  # 중복 제거를 고려하여 2배로 검색
+                    threshold, 
+                    metadata_filter, 
+                    user_id=user_id, 
+                    query_embedding=query_embedding
+                )
             
             # 검색 결과 처리
             results = []
@@ -659,6 +690,53 @@ class ReportAnalyzerAgent(BaseAgent):
             logger.error(f"기업리포트 검색 중 오류 발생: {str(e)}", exc_info=True)
             raise
     
+    async def _retrieve_candidates(self, query: str, top_k: int, threshold: float,
+                                   filters: Optional[Dict[str, Any]] = None,
+                                   user_id: Optional[Union[str, UUID]] = None,
+                                   query_embedding: Optional[List[float]] = None) -> RetrievalResult:
+        """
+        기업리포트 벡터 검색 (중복 제거 전 후보)
+        
+        Args:
+            query: 검색 쿼리
+            top_k: 검색할 후보 수
+            threshold: 유사도 임계값
+            filters: 메타데이터 필터
+            user_id: 사용자 ID (문자열 또는 UUID 객체)
+            query_embedding: 미리 계산된 쿼리 임베딩 (None이면 검색 시 임베딩)
+            
+        Returns:
+            검색 결과
+        """
+        # 벡터 스토어 연결
+        vs_manager = await VectorStoreManager.create_async(
+            embedding_model_type=EmbeddingModelType.OPENAI_3_LARGE,
+            project_name="stockeasy",
+            namespace=settings.PINECONE_NAMESPACE_STOCKEASY
+        )
+
+        # UUID 변환 로직: 문자열이면 UUID로 변환, UUID 객체면 그대로 사용, None이면 None
+        if user_id != "test_user":
+            parsed_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+        else:
+            parsed_user_id = None
+
+        # 시맨틱 검색 설정
+        semantic_retriever = SemanticRetriever(
+            config=SemanticRetrieverConfig(min_score=threshold,
+                                           user_id=parsed_user_id,
+                                           project_type=ProjectType.STOCKEASY),
+            vs_manager=vs_manager
+        )
+        
+        # 검색 수행
+        return await semantic_retriever.retrieve(
+            query=query, 
+            top_k=top_k,
+            filters=filters,
+            query_embedding=query_embedding
+        )
+
     def _format_date(self, date_str: str) -> str:
         """
         날짜 문자열 형식화
@@ -769,7 +847,10 @@ class ReportAnalyzerAgent(BaseAgent):
             return []
         
         # 리포트 내용 형식화
-        formatted_reports = format_report_contents(reports)
+        # 토큰 예산에 맞춰 점수 순으로 패킹(중복 제거)한 하나의 컨텍스트를 두 프롬프트가 공유
+        packer = ContextPacker.for_agent("report_analyzer_agent")
+        packed = packer.pack(reports, text_key="content", score_key="score")
+        formatted_reports = format_report_contents(packed.items)
         
         # 1) 기본 분석 프롬프트 생성
         query_with_date = f"오늘 {datetime.now().strftime('%Y-%m-%d')} 기준, {query}"
@@ -892,7 +973,9 @@ class ReportAnalyzerAgent(BaseAgent):
                 #"analysis": {
                     "llm_response": analysis_content,
                     "investment_opinions": investment_opinions,
-                    "opinion_summary": opinion_content
+                    "opinion_summary": opinion_content,
+                    # 분석/투자의견 두 호출이 같은 컨텍스트를 사용하므로 절약 토큰은 2배
+                    "context_packing": packed.to_metrics(num_calls=2)
                 #}
                 #"searched_documents": reports
             }
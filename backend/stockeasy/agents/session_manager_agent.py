@@ -16,6 +16,12 @@ from stockeasy.agents.base import BaseAgent
 from common.services.user import UserService
 from common.schemas.user import SessionBase
 from stockeasy.prompts.session_manager_prompts import SESSION_MANAGER_PROMPT
+from stockeasy.services.chat_service import ChatService
+from stockeasy.services.conversation_history import (
+    ConversationHistoryStore,
+    get_conversation_history_store,
+    messages_to_turns,
+)
 
 
 class SessionManagerAgent(BaseAgent):
@@ -25,15 +31,18 @@ class SessionManagerAgent(BaseAgent):
     기존 common.services.user.UserService를 활용하여 세션 인증 및 관리를 수행합니다.
     """
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, history_store: Optional[ConversationHistoryStore] = None):
         """
         세션 관리자 에이전트 초기화
         
         Args:
             db: 데이터베이스 세션 객체
+            history_store: 대화 이력 저장소 (기본값: 프로세스 공유 저장소 - Redis 또는 로컬 LRU)
         """
+        self.db = db
         self.user_service = UserService(db)
-        self.conversation_history_cache = {}  # 세션 ID별 대화 이력 캐싱
+        # 세션 ID별 대화 이력 캐싱 (워커 간 공유 저장소, 캐시 미스 시 채팅 메시지 DB에서 적재)
+        self.conversation_history_cache = history_store or get_conversation_history_store()
     
     async def process(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -88,7 +97,11 @@ class SessionManagerAgent(BaseAgent):
                     }
                     
                     # 대화 이력 검색 (캐시 또는 DB에서)
-                    conversation_history = self._get_conversation_history(str(session.id))
+                    # 채팅 세션 ID가 있으면 채팅 세션 단위로, 없으면 인증 세션 단위로 이력을 관리
+                    history_session_id = str(state.get("chat_session_id") or session.id)
+                    conversation_history = await self._get_conversation_history(
+                        history_session_id, chat_session_id=state.get("chat_session_id")
+                    )
                     state["conversation_history"] = conversation_history
                     
                     # 컨텍스트를 기반으로 현재 질문 보강
@@ -96,7 +109,7 @@ class SessionManagerAgent(BaseAgent):
                         state = self._enhance_query_with_context(state)
                     
                     # 동일 세션 내 새 쿼리에 대해 처리 시 이전 에이전트 결과 정리
-                    if state.get("query") and state.get("query") != self._get_last_query(str(session.id)):
+                    if state.get("query") and state.get("query") != self._get_last_query(conversation_history):
                         # 새로운 쿼리가 있고 이전 쿼리와 다른 경우 에이전트 결과 초기화
                         state = self._clean_agent_results(state)
                         logger.info(f"새 쿼리 감지: 에이전트 결과 데이터 초기화 완료")
@@ -222,58 +235,63 @@ class SessionManagerAgent(BaseAgent):
         
         return state
     
-    def _get_last_query(self, session_id: str) -> Optional[str]:
+    def _get_last_query(self, conversation_history: List[Dict[str, Any]]) -> Optional[str]:
         """
         세션의 마지막 쿼리를 반환합니다.
         
         Args:
-            session_id: 세션 ID
+            conversation_history: 이미 조회한 세션의 대화 이력 (저장소 재조회 방지)
             
         Returns:
             마지막 쿼리 또는 None
         """
-        conversation_history = self._get_conversation_history(session_id)
         if not conversation_history:
             return None
         
         return conversation_history[-1].get("query")
     
-    def _get_conversation_history(self, session_id: str) -> List[Dict[str, Any]]:
+    async def _get_conversation_history(self, session_id: str, chat_session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         세션에 대한 대화 이력을 조회합니다.
         
-        현재는 간단한 메모리 캐싱을 사용하지만, 추후 데이터베이스에 저장하도록 확장 가능합니다.
+        공유 저장소(Redis 또는 로컬 LRU)를 먼저 확인하고, 캐시 미스이면서 채팅 세션 ID가 있는 경우
+        ChatService.get_chat_messages로 최근 메시지를 적재하여 저장소에 채워 넣습니다.
         
         Args:
-            session_id: 세션 ID
+            session_id: 세션 ID (저장소 키)
+            chat_session_id: 채팅 세션 ID (DB 적재용, 선택)
             
         Returns:
             대화 이력 목록
         """
-        return self.conversation_history_cache.get(session_id, [])
-    
-    def _update_conversation_history(self, session_id: str, query: str, response: str) -> None:
-        """
-        세션의 대화 이력을 업데이트합니다.
+        try:
+            cached_history = await self.conversation_history_cache.get(session_id)
+        except Exception as e:
+            logger.warning(f"대화 이력 저장소 조회 실패: {str(e)}")
+            cached_history = None
+        if cached_history is not None:
+            return cached_history
         
-        Args:
-            session_id: 세션 ID
-            query: 사용자 질문
-            response: 시스템 응답
-        """
-        if session_id not in self.conversation_history_cache:
-            self.conversation_history_cache[session_id] = []
-            
-        # 새 대화 추가
-        self.conversation_history_cache[session_id].append({
-            "timestamp": datetime.now(),
-            "query": query,
-            "response": response
-        })
+        if not chat_session_id or not self.db:
+            return []
         
-        # 대화 이력 크기 제한 (최대 10개)
-        if len(self.conversation_history_cache[session_id]) > 10:
-            self.conversation_history_cache[session_id] = self.conversation_history_cache[session_id][-10:]
+        # 캐시 미스: 최근 메시지를 DB에서 지연 적재 (user/assistant 한 쌍이 한 턴)
+        max_turns = self.conversation_history_cache.max_turns
+        messages = await ChatService.get_chat_messages(
+            self.db,
+            session_id=UUID(str(chat_session_id)),
+            limit=max_turns * 2,
+            latest=True
+        )
+        conversation_history = messages_to_turns(messages)
+        # 현재 처리 중인 질문(응답 미저장)은 이력에서 제외
+        if conversation_history and not conversation_history[-1]["response"]:
+            conversation_history = conversation_history[:-1]
+        conversation_history = conversation_history[-max_turns:]
+        if conversation_history:
+            await self.conversation_history_cache.set(session_id, conversation_history)
+        logger.info(f"DB에서 대화 이력 적재: {chat_session_id}, {len(conversation_history)}턴")
+        return conversation_history
     
     def _enhance_query_with_context(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -110,7 +110,8 @@ class SummarizerAgent(BaseAgent):
                 query=query, stock_code=stock_code, stock_name=stock_name, classification=classification,
                 telegram_data=telegram_data, report_data=report_data, confidential_data=confidential_data,
                 financial_data=financial_data, industry_data=industry_data,
-                integrated_knowledge=integrated_knowledge, system_prompt=system_prompt
+                integrated_knowledge=integrated_knowledge, system_prompt=system_prompt,
+                integration_partials=state.get("integration_partials")
             )
             
             # LLM으로 요약 생성
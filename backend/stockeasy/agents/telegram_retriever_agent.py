@@ -35,6 +35,8 @@ from common.services.retrievers.models import DocumentWithScore, RetrievalResult
 from stockeasy.models.agent_io import RetrievedAllAgentData, RetrievedTelegramMessage
 from langchain_core.messages import AIMessage
 from stockeasy.agents.base import BaseAgent
+from stockeasy.services.query_embedding import embed_search_query
+from stockeasy.services.speculative_retrieval import filter_retrieval_candidates, take_speculative_retrieval
 from sqlalchemy.ext.asyncio import AsyncSession
 
 class TelegramRetrieverAgent(BaseAgent):
@@ -105,6 +107,10 @@ class TelegramRetrieverAgent(BaseAgent):
             
             # 검색 쿼리 생성 (보다 정확한 검색을 위해 클래스 및 의도 정보 활용)
             search_query = self._make_search_query(query, stock_code, stock_name, classification, sector)
+            # 질문 분석과 동시에 시작한 예측 검색 후보 (채택할 수 없으면 None)
+            candidates = await take_speculative_retrieval(state, "telegram_retriever", stock_code, query=search_query)
+            # 질문 분석 직후 배치로 계산된 쿼리 임베딩 (없으면 검색 시 임베딩)
+            query_embedding = await embed_search_query(state, search_query) if candidates is None else None
             
             user_context = state.get("user_context", {})
             user_id = user_context.get("user_id", None)
@@ -114,7 +120,9 @@ class TelegramRetrieverAgent(BaseAgent):
                 user_id=user_id,
                 search_query= search_query,
                 k=message_count, 
-                threshold=threshold
+                threshold=threshold,
+                query_embedding=query_embedding,
+                candidates=candidates
             )
             
             
@@ -609,6 +617,36 @@ class TelegramRetrieverAgent(BaseAgent):
             logger.warning(f"시간 가중치 계산 오류: {str(e)}")
             return 0.5  # 오류 시 중간값 반환
     
+    def get_search_queries(self, state: Dict[str, Any]) -> List[str]:
+        """질문 분석 결과로 만든 벡터 검색 쿼리 목록 (쿼리 임베딩 선계산용)"""
+        query = state.get("query", "")
+        if not query:
+            return []
+        question_analysis = state.get("question_analysis", {})
+        entities = question_analysis.get("entities", {})
+        classification = question_analysis.get("classification", {})
+        stock_code = entities.get("stock_code", state.get("stock_code"))
+        stock_name = entities.get("stock_name", state.get("stock_name"))
+        sector = entities.get("sector", "")
+        return [self._make_search_query(query, stock_code, stock_name, classification, sector)]
+
+    def get_speculative_search(self, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        질문 분석 전에 시작할 예측 검색 매개변수 (화면에서 지정한 종목코드와 원본 질문 기준)
+        
+        분류 결과를 모르므로 가장 큰 초기 검색 수와 가장 낮은 임계값으로 후보를 가져옵니다.
+        """
+        query = state.get("query", "")
+        stock_code = state.get("stock_code")
+        if not query or not stock_code:
+            return None
+        return {
+            "search_query": self._make_search_query(query, stock_code, state.get("stock_name"), {}),
+            "top_k": min(self._get_message_count({"complexity": "전문가급"}) * 3, 30),
+            "threshold": self._calculate_dynamic_threshold({"complexity": "전문가급"}),
+            "user_id": state.get("user_context", {}).get("user_id"),
+        }
+
     def _make_search_query(self, query: str, stock_code: Optional[str], 
                           stock_name: Optional[str], classification: Dict[str, Any],
                           sector: Optional[str] = None) -> str:
@@ -672,7 +710,9 @@ class TelegramRetrieverAgent(BaseAgent):
         return enhanced_query
     
     @async_retry(retries=3, delay=1.0, exceptions=(Exception,))
-    async def _search_messages(self, search_query: str, k: int, threshold: float, user_id: Optional[Union[str, UUID]] = None) -> List[RetrievedTelegramMessage]:
+    async def _search_messages(self, search_query: str, k: int, threshold: float, user_id: Optional[Union[str, UUID]] = None,
+                               query_embedding: Optional[List[float]] = None,
+                               candidates: Optional[RetrievalResult] = None) -> List[RetrievedTelegramMessage]:
         """
         텔레그램 메시지 검색을 수행합니다.
         
@@ -681,6 +721,8 @@ class TelegramRetrieverAgent(BaseAgent):
             k: 검색할 메시지 수
             threshold: 유사도 임계값
             user_id: 사용자 ID (문자열 또는 UUID 객체)
+            query_embedding: 미리 계산된 쿼리 임베딩 (None이면 검색 시 임베딩)
+            candidates: 예측 검색으로 미리 가져온 후보 (있으면 벡터 검색 생략)
             
         Returns:
             검색된 텔레그램 메시지 목록
@@ -688,38 +730,14 @@ class TelegramRetrieverAgent(BaseAgent):
         try:
             logger.info(f"Generated search query: {search_query}")
             
-            # 임베딩 모델을 사용하여 쿼리 벡터 생성
-            
             # 초기 검색은 더 많은 결과를 가져온 후 필터링
             initial_k = min(k * 3, 30)  # 적어도 원하는 k의 3배, 최대 30개까지
             
-            # Pinecone 벡터 스토어 연결
-            vs_manager = VectorStoreManager(
-                embedding_model_type=self.embedding_service.get_model_type(),
-                project_name="stockeasy",
-                namespace=settings.PINECONE_NAMESPACE_STOCKEASY_TELEGRAM
-            )
-
-            # UUID 변환 로직: 문자열이면 UUID로 변환, UUID 객체면 그대로 사용, None이면 None
-            if user_id != "test_user":
-                parsed_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            if candidates is not None:
+                # 예측 검색 후보를 최종 임계값/검색 수로 필터링
+                result = filter_retrieval_candidates(candidates, initial_k, threshold)
             else:
-                parsed_user_id = None
-
-            semantic_retriever_config = SemanticRetrieverConfig(min_score=threshold,
-                                               user_id=parsed_user_id,
-                                               project_type=ProjectType.STOCKEASY    )
-            # 시맨틱 검색 설정
-            semantic_retriever = SemanticRetriever(
-                config=semantic_retriever_config,
-                vs_manager=vs_manager
-            )
-            
-            # 검색 수행
-            result: RetrievalResult = await semantic_retriever.retrieve(
-                query=search_query, 
-                top_k=initial_k,#k * 2,
-            )
+                result = await self._retrieve_candidates(search_query, initial_k, threshold, user_id, query_embedding)
             
             if len(result.documents) == 0:
                 logger.warning(f"No telegram messages found for query: {search_query}")
@@ -813,6 +831,51 @@ class TelegramRetrieverAgent(BaseAgent):
             logger.exception(f"Error searching telegram messages: {str(e)}")
             raise 
 
+    async def _retrieve_candidates(self, search_query: str, top_k: int, threshold: float,
+                                   user_id: Optional[Union[str, UUID]] = None,
+                                   query_embedding: Optional[List[float]] = None) -> RetrievalResult:
+        """
+        텔레그램 메시지 벡터 검색 (중복 제거/리랭킹 전 후보)
+        
+        Args:
+            search_query: 검색 쿼리
+            top_k: 검색할 후보 수
+            threshold: 유사도 임계값
+            user_id: 사용자 ID (문자열 또는 UUID 객체)
+            query_embedding: 미리 계산된 쿼리 임베딩 (None이면 검색 시 임베딩)
+            
+        Returns:
+            검색 결과
+        """
+        # Pinecone 벡터 스토어 연결
+        vs_manager = await VectorStoreManager.create_async(
+            embedding_model_type=self.embedding_service.get_model_type(),
+            project_name="stockeasy",
+            namespace=settings.PINECONE_NAMESPACE_STOCKEASY_TELEGRAM
+        )
+
+        # UUID 변환 로직: 문자열이면 UUID로 변환, UUID 객체면 그대로 사용, None이면 None
+        if user_id != "test_user":
+            parsed_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+        else:
+            parsed_user_id = None
+
+        semantic_retriever_config = SemanticRetrieverConfig(min_score=threshold,
+                                           user_id=parsed_user_id,
+                                           project_type=ProjectType.STOCKEASY    )
+        # 시맨틱 검색 설정
+        semantic_retriever = SemanticRetriever(
+            config=semantic_retriever_config,
+            vs_manager=vs_manager
+        )
+        
+        # 검색 수행
+        return await semantic_retriever.retrieve(
+            query=search_query, 
+            top_k=top_k,
+            query_embedding=query_embedding
+        )
+
     def _get_message_hash(self, content: str) -> str:
         """
         메시지 내용의 해시값을 생성합니다.
@@ -7,6 +7,7 @@ from fastapi import APIRouter
 from stockeasy.api.v1.telegram import telegram_router
 from stockeasy.api.v1.root_router import router
 from stockeasy.api.v1.chat import chat_router
+from stockeasy.api.v1.stock import stock_router
 from stockeasy.api.v1._internal_test import router as internal_test_router
 from loguru import logger
 
@@ -28,6 +29,11 @@ logger.info("채팅 라우터 등록 시작")
 api_router_stockeasy.include_router(chat_router)
 logger.info("채팅 라우터 등록 완료")
 
+# 종목 라우터 등록
+logger.info("종목 라우터 등록 시작")
+api_router_stockeasy.include_router(stock_router)
+logger.info("종목 라우터 등록 완료")
+
 # 내부 테스트 라우터 등록
 logger.info("내부 테스트 라우터 등록 시작")
 api_router_stockeasy.include_router(internal_test_router)
@@ -18,6 +18,7 @@ from common.models.user import Session
 from common.core.deps import get_current_session
 from stockeasy.services.chat_service import ChatService
 from stockeasy.services.rag_service import StockRAGService
+from stockeasy.services.conversation_history import get_conversation_history_store
 from stockeasy.api.deps import get_stock_rag_service
 
 
@@ -232,6 +233,9 @@ async def delete_chat_session(
                 detail="채팅 세션을 찾을 수 없습니다."
             )
         
+        # 공유 대화 이력 캐시 정리
+        await get_conversation_history_store().delete(str(chat_session_id))
+        
         return BaseResponse(
             ok=True,
             status_message="채팅 세션이 성공적으로 삭제되었습니다."
@@ -290,7 +294,8 @@ async def create_chat_message(
             stock_code=request.stock_code,
             stock_name=request.stock_name,
             session_id=str(current_session.id),
-            user_id=str(current_session.user_id)
+            user_id=str(current_session.user_id),
+            chat_session_id=str(chat_session_id)
         )
 
         # 응답 정보 추출
@@ -334,6 +339,15 @@ async def create_chat_message(
         )
         assistant_message["ok"] = True
         assistant_message["status_message"] = "정상 응답 완료"
+        
+        # 공유 대화 이력 캐시에 이번 턴 추가 (캐시된 세션에만 추가, 미스인 경우 다음 요청에서 DB 적재)
+        await get_conversation_history_store().append(str(chat_session_id), {
+            "timestamp": datetime.now(),
+            "query": request.message,
+            "response": answer,
+            "stock_code": request.stock_code,
+            "stock_name": request.stock_name
+        }, create=False)
         logger.info(f"어시스턴트 응답 완료")
         return ChatMessageResponse(**assistant_message)
         
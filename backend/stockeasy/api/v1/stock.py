@@ -0,0 +1,50 @@
+"""
+종목 API 라우터.
+
+이 모듈은 종목 선택기에서 사용하는 종목 검색(자동완성) API 엔드포인트를 제공합니다.
+"""
+from typing import List
+
+from fastapi import APIRouter, Query
+from pydantic import BaseModel, Field
+
+from stockeasy.services.financial.stock_info_service import StockInfoService
+
+
+# API 라우터 정의
+stock_router = APIRouter(prefix="/stocks", tags=["종목"])
+
+
+class StockSearchItem(BaseModel):
+    """종목 검색 결과 항목"""
+    code: str
+    name: str
+    sector: str = ""
+    match_type: str = Field(..., description="매칭 유형 (exact, prefix, choseong_prefix, substring, choseong_substring, fuzzy)")
+
+
+class StockAutocompleteResponse(BaseModel):
+    """종목 자동완성 응답 모델"""
+    query: str
+    results: List[StockSearchItem]
+
+
+@stock_router.get("/autocomplete", response_model=StockAutocompleteResponse)
+async def autocomplete_stocks(
+    q: str = Query(..., min_length=1, max_length=50, description="검색어 (종목명, 초성, 종목코드)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수")
+) -> StockAutocompleteResponse:
+    """종목명/초성/종목코드로 종목을 검색합니다. (미리 만든 검색 인덱스 사용)"""
+    results = await StockInfoService().autocomplete(q, limit=limit)
+    return StockAutocompleteResponse(
+        query=q,
+        results=[
+            StockSearchItem(
+                code=str(result.get("code", "")),
+                name=str(result.get("name", "")),
+                sector=str(result.get("sector") or ""),
+                match_type=result["match_type"]
+            )
+            for result in results
+        ]
+    )
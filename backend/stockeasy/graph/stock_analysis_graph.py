@@ -5,6 +5,8 @@
 """
 
 import os
+import asyncio
+from uuid import uuid4
 from typing import Dict, Any, List, Literal, Union, Optional, TypedDict, Tuple, Set, cast, Callable
 
 from langgraph.graph import END, StateGraph
@@ -17,9 +19,29 @@ from stockeasy.models.agent_io import AgentState
 from stockeasy.agents.base import BaseAgent
 from stockeasy.agents.session_manager_agent import SessionManagerAgent
 from stockeasy.agents.parallel_search_agent import ParallelSearchAgent
+from stockeasy.services.result_condenser import ResultCondenser
+from stockeasy.services.query_embedding import create_query_embedding_service, release_query_embedding_service
+from stockeasy.services.speculative_retrieval import (
+    create_speculative_retrieval_service,
+    get_speculative_retrieval_service,
+    release_speculative_retrieval_service,
+)
+from common.core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+# 쿼리 임베딩을 미리 계산할 검색 에이전트와 질문 분석 결과의 데이터 필요 여부 키
+QUERY_EMBEDDING_AGENTS = {
+    "telegram_retriever": "telegram_needed",
+    "report_analyzer": "reports_needed",
+    "confidential_analyzer": "confidential_data_needed",
+    "industry_analyzer": "industry_data_needed",
+}
+
+# 질문 분석과 동시에 예측 검색을 시작할 에이전트 (종목이 지정된 질문에서 대부분 필요한 검색)
+SPECULATIVE_RETRIEVAL_AGENTS = ("telegram_retriever", "report_analyzer")
+
+
 def should_use_telegram(state: AgentState) -> bool:
     """텔레그램 검색 에이전트를 사용해야 하는지 결정합니다."""
     # 기존 오케스트레이터 분류 우선 확인
@@ -144,6 +166,8 @@ class StockAnalysisGraph:
         self.graph = None
         # 메모리 저장소 초기화
         self.memory_saver = MemorySaver()
+        # 진행 중인 쿼리 임베딩 선계산 태스크 (가비지 컬렉션 방지용 참조)
+        self._prefetch_tasks: Set[asyncio.Task] = set()
         # 콜백 함수 저장을 위한 딕셔너리 추가
         self.callbacks = {
             'agent_start': [],
@@ -261,7 +285,9 @@ class StockAnalysisGraph:
             "financial_analyzer": self.agents.get("financial_analyzer"),
             "industry_analyzer": self.agents.get("industry_analyzer"),
             "confidential_analyzer": self.agents.get("confidential_analyzer")
-        }, graph=self)  # 현재 그래프 인스턴스 전달
+        }, graph=self,  # 현재 그래프 인스턴스 전달
+            result_formatter=getattr(self.agents.get("knowledge_integrator"), "format_agent_result", None),
+            result_condenser=ResultCondenser(db=db))
         
         # 그래프 초기화
         workflow = StateGraph(AgentState)
@@ -458,9 +484,17 @@ class StockAnalysisGraph:
             # 에이전트 시작 콜백 실행
             self._execute_callbacks('agent_start', agent_name, state)
             
+            # 질문 분석과 동시에 종목코드/원본 질문 기준 예측 검색 시작
+            if agent_name == "question_analyzer":
+                self._start_speculative_retrieval(state)
+            
             # 원래 프로세스 실행
             result = await original_process(state)
             
+            # 질문 분석 직후 검색 에이전트들의 쿼리 임베딩을 한 번에 계산 시작
+            if agent_name == "question_analyzer":
+                self._prefetch_query_embeddings({**state, **result} if isinstance(result, dict) else state)
+            
             # 에이전트 종료 콜백 실행
             self._execute_callbacks('agent_end', agent_name, result)
             
@@ -468,6 +502,71 @@ class StockAnalysisGraph:
             
         return wrapped_process
 
+    def _prefetch_query_embeddings(self, state: Dict[str, Any]) -> None:
+        """
+        실행될 검색 에이전트들의 검색 쿼리를 모아 한 번의 배치 호출로 임베딩합니다.
+        
+        임베딩은 백그라운드로 진행하며(오케스트레이터와 동시 실행), 검색 에이전트는
+        embed_search_query로 결과를 기다리거나 실패 시 개별 임베딩합니다.
+        """
+        key = state.get("query_embedding_key")
+        if not key:
+            return
+        try:
+            data_requirements = state.get("question_analysis", {}).get("data_requirements", {}) or {}
+            speculative_service = get_speculative_retrieval_service(state)
+            queries = []
+            for agent_name, requirement in QUERY_EMBEDDING_AGENTS.items():
+                agent = self.agents.get(agent_name)
+                if agent is None or not hasattr(agent, "get_search_queries"):
+                    continue
+                if not data_requirements.get(requirement, True):
+                    continue
+                # 예측 검색이 진행 중인 에이전트는 채택되지 않을 때만 요청 시점에 임베딩
+                if speculative_service is not None and speculative_service.pending(agent_name):
+                    continue
+                queries.extend(agent.get_search_queries(state))
+            if not queries:
+                return
+
+            service = create_query_embedding_service(
+                key,
+                user_id=state.get("user_context", {}).get("user_id"),
+            )
+            task = service.prefetch(queries)
+            if task is not None:
+                self._prefetch_tasks.add(task)
+                task.add_done_callback(self._prefetch_tasks.discard)
+        except Exception as e:
+            logger.warning(f"쿼리 임베딩 선계산 시작 실패: {str(e)}")
+
+    def _start_speculative_retrieval(self, state: Dict[str, Any]) -> None:
+        """
+        화면에서 종목이 지정된 질문이면 질문 분석을 기다리지 않고 검색 후보를 미리 가져옵니다.
+        
+        예측 검색은 백그라운드로 진행하며, ParallelSearchAgent가 최종 data_requirements에 따라
+        채택하거나 취소합니다.
+        """
+        key = state.get("speculative_retrieval_key")
+        if not key or not settings.STOCKEASY_SPECULATIVE_RETRIEVAL or not state.get("stock_code"):
+            return
+        try:
+            service = None
+            for agent_name in SPECULATIVE_RETRIEVAL_AGENTS:
+                agent = self.agents.get(agent_name)
+                if agent is None or not hasattr(agent, "get_speculative_search"):
+                    continue
+                params = agent.get_speculative_search(state)
+                if not params:
+                    continue
+                if service is None:
+                    service = create_speculative_retrieval_service(
+                        key, stock_code=state.get("stock_code"), query=state.get("query", "")
+                    )
+                service.start(agent_name, params, agent._retrieve_candidates)
+        except Exception as e:
+            logger.warning(f"예측 검색 시작 실패: {str(e)}")
+
     def _determine_next_agent(self, state: AgentState) -> str:
         """
         현재 상태를 기반으로 다음에 실행할 에이전트를 결정합니다.
@@ -551,6 +650,10 @@ class StockAnalysisGraph:
         Returns:
             처리 결과
         """
+        # 요청 단위 쿼리 임베딩 서비스 키 (질문 분석 후 생성, 요청 종료 시 해제)
+        query_embedding_key = str(uuid4())
+        # 요청 단위 예측 검색 서비스 키 (질문 분석 시작 시 생성, 요청 종료 시 해제)
+        speculative_retrieval_key = str(uuid4())
         try:
             if not self.graph:
                 raise ValueError("그래프가 초기화되지 않았습니다. register_agents 메서드를 먼저 호출하세요.")
@@ -563,6 +666,8 @@ class StockAnalysisGraph:
             initial_state: AgentState = {
                 "query": query,
                 "session_id": trace_id,
+                "query_embedding_key": query_embedding_key,
+                "speculative_retrieval_key": speculative_retrieval_key,
                 "stock_code": stock_code,
                 "stock_name": stock_name,
                 "errors": [],
@@ -653,6 +758,9 @@ class StockAnalysisGraph:
                 }],
                 "summary": "처리 중 오류가 발생했습니다."
             }
+        finally:
+            release_query_embedding_service(query_embedding_key)
+            release_speculative_retrieval_service(speculative_retrieval_key)
     
     def get_thread_ids(self) -> List[str]:
         """
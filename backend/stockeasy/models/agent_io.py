@@ -236,6 +236,9 @@ class AgentState(TypedDict, total=False):
     stock_code: str                 # 종목코드
     stock_name: str                 # 종목명
     session_id: str                 # 세션 ID
+    chat_session_id: str            # 채팅 세션 ID (대화 이력 키, 캐시 미스 시 채팅 메시지 DB에서 적재)
+    query_embedding_key: str        # 요청 단위 쿼리 임베딩 서비스 키
+    speculative_retrieval_key: str  # 요청 단위 예측 검색 서비스 키
     
     # 사용자 컨텍스트
     user_context: Dict[str, Any]    # 사용자 컨텍스트 정보
@@ -255,6 +258,7 @@ class AgentState(TypedDict, total=False):
     
     # 통합 및 요약
     integrated_knowledge: Optional[IntegratedKnowledge]  # 통합된 지식 베이스
+    integration_partials: Dict[str, str]  # 검색 에이전트별 압축본 (결과 도착 즉시 소형 모델로 압축, 지식 통합/요약에서 원문 대신 사용)
     summary: Optional[str]          # 생성된 요약
     formatted_response: Optional[str]  # 최종 응답
     answer: Optional[str]           # 최종 답변
@@ -0,0 +1,56 @@
+"""
+검색 결과 압축 프롬프트 템플릿
+
+이 모듈은 병렬 검색 중 도착한 검색 에이전트 결과를 지식 통합/요약 전에
+질문과 관련된 내용만 남도록 압축하는 프롬프트 템플릿을 정의합니다.
+"""
+
+from typing import Optional
+
+
+RESULT_CONDENSER_PROMPT = """
+당신은 금융 정보 압축 전문가입니다. 아래는 '{source_name}' 검색 결과입니다.
+사용자 질문에 답하는 데 필요한 내용만 남겨 {max_chars}자 이내로 압축하세요.
+
+사용자 질문: {query}
+종목명: {stock_name}
+
+압축 지침:
+1. 질문과 관련된 사실, 수치, 전망, 투자의견은 그대로 유지하세요. 수치는 바꾸거나 반올림하지 마세요.
+2. 출처, 작성일, 페이지 등 인용 정보가 있으면 해당 내용 옆에 그대로 남기세요.
+3. 질문과 관련 없는 내용, 반복되는 내용은 제거하세요.
+4. 원문에 없는 내용을 추가하거나 추론하지 마세요.
+5. 서론이나 설명 없이 압축한 내용만 출력하세요.
+
+검색 결과:
+{content}
+"""
+
+
+def format_result_condenser_prompt(
+    source_name: str,
+    query: str,
+    content: str,
+    max_chars: int,
+    stock_name: Optional[str] = None
+) -> str:
+    """
+    검색 결과 압축 프롬프트를 생성합니다.
+
+    Args:
+        source_name: 검색 소스 이름 (예: 기업 리포트)
+        query: 사용자 질문
+        content: 압축할 검색 결과 텍스트
+        max_chars: 압축 결과 최대 글자 수
+        stock_name: 종목명
+
+    Returns:
+        포맷팅된 프롬프트
+    """
+    return RESULT_CONDENSER_PROMPT.format(
+        source_name=source_name,
+        query=query,
+        stock_name=stock_name or "정보 없음",
+        max_chars=max_chars,
+        content=content
+    )
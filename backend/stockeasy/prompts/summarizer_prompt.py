@@ -306,9 +306,14 @@ def create_prompt(query: str, stock_code: Optional[str], stock_name: Optional[st
                 classification: Dict[str, Any], telegram_data: Dict[str, Any],
                 report_data: List[Dict[str, Any]], confidential_data: List[Dict[str, Any]],
                 financial_data: Dict[str, Any], industry_data: List[Dict[str, Any]], integrated_knowledge: Optional[Any],
-                system_prompt: Optional[str] = None) -> ChatPromptTemplate:
-        """요약을 위한 프롬프트 생성"""
-        
+                system_prompt: Optional[str] = None,
+                integration_partials: Optional[Dict[str, str]] = None) -> ChatPromptTemplate:
+        """요약을 위한 프롬프트 생성
+
+        integration_partials에 에이전트별 압축본(병렬 검색 중 결과 도착 즉시 압축)이 있으면
+        해당 소스는 원문 대신 압축본을 사용합니다.
+        """
+        partials = integration_partials or {}
         
 
         primary_intent = classification.get("primary_intent", "기타")
@@ -319,12 +324,16 @@ def create_prompt(query: str, stock_code: Optional[str], stock_name: Optional[st
         sources_info = ""
         
         # 텔레그램 메시지
-        if telegram_data:
+        if partials.get("telegram_retriever"):
+            sources_info += f"\n출처 - 내부DB :\n{partials['telegram_retriever']}\n\n"
+        elif telegram_data:
             formatted_msgs = format_telegram_messages(telegram_data)
             sources_info += f"\n출처 - 내부DB :\n{formatted_msgs}\n\n"
         
         # 기업 리포트
-        if report_data:
+        if partials.get("report_analyzer"):
+            sources_info += f"\n출처 - 기업 리포트:\n{partials['report_analyzer']}\n\n"
+        elif report_data:
             analysis = report_data.get("analysis", {})
             sources_info += "\n출처 - 기업 리포트:\n"
             if analysis:
@@ -344,7 +353,9 @@ def create_prompt(query: str, stock_code: Optional[str], stock_name: Optional[st
                     sources_info += f"[출처: {report_source}, {report_date}, {report_page}]\n{report_info}\n\n"
 
         # 산업 동향(일단 미구현. 산업리포트 에이전트 추가 후에 풀것)
-        if industry_data:
+        if partials.get("industry_analyzer"):
+            sources_info += f"\n출처 - 산업 동향:\n{partials['industry_analyzer']}\n\n"
+        elif industry_data:
             analysis = industry_data.get("analysis", {})
             sources_info += "\n출처 - 산업 동향:\n"
             if analysis:
@@ -363,7 +374,9 @@ def create_prompt(query: str, stock_code: Optional[str], stock_name: Optional[st
                 # sources_info += f"[출처: {industry_source}, {industry_date}]\n{industry_info}\n\n"   
 
          # 기업 리포트
-        if confidential_data:
+        if partials.get("confidential_analyzer"):
+            sources_info += f"\n출처 - 비공개자료:\n{partials['confidential_analyzer']}\n\n"
+        elif confidential_data:
             analysis = confidential_data.get("analysis", {})
             sources_info += "\n출처 - 비공개자료:\n"
             if analysis:
@@ -391,7 +404,9 @@ def create_prompt(query: str, stock_code: Optional[str], stock_name: Optional[st
             #         "years_covered": List[int]
             #     },
             #     "raw_financial_data": List[Dict]        
-        if financial_data:
+        if partials.get("financial_analyzer"):
+            sources_info += f"재무 정보:\n{partials['financial_analyzer']}\n\n"
+        elif financial_data:
             sources_info += "재무 정보:\n"
             llm_response = financial_data.get("llm_response", "")
             if llm_response:
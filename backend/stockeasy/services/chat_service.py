@@ -368,7 +368,8 @@ class ChatService:
         session_id: UUID,
         user_id: Optional[UUID] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        latest: bool = False
     ) -> List[Dict[str, Any]]:
         """특정 채팅 세션의 메시지 목록을 조회합니다.
         
@@ -378,6 +379,7 @@ class ChatService:
             user_id: 사용자 ID (권한 검증용, 선택)
             limit: 조회할 최대 메시지 수 (기본값: 100)
             offset: 조회 시작 위치 (기본값: 0)
+            latest: True이면 가장 최근 메시지 limit개를 조회 (반환 순서는 동일하게 시간 오름차순)
             
         Returns:
             List[Dict[str, Any]]: 채팅 메시지 목록
@@ -399,7 +401,7 @@ class ChatService:
             query = (
                 select(StockChatMessage)
                 .where(StockChatMessage.chat_session_id == session_id)
-                .order_by(StockChatMessage.created_at)
+                .order_by(StockChatMessage.created_at.desc() if latest else StockChatMessage.created_at)
                 .limit(limit)
                 .offset(offset)
             )
@@ -407,6 +409,9 @@ class ChatService:
             # 쿼리 실행
             result = await db.execute(query)
             messages = result.scalars().all()
+            if latest:
+                # 최근 메시지를 역순으로 가져왔으므로 시간 오름차순으로 되돌림
+                messages = list(reversed(messages))
             
             # 결과를 딕셔너리 리스트로 변환
             return [
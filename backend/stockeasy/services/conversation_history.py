@@ -0,0 +1,301 @@
+"""
+대화 이력 저장소 모듈
+
+SessionManagerAgent가 사용하는 세션별 대화 이력 저장소를 정의합니다.
+FastAPI 워커가 여러 개인 환경에서도 이력을 공유할 수 있도록 Redis 리스트(TTL 적용)를
+기본 저장소로 사용하고, Redis를 사용할 수 없는 경우 프로세스 내 LRU 저장소로 대체합니다.
+
+- RedisConversationHistoryStore: 세션별 Redis 리스트, 최대 턴 수 유지(LTRIM) + TTL 만료
+- LRUConversationHistoryStore: 최대 세션 수를 넘으면 가장 오래 사용되지 않은 세션부터 제거
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from common.core.config import settings
+from common.core.redis import async_redis_client
+
+
+class ConversationHistoryStore(ABC):
+    """
+    대화 이력 저장소 기본 클래스
+
+    저장소에 저장되는 한 턴은 다음 형식의 딕셔너리입니다.
+    {"timestamp": datetime, "query": str, "response": str, "stock_code": str, "stock_name": str}
+
+    get()은 캐시 미스와 빈 이력을 구분하기 위해 미스인 경우 None을 반환합니다.
+    """
+
+    def __init__(self, max_turns: int = 10, ttl: int = 86400):
+        """
+        Args:
+            max_turns: 세션별로 유지할 최대 대화 턴 수
+            ttl: 이력 만료 시간 (초)
+        """
+        self.max_turns = max_turns
+        self.ttl = ttl
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        """세션의 대화 이력 조회 (캐시 미스인 경우 None)"""
+
+    @abstractmethod
+    async def set(self, session_id: str, turns: List[Dict[str, Any]]) -> None:
+        """세션의 대화 이력을 통째로 교체 (최근 max_turns개만 저장)"""
+
+    @abstractmethod
+    async def append(self, session_id: str, turn: Dict[str, Any], create: bool = True) -> None:
+        """
+        세션의 대화 이력에 한 턴을 추가합니다.
+
+        Args:
+            session_id: 세션 ID
+            turn: 추가할 대화 턴
+            create: False이면 이미 캐시된 세션에만 추가 (미스인 세션은 다음 조회 시 DB에서 적재)
+        """
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None:
+        """세션의 대화 이력 삭제"""
+
+
+class LRUConversationHistoryStore(ConversationHistoryStore):
+    """
+    프로세스 내 LRU 대화 이력 저장소
+
+    Redis를 사용할 수 없을 때의 로컬 대체 저장소입니다.
+    세션 수가 max_sessions를 넘으면 가장 오래 사용되지 않은 세션부터 제거하므로
+    동시 세션이 많아져도 메모리 사용량이 일정하게 유지됩니다.
+    """
+
+    def __init__(self, max_turns: int = 10, ttl: int = 86400, max_sessions: int = 1000):
+        """
+        Args:
+            max_turns: 세션별로 유지할 최대 대화 턴 수
+            ttl: 이력 만료 시간 (초)
+            max_sessions: 유지할 최대 세션 수
+        """
+        super().__init__(max_turns=max_turns, ttl=ttl)
+        self.max_sessions = max_sessions
+        # session_id -> (만료 시각, 대화 턴 목록)
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _touch(self, session_id: str, turns: List[Dict[str, Any]]) -> None:
+        """세션을 가장 최근 사용으로 갱신하고 용량 초과분을 제거"""
+        self._sessions[session_id] = (time.monotonic() + self.ttl, turns[-self.max_turns:])
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            logger.debug(f"[LRUConversationHistoryStore] 세션 이력 제거: {evicted_id}")
+
+    async def get(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        expires_at, turns = entry
+        if expires_at < time.monotonic():
+            # 만료된 이력은 미스로 취급
+            del self._sessions[session_id]
+            return None
+        self._sessions.move_to_end(session_id)
+        return list(turns)
+
+    async def set(self, session_id: str, turns: List[Dict[str, Any]]) -> None:
+        self._touch(session_id, list(turns))
+
+    async def append(self, session_id: str, turn: Dict[str, Any], create: bool = True) -> None:
+        turns = await self.get(session_id)
+        if turns is None:
+            if not create:
+                return
+            turns = []
+        turns.append(turn)
+        self._touch(session_id, turns)
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisConversationHistoryStore(ConversationHistoryStore):
+    """
+    Redis 리스트 기반 대화 이력 저장소
+
+    세션별로 하나의 리스트 키를 사용하며, 추가 시 RPUSH + LTRIM + EXPIRE를
+    하나의 파이프라인으로 전송합니다. 모든 FastAPI 워커가 같은 이력을 공유합니다.
+    """
+
+    KEY_PREFIX = "stockeasy:conv_history:"
+
+    def __init__(self, redis: Redis, max_turns: int = 10, ttl: int = 86400):
+        """
+        Args:
+            redis: redis.asyncio 클라이언트 (decode_responses=True)
+            max_turns: 세션별로 유지할 최대 대화 턴 수
+            ttl: 이력 만료 시간 (초)
+        """
+        super().__init__(max_turns=max_turns, ttl=ttl)
+        self.redis = redis
+
+    def _make_key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    @staticmethod
+    def _dumps(turn: Dict[str, Any]) -> str:
+        # datetime 등은 문자열로 직렬화
+        return json.dumps(turn, ensure_ascii=False, default=lambda o: o.isoformat() if isinstance(o, datetime) else str(o))
+
+    @staticmethod
+    def _loads(raw: str) -> Dict[str, Any]:
+        turn = json.loads(raw)
+        # format_conversation_history 등에서 strftime을 사용하므로 datetime으로 복원
+        timestamp = turn.get("timestamp")
+        if isinstance(timestamp, str):
+            try:
+                turn["timestamp"] = datetime.fromisoformat(timestamp)
+            except ValueError:
+                pass
+        return turn
+
+    async def get(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        raw_turns = await self.redis.lrange(self._make_key(session_id), 0, -1)
+        if not raw_turns:
+            return None
+        return [self._loads(raw) for raw in raw_turns]
+
+    async def set(self, session_id: str, turns: List[Dict[str, Any]]) -> None:
+        key = self._make_key(session_id)
+        turns = turns[-self.max_turns:]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if turns:
+                pipe.rpush(key, *[self._dumps(turn) for turn in turns])
+                pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def append(self, session_id: str, turn: Dict[str, Any], create: bool = True) -> None:
+        key = self._make_key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if create:
+                pipe.rpush(key, self._dumps(turn))
+            else:
+                # 키가 있을 때만 추가 (RPUSHX)
+                pipe.rpushx(key, self._dumps(turn))
+            pipe.ltrim(key, -self.max_turns, -1)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def delete(self, session_id: str) -> None:
+        await self.redis.delete(self._make_key(session_id))
+
+
+class FallbackConversationHistoryStore(ConversationHistoryStore):
+    """
+    Redis 저장소를 우선 사용하고, Redis 오류 시 로컬 LRU 저장소로 대체하는 저장소
+
+    Redis 장애가 채팅 처리 실패로 이어지지 않도록 모든 Redis 오류를 로깅 후 흡수합니다.
+    """
+
+    def __init__(self, primary: ConversationHistoryStore, fallback: LRUConversationHistoryStore):
+        super().__init__(max_turns=primary.max_turns, ttl=primary.ttl)
+        self.primary = primary
+        self.fallback = fallback
+
+    async def get(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return await self.primary.get(session_id)
+        except Exception as e:
+            logger.warning(f"[ConversationHistory] Redis 조회 실패, 로컬 저장소 사용: {str(e)}")
+            return await self.fallback.get(session_id)
+
+    async def set(self, session_id: str, turns: List[Dict[str, Any]]) -> None:
+        try:
+            await self.primary.set(session_id, turns)
+        except Exception as e:
+            logger.warning(f"[ConversationHistory] Redis 저장 실패, 로컬 저장소 사용: {str(e)}")
+            await self.fallback.set(session_id, turns)
+
+    async def append(self, session_id: str, turn: Dict[str, Any], create: bool = True) -> None:
+        try:
+            await self.primary.append(session_id, turn, create=create)
+        except Exception as e:
+            logger.warning(f"[ConversationHistory] Redis 추가 실패, 로컬 저장소 사용: {str(e)}")
+            await self.fallback.append(session_id, turn, create=create)
+
+    async def delete(self, session_id: str) -> None:
+        # 두 저장소 모두에서 삭제
+        await self.fallback.delete(session_id)
+        try:
+            await self.primary.delete(session_id)
+        except Exception as e:
+            logger.warning(f"[ConversationHistory] Redis 삭제 실패: {str(e)}")
+
+
+def messages_to_turns(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    ChatService.get_chat_messages 결과를 대화 턴 목록으로 변환합니다.
+
+    user 메시지와 그 뒤에 오는 assistant 메시지를 하나의 턴으로 묶습니다.
+    응답이 아직 없는 user 메시지는 response를 빈 문자열로 둡니다.
+
+    Args:
+        messages: 생성 시간 순으로 정렬된 채팅 메시지 목록
+
+    Returns:
+        대화 턴 목록
+    """
+    turns: List[Dict[str, Any]] = []
+    for message in messages:
+        # 조회 실패 시 반환되는 오류 항목은 건너뜀
+        if not message.get("ok", True) or not message.get("role"):
+            continue
+        if message["role"] == "user":
+            created_at = message.get("created_at")
+            turns.append({
+                "timestamp": datetime.fromisoformat(created_at) if created_at else None,
+                "query": message.get("content", ""),
+                "response": "",
+                "stock_code": message.get("stock_code"),
+                "stock_name": message.get("stock_name"),
+            })
+        elif message["role"] == "assistant" and turns and not turns[-1]["response"]:
+            turns[-1]["response"] = message.get("content", "")
+    return turns
+
+
+_conversation_history_store: Optional[ConversationHistoryStore] = None
+
+
+def get_conversation_history_store() -> ConversationHistoryStore:
+    """
+    프로세스 단위로 공유되는 대화 이력 저장소를 반환합니다.
+
+    CONVERSATION_HISTORY_BACKEND 설정이 "redis"이면 Redis 저장소(오류 시 LRU 대체)를,
+    "memory"이면 로컬 LRU 저장소만 사용합니다.
+    """
+    global _conversation_history_store
+    if _conversation_history_store is None:
+        local_store = LRUConversationHistoryStore(
+            max_turns=settings.CONVERSATION_HISTORY_MAX_TURNS,
+            ttl=settings.CONVERSATION_HISTORY_TTL,
+            max_sessions=settings.CONVERSATION_HISTORY_MAX_SESSIONS,
+        )
+        if settings.CONVERSATION_HISTORY_BACKEND == "redis":
+            _conversation_history_store = FallbackConversationHistoryStore(
+                primary=RedisConversationHistoryStore(
+                    async_redis_client.get_client(),
+                    max_turns=settings.CONVERSATION_HISTORY_MAX_TURNS,
+                    ttl=settings.CONVERSATION_HISTORY_TTL,
+                ),
+                fallback=local_store,
+            )
+        else:
+            _conversation_history_store = local_store
+        logger.info(f"[ConversationHistory] 대화 이력 저장소 초기화: {settings.CONVERSATION_HISTORY_BACKEND}")
+    return _conversation_history_store
@@ -15,6 +15,7 @@ from pathlib import Path
 import pandas as pd
 
 from common.core.config import settings
+from stockeasy.services.financial.stock_search_index import StockSearchIndex
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class StockInfoService:
     _stock_info_cache = None  # 메모리 캐시
     _last_update_date = None  # 마지막 업데이트 날짜
     _update_task = None  # 자동 업데이트 태스크
+    _search_index = None  # 종목 검색 인덱스 (_stock_info_cache로 생성)
     
     def __new__(cls):
         if cls._instance is None:
@@ -62,6 +64,7 @@ class StockInfoService:
                     logger.info("초기 주식 정보 캐시 파일 생성 완료")
             
             self._last_update_date = datetime.now().date()
+            self._search_index = await asyncio.to_thread(self._build_search_index, self._stock_info_cache)
             
         except Exception as e:
             logger.error(f"초기 주식 정보 로드 실패: {str(e)}")
@@ -95,14 +98,24 @@ class StockInfoService:
                 # 7:30이 되면 데이터 갱신
                 logger.info("예정된 시각에 주식 정보 업데이트 시작")
                 stock_info = await self._fetch_stock_info_from_krx()
+                if not stock_info.get("by_code"):
+                    logger.warning("KRX 종목 정보가 비어 있어 기존 데이터를 유지합니다")
+                    continue
+                changed = stock_info != self._stock_info_cache
+                
+                # 검색 인덱스를 먼저 만든 뒤 데이터와 인덱스를 함께 교체 (조회 중인 요청은 이전 데이터를 그대로 사용)
+                search_index = await asyncio.to_thread(self._build_search_index, stock_info)
                 self._stock_info_cache = stock_info
+                self._search_index = search_index
                 self._last_update_date = datetime.now().date()
                 
-                # 파일 캐시 업데이트
+                # 파일 캐시 업데이트 (종목 목록이 바뀐 경우에만)
+                if not changed:
+                    logger.info("종목 목록 변경 없음, 캐시 파일 저장 생략")
+                    continue
                 try:
-                    with open(self.stock_info_path, 'w', encoding='utf-8') as f:
-                        json.dump(stock_info, f, ensure_ascii=False, indent=2)
-                        logger.info("주식 정보 캐시 파일 업데이트 완료")
+                    await asyncio.to_thread(self._write_stock_info_file, stock_info)
+                    logger.info("주식 정보 캐시 파일 업데이트 완료")
                 except Exception as e:
                     logger.warning(f"주식 정보 캐시 파일 저장 실패: {str(e)}")
                     
@@ -169,12 +182,8 @@ class StockInfoService:
         if stock_name in name_map:
             return name_map.get(stock_name)
             
-        # 부분 일치 검색
-        for name, info in name_map.items():
-            if stock_name in name:
-                return info
-                
-        return None
+        # 부분 일치 검색 (검색 인덱스에서 가장 순위가 높은 종목)
+        return self._get_search_index().find_by_name(stock_name)
         
     async def search_stocks(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -187,29 +196,44 @@ class StockInfoService:
         Returns:
             검색 결과 목록
         """
-        stock_info = await self._load_stock_info()
-        if not stock_info:
-            return []
-            
-        results = []
-        name_map = stock_info.get("by_name", {})
-        
-        # 종목코드 검색
-        if query.isdigit():
-            code_map = stock_info.get("by_code", {})
-            if query in code_map:
-                results.append(code_map[query])
-                
-        # 종목명 검색 (부분 일치)
-        for name, info in name_map.items():
-            if query.lower() in name.lower():
-                if info not in results:  # 중복 방지
-                    results.append(info)
-                    
-            if len(results) >= limit:
-                break
-                
+        results = self._get_search_index().search(query, limit=limit, fuzzy=False)
+        for result in results:
+            result.pop("match_type", None)
         return results
+
+    async def autocomplete(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        종목 자동완성 검색 (종목명/초성/종목코드 접두, 오타 허용)
+        
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            
+        Returns:
+            순위순 검색 결과 목록 (각 결과에 match_type 포함)
+        """
+        return self._get_search_index().search(query, limit=limit, fuzzy=True)
+
+    def _get_search_index(self) -> StockSearchIndex:
+        """현재 종목 정보로 만든 검색 인덱스 반환 (종목 정보가 교체되었으면 다시 생성)"""
+        stock_info = self._stock_info_cache or {"by_code": {}, "by_name": {}}
+        search_index = self._search_index
+        if search_index is None or search_index.source is not stock_info:
+            search_index = self._build_search_index(stock_info)
+            self._search_index = search_index
+        return search_index
+
+    @staticmethod
+    def _build_search_index(stock_info: Dict[str, Any]) -> StockSearchIndex:
+        """종목 정보로 검색 인덱스 생성"""
+        return StockSearchIndex(stock_info.get("by_code", {}).values(), source=stock_info)
+
+    def _write_stock_info_file(self, stock_info: Dict[str, Any]) -> None:
+        """종목 정보 캐시 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = self.stock_info_path.with_suffix(".json.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(stock_info, f, ensure_ascii=False)
+        os.replace(temp_path, self.stock_info_path)
         
     async def _load_stock_info(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,248 @@
+"""
+종목 검색 인덱스 모듈
+
+종목명/종목코드 자동완성을 위해 상장 종목 목록으로 미리 만들어 두는 메모리 검색 인덱스입니다.
+
+- 종목명: 정규화(소문자, 공백/특수문자 제거)한 이름의 글자 1~2-gram 역색인
+- 초성: 이름의 초성 문자열 2-gram 역색인 ("ㅅㅅㅈㅈ", "삼성ㅈ"처럼 초성이 섞인 검색어 지원)
+- 오타 허용: 자모 분해 문자열의 2-gram 역색인과 Dice 유사도
+- 순위: 정확 일치 > 접두 일치 > 초성 접두 일치 > 부분 일치 > 초성 부분 일치 > 유사 일치
+  (같은 단계에서는 일치 위치가 앞설수록, 이름이 짧을수록 우선)
+
+인덱스는 생성 후 변경하지 않으므로, 갱신 시에는 새 인덱스를 만들어 참조만 교체합니다.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+CHOSEONG_SET = set(CHOSEONG)
+
+# 매칭 단계 (작을수록 우선)
+MATCH_EXACT = 0
+MATCH_PREFIX = 1
+MATCH_CHOSEONG_PREFIX = 2
+MATCH_SUBSTRING = 3
+MATCH_CHOSEONG_SUBSTRING = 4
+MATCH_FUZZY = 5
+MATCH_TYPES = {
+    MATCH_EXACT: "exact",
+    MATCH_PREFIX: "prefix",
+    MATCH_CHOSEONG_PREFIX: "choseong_prefix",
+    MATCH_SUBSTRING: "substring",
+    MATCH_CHOSEONG_SUBSTRING: "choseong_substring",
+    MATCH_FUZZY: "fuzzy",
+}
+
+_NORMALIZE_PATTERN = re.compile(r"[^0-9a-z가-힣ㄱ-ㅣ]")
+
+
+def normalize(text: str) -> str:
+    """소문자 변환 후 공백/특수문자 제거"""
+    return _NORMALIZE_PATTERN.sub("", text.lower())
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            result.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (그 외 문자는 그대로)"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _grams(text: str) -> Set[str]:
+    """1-gram과 2-gram 집합"""
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _query_grams(text: str) -> Set[str]:
+    """검색어 후보 조회용 gram (2글자 이상이면 2-gram만 사용)"""
+    if len(text) < 2:
+        return set(text)
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)} or {text}
+
+
+class StockSearchIndex:
+    """종목명/종목코드 자동완성 검색 인덱스 (생성 후 읽기 전용)"""
+
+    def __init__(self, stocks: Iterable[Dict[str, Any]], source: Any = None):
+        """
+        Args:
+            stocks: {"code", "name", "sector"} 종목 정보 목록
+            source: 인덱스를 만든 원본 데이터 (원본이 교체되었는지 확인하는 용도)
+        """
+        self.source = source
+        self.stocks: List[Dict[str, Any]] = []
+        self._names: List[str] = []
+        self._choseongs: List[str] = []
+        self._jamo_bigrams: List[Set[str]] = []
+        self._name_index: Dict[str, Set[int]] = {}
+        self._choseong_index: Dict[str, Set[int]] = {}
+        self._jamo_index: Dict[str, Set[int]] = {}
+        self._code_index: Dict[str, int] = {}
+
+        for stock in stocks:
+            name = normalize(str(stock.get("name") or ""))
+            if not name:
+                continue
+            doc_id = len(self.stocks)
+            self.stocks.append(stock)
+            self._names.append(name)
+            choseong = to_choseong(name)
+            self._choseongs.append(choseong)
+            jamo_bigrams = _bigrams(to_jamo(name))
+            self._jamo_bigrams.append(jamo_bigrams)
+            self._code_index[str(stock.get("code") or "").lower()] = doc_id
+            for gram in _grams(name):
+                self._name_index.setdefault(gram, set()).add(doc_id)
+            for gram in _grams(choseong):
+                self._choseong_index.setdefault(gram, set()).add(doc_id)
+            for gram in jamo_bigrams:
+                self._jamo_index.setdefault(gram, set()).add(doc_id)
+
+        # 종목코드 접두 검색용 정렬 목록
+        self._sorted_codes: List[str] = sorted(self._code_index)
+
+    def __len__(self) -> int:
+        return len(self.stocks)
+
+    @staticmethod
+    def _candidates(index: Dict[str, Set[int]], grams: Set[str]) -> Set[int]:
+        """모든 gram을 포함하는 후보 문서 (게시 목록이 짧은 순서로 교집합)"""
+        postings = sorted((index.get(gram, set()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _find_choseong(name: str, choseong: str, query: str) -> int:
+        """초성이 섞인 검색어의 일치 위치 (초성 자리는 초성, 음절 자리는 음절이 같아야 일치, 없으면 -1)"""
+        query_choseong = to_choseong(query)
+        start = choseong.find(query_choseong)
+        while start != -1:
+            if all(q in CHOSEONG_SET or q == name[start + i] for i, q in enumerate(query)):
+                return start
+            start = choseong.find(query_choseong, start + 1)
+        return -1
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True, min_similarity: float = 0.5) -> List[Dict[str, Any]]:
+        """
+        종목명/종목코드 검색
+
+        Args:
+            query: 검색어 (종목명, 초성, 종목코드 일부)
+            limit: 최대 결과 수
+            fuzzy: 일치 결과가 limit보다 적을 때 오타 허용 검색 수행 여부
+            min_similarity: 오타 허용 검색의 최소 자모 2-gram Dice 유사도
+
+        Returns:
+            종목 정보에 match_type이 추가된 검색 결과 목록 (순위순)
+        """
+        return [
+            {**self.stocks[doc_id], "match_type": MATCH_TYPES[match]}
+            for doc_id, match in self._rank(query, limit, fuzzy, min_similarity)
+        ]
+
+    def find_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """종목명 부분 일치 검색의 최상위 종목 정보 (오타 허용 없음)"""
+        ranked = self._rank(name, 1, fuzzy=False)
+        return self.stocks[ranked[0][0]] if ranked else None
+
+    def _rank(self, query: str, limit: int, fuzzy: bool = True, min_similarity: float = 0.5) -> List[Tuple[int, int]]:
+        """검색어와 일치하는 (문서 번호, 매칭 단계) 목록을 순위순으로 반환"""
+        normalized = normalize(query)
+        if not normalized or limit <= 0:
+            return []
+
+        ranked: Dict[int, Tuple[int, int]] = {}
+
+        def add(doc_id: int, match: int, position: int) -> None:
+            if doc_id not in ranked or (match, position) < ranked[doc_id]:
+                ranked[doc_id] = (match, position)
+
+        # 종목코드 접두 일치
+        if normalized.isalnum() and normalized.isascii():
+            for position in range(bisect_left(self._sorted_codes, normalized), len(self._sorted_codes)):
+                code = self._sorted_codes[position]
+                if not code.startswith(normalized):
+                    break
+                add(self._code_index[code], MATCH_EXACT if code == normalized else MATCH_PREFIX, 0)
+
+        # 종목명 정확/접두/부분 일치
+        for doc_id in self._candidates(self._name_index, _query_grams(normalized)):
+            position = self._names[doc_id].find(normalized)
+            if position == -1:
+                continue
+            if self._names[doc_id] == normalized:
+                add(doc_id, MATCH_EXACT, 0)
+            else:
+                add(doc_id, MATCH_PREFIX if position == 0 else MATCH_SUBSTRING, position)
+
+        # 초성 일치 (검색어에 초성이 있을 때만)
+        if any(char in CHOSEONG_SET for char in normalized):
+            for doc_id in self._candidates(self._choseong_index, _query_grams(to_choseong(normalized))):
+                position = self._find_choseong(self._names[doc_id], self._choseongs[doc_id], normalized)
+                if position != -1:
+                    add(doc_id, MATCH_CHOSEONG_PREFIX if position == 0 else MATCH_CHOSEONG_SUBSTRING, position)
+
+        # 오타 허용 (자모 2-gram Dice 유사도)
+        similarities: Dict[int, float] = {}
+        if fuzzy and len(ranked) < limit:
+            query_bigrams = _bigrams(to_jamo(normalized))
+            overlaps: Dict[int, int] = {}
+            for gram in query_bigrams:
+                for doc_id in self._jamo_index.get(gram, ()):
+                    overlaps[doc_id] = overlaps.get(doc_id, 0) + 1
+            for doc_id, overlap in overlaps.items():
+                if doc_id in ranked:
+                    continue
+                similarity = 2 * overlap / (len(query_bigrams) + len(self._jamo_bigrams[doc_id]))
+                if similarity >= min_similarity:
+                    similarities[doc_id] = similarity
+                    ranked[doc_id] = (MATCH_FUZZY, 0)
+
+        ordered = sorted(
+            ranked,
+            key=lambda doc_id: (
+                ranked[doc_id][0],
+                -similarities.get(doc_id, 0.0),
+                ranked[doc_id][1],
+                len(self._names[doc_id]),
+                self._names[doc_id],
+            )
+        )
+        return [(doc_id, ranked[doc_id][0]) for doc_id in ordered[:limit]]
@@ -0,0 +1,166 @@
+"""
+요청 단위 쿼리 임베딩 서비스 모듈
+
+한 번의 StockAnalysisGraph 실행에서 여러 검색 에이전트(텔레그램, 기업리포트, 비공개자료, 산업)가
+같은 사용자 질문으로 만든 검색 쿼리를 각자 임베딩하지 않도록, 질문 분석 직후 모든 에이전트의
+검색 쿼리를 한 번의 배치 호출로 임베딩해 두고 에이전트에 미리 계산된 벡터를 전달합니다.
+
+- 서비스 객체는 상태(state)에 직접 넣지 않고(체크포인트 직렬화 대상), 요청별 키(query_embedding_key)로
+  프로세스 내 레지스트리에 등록합니다.
+- 미리 임베딩하지 않은 쿼리나 배치 호출이 실패한 쿼리는 요청 시점에 개별 임베딩합니다.
+- 같은 쿼리는 요청 안에서 한 번만 임베딩합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from loguru import logger
+
+from common.models.token_usage import ProjectType
+from common.services.embedding import EmbeddingService
+from common.services.embedding_models import EmbeddingModelType
+
+# 해제되지 않은 서비스를 정리하는 기준 시간 (초)
+SERVICE_MAX_AGE = 600
+
+
+class QueryEmbeddingService:
+    """요청 단위 쿼리 임베딩 캐시 (배치 선계산 + 요청 시점 임베딩)"""
+
+    def __init__(
+        self,
+        embedding_model_type: EmbeddingModelType = EmbeddingModelType.OPENAI_3_LARGE,
+        user_id: Optional[Any] = None,
+        project_type: Optional[ProjectType] = ProjectType.STOCKEASY,
+        provider: Optional[Any] = None
+    ):
+        """
+        Args:
+            embedding_model_type: 임베딩 모델 (검색 대상 인덱스와 같은 모델)
+            user_id: 토큰 사용량 기록용 사용자 ID
+            project_type: 토큰 사용량 기록용 프로젝트 타입
+            provider: 임베딩 제공자 (None이면 embedding_model_type으로 생성)
+        """
+        if isinstance(user_id, str):
+            try:
+                user_id = UUID(user_id)
+            except ValueError:
+                user_id = None
+        self.embedding_model_type = embedding_model_type
+        self.user_id = user_id
+        self.project_type = project_type
+        self._provider = provider
+        self._embeddings: Dict[str, "asyncio.Future[List[float]]"] = {}
+        self.created_at = time.monotonic()
+        self.stats = {"prefetched": 0, "batch_calls": 0, "hits": 0, "on_demand": 0, "errors": 0}
+
+    @property
+    def provider(self):
+        if self._provider is None:
+            self._provider = EmbeddingService(self.embedding_model_type).provider
+        return self._provider
+
+    async def _create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        embeddings = await self.provider.create_embeddings_async(
+            texts=texts, user_id=self.user_id, project_type=self.project_type
+        )
+        if not embeddings or len(embeddings) != len(texts):
+            raise ValueError(f"임베딩 결과 수 불일치: {len(embeddings) if embeddings else 0}/{len(texts)}")
+        return embeddings
+
+    def prefetch(self, queries: Sequence[str]) -> Optional["asyncio.Task[None]"]:
+        """
+        아직 임베딩하지 않은 쿼리를 한 번의 배치 호출로 임베딩하는 백그라운드 태스크 시작
+
+        쿼리는 호출 즉시 등록되므로, 배치가 끝나기 전에 embed()를 호출해도 같은 배치 결과를 기다립니다.
+        """
+        texts = list(dict.fromkeys(query for query in queries if query and query not in self._embeddings))
+        if not texts:
+            return None
+        loop = asyncio.get_running_loop()
+        futures = {text: loop.create_future() for text in texts}
+        self._embeddings.update(futures)
+        return asyncio.create_task(self._prefetch_batch(texts, futures))
+
+    async def _prefetch_batch(self, texts: List[str], futures: Dict[str, "asyncio.Future[List[float]]"]) -> None:
+        self.stats["batch_calls"] += 1
+        try:
+            embeddings = await self._create_embeddings(texts)
+        except Exception as e:
+            # 실패한 쿼리는 요청 시점 임베딩으로 대체
+            self.stats["errors"] += 1
+            logger.warning(f"[QueryEmbedding] 배치 임베딩 실패 ({len(texts)}개): {str(e)}")
+            for text, future in futures.items():
+                self._embeddings.pop(text, None)
+                future.set_result(None)
+            return
+        for text, embedding in zip(texts, embeddings):
+            futures[text].set_result(embedding)
+        self.stats["prefetched"] += len(texts)
+        logger.info(f"[QueryEmbedding] 검색 쿼리 {len(texts)}개 배치 임베딩 완료")
+
+    async def embed(self, query: str) -> List[float]:
+        """쿼리 임베딩 반환 (미리 계산된 벡터가 있으면 사용, 없으면 임베딩 후 저장)"""
+        future = self._embeddings.get(query)
+        if future is not None:
+            embedding = await asyncio.shield(future)
+            if embedding is not None:
+                self.stats["hits"] += 1
+                return embedding
+
+        self.stats["on_demand"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._embeddings[query] = future
+        try:
+            embedding = (await self._create_embeddings([query]))[0]
+        except BaseException:
+            self._embeddings.pop(query, None)
+            future.set_result(None)
+            raise
+        future.set_result(embedding)
+        return embedding
+
+
+_services: Dict[str, QueryEmbeddingService] = {}
+
+
+def create_query_embedding_service(key: str, **kwargs) -> QueryEmbeddingService:
+    """요청 키로 쿼리 임베딩 서비스를 생성해 등록 (오래된 미해제 서비스는 정리)"""
+    now = time.monotonic()
+    for stale_key in [k for k, service in _services.items() if now - service.created_at > SERVICE_MAX_AGE]:
+        _services.pop(stale_key, None)
+    service = QueryEmbeddingService(**kwargs)
+    _services[key] = service
+    return service
+
+
+def get_query_embedding_service(state: Dict[str, Any]) -> Optional[QueryEmbeddingService]:
+    """상태의 query_embedding_key로 등록된 서비스 반환 (없으면 None)"""
+    key = state.get("query_embedding_key")
+    return _services.get(key) if key else None
+
+
+def release_query_embedding_service(key: Optional[str]) -> None:
+    """요청 처리 완료 후 서비스 해제"""
+    service = _services.pop(key, None) if key else None
+    if service is not None:
+        logger.info(f"[QueryEmbedding] 요청 종료 - 통계: {service.stats}")
+
+
+async def embed_search_query(state: Dict[str, Any], query: str) -> Optional[List[float]]:
+    """
+    검색 에이전트용 쿼리 임베딩 조회
+
+    요청 단위 서비스가 없거나 임베딩에 실패하면 None을 반환하며,
+    이 경우 에이전트는 기존처럼 VectorStoreManager에서 쿼리를 임베딩합니다.
+    """
+    service = get_query_embedding_service(state)
+    if service is None:
+        return None
+    try:
+        return await service.embed(query)
+    except Exception as e:
+        logger.warning(f"[QueryEmbedding] 쿼리 임베딩 실패, 개별 검색 임베딩으로 대체: {str(e)}")
+        return None
@@ -101,7 +101,7 @@ class StockeasyRAGService:
             logger.error("stock_code 또는 stock_name이 없습니다.")
             return ""
         
-        vs_manager = VectorStoreManager(
+        vs_manager = await VectorStoreManager.create_async(
             EmbeddingModelType.OPENAI_3_LARGE,   
             project_name="stockeasy",
             namespace=settings.PINECONE_NAMESPACE_STOCKEASY,
@@ -115,7 +115,8 @@ class StockRAGService:
                            stock_name: Optional[str] = None,
                            session_id: Optional[str] = None,
                            user_id: Optional[str] = None,
-                           classification: Optional[QuestionClassification] = None) -> Dict[str, Any]:
+                           classification: Optional[QuestionClassification] = None,
+                           chat_session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         주식 관련 쿼리 분석 및 응답 생성
         
@@ -126,6 +127,7 @@ class StockRAGService:
             session_id: 세션 ID (사용자 인증용)
             user_id: 사용자 ID (선택적)
             classification: 질문 분류 결과 (선택적)
+            chat_session_id: 채팅 세션 ID (대화 이력 조회용, 선택적)
             
         Returns:
             분석 결과 (요약, 검색된 메시지, 분류 정보 등)
@@ -170,6 +172,10 @@ class StockRAGService:
             if classification:
                 initial_state["question_classification"] = classification.model_dump()
             
+            # 채팅 세션 ID가 있으면 세션 관리자가 해당 채팅의 대화 이력을 사용
+            if chat_session_id:
+                initial_state["chat_session_id"] = chat_session_id
+            
             logger.info(f"[analyze_stock] initial_state: {initial_state}")
             result = await self.graph.process_query(**initial_state)
             
@@ -0,0 +1,100 @@
+"""
+검색 에이전트 결과 압축 서비스 모듈
+
+병렬 검색 중 검색 에이전트의 결과가 도착하면 바로 소형 모델(result_condenser_agent)로
+질문과 관련된 내용만 남긴 압축본을 만듭니다. 압축은 나머지 에이전트를 기다리는 동안 진행되고,
+지식 통합(KnowledgeIntegratorAgent)과 요약(SummarizerAgent)은 원문 대신 압축본(integration_partials)을 사용합니다.
+
+- STOCKEASY_CONDENSE_MIN_CHARS보다 짧은 결과는 압축하지 않음 (원문 사용)
+- 호출 시간은 STOCKEASY_CONDENSE_TIMEOUT, 출력 길이는 모델 설정(max_tokens)과 원문 길이로 제한
+- 실패, 시간 초과, 원문보다 길어진 응답은 버리고 원문 사용
+- 요청당 동시 호출 수는 호출 측(ParallelSearchAgent)에서 STOCKEASY_CONDENSE_MAX_CONCURRENCY로 제한
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.core.config import settings
+from common.models.token_usage import ProjectType
+from common.services.agent_llm import AgentLLM, get_agent_llm
+from stockeasy.prompts.result_condenser_prompts import format_result_condenser_prompt
+
+# 에이전트별 소스 이름 (압축 프롬프트용)
+SOURCE_NAMES = {
+    "telegram_retriever": "내부DB",
+    "report_analyzer": "기업 리포트",
+    "financial_analyzer": "재무 정보",
+    "industry_analyzer": "산업 동향",
+    "confidential_analyzer": "비공개자료",
+}
+
+
+class ResultCondenser:
+    """검색 에이전트 결과를 소형 모델로 압축하는 서비스"""
+
+    def __init__(self, agent_llm: Optional[AgentLLM] = None, db: Optional[AsyncSession] = None):
+        """
+        Args:
+            agent_llm: 압축에 사용할 LLM (None이면 result_condenser_agent 설정 사용)
+            db: 토큰 사용량 기록용 데이터베이스 세션
+        """
+        self.agent_llm = agent_llm or get_agent_llm("result_condenser_agent")
+        self.db = db
+
+    async def condense(
+        self,
+        agent_name: str,
+        text: str,
+        query: str,
+        stock_name: Optional[str] = None,
+        user_id: Optional[Any] = None
+    ) -> Optional[str]:
+        """
+        검색 결과 텍스트를 질문 기준으로 압축합니다.
+
+        Args:
+            agent_name: 검색 에이전트 이름
+            text: 지식 통합 프롬프트용으로 정리된 결과 텍스트
+            query: 사용자 질문
+            stock_name: 종목명
+            user_id: 토큰 사용량 기록용 사용자 ID
+
+        Returns:
+            압축된 텍스트 (압축하지 않았거나 실패하면 None)
+        """
+        if not text or len(text) < settings.STOCKEASY_CONDENSE_MIN_CHARS:
+            return None
+
+        prompt = format_result_condenser_prompt(
+            source_name=SOURCE_NAMES.get(agent_name, agent_name),
+            query=query,
+            content=text,
+            max_chars=max(len(text) // 3, settings.STOCKEASY_CONDENSE_MIN_CHARS // 2),
+            stock_name=stock_name
+        )
+        try:
+            response = await asyncio.wait_for(
+                self.agent_llm.ainvoke_with_fallback(
+                    prompt,
+                    user_id=user_id,
+                    project_type=ProjectType.STOCKEASY,
+                    db=self.db
+                ),
+                timeout=settings.STOCKEASY_CONDENSE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"[ResultCondenser] {agent_name} 결과 압축 시간 초과 ({settings.STOCKEASY_CONDENSE_TIMEOUT}초), 원문 사용")
+            return None
+        except Exception as e:
+            logger.warning(f"[ResultCondenser] {agent_name} 결과 압축 실패, 원문 사용: {str(e)}")
+            return None
+
+        condensed = (response.content if hasattr(response, "content") else str(response)).strip()
+        if not condensed or len(condensed) >= len(text):
+            logger.warning(f"[ResultCondenser] {agent_name} 압축 결과가 비었거나 원문보다 길어 원문 사용")
+            return None
+        logger.info(f"[ResultCondenser] {agent_name} 결과 압축: {len(text)}자 -> {len(condensed)}자")
+        return condensed
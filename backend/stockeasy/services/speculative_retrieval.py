@@ -0,0 +1,219 @@
+"""
+요청 단위 예측 검색(speculative retrieval) 서비스 모듈
+
+그래프는 session_manager → question_analyzer → orchestrator → parallel_search 순서로 실행되어
+두 번의 LLM 호출이 끝나야 검색이 시작됩니다. 화면에서 종목(stock_code)을 지정한 질문은
+텔레그램/기업리포트 검색이 대부분 필요하므로, 질문 분석과 동시에 종목코드와 원본 질문으로
+검색 후보를 미리 가져옵니다.
+
+- 예측 검색은 가장 낮은 유사도 임계값과 가장 큰 검색 수로 후보를 가져오고, 에이전트는 최종 분류에 따른
+  임계값/검색 수로 후보를 걸러 사용합니다. (리랭킹과 요약은 최종 검색 쿼리로 수행)
+- ParallelSearchAgent가 최종 data_requirements에 따라 실행할 에이전트의 예측 검색만 남기고 나머지는 취소합니다.
+- 에이전트는 종목코드/메타데이터 필터가 예측 검색과 같을 때만 결과를 채택하고, 다르면 버린 뒤 기존처럼 검색합니다.
+- 최종 검색 쿼리가 예측 검색 쿼리와 다르면 query_drift로 집계하고 로그를 남깁니다.
+  (STOCKEASY_SPECULATIVE_STRICT_QUERY이면 조건 불일치로 보고 폐기)
+- 기본값은 비활성이며 STOCKEASY_SPECULATIVE_RETRIEVAL로 켭니다.
+- 서비스 객체는 상태에 넣지 않고 요청별 키(speculative_retrieval_key)로 프로세스 내 레지스트리에 등록합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from loguru import logger
+
+from common.core.config import settings
+from common.services.retrievers.models import RetrievalResult
+
+# 해제되지 않은 서비스를 정리하는 기준 시간 (초)
+SERVICE_MAX_AGE = 600
+
+# 전체 요청 누적 통계 (채택률/절감 시간 모니터링용)
+_totals: Dict[str, float] = {
+    "requests": 0, "started": 0, "adopted": 0, "discarded": 0, "mismatched": 0, "query_drift": 0, "failed": 0,
+    "latency_saved": 0.0
+}
+
+
+class SpeculativeSearch:
+    """에이전트 하나의 예측 검색 (매개변수, 백그라운드 태스크, 시작/완료 시각)"""
+
+    def __init__(self, agent_name: str, params: Dict[str, Any], task: "asyncio.Task[RetrievalResult]"):
+        self.agent_name = agent_name
+        self.params = params
+        # 예측 검색 쿼리 (검색 함수마다 인자 이름이 다름: 리포트 query, 텔레그램 search_query)
+        self.query: Optional[str] = params.get("query", params.get("search_query"))
+        self.task = task
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: "asyncio.Task[RetrievalResult]") -> None:
+        self.finished_at = time.monotonic()
+        # 채택되지 않은 태스크의 예외가 "never retrieved"로 로깅되지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+
+class SpeculativeRetrievalService:
+    """요청 단위 예측 검색 관리 (시작, 채택/폐기, 통계)"""
+
+    def __init__(self, stock_code: str, query: str):
+        """
+        Args:
+            stock_code: 예측 검색 기준 종목코드 (화면에서 지정한 종목)
+            query: 예측 검색 기준 원본 질문
+        """
+        self.stock_code = stock_code
+        self.query = query
+        self._searches: Dict[str, SpeculativeSearch] = {}
+        self.created_at = time.monotonic()
+        self.stats = {
+            "started": 0, "adopted": 0, "discarded": 0, "mismatched": 0, "query_drift": 0, "failed": 0, "latency_saved": 0.0
+        }
+
+    def start(self, agent_name: str, params: Dict[str, Any],
+              retrieve: Callable[..., Awaitable[RetrievalResult]]) -> "asyncio.Task[RetrievalResult]":
+        """retrieve(**params)를 백그라운드로 실행하는 예측 검색 시작"""
+        self._discard(agent_name)
+        search = SpeculativeSearch(agent_name, params, asyncio.create_task(retrieve(**params)))
+        self._searches[agent_name] = search
+        self.stats["started"] += 1
+        return search.task
+
+    def pending(self, agent_name: str) -> bool:
+        """채택/폐기되지 않은 예측 검색이 있는지 여부"""
+        return agent_name in self._searches
+
+    def resolve(self, agent_names: Iterable[str]) -> None:
+        """실행이 확정된 에이전트의 예측 검색만 남기고 나머지는 취소"""
+        keep = set(agent_names)
+        for agent_name in [name for name in self._searches if name not in keep]:
+            self._discard(agent_name)
+
+    async def take(self, agent_name: str, stock_code: Optional[str],
+                   filters: Optional[Dict[str, Any]] = None,
+                   query: Optional[str] = None) -> Optional[RetrievalResult]:
+        """
+        에이전트의 예측 검색 결과 채택
+
+        종목코드나 메타데이터 필터가 예측 검색과 다르거나 검색이 실패하면 None을 반환하며,
+        이 경우 에이전트는 기존처럼 직접 검색합니다.
+        최종 검색 쿼리(query)가 예측 검색 쿼리와 다르면 query_drift로 집계하고,
+        STOCKEASY_SPECULATIVE_STRICT_QUERY이면 조건 불일치로 폐기합니다.
+        """
+        search = self._searches.pop(agent_name, None)
+        if search is None:
+            return None
+        query_drift = query is not None and query != search.query
+        if query_drift:
+            self.stats["query_drift"] += 1
+            logger.info(f"[SpeculativeRetrieval] {agent_name} 최종 검색 쿼리가 예측 검색과 다름: "
+                        f"'{search.query}' -> '{query}'")
+        if stock_code != self.stock_code or filters != search.params.get("filters") or \
+                (query_drift and settings.STOCKEASY_SPECULATIVE_STRICT_QUERY):
+            self.stats["mismatched"] += 1
+            self.stats["discarded"] += 1
+            search.task.cancel()
+            logger.info(f"[SpeculativeRetrieval] {agent_name} 예측 검색 조건 불일치로 폐기")
+            return None
+
+        taken_at = time.monotonic()
+        try:
+            result = await asyncio.shield(search.task)
+        except asyncio.CancelledError:
+            if not search.task.cancelled():
+                raise
+            self.stats["failed"] += 1
+            return None
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning(f"[SpeculativeRetrieval] {agent_name} 예측 검색 실패, 직접 검색으로 대체: {str(e)}")
+            return None
+
+        # 질문 분석/오케스트레이터와 겹쳐서 진행된 검색 시간
+        latency_saved = min(search.finished_at or taken_at, taken_at) - search.started_at
+        self.stats["adopted"] += 1
+        self.stats["latency_saved"] += latency_saved
+        logger.info(f"[SpeculativeRetrieval] {agent_name} 예측 검색 채택 (후보 {len(result.documents)}개, "
+                    f"절감 {latency_saved:.2f}초)")
+        return result
+
+    def cancel_all(self) -> None:
+        """남아 있는 예측 검색 모두 취소"""
+        for agent_name in list(self._searches):
+            self._discard(agent_name)
+
+    def _discard(self, agent_name: str) -> None:
+        search = self._searches.pop(agent_name, None)
+        if search is not None:
+            search.task.cancel()
+            self.stats["discarded"] += 1
+
+
+def filter_retrieval_candidates(candidates: RetrievalResult, top_k: int, threshold: float) -> RetrievalResult:
+    """
+    예측 검색 후보를 최종 검색 조건으로 필터링
+
+    SemanticRetriever.retrieve와 같이 점수 순 상위 top_k개 중 threshold 이상인 문서만 남깁니다.
+    """
+    ranked = sorted(candidates.documents, key=lambda doc: doc.score or 0.0, reverse=True)[:top_k]
+    documents = [doc for doc in ranked if (doc.score or 0.0) >= threshold]
+    return RetrievalResult(
+        documents=documents,
+        query_analysis={
+            "type": "semantic",
+            "min_score": threshold,
+            "total_found": len(candidates.documents),
+            "returned": len(documents),
+            "speculative": True,
+        }
+    )
+
+
+_services: Dict[str, SpeculativeRetrievalService] = {}
+
+
+def create_speculative_retrieval_service(key: str, **kwargs) -> SpeculativeRetrievalService:
+    """요청 키로 예측 검색 서비스를 생성해 등록 (오래된 미해제 서비스는 정리)"""
+    now = time.monotonic()
+    for stale_key in [k for k, service in _services.items() if now - service.created_at > SERVICE_MAX_AGE]:
+        release_speculative_retrieval_service(stale_key)
+    service = SpeculativeRetrievalService(**kwargs)
+    _services[key] = service
+    return service
+
+
+def get_speculative_retrieval_service(state: Dict[str, Any]) -> Optional[SpeculativeRetrievalService]:
+    """상태의 speculative_retrieval_key로 등록된 서비스 반환 (없으면 None)"""
+    key = state.get("speculative_retrieval_key")
+    return _services.get(key) if key else None
+
+
+def release_speculative_retrieval_service(key: Optional[str]) -> None:
+    """요청 처리 완료 후 남은 예측 검색을 취소하고 통계를 누적"""
+    service = _services.pop(key, None) if key else None
+    if service is None:
+        return
+    service.cancel_all()
+    _totals["requests"] += 1
+    for name, value in service.stats.items():
+        _totals[name] += value
+    logger.info(f"[SpeculativeRetrieval] 요청 종료 - 통계: {service.stats}")
+
+
+def get_speculative_retrieval_stats() -> Dict[str, float]:
+    """전체 요청 누적 통계 (hit_rate: 시작한 예측 검색 중 채택 비율)"""
+    stats = dict(_totals)
+    stats["hit_rate"] = stats["adopted"] / stats["started"] if stats["started"] else 0.0
+    return stats
+
+
+async def take_speculative_retrieval(state: Dict[str, Any], agent_name: str, stock_code: Optional[str],
+                                     filters: Optional[Dict[str, Any]] = None,
+                                     query: Optional[str] = None) -> Optional[RetrievalResult]:
+    """검색 에이전트용 예측 검색 결과 조회 (서비스가 없거나 채택할 수 없으면 None)"""
+    service = get_speculative_retrieval_service(state)
+    if service is None:
+        return None
+    return await service.take(agent_name, stock_code, filters, query)
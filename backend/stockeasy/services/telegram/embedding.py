@@ -110,8 +110,8 @@ class TelegramEmbeddingService(CommonEmbeddingService):
             {text}
             """
             
-            # LLM 호출
-            response = agent_llm.get_llm().invoke([HumanMessage(content=prompt)])
+            # LLM 호출 (재게시된 메시지는 응답 캐시 사용)
+            response = agent_llm.invoke_with_fallback([HumanMessage(content=prompt)])
             
             # 결과 처리
             keywords_text = response.content.strip()
@@ -219,7 +219,7 @@ class TelegramRAGService:
             # 동적 임계값 계산
             #dynamic_threshold = self._calculate_dynamic_threshold(query)
             
-            vs_manager = VectorStoreManager(embedding_model_type=self.embedding_service.get_model_type(),
+            vs_manager = await VectorStoreManager.create_async(embedding_model_type=self.embedding_service.get_model_type(),
                                             project_name="stockeasy",
                                             namespace=settings.PINECONE_NAMESPACE_STOCKEASY_TELEGRAM)
 
@@ -406,7 +406,7 @@ class TelegramRAGService:
             Exception: 검색 중 오류 발생 시
         """
         try:
-            vs_manager = VectorStoreManager(embedding_model_type=self.embedding_service.get_model_type(),
+            vs_manager = await VectorStoreManager.create_async(embedding_model_type=self.embedding_service.get_model_type(),
                                             project_name="stockeasy",
                                             namespace=settings.PINECONE_NAMESPACE_STOCKEASY)
 
@@ -0,0 +1,140 @@
+"""대화 이력 저장소 테스트
+
+주요 테스트 항목:
+1. 세션별 최대 턴 수 유지
+2. 최대 세션 수 초과 시 LRU 제거
+3. create=False 추가 동작
+4. 채팅 메시지 -> 대화 턴 변환
+5. 그래프 실행 시 채팅 세션 단위 이력 유지 (DB 지연 적재 후 캐시 사용)
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from stockeasy.agents import session_manager_agent as session_manager_module
+from stockeasy.agents.session_manager_agent import SessionManagerAgent
+from stockeasy.models.agent_io import AgentState
+from stockeasy.services.conversation_history import (
+    LRUConversationHistoryStore,
+    messages_to_turns,
+)
+
+
+@pytest.mark.asyncio
+async def test_lru_store_keeps_recent_turns():
+    """세션별 최근 max_turns개만 유지하는지 확인"""
+    store = LRUConversationHistoryStore(max_turns=3, ttl=60, max_sessions=10)
+    for i in range(5):
+        await store.append("s1", {"query": f"q{i}", "response": f"r{i}"})
+
+    history = await store.get("s1")
+    assert [turn["query"] for turn in history] == ["q2", "q3", "q4"]
+
+
+@pytest.mark.asyncio
+async def test_lru_store_evicts_least_recently_used_session():
+    """최대 세션 수를 넘으면 가장 오래 사용되지 않은 세션이 제거되는지 확인"""
+    store = LRUConversationHistoryStore(max_turns=3, ttl=60, max_sessions=2)
+    await store.set("s1", [{"query": "a", "response": "b"}])
+    await store.set("s2", [{"query": "c", "response": "d"}])
+    # s1을 최근 사용으로 갱신
+    assert await store.get("s1") is not None
+    await store.set("s3", [{"query": "e", "response": "f"}])
+
+    assert await store.get("s2") is None
+    assert await store.get("s1") is not None
+    assert await store.get("s3") is not None
+
+
+@pytest.mark.asyncio
+async def test_lru_store_append_without_create():
+    """create=False이면 캐시되지 않은 세션에는 추가하지 않는지 확인"""
+    store = LRUConversationHistoryStore(max_turns=3, ttl=60, max_sessions=10)
+    await store.append("missing", {"query": "q", "response": "r"}, create=False)
+    assert await store.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_lru_store_expired_entry_is_miss():
+    """TTL이 지난 이력은 캐시 미스로 처리되는지 확인"""
+    store = LRUConversationHistoryStore(max_turns=3, ttl=-1, max_sessions=10)
+    await store.set("s1", [{"query": "q", "response": "r"}])
+    assert await store.get("s1") is None
+
+
+def test_messages_to_turns_pairs_user_and_assistant():
+    """user/assistant 메시지가 하나의 턴으로 묶이는지 확인"""
+    messages = [
+        {"ok": True, "role": "user", "content": "삼성전자 실적은?", "stock_code": "005930",
+         "stock_name": "삼성전자", "created_at": "2025-03-01T10:00:00"},
+        {"ok": True, "role": "assistant", "content": "1분기 실적은...", "created_at": "2025-03-01T10:00:05"},
+        {"ok": True, "role": "user", "content": "그 종목 전망은?", "created_at": "2025-03-01T10:01:00"},
+    ]
+
+    turns = messages_to_turns(messages)
+    assert len(turns) == 2
+    assert turns[0]["query"] == "삼성전자 실적은?"
+    assert turns[0]["response"] == "1분기 실적은..."
+    assert turns[0]["stock_name"] == "삼성전자"
+    assert turns[1]["response"] == ""
+
+
+class _FakeUserService:
+    async def get_active_session(self, session_id):
+        return SimpleNamespace(id=session_id, user_id="user-1", user_email="user@example.com",
+                               is_authenticated=True, last_accessed_at=datetime.now())
+
+
+@pytest.mark.asyncio
+async def test_graph_second_turn_sees_first_turn_history(monkeypatch):
+    """컴파일된 그래프에서 chat_session_id가 유지되어 다음 턴이 이전 턴의 이력을 보는지 확인"""
+    chat_session_id = "7f5c2a4e-4d7b-4f6e-9f7a-0b8c1d2e3f40"
+    db_messages = []
+    db_calls = []
+
+    async def get_chat_messages(db, session_id, limit, latest=False):
+        db_calls.append((str(session_id), limit, latest))
+        return list(db_messages)
+
+    monkeypatch.setattr(session_manager_module.ChatService, "get_chat_messages", staticmethod(get_chat_messages))
+    store = LRUConversationHistoryStore(max_turns=3, ttl=60, max_sessions=10)
+    agent = SessionManagerAgent(db=object(), history_store=store)
+    agent.user_service = _FakeUserService()
+
+    seen_histories = []
+
+    async def session_manager(state):
+        return await agent.process(state)
+
+    async def recorder(state):
+        seen_histories.append([turn["query"] for turn in state.get("conversation_history", [])])
+        return {"answer": f"{state['query']} 답변"}
+
+    workflow = StateGraph(AgentState)
+    workflow.add_node("session_manager", session_manager)
+    workflow.add_node("recorder", recorder)
+    workflow.set_entry_point("session_manager")
+    workflow.add_edge("session_manager", "recorder")
+    workflow.add_edge("recorder", END)
+    graph = workflow.compile()
+
+    async def chat_turn(query):
+        # chat.py: 사용자 메시지 저장 -> 그래프 실행 -> 응답 저장 후 캐시된 세션에만 이력 추가
+        db_messages.append({"ok": True, "role": "user", "content": query, "created_at": "2025-03-01T10:00:00"})
+        result = await graph.ainvoke({"query": query, "session_id": "auth-session", "chat_session_id": chat_session_id})
+        db_messages.append({"ok": True, "role": "assistant", "content": result["answer"]})
+        await store.append(chat_session_id, {"timestamp": datetime.now(), "query": query,
+                                             "response": result["answer"]}, create=False)
+
+    await chat_turn("삼성전자 실적은?")
+    await chat_turn("그 종목 전망은?")
+    await chat_turn("목표 주가는?")
+
+    assert seen_histories == [[], ["삼성전자 실적은?"], ["삼성전자 실적은?", "그 종목 전망은?"]]
+    # 두 번째 턴에서 DB 적재 후에는 저장소 캐시 사용, 인증 세션 ID가 아닌 채팅 세션 ID로 저장
+    assert [call[0] for call in db_calls] == [chat_session_id, chat_session_id]
+    assert all(call[2] for call in db_calls)
+    assert await store.get("auth-session") is None
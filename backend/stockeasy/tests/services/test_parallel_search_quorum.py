@@ -0,0 +1,213 @@
+"""병렬 검색 정족수/마감 시간 및 결과 도착 즉시 압축 테스트
+
+주요 테스트 항목:
+1. 정족수 이상 성공 후 마감 시간이 지나면 남은 에이전트를 제외하고 절감 시간 기록
+2. 정족수를 채우지 못하면 마감 시간이 지나도 모든 에이전트를 기다림
+3. 도착한 결과는 나머지 에이전트를 기다리는 동안 압축되어 integration_partials에 저장
+4. 정족수 기본값(0)은 모든 에이전트를 기다리고, 내부에서 취소된 에이전트는 실패로 처리
+5. 압축기는 짧은 결과/시간 초과/원문보다 긴 응답은 원문 사용, 요약 프롬프트는 압축본 사용
+"""
+
+import asyncio
+
+import pytest
+
+from langchain_core.messages import AIMessage
+
+from common.core.config import settings
+from stockeasy.agents.knowledge_integrator_agent import KnowledgeIntegratorAgent
+from stockeasy.agents.parallel_search_agent import ParallelSearchAgent
+from stockeasy.prompts.summarizer_prompt import create_prompt
+from stockeasy.services.result_condenser import ResultCondenser
+
+
+class _FakeSearchAgent:
+    """지정한 시간 후 결과를 반환(또는 실패)하는 검색 에이전트"""
+
+    def __init__(self, name, delay, fail=False, cancel_self=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.cancel_self = cancel_self
+        self.cancelled = False
+
+    async def process(self, state):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.cancel_self:
+            raise asyncio.CancelledError()
+        if self.fail:
+            raise RuntimeError("검색 실패")
+        state["retrieved_data"] = {"telegram_messages": [{"content": self.name}]}
+        state["agent_results"] = {self.name: {
+            "status": "success", "data": {"summary": f"{self.name} 요약", "analysis": {"llm_response": f"{self.name} 분석"}}
+        }}
+        state["processing_status"] = {self.name: "completed"}
+        return state
+
+
+def _formatter():
+    integrator = KnowledgeIntegratorAgent.__new__(KnowledgeIntegratorAgent)
+    return integrator.format_agent_result
+
+
+class _FakeCondenser:
+    """지정한 시간 후 압축본을 반환하고 시작/종료 시각을 기록하는 압축기"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.started = {}
+        self.finished = {}
+
+    async def condense(self, agent_name, text, query, stock_name=None, user_id=None):
+        self.started[agent_name] = asyncio.get_running_loop().time()
+        await asyncio.sleep(self.delay)
+        self.finished[agent_name] = asyncio.get_running_loop().time()
+        return f"{agent_name} 압축본"
+
+
+class _FakeLLM:
+    """정해진 응답을 지정한 시간 후 반환하는 AgentLLM 대체 구현"""
+
+    def __init__(self, content, delay=0.0):
+        self.content = content
+        self.delay = delay
+
+    async def ainvoke_with_fallback(self, *args, **kwargs):
+        await asyncio.sleep(self.delay)
+        return AIMessage(content=self.content)
+
+
+@pytest.fixture
+def deadline_settings(monkeypatch):
+    monkeypatch.setattr(settings, "STOCKEASY_CONDENSE_ON_ARRIVAL", True)
+    monkeypatch.setattr(settings, "STOCKEASY_CONDENSE_MAX_CONCURRENCY", 3)
+    monkeypatch.setattr(settings, "STOCKEASY_SEARCH_QUORUM", 2)
+    monkeypatch.setattr(settings, "STOCKEASY_SEARCH_DEADLINE", 0.05)
+    monkeypatch.setattr(ParallelSearchAgent, "_duration_ewma", {"industry_analyzer": 3.0})
+
+
+@pytest.mark.asyncio
+async def test_straggler_is_skipped_after_quorum_and_deadline(deadline_settings):
+    """정족수 성공 후 마감 시간이 지나면 느린 에이전트를 제외하고, 도착한 결과는 압축본으로 저장하는지 확인"""
+    agents = {
+        "telegram_retriever": _FakeSearchAgent("telegram_retriever", 0.0),
+        "report_analyzer": _FakeSearchAgent("report_analyzer", 0.01),
+        "industry_analyzer": _FakeSearchAgent("industry_analyzer", 5.0),
+    }
+    parallel_search = ParallelSearchAgent(agents, result_formatter=_formatter(), result_condenser=_FakeCondenser())
+    state = await parallel_search.process({
+        "query": "실적 전망",
+        "data_requirements": {"telegram_needed": True, "reports_needed": True, "industry_data_needed": True},
+        "integration_partials": {"industry_analyzer": "이전 질문의 요약"},
+    })
+
+    assert agents["industry_analyzer"].cancelled
+    assert state["processing_status"]["industry_analyzer"] == "skipped_deadline"
+    assert "all_search_agents_failed" not in state
+    assert state["integration_partials"] == {
+        "telegram_retriever": "telegram_retriever 압축본",
+        "report_analyzer": "report_analyzer 압축본",
+    }
+
+    metrics = state["metrics"]["parallel_search"]
+    assert metrics["skipped_agents"] == ["industry_analyzer"]
+    assert metrics["quorum_reached_at"] < 1.0
+    assert 2.0 < metrics["latency_saved"] < 3.0
+    assert state["agent_results"]["parallel_search"]["data"]["skipped_agents"] == ["industry_analyzer"]
+
+
+@pytest.mark.asyncio
+async def test_waits_for_all_agents_until_quorum_is_met(deadline_settings):
+    """실패한 에이전트 때문에 정족수를 채우지 못하면 마감 시간이 지나도 나머지를 기다리는지 확인"""
+    agents = {
+        "telegram_retriever": _FakeSearchAgent("telegram_retriever", 0.0),
+        "report_analyzer": _FakeSearchAgent("report_analyzer", 0.0, fail=True),
+        "industry_analyzer": _FakeSearchAgent("industry_analyzer", 0.1),
+    }
+    parallel_search = ParallelSearchAgent(agents, result_formatter=_formatter(), result_condenser=_FakeCondenser())
+    state = await parallel_search.process({
+        "query": "실적 전망",
+        "data_requirements": {"telegram_needed": True, "reports_needed": True, "industry_data_needed": True},
+    })
+
+    assert state["processing_status"] == {
+        "telegram_retriever": "completed", "report_analyzer": "failed", "industry_analyzer": "completed"
+    }
+    assert state["metrics"]["parallel_search"]["skipped_agents"] == []
+    assert state["metrics"]["parallel_search"]["latency_saved"] == 0.0
+    assert set(state["integration_partials"]) == {"telegram_retriever", "industry_analyzer"}
+
+
+@pytest.mark.asyncio
+async def test_default_quorum_waits_for_all_and_handles_cancelled_agent(deadline_settings, monkeypatch):
+    """정족수 기본값(0)이면 마감 시간이 지나도 모두 기다리고, 내부에서 취소된 에이전트는 실패로 기록하는지 확인"""
+    monkeypatch.setattr(settings, "STOCKEASY_SEARCH_QUORUM", 0)
+    agents = {
+        "telegram_retriever": _FakeSearchAgent("telegram_retriever", 0.0),
+        "report_analyzer": _FakeSearchAgent("report_analyzer", 0.0, cancel_self=True),
+        "industry_analyzer": _FakeSearchAgent("industry_analyzer", 0.1),
+    }
+    parallel_search = ParallelSearchAgent(agents, result_formatter=_formatter(), result_condenser=_FakeCondenser())
+    state = await parallel_search.process({
+        "query": "실적 전망",
+        "data_requirements": {"telegram_needed": True, "reports_needed": True, "industry_data_needed": True},
+    })
+
+    assert state["processing_status"] == {
+        "telegram_retriever": "completed", "report_analyzer": "failed", "industry_analyzer": "completed"
+    }
+    assert state["metrics"]["parallel_search"]["skipped_agents"] == []
+
+
+@pytest.mark.asyncio
+async def test_condensing_overlaps_with_waiting_for_slower_agents(deadline_settings):
+    """먼저 도착한 결과의 압축이 느린 에이전트를 기다리는 동안 진행되는지 확인"""
+    agents = {
+        "telegram_retriever": _FakeSearchAgent("telegram_retriever", 0.0),
+        "industry_analyzer": _FakeSearchAgent("industry_analyzer", 0.2),
+    }
+    condenser = _FakeCondenser(delay=0.1)
+    parallel_search = ParallelSearchAgent(agents, result_formatter=_formatter(), result_condenser=condenser)
+    state = await parallel_search.process({
+        "query": "실적 전망",
+        "data_requirements": {"telegram_needed": True, "industry_data_needed": True},
+    })
+
+    # 텔레그램 압축은 산업 분석이 끝나기(0.2초) 전에 끝나고, 검색 후에는 산업 분석 압축만 기다림
+    assert condenser.finished["telegram_retriever"] < condenser.started["industry_analyzer"]
+    metrics = state["metrics"]["parallel_search"]
+    assert metrics["condensed_agents"] == ["telegram_retriever", "industry_analyzer"]
+    assert metrics["condense_wait"] < 0.18
+    assert set(state["integration_partials"]) == {"telegram_retriever", "industry_analyzer"}
+
+
+@pytest.mark.asyncio
+async def test_condenser_falls_back_to_original_text(monkeypatch):
+    """짧은 결과, 시간 초과, 원문보다 긴 응답은 압축본 없이(None) 원문을 사용하는지 확인"""
+    monkeypatch.setattr(settings, "STOCKEASY_CONDENSE_MIN_CHARS", 100)
+    monkeypatch.setattr(settings, "STOCKEASY_CONDENSE_TIMEOUT", 0.05)
+    long_text = "매출 증가 " * 50
+
+    assert await ResultCondenser(agent_llm=_FakeLLM("요약")).condense("report_analyzer", "짧은 결과", "질문") is None
+    assert await ResultCondenser(agent_llm=_FakeLLM("요약", delay=1.0)).condense("report_analyzer", long_text, "질문") is None
+    assert await ResultCondenser(agent_llm=_FakeLLM(long_text * 2)).condense("report_analyzer", long_text, "질문") is None
+    assert await ResultCondenser(agent_llm=_FakeLLM(" 매출 증가 ")).condense("report_analyzer", long_text, "질문") == "매출 증가"
+
+
+def test_summarizer_prompt_uses_condensed_partials():
+    """요약 프롬프트가 압축본이 있는 소스는 원문 대신 압축본을 사용하는지 확인"""
+    report_data = {"analysis": {"llm_response": "원문 리포트 분석"}, "searched_reports": []}
+    prompt = create_prompt(
+        query="실적 전망", stock_code="005930", stock_name="삼성전자", classification={},
+        telegram_data=None, report_data=report_data, confidential_data=None, financial_data={"llm_response": "재무 원문"},
+        industry_data=None, integrated_knowledge=None,
+        integration_partials={"report_analyzer": "리포트 압축본"}
+    )
+    text = prompt.format_prompt().to_string()
+
+    assert "리포트 압축본" in text and "원문 리포트 분석" not in text
+    assert "재무 원문" in text
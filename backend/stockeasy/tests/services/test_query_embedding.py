@@ -0,0 +1,115 @@
+"""요청 단위 쿼리 임베딩 서비스 테스트
+
+주요 테스트 항목:
+1. 검색 쿼리 배치 선계산 후 에이전트 조회 시 재사용 (중복 쿼리는 한 번만 임베딩)
+2. 배치 임베딩 실패 시 요청 시점 개별 임베딩으로 대체
+3. 질문 분석 직후 실행될 검색 에이전트의 쿼리만 선계산, 요청 종료 시 해제
+"""
+
+import asyncio
+
+import pytest
+
+from common.services.retrievers.semantic import SemanticRetriever, SemanticRetrieverConfig
+from stockeasy.graph.stock_analysis_graph import StockAnalysisGraph
+from stockeasy.services.query_embedding import (
+    QueryEmbeddingService,
+    create_query_embedding_service,
+    embed_search_query,
+    get_query_embedding_service,
+    release_query_embedding_service,
+)
+
+
+class _FakeProvider:
+    """호출된 텍스트 배치를 기록하는 임베딩 제공자"""
+
+    def __init__(self, fail_batches: bool = False):
+        self.calls = []
+        self.fail_batches = fail_batches
+
+    async def create_embeddings_async(self, texts, user_id=None, project_type=None):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        if self.fail_batches and len(texts) > 1:
+            raise RuntimeError("rate limited")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class _FakeAgent:
+    def __init__(self, queries):
+        self.queries = queries
+
+    def get_search_queries(self, state):
+        return self.queries
+
+
+@pytest.mark.asyncio
+async def test_prefetched_queries_are_reused():
+    """배치로 선계산한 쿼리는 추가 호출 없이 반환되고, 새 쿼리만 개별 임베딩하는지 확인"""
+    provider = _FakeProvider()
+    service = QueryEmbeddingService(provider=provider)
+
+    prefetch = service.prefetch(["삼성전자 실적", "삼성전자 전망", "삼성전자 실적"])
+    # 선계산이 끝나기 전 조회도 같은 배치 결과를 기다림
+    assert await service.embed("삼성전자 실적") == [7.0, 1.0]
+    await prefetch
+    assert await service.embed("삼성전자 전망") == [7.0, 1.0]
+    assert await service.embed("HBM") == [3.0, 1.0]
+    assert await service.embed("HBM") == [3.0, 1.0]
+    assert service.prefetch(["HBM", "삼성전자 전망"]) is None
+
+    assert provider.calls == [["삼성전자 실적", "삼성전자 전망"], ["HBM"]]
+    assert service.stats["hits"] == 3 and service.stats["on_demand"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_on_demand():
+    """배치 임베딩이 실패하면 각 쿼리를 요청 시점에 개별 임베딩하는지 확인"""
+    provider = _FakeProvider(fail_batches=True)
+    service = QueryEmbeddingService(provider=provider)
+
+    await service.prefetch(["질문 A", "질문 BB"])
+    assert await service.embed("질문 BB") == [5.0, 1.0]
+    assert provider.calls == [["질문 A", "질문 BB"], ["질문 BB"]]
+    assert service.stats["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_prefetches_only_required_agents_and_retriever_uses_vector(monkeypatch):
+    """데이터가 필요한 검색 에이전트의 쿼리만 선계산하고, 검색기는 전달된 벡터로 조회하는지 확인"""
+    provider = _FakeProvider()
+    monkeypatch.setattr(QueryEmbeddingService, "provider", property(lambda self: provider))
+    graph = StockAnalysisGraph.__new__(StockAnalysisGraph)
+    graph._prefetch_tasks = set()
+    graph.agents = {
+        "telegram_retriever": _FakeAgent(["텔레그램 쿼리"]),
+        "report_analyzer": _FakeAgent(["리포트 쿼리"]),
+        "industry_analyzer": _FakeAgent(["산업 쿼리"]),
+        "financial_analyzer": object(),
+    }
+    state = {
+        "query_embedding_key": "request-1",
+        "question_analysis": {"data_requirements": {"telegram_needed": True, "reports_needed": True, "industry_data_needed": False}},
+    }
+
+    graph._prefetch_query_embeddings(state)
+    await asyncio.gather(*graph._prefetch_tasks)
+    assert provider.calls == [["텔레그램 쿼리", "리포트 쿼리"]]
+
+    class _VectorStore:
+        async def search_by_vector_async(self, embedding, top_k, filters=None):
+            self.embedding = embedding
+            return []
+
+    vs_manager = _VectorStore()
+    retriever = SemanticRetriever(SemanticRetrieverConfig(min_score=0.1), vs_manager)
+    await retriever.retrieve("리포트 쿼리", top_k=3, query_embedding=await embed_search_query(state, "리포트 쿼리"))
+    assert vs_manager.embedding == [6.0, 1.0]
+    assert len(provider.calls) == 1
+
+    release_query_embedding_service("request-1")
+    assert get_query_embedding_service(state) is None
+    assert await embed_search_query(state, "리포트 쿼리") is None
+    create_query_embedding_service("request-2", provider=provider)
+    release_query_embedding_service("request-2")
@@ -0,0 +1,141 @@
+"""요청 단위 예측 검색 서비스 테스트
+
+주요 테스트 항목:
+1. 질문 분석과 동시에 종목이 지정된 질문의 예측 검색 시작, 실행이 확정된 에이전트만 채택
+2. 메타데이터 필터가 달라지면 예측 검색을 폐기하고 통계(채택률, 절감 시간) 누적
+   최종 검색 쿼리가 달라지면 query_drift로 집계 (엄격 모드에서는 폐기)
+3. 예측 검색 후보를 최종 임계값/검색 수로 필터링
+"""
+
+import asyncio
+
+import pytest
+
+from common.core.config import settings
+from common.services.retrievers.models import DocumentWithScore, RetrievalResult
+from stockeasy.agents.parallel_search_agent import ParallelSearchAgent
+from stockeasy.graph.stock_analysis_graph import StockAnalysisGraph
+from stockeasy.services.speculative_retrieval import (
+    create_speculative_retrieval_service,
+    filter_retrieval_candidates,
+    get_speculative_retrieval_service,
+    get_speculative_retrieval_stats,
+    release_speculative_retrieval_service,
+    take_speculative_retrieval,
+)
+
+
+def _result(*scores):
+    return RetrievalResult(documents=[
+        DocumentWithScore(page_content=f"문서 {score}", metadata={}, score=score) for score in scores
+    ])
+
+
+class _FakeSearchAgent:
+    """예측 검색 매개변수와 검색 호출을 기록하는 검색 에이전트"""
+
+    def __init__(self, name, filters=None):
+        self.name = name
+        self.filters = filters
+        self.calls = []
+        self.cancelled = False
+
+    def get_speculative_search(self, state):
+        return {"query": f"{state['stock_name']} {state['query']}", "filters": self.filters}
+
+    async def _retrieve_candidates(self, query, filters=None):
+        self.calls.append(query)
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return _result(0.9, 0.4)
+
+    async def process(self, state):
+        state["retrieved_data"] = {f"{self.name}_candidates": await take_speculative_retrieval(state, self.name, state["stock_code"])}
+        return state
+
+
+@pytest.mark.asyncio
+async def test_speculative_search_is_adopted_only_for_executed_agents(monkeypatch):
+    """종목이 지정된 질문은 질문 분석 전 예측 검색을 시작하고, 실행할 에이전트만 결과를 채택하는지 확인"""
+    monkeypatch.setattr(settings, "STOCKEASY_SPECULATIVE_RETRIEVAL", True)
+    telegram, report = _FakeSearchAgent("telegram_retriever"), _FakeSearchAgent("report_analyzer")
+    graph = StockAnalysisGraph.__new__(StockAnalysisGraph)
+    graph.agents = {"telegram_retriever": telegram, "report_analyzer": report}
+    state = {"query": "실적 전망", "stock_code": "005930", "stock_name": "삼성전자",
+             "speculative_retrieval_key": "request-1"}
+
+    graph._start_speculative_retrieval({**state, "stock_code": None})
+    assert get_speculative_retrieval_service(state) is None
+
+    graph._start_speculative_retrieval(state)
+    service = get_speculative_retrieval_service(state)
+    assert service.pending("telegram_retriever") and service.pending("report_analyzer")
+    # 질문 분석(LLM 호출)이 진행되는 동안 예측 검색 시작
+    await asyncio.sleep(0)
+    assert telegram.calls == report.calls == ["삼성전자 실적 전망"]
+
+    # 질문 분석 결과 텔레그램 검색만 필요
+    parallel_search = ParallelSearchAgent(graph.agents)
+    result = await parallel_search.process({**state, "data_requirements": {"telegram_needed": True, "reports_needed": False}})
+
+    adopted = result["retrieved_data"]["telegram_retriever_candidates"]
+    assert [doc.score for doc in adopted.documents] == [0.9, 0.4]
+    assert report.cancelled
+    assert service.stats["adopted"] == 1 and service.stats["discarded"] == 1
+    assert service.stats["latency_saved"] > 0
+
+    release_speculative_retrieval_service("request-1")
+    assert get_speculative_retrieval_service(state) is None
+
+
+@pytest.mark.asyncio
+async def test_mismatched_filters_discard_speculative_search():
+    """최종 메타데이터 필터가 예측 검색과 다르면 폐기하고 누적 통계에 반영하는지 확인"""
+    before = get_speculative_retrieval_stats()
+    agent = _FakeSearchAgent("report_analyzer", filters={"stock_code": {"$eq": "005930"}})
+    service = create_speculative_retrieval_service("request-2", stock_code="005930", query="실적 전망")
+    service.start("report_analyzer", agent.get_speculative_search({"query": "실적 전망", "stock_name": "삼성전자"}),
+                  agent._retrieve_candidates)
+
+    final_filters = {"stock_code": {"$eq": "005930"}, "document_date": {"$gte": "20250101"}}
+    assert await service.take("report_analyzer", "005930", final_filters) is None
+    assert await service.take("report_analyzer", "005930", agent.filters) is None
+    assert service.stats == {
+        "started": 1, "adopted": 0, "discarded": 1, "mismatched": 1, "query_drift": 0, "failed": 0, "latency_saved": 0.0
+    }
+
+    release_speculative_retrieval_service("request-2")
+    after = get_speculative_retrieval_stats()
+    assert after["started"] == before["started"] + 1
+    assert after["mismatched"] == before["mismatched"] + 1
+
+
+@pytest.mark.asyncio
+async def test_final_query_drift_is_recorded_and_discarded_in_strict_mode(monkeypatch):
+    """최종 검색 쿼리가 예측 검색과 다르면 query_drift로 집계하고, 엄격 모드에서는 폐기하는지 확인"""
+    agent = _FakeSearchAgent("telegram_retriever")
+    speculative_params = agent.get_speculative_search({"query": "실적 전망", "stock_name": "삼성전자"})
+    service = create_speculative_retrieval_service("request-3", stock_code="005930", query="실적 전망")
+
+    service.start("telegram_retriever", speculative_params, agent._retrieve_candidates)
+    assert await service.take("telegram_retriever", "005930", query="삼성전자 실적 전망 전망 목표가") is not None
+    assert service.stats["adopted"] == 1 and service.stats["query_drift"] == 1
+
+    monkeypatch.setattr(settings, "STOCKEASY_SPECULATIVE_STRICT_QUERY", True)
+    service.start("telegram_retriever", speculative_params, agent._retrieve_candidates)
+    assert await service.take("telegram_retriever", "005930", query="삼성전자 실적 전망 전망 목표가") is None
+    service.start("telegram_retriever", speculative_params, agent._retrieve_candidates)
+    assert await service.take("telegram_retriever", "005930", query="삼성전자 실적 전망") is not None
+    assert service.stats["mismatched"] == 1 and service.stats["query_drift"] == 2 and service.stats["adopted"] == 2
+
+    release_speculative_retrieval_service("request-3")
+
+
+def test_filter_candidates_applies_final_threshold_and_top_k():
+    """예측 검색 후보에서 점수 순 상위 top_k개 중 임계값 이상만 남기는지 확인"""
+    candidates = _result(0.3, 0.8, 0.5, 0.22, 0.6)
+    assert [doc.score for doc in filter_retrieval_candidates(candidates, top_k=3, threshold=0.55).documents] == [0.8, 0.6]
+    assert [doc.score for doc in filter_retrieval_candidates(candidates, top_k=10, threshold=0.25).documents] == [0.8, 0.6, 0.5, 0.3]
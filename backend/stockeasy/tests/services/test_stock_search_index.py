@@ -0,0 +1,64 @@
+"""종목 검색 인덱스 테스트
+
+주요 테스트 항목:
+1. 정확/접두/초성/부분/오타 허용 일치 순위
+2. 종목코드 접두 검색
+3. 종목 정보 교체 시 검색 인덱스 재생성
+"""
+
+import pytest
+
+from stockeasy.services.financial.stock_info_service import StockInfoService
+from stockeasy.services.financial.stock_search_index import StockSearchIndex, to_choseong
+
+_STOCKS = [
+    {"code": code, "name": name, "sector": "업종"}
+    for code, name in [
+        ("005930", "삼성전자"), ("009150", "삼성전기"), ("006400", "삼성SDI"), ("000660", "SK하이닉스"),
+        ("005380", "현대차"), ("012330", "현대모비스"), ("035420", "NAVER"), ("KOSPI", "KOSPI"),
+    ]
+]
+
+
+def _names(results):
+    return [(result["name"], result["match_type"]) for result in results]
+
+
+def test_search_ranks_prefix_choseong_substring_and_fuzzy():
+    """매칭 유형별 순위와 초성/혼합 초성/오타 검색 확인"""
+    index = StockSearchIndex(_STOCKS)
+
+    assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+    assert _names(index.search("삼성전", fuzzy=False)) == [("삼성전기", "prefix"), ("삼성전자", "prefix")]
+    assert _names(index.search("ㅅㅅㅈㅈ")) == [("삼성전자", "choseong_prefix")]
+    assert _names(index.search("삼성ㅈ", fuzzy=False)) == [("삼성전기", "choseong_prefix"), ("삼성전자", "choseong_prefix")]
+    assert _names(index.search("하이닉스")) == [("SK하이닉스", "substring")]
+    assert _names(index.search("sk 하이")) == [("SK하이닉스", "prefix")]
+    assert _names(index.search("naver")) == [("NAVER", "exact")]
+    assert index.search("삼송전자", limit=1)[0]["name"] == "삼성전자"
+    assert index.search("삼송전자", fuzzy=False) == []
+    assert index.search("") == []
+
+
+def test_search_matches_code_prefix():
+    """종목코드 접두 검색과 정확 일치 우선 확인"""
+    index = StockSearchIndex(_STOCKS)
+
+    assert _names(index.search("0059")) == [("삼성전자", "prefix")]
+    assert _names(index.search("005930", fuzzy=False)) == [("삼성전자", "exact")]
+    assert {result["code"] for result in index.search("00", fuzzy=False)} == {"000660", "005380", "005930", "009150", "006400"}
+
+
+@pytest.mark.asyncio
+async def test_service_rebuilds_index_when_stock_info_replaced():
+    """종목 정보가 교체되면 새 데이터로 검색하고, 부분 일치 조회는 원본 종목 정보를 반환하는지 확인"""
+    service = object.__new__(StockInfoService)
+    stock_info = {"by_code": {s["code"]: s for s in _STOCKS}, "by_name": {s["name"]: s for s in _STOCKS}}
+    service._stock_info_cache = stock_info
+
+    assert await service.get_stock_by_name("하이닉스") is stock_info["by_code"]["000660"]
+    assert [stock["code"] for stock in await service.search_stocks("현대")] == ["005380", "012330"]
+
+    new_stock = {"code": "999990", "name": "현대신규", "sector": "업종"}
+    service._stock_info_cache = {"by_code": {"999990": new_stock}, "by_name": {"현대신규": new_stock}}
+    assert _names(await service.autocomplete("현대")) == [("현대신규", "prefix")]
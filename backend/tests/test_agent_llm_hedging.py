@@ -0,0 +1,149 @@
+"""AgentLLM 헤지/마감 시간/회로 차단기 테스트
+
+주요 테스트 항목:
+1. 기본 LLM 응답이 늦으면 폴백 LLM을 동시에 호출하고 먼저 성공한 응답 채택, 늦은 호출은 취소
+2. 마감 시간 초과 시 TimeoutError 발생 및 실패로 한 번만 기록
+3. 실패율이 높은 제공자는 회로 차단기로 호출에서 제외
+4. 토큰 사용량은 채택된 호출의 모델 이름으로 기록
+5. 전역 헤지가 꺼져 있어도 에이전트 설정으로 헤지 사용
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from langchain_core.messages import AIMessage
+
+import common.services.token_usage_service as token_usage_service
+from common.services import agent_llm as agent_llm_module
+from common.services.agent_llm import AgentLLM
+
+
+class _FakeLLM:
+    """지연/실패를 지정할 수 있는 테스트용 LLM"""
+
+    def __init__(self, content: str, delay: float = 0.0, fail: bool = False):
+        self.content = content
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.content} 실패")
+        return AIMessage(
+            content=self.content,
+            usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}
+        )
+
+
+def _make_agent_llm(primary: _FakeLLM, fallback: _FakeLLM, hedging: bool = True, deadline: float = None) -> AgentLLM:
+    agent = AgentLLM("test_agent")
+    agent.llm_config = {"provider": "primary", "model_name": "primary-model"}
+    agent.llm = primary
+    agent.fallback_settings = {
+        "enabled": True,
+        "max_retries": 2,
+        "default_deadline_seconds": deadline,
+        "providers": [{"provider": "fallback", "model_name": "fallback-model"}],
+        "hedging": {"enabled": hedging, "initial_delay_seconds": 0.05},
+        "circuit_breaker": {"min_requests": 2, "failure_threshold": 0.5, "open_seconds": 60}
+    }
+    agent._fallback_llms = {0: fallback}
+    return agent
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider_health():
+    agent_llm_module.provider_health.clear()
+    yield
+    agent_llm_module.provider_health.clear()
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_uses_faster_fallback_and_cancels_primary():
+    """기본 LLM이 헤지 지연 안에 응답하지 않으면 폴백 응답을 채택하고 기본 호출을 취소하는지 확인"""
+    primary = _FakeLLM("primary", delay=5.0)
+    fallback = _FakeLLM("fallback", delay=0.01)
+    agent = _make_agent_llm(primary, fallback)
+
+    result = await asyncio.wait_for(agent.ainvoke_with_fallback("질문"), timeout=1.0)
+    await asyncio.sleep(0)
+
+    assert result.content == "fallback"
+    assert primary.calls == 1 and fallback.calls == 1
+    primary_health = agent_llm_module.provider_health["primary:primary-model"]
+    assert primary_health.stats["cancelled"] == 1
+    assert primary_health.stats["failures"] == 0
+    assert agent_llm_module.provider_health["fallback:fallback-model"].stats["successes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_pending_calls():
+    """마감 시간이 지나면 진행 중인 호출을 실패로 기록하고 TimeoutError를 발생시키는지 확인"""
+    agent = _make_agent_llm(_FakeLLM("primary", delay=5.0), _FakeLLM("fallback", delay=5.0), deadline=0.2)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(agent.ainvoke_with_fallback("질문"), timeout=1.0)
+
+    for key in ("primary:primary-model", "fallback:fallback-model"):
+        stats = agent_llm_module.provider_health[key].stats
+        assert stats["failures"] == 1
+        assert stats["cancelled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_agent_level_hedging_opt_in():
+    """전역 헤지가 꺼져 있어도 에이전트 설정에서 hedging을 켜면 폴백을 동시에 호출하는지 확인"""
+    primary = _FakeLLM("primary", delay=5.0)
+    fallback = _FakeLLM("fallback", delay=0.01)
+    agent = _make_agent_llm(primary, fallback, hedging=False)
+    agent.llm_config["hedging"] = True
+
+    result = await asyncio.wait_for(agent.ainvoke_with_fallback("질문"), timeout=1.0)
+
+    assert result.content == "fallback"
+    assert agent_llm_module.provider_health["primary:primary-model"].stats["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_failing_provider():
+    """실패가 반복된 기본 제공자는 차단되어 폴백으로 바로 호출되는지 확인"""
+    primary = _FakeLLM("primary", fail=True)
+    fallback = _FakeLLM("fallback")
+    agent = _make_agent_llm(primary, fallback, hedging=False)
+
+    for _ in range(3):
+        result = await agent.ainvoke_with_fallback("질문")
+        assert result.content == "fallback"
+
+    assert primary.calls == 2
+    assert fallback.calls == 3
+    assert agent_llm_module.provider_health["primary:primary-model"].state == "open"
+
+
+@pytest.mark.asyncio
+async def test_token_usage_recorded_for_winning_call(monkeypatch):
+    """토큰 사용량이 채택된 폴백 호출의 모델 이름으로 한 번만 기록되는지 확인"""
+    recorded = []
+
+    class _Tracker:
+        def add_tokens(self, **tokens):
+            recorded[-1]["tokens"] = tokens
+
+    @asynccontextmanager
+    async def fake_track_token_usage(user_id, project_type, token_type, model_name, db_getter=None):
+        recorded.append({"model_name": model_name})
+        yield _Tracker()
+
+    monkeypatch.setattr(token_usage_service, "track_token_usage", fake_track_token_usage)
+    agent = _make_agent_llm(_FakeLLM("primary", delay=5.0), _FakeLLM("fallback", delay=0.01))
+
+    await agent.ainvoke_with_fallback("질문", user_id="user", project_type="stockeasy", db=object())
+
+    assert recorded == [{
+        "model_name": "fallback-model",
+        "tokens": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+    }]
@@ -0,0 +1,193 @@
+"""비동기 Redis 클라이언트 테스트
+
+주요 테스트 항목:
+1. 문서 상태 저장과 상태 변경 이벤트 발행을 한 번의 파이프라인으로 처리
+2. 여러 문서의 상태를 한 번의 MGET으로 조회
+3. 상태 변경 채널 구독 (이벤트 수신, 유휴 시 None, 종료 시 구독 해제)
+4. 문서 상태 키 TTL 설정, 구독 전용 풀 사용 및 동시 구독 수 제한
+5. 세션 캐시, 대화 이력, LLM 응답 캐시가 공유 커넥션 풀 클라이언트를 사용
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from redis.asyncio import BlockingConnectionPool
+
+from common.core import redis as redis_module
+from common.core.config import settings
+from common.core.redis import AsyncRedisClient, SubscriptionLimitError
+from common.services import llm_response_cache, session_cache
+from stockeasy.services import conversation_history
+
+
+class _FakePipeline:
+    """명령을 모아 두었다가 execute 시 순서대로 실행하는 테스트용 파이프라인"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [await getattr(self.redis, name)(*args, **kwargs, _pipelined=True) for name, args, kwargs in self.commands]
+
+
+class _FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.channels = set()
+        self.messages = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+        self.redis.subscribers.append(self)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def aclose(self):
+        self.redis.subscribers.remove(self)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _FakeRedis:
+    """AsyncRedisClient가 사용하는 명령만 구현한 메모리 Redis (왕복 횟수 기록)"""
+
+    def __init__(self):
+        self.values = {}
+        self.expires = {}
+        self.subscribers = []
+        self.round_trips = 0
+
+    def _count(self, pipelined):
+        if not pipelined:
+            self.round_trips += 1
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    async def set(self, key, value, ex=None, _pipelined=False):
+        self._count(_pipelined)
+        self.values[key] = value
+        self.expires[key] = ex
+
+    async def get(self, key, _pipelined=False):
+        self._count(_pipelined)
+        return self.values.get(key)
+
+    async def mget(self, keys, _pipelined=False):
+        self._count(_pipelined)
+        return [self.values.get(key) for key in keys]
+
+    async def delete(self, *keys, _pipelined=False):
+        self._count(_pipelined)
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def publish(self, channel, message, _pipelined=False):
+        self._count(_pipelined)
+        for subscriber in self.subscribers:
+            if channel in subscriber.channels:
+                subscriber.messages.put_nowait({"type": "message", "channel": channel, "data": message})
+
+
+@pytest.fixture
+def client():
+    redis_client = AsyncRedisClient(redis_url="redis://unused", max_connections=1, max_subscriptions=1)
+    redis_client._redis = redis_client._pubsub_redis = _FakeRedis()
+    return redis_client
+
+
+@pytest.mark.asyncio
+async def test_document_statuses_use_single_round_trip(client):
+    """상태 저장(SET+PUBLISH)과 N개 문서 상태 조회(MGET)가 각각 한 번의 왕복으로 처리되는지 확인"""
+    await client.set_document_status("doc-1", "COMPLETED", metadata={"embedding_ids": ["c1"]})
+    assert client.redis.round_trips == 1
+    await client.set_document_status("doc-2", "ERROR", error_message="텍스트 추출 실패")
+
+    client.redis.round_trips = 0
+    statuses = await client.get_document_statuses(["doc-1", "doc-2", "doc-3"])
+
+    assert client.redis.round_trips == 1
+    assert statuses["doc-1"]["status"] == "COMPLETED"
+    assert statuses["doc-1"]["metadata"] == {"embedding_ids": ["c1"]}
+    assert statuses["doc-2"]["error_message"] == "텍스트 추출 실패"
+    assert statuses["doc-3"] is None
+    assert await client.get_document_statuses([]) == {}
+    assert client.redis.expires["doc_status:doc-1"] == settings.DOCUMENT_STATUS_TTL
+
+
+@pytest.mark.asyncio
+async def test_subscribe_receives_status_changes(client):
+    """구독한 문서의 상태 변경만 수신하고, 유휴 시 None, 종료 시 구독을 해제하는지 확인"""
+    async with client.subscribe_document_status(["doc-1"], idle_timeout=0.01) as events:
+        await client.set_document_status("doc-2", "PROCESSING")
+        await client.set_document_status("doc-1", "PROCESSING")
+        await client.delete_document_status("doc-1")
+
+        received = [await events.__anext__() for _ in range(3)]
+
+    assert [event["status"] for event in received[:2]] == ["PROCESSING", "DELETED"]
+    assert all(event["document_id"] == "doc-1" for event in received[:2])
+    assert received[2] is None
+    assert client.redis.subscribers == []
+    assert json.loads(client.redis.values["doc_status:doc-2"])["status"] == "PROCESSING"
+    assert "doc_status:doc-1" not in client.redis.values
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_use_dedicated_pool_and_are_capped(client):
+    """구독은 공유 풀과 분리된 클라이언트를 사용하고, 동시 구독 수를 넘으면 거부하는지 확인"""
+    client._pubsub_redis = pubsub_redis = _FakeRedis()
+
+    async with client.subscribe_document_status(["doc-1"], idle_timeout=0.01):
+        assert len(pubsub_redis.subscribers) == 1 and client.redis.subscribers == []
+        with pytest.raises(SubscriptionLimitError):
+            async with client.subscribe_document_status(["doc-2"]):
+                pass
+
+    assert client.active_subscriptions == 0
+    async with client.subscribe_document_status(["doc-2"], idle_timeout=0.01):
+        assert client.active_subscriptions == 1
+
+
+def test_async_redis_users_share_one_pool(monkeypatch):
+    """다른 비동기 Redis 사용처가 각자 풀을 만들지 않고 공유 클라이언트를 사용하는지 확인"""
+    shared = AsyncRedisClient(redis_url="redis://unused", max_connections=3)
+    monkeypatch.setattr(redis_module, "async_redis_client", shared)
+    for module in (session_cache, conversation_history, llm_response_cache):
+        monkeypatch.setattr(module, "async_redis_client", shared)
+    monkeypatch.setattr(settings, "SESSION_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "CONVERSATION_HISTORY_BACKEND", "redis")
+    monkeypatch.setattr(session_cache, "_session_cache", None)
+    monkeypatch.setattr(conversation_history, "_conversation_history_store", None)
+    monkeypatch.setattr(llm_response_cache, "_llm_response_cache", None)
+
+    client = shared.get_client()
+
+    assert isinstance(client.connection_pool, BlockingConnectionPool)
+    assert client.connection_pool.max_connections == 3
+    assert session_cache.get_session_cache().redis is client
+    assert conversation_history.get_conversation_history_store().primary.redis is client
+    assert llm_response_cache.get_llm_response_cache().redis is client
@@ -0,0 +1,100 @@
+"""컨텍스트 패커 테스트
+
+주요 테스트 항목:
+1. 점수 순 정렬 및 토큰 예산 준수
+2. 거의 동일한 문서 중복 제거
+3. 섹션 단위 중요도 비례 예산 배분
+4. 중요도 0 섹션/0 토큰 자르기 경계 처리
+"""
+
+from typing import List
+
+from common.services.context_packer import ContextPacker
+
+
+class _FakeEncoding:
+    """tiktoken 인코딩 대체 (문자 단위 토큰, BPE 파일 다운로드 없음)"""
+
+    def encode(self, text: str, disallowed_special=()) -> List[int]:
+        return [ord(char) for char in text]
+
+    def decode(self, tokens: List[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+def _packer(**kwargs) -> ContextPacker:
+    return ContextPacker("gpt-4o-mini", encoding=_FakeEncoding(), **kwargs)
+
+
+def _make_report(title: str, content: str, score: float):
+    return {"title": title, "content": content, "score": score, "source": "테스트증권", "publish_date": "2025-03-01"}
+
+
+def test_pack_ranks_by_score_and_respects_budget():
+    """점수가 높은 문서부터 포함되고 예산을 넘지 않는지 확인"""
+    packer = _packer(token_budget=300, min_truncated_tokens=50)
+    reports = [
+        _make_report("낮은 점수", "반도체 업황 회복이 기대된다. " * 40, 0.3),
+        _make_report("높은 점수", "삼성전자 1분기 영업이익이 시장 예상을 상회했다. " * 10, 0.9),
+        _make_report("중간 점수", "HBM 공급 확대로 하반기 실적 개선이 전망된다. " * 10, 0.6),
+    ]
+
+    packed = packer.pack(reports)
+
+    assert packed.items[0]["title"] == "높은 점수"
+    assert packed.packed_tokens <= 300
+    assert packed.saved_tokens > 0
+    assert packed.to_metrics(num_calls=2)["prompt_tokens_saved"] == packed.saved_tokens * 2
+
+
+def test_pack_removes_near_duplicates():
+    """거의 동일한 문서는 한 번만 포함되는지 확인"""
+    packer = _packer(token_budget=5000)
+    content = "SK하이닉스는 HBM3E 12단 제품을 주요 고객사에 공급하기 시작했으며 점유율 확대가 예상된다."
+    reports = [
+        _make_report("원본", content, 0.8),
+        _make_report("재인용", content + " ", 0.7),
+        _make_report("다른 내용", "LG에너지솔루션은 북미 배터리 공장 가동률 하락으로 실적이 부진했다.", 0.5),
+    ]
+
+    packed = packer.pack(reports)
+
+    assert [item["title"] for item in packed.items] == ["원본", "다른 내용"]
+    assert packed.duplicate_count == 1
+
+
+def test_pack_sections_allocates_budget_by_importance():
+    """중요도가 높은 섹션에 더 많은 예산이 배분되는지 확인"""
+    packer = _packer(token_budget=400)
+    long_text = " ".join(f"{i}번째 문장: 반도체 수출이 전년 대비 증가하며 업황 개선 신호가 나타났다." for i in range(60))
+    other_text = " ".join(f"{i}번째 메시지: 2차전지 업종은 재고 조정이 이어지고 있어 단기 반등은 제한적이다." for i in range(60))
+
+    packed = packer.pack_sections({
+        "report": (long_text, 8),
+        "telegram": (other_text, 2),
+        "financial": ("정보 없음", 5),
+    })
+
+    assert packed.sections["financial"] == "정보 없음"
+    assert packer.count_tokens(packed.sections["report"]) > packer.count_tokens(packed.sections["telegram"])
+    assert packed.packed_tokens <= 400 + 10
+
+
+def test_pack_sections_zero_importance_uses_leftover_budget():
+    """중요도 0인 섹션은 다른 섹션이 예산 안에 들어간 뒤 남은 토큰만 사용하는지 확인"""
+    packer = _packer(token_budget=100)
+
+    packed = packer.pack_sections({"report": ("가" * 60, 1), "misc": ("나" * 60, 0)})
+    assert packed.sections["report"] == "가" * 60
+    assert packed.sections["misc"].startswith("나" * 40) and packed.sections["misc"].endswith("(생략)")
+
+    packed = packer.pack_sections({"report": ("가" * 150, 1), "misc": ("나" * 60, 0)})
+    assert packed.sections["misc"] == ""
+    assert packed.packed_tokens == 100
+
+
+def test_truncate_to_zero_tokens_returns_empty():
+    """0 토큰 이하로 자르면 생략 표시 없이 빈 문자열을 반환하는지 확인"""
+    packer = _packer()
+    assert packer.truncate("삼성전자 실적", 0) == ""
+    assert packer.truncate("삼성전자 실적", 4) == "삼성전자 ...(생략)"
@@ -0,0 +1,142 @@
+"""데이터셋 생성 체크포인트 테스트
+
+주요 테스트 항목:
+1. 잘린 마지막 줄을 무시하고 체크포인트 기록 로드
+2. 재실행 시 변경되지 않은 파일/청크는 다시 파싱/생성하지 않음
+3. 문서를 추가하면 추가된 문서의 청크만 생성
+"""
+
+import json
+
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+
+from evaluation.generator import dataset_generator
+from evaluation.generator.checkpoint import GenerationCheckpoint
+
+
+class _TextLoader:
+    """PyPDFLoader 대체 (테스트용 .pdf 파일을 텍스트로 읽음)"""
+    loaded = []
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def load(self):
+        _TextLoader.loaded.append(self.file_path)
+        with open(self.file_path, encoding="utf-8") as f:
+            return [Document(page_content=f.read(), metadata={"source": self.file_path, "page": 0})]
+
+
+def _fake_llm(calls):
+    def respond(prompt_value) -> str:
+        calls.append(prompt_value.to_string())
+        return json.dumps([{"question": f"질문 {len(calls)}", "answer": "답변"}], ensure_ascii=False)
+    return RunnableLambda(respond)
+
+
+def test_checkpoint_ignores_truncated_line(tmp_path):
+    """중단으로 잘린 마지막 줄은 무시하고 완료된 기록만 로드하는지 확인"""
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = GenerationCheckpoint(path)
+    checkpoint.put("queries:a", [{"question": "q"}])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": "queries:b", "val')
+
+    reloaded = GenerationCheckpoint(path)
+    assert reloaded.get("queries:a") == [{"question": "q"}]
+    assert reloaded.get("queries:b") is None
+    assert len(reloaded) == 1
+
+
+def test_synthetic_dataset_rerun_only_generates_new_documents(tmp_path, monkeypatch):
+    """재실행 시 체크포인트를 재사용하고, 추가된 문서만 파싱/생성하는지 확인"""
+    monkeypatch.setattr(dataset_generator, "PyPDFLoader", _TextLoader)
+    _TextLoader.loaded = []
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "a.pdf").write_text("삼성전자 1분기 실적 보고서", encoding="utf-8")
+    (docs_dir / "b.pdf").write_text("SK하이닉스 HBM 공급 계획", encoding="utf-8")
+    output_path = tmp_path / "dataset.json"
+
+    calls = []
+    kwargs = dict(docs_dir=docs_dir, output_path=output_path, dataset_name="test", num_samples=10, max_concurrency=2)
+    first = dataset_generator.generate_synthetic_dataset(llm=_fake_llm(calls), **kwargs)
+    assert len(calls) == 2
+    assert len(first.queries) == 2
+    assert (tmp_path / "dataset.checkpoint.jsonl").exists()
+
+    # 변경 없이 재실행: 파싱/LLM 호출 없음
+    _TextLoader.loaded = []
+    rerun_calls = []
+    rerun = dataset_generator.generate_synthetic_dataset(llm=_fake_llm(rerun_calls), **kwargs)
+    assert rerun_calls == []
+    assert _TextLoader.loaded == []
+    assert [q["question"] for q in rerun.queries] == [q["question"] for q in first.queries]
+
+    # 문서 추가: 새 문서만 파싱/생성하고 쿼리는 현재 청크 ID로 연결
+    (docs_dir / "c.pdf").write_text("현대차 전기차 판매량", encoding="utf-8")
+    _TextLoader.loaded = []
+    added_calls = []
+    added = dataset_generator.generate_synthetic_dataset(llm=_fake_llm(added_calls), **kwargs)
+    assert len(added_calls) == 1
+    assert "현대차" in added_calls[0]
+    assert [path.endswith("c.pdf") for path in _TextLoader.loaded] == [True]
+    assert len(added.queries) == 3
+    chunk_ids = {doc["id"] for doc in added.documents}
+    assert all(q["relevant_doc_ids"][0] in chunk_ids for q in added.queries)
+
+
+def test_synthetic_dataset_reserves_quota_for_new_document(tmp_path, monkeypatch):
+    """앞 문서의 청크만으로 목표 수를 채울 수 있어도, 추가된 문서가 할당량만큼 쿼리를 받는지 확인"""
+    monkeypatch.setattr(dataset_generator, "PyPDFLoader", _TextLoader)
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "a.pdf").write_text("\n\n".join(f"삼성전자 {i}분기 실적 보고서 요약" for i in range(6)), encoding="utf-8")
+    kwargs = dict(docs_dir=docs_dir, output_path=tmp_path / "dataset.json", dataset_name="test",
+                  num_samples=4, doc_chunk_size=20, doc_chunk_overlap=0, max_concurrency=2)
+
+    first = dataset_generator.generate_synthetic_dataset(llm=_fake_llm([]), **kwargs)
+    assert len(first.queries) == 4
+
+    (docs_dir / "b.pdf").write_text("\n\n".join(f"현대차 {i}월 전기차 판매량" for i in range(6)), encoding="utf-8")
+    added_calls = []
+    added = dataset_generator.generate_synthetic_dataset(llm=_fake_llm(added_calls), **kwargs)
+
+    # 기존 문서는 체크포인트를 재사용하고, 새 문서는 할당량(2개)만큼만 생성
+    assert len(added_calls) == 2
+    assert all("현대차" in call for call in added_calls)
+    sources = [next(doc["metadata"]["source"] for doc in added.documents if doc["id"] == q["relevant_doc_ids"][0])
+               for q in added.queries]
+    assert [source.endswith("b.pdf") for source in sources].count(True) == 2
+    assert len(added.queries) == 4
+
+
+def test_complex_dataset_keeps_pairs_when_document_added(tmp_path, monkeypatch):
+    """문서를 추가해도 기존 문서 쌍은 유지되어, 새로 생성하는 쿼리에는 항상 새 문서 청크가 포함되는지 확인"""
+    monkeypatch.setattr(dataset_generator, "PyPDFLoader", _TextLoader)
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "a.pdf").write_text("\n\n".join(f"삼성전자 {i}분기 실적 보고서 요약" for i in range(6)), encoding="utf-8")
+    (docs_dir / "b.pdf").write_text("\n\n".join(f"SK하이닉스 {i}세대 HBM 공급" for i in range(6)), encoding="utf-8")
+
+    def complex_llm(calls):
+        def respond(prompt_value) -> str:
+            calls.append(prompt_value.to_string())
+            return json.dumps({"question": f"질문 {len(calls)}", "answer": "답변"}, ensure_ascii=False)
+        return RunnableLambda(respond)
+
+    kwargs = dict(docs_dir=str(docs_dir), output_path=str(tmp_path / "complex.json"), dataset_name="complex",
+                  num_samples=20, complexity_types=["multi_hop", "comparison"], doc_chunk_size=20,
+                  doc_chunk_overlap=0, max_concurrency=2)
+    first_calls = []
+    first = dataset_generator.generate_complex_dataset(llm=complex_llm(first_calls), **kwargs)
+    assert len(first.queries) == 20
+
+    (docs_dir / "c.pdf").write_text("현대차 전기차 판매량", encoding="utf-8")
+    added_calls = []
+    added = dataset_generator.generate_complex_dataset(llm=complex_llm(added_calls), **kwargs)
+
+    assert len(added.queries) == 20
+    assert len(added_calls) < len(first_calls)
+    assert all("현대차" in call for call in added_calls)
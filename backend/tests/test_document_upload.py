@@ -0,0 +1,69 @@
+"""문서 업로드 스풀 파일 처리 테스트
+
+주요 테스트 항목:
+1. 스풀 파일을 동시에 처리하고 완료 순서대로 결과 반환
+2. 소비 도중 닫히면 남은 처리 작업이 취소되고 종료된 뒤에 반환 (임시 디렉토리 삭제 전 정리)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from doceasy.api.v1 import document as document_api
+
+
+class _FakeDocumentService:
+    """처리 시작/종료를 기록하는 DocumentService 대체 구현"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.running = 0
+        self.finished = []
+
+    async def upload_spooled_document(self, filename, **kwargs):
+        self.running += 1
+        try:
+            await asyncio.sleep(self.delays[filename])
+            self.finished.append(filename)
+            return SimpleNamespace(filename=filename)
+        finally:
+            self.running -= 1
+
+
+def _spooled_files(tmp_path, names):
+    files = []
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        files.append({"filename": name, "path": path, "content_type": "text/plain", "size": 4})
+    return files
+
+
+@pytest.mark.asyncio
+async def test_process_spooled_files_yields_in_completion_order(tmp_path, monkeypatch):
+    """먼저 끝난 파일부터 결과가 반환되고 처리된 스풀 파일은 삭제되는지 확인"""
+    monkeypatch.setattr(document_api.settings, "UPLOAD_MAX_CONCURRENCY", 2)
+    service = _FakeDocumentService({"slow": 0.05, "fast": 0.0})
+    files = _spooled_files(tmp_path, ["slow", "fast"])
+
+    results = [item async for item in document_api.process_spooled_files(service, "p", "u", files)]
+
+    assert [document.filename for _, document, _ in results] == ["fast", "slow"]
+    assert not any(file_data["path"].exists() for file_data in files)
+
+
+@pytest.mark.asyncio
+async def test_closing_process_spooled_files_stops_pending_tasks(tmp_path, monkeypatch):
+    """소비 도중 닫으면 남은 작업이 취소되고, 닫기가 끝났을 때 실행 중인 작업이 없는지 확인"""
+    monkeypatch.setattr(document_api.settings, "UPLOAD_MAX_CONCURRENCY", 3)
+    service = _FakeDocumentService({"a": 0.0, "b": 10.0, "c": 10.0})
+    files = _spooled_files(tmp_path, ["a", "b", "c"])
+
+    generator = document_api.process_spooled_files(service, "p", "u", files)
+    first = await generator.__anext__()
+    await generator.aclose()
+
+    assert first[1].filename == "a"
+    assert service.running == 0
+    assert service.finished == ["a"]
@@ -0,0 +1,105 @@
+"""임베딩 디스패처 테스트
+
+주요 테스트 항목:
+1. 토큰 수 기준 배치 구성
+2. 동시 요청 결과의 입력 순서 유지
+3. 실패한 배치만 재시도
+4. 분당 요청 수 제한
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from common.services.embedding_dispatcher import (
+    BatchEmbeddingResult,
+    EmbeddingDispatcher,
+    RateLimiter,
+    build_token_batches,
+)
+
+
+def _count_tokens(text: str) -> int:
+    return len(text)
+
+
+def test_build_token_batches_respects_token_and_size_limits():
+    """토큰/텍스트 수 제한과 입력 순서를 지키는지 확인"""
+    texts = ["a" * 4, "b" * 4, "c" * 4, "d" * 20, "e"]
+    batches = build_token_batches(texts, _count_tokens, max_batch_tokens=10, max_batch_size=2)
+
+    assert [batch.texts for batch in batches] == [["a" * 4, "b" * 4], ["c" * 4], ["d" * 20], ["e"]]
+    assert [batch.tokens for batch in batches] == [8, 4, 20, 1]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_keeps_input_order_with_concurrency():
+    """늦게 끝난 배치가 있어도 결과가 입력 순서인지 확인"""
+    texts = [f"text-{i}" for i in range(10)]
+    batches = build_token_batches(texts, _count_tokens, max_batch_tokens=14)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _embed(batch):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # 앞 배치일수록 늦게 끝나도록 지연
+        await asyncio.sleep(0.01 * (10 - int(batch[0].split("-")[1])))
+        in_flight -= 1
+        return BatchEmbeddingResult([[float(text.split("-")[1])] for text in batch], len(batch), len(batch))
+
+    result = await EmbeddingDispatcher(max_concurrency=3).dispatch(batches, _embed)
+
+    assert result.embeddings == [[float(i)] for i in range(10)]
+    assert result.total_tokens == 10
+    assert max_in_flight == 3
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.mark.asyncio
+async def test_dispatch_retries_only_failed_batch():
+    """일시적 오류가 난 배치만 다시 요청하는지 확인"""
+    batches = build_token_batches(["a", "b", "c"], _count_tokens, max_batch_tokens=1)
+    calls = []
+
+    async def _embed(batch):
+        calls.append(batch[0])
+        if batch[0] == "b" and calls.count("b") == 1:
+            raise _RateLimitError("rate limited")
+        return BatchEmbeddingResult([[1.0]])
+
+    dispatcher = EmbeddingDispatcher(max_concurrency=3, retry_base_delay=0.01)
+    result = await dispatcher.dispatch(batches, _embed)
+
+    assert len(result.embeddings) == 3
+    assert result.retries == 1
+    assert sorted(calls) == ["a", "b", "b", "c"]
+
+
+def test_dispatch_sync_raises_non_retryable_error():
+    """재시도 대상이 아닌 오류는 바로 전달되는지 확인"""
+    batches = build_token_batches(["a", "b"], _count_tokens, max_batch_tokens=1)
+
+    def _embed(batch):
+        if batch[0] == "b":
+            raise ValueError("bad input")
+        return BatchEmbeddingResult([[1.0]])
+
+    with pytest.raises(ValueError):
+        EmbeddingDispatcher(max_concurrency=2).dispatch_sync(batches, _embed)
+
+
+def test_rate_limiter_waits_when_requests_exhausted():
+    """분당 요청 한도를 다 쓰면 다음 요청이 대기하는지 확인"""
+    limiter = RateLimiter(requests_per_minute=600)  # 0.1초당 1회
+    limiter._request_allowance = 1
+    limiter.acquire_sync(1)
+
+    started = time.monotonic()
+    limiter.acquire_sync(1)
+    assert time.monotonic() - started >= 0.05
@@ -0,0 +1,96 @@
+"""임베딩 평가 메트릭 테스트
+
+주요 테스트 항목:
+1. 행렬 연산 유사도와 쌍별 코사인 유사도 일치
+2. searchsorted 기반 최적 임계값이 반복 계산 결과와 일치
+3. MRR 순위 계산
+4. 배치 임베딩 기반 모델 평가
+"""
+
+import numpy as np
+
+from evaluation.metrics.embedding_metrics import (
+    calculate_mrr,
+    calculate_similarity,
+    evaluate_embedding_model,
+    find_optimal_threshold,
+    similarity_matrix,
+)
+
+
+def _reference_optimal_threshold(related, unrelated, start=0.0, end=1.0, step=0.01):
+    """기존 반복문 구현 (비교 기준)"""
+    best_threshold, best_f1 = 0.0, 0.0
+    for threshold in np.arange(start, end + step, step):
+        tp = sum(1 for s in related if s >= threshold)
+        fp = len(unrelated) - sum(1 for s in unrelated if s < threshold)
+        fn = len(related) - tp
+        precision = tp / (tp + fp) if tp + fp else 0
+        recall = tp / (tp + fn) if tp + fn else 0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0
+        if f1 > best_f1:
+            best_f1, best_threshold = f1, threshold
+    return best_threshold, best_f1
+
+
+def test_similarity_matrix_matches_pairwise():
+    """유사도 행렬이 쌍별 코사인 유사도와 같은지 확인"""
+    rng = np.random.default_rng(0)
+    texts, queries = rng.normal(size=(4, 8)), rng.normal(size=(3, 8))
+
+    matrix = similarity_matrix(texts, queries)
+
+    expected = [[calculate_similarity(t, q) for q in queries] for t in texts]
+    assert np.allclose(matrix, expected)
+
+
+def test_find_optimal_threshold_matches_reference():
+    """벡터화된 임계값 탐색이 기존 반복 계산과 같은 결과를 내는지 확인"""
+    rng = np.random.default_rng(1)
+    texts = rng.normal(size=(6, 16))
+    related = texts[:3] + rng.normal(scale=0.5, size=(3, 16))
+    unrelated = rng.normal(size=(5, 16))
+
+    threshold, f1 = find_optimal_threshold(list(texts), list(related), list(unrelated))
+
+    related_sims = [calculate_similarity(t, q) for t in texts for q in related]
+    unrelated_sims = [calculate_similarity(t, q) for t in texts for q in unrelated]
+    expected_threshold, expected_f1 = _reference_optimal_threshold(related_sims, unrelated_sims)
+    assert threshold == expected_threshold
+    assert abs(f1 - expected_f1) < 1e-9
+
+
+def test_calculate_mrr_uses_query_ranks():
+    """관련 쿼리의 순위 역수 평균을 계산하는지 확인"""
+    texts = [[1.0, 0.0], [0.0, 1.0]]
+    queries = [[1.0, 0.1], [0.1, 1.0], [1.0, 1.0]]
+
+    # 텍스트 0의 관련 쿼리 0은 1위, 텍스트 1의 관련 쿼리 0은 3위
+    assert abs(calculate_mrr(texts, [[0], [0]], queries) - (1.0 + 1.0 / 3) / 2) < 1e-9
+
+
+class _BatchModel:
+    """embed_documents 호출 횟수를 기록하는 테스트용 LangChain 호환 모델"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [[1.0, 0.0] if "반도체" in text else [0.0, 1.0] for text in texts]
+
+
+def test_evaluate_embedding_model_embeds_in_batch(tmp_path):
+    """텍스트와 쿼리를 배치로 임베딩하고 관련/비관련을 구분하는지 확인"""
+    model = _BatchModel()
+
+    results = evaluate_embedding_model(
+        ["반도체 업황", "반도체 수출"], ["반도체 전망"], ["배터리 전망", "화장품 수출"],
+        model, "batch-model", tmp_path
+    )
+
+    assert model.calls == 1
+    assert results["success_rate"] == 1.0
+    assert results["f1_score"] == 1.0
+    assert results["mrr"] == 1.0
+    assert (tmp_path / "batch-model_embedding_evaluation_report.json").exists()
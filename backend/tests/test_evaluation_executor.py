@@ -0,0 +1,101 @@
+"""평가 실행기 및 영구 캐시 테스트
+
+주요 테스트 항목:
+1. 실행기의 입력 순서 유지와 동시성 제한
+2. 임베딩 캐시 미스만 한 번에 임베딩, 재실행 시 캐시 사용
+3. LLM 평가(judge) 응답 캐싱 및 LCEL 체인 사용
+"""
+
+import threading
+import time
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+
+from evaluation.executor import CachedEmbeddings, CachedJudge, EvaluationCache, EvaluationExecutor
+
+
+class _CountingEmbeddings(Embeddings):
+    """호출된 텍스트를 기록하는 테스트용 임베딩 모델"""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class _CountingLLM:
+    """호출 횟수를 기록하는 테스트용 LLM"""
+    model_name = "fake-judge"
+    temperature = 0
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, input, config=None, **kwargs):
+        self.calls += 1
+        return AIMessage(content="8")
+
+
+def test_executor_preserves_order_and_bounds_concurrency():
+    """완료 순서와 관계없이 입력 순서로 결과를 반환하고 동시 실행 수를 제한하는지 확인"""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(value: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01 * (5 - value % 5))
+        with lock:
+            active -= 1
+        return value * 2
+
+    completed = []
+    results = EvaluationExecutor(max_workers=3).map(work, range(10), on_result=lambda i, r: completed.append(i))
+
+    assert results == [value * 2 for value in range(10)]
+    assert sorted(completed) == list(range(10))
+    assert peak <= 3
+
+
+def test_cached_embeddings_embeds_only_misses_and_persists(tmp_path):
+    """캐시 미스만 한 번의 호출로 임베딩하고 새 캐시 인스턴스에서도 재사용하는지 확인"""
+    path = tmp_path / "cache.sqlite"
+    model = _CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EvaluationCache(path))
+
+    first = embeddings.embed_documents(["a", "bb", "a"])
+    second = embeddings.embed_documents(["bb", "ccc"])
+
+    assert first == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert second == [[2.0, 1.0], [3.0, 1.0]]
+    assert model.calls == [["a", "bb"], ["ccc"]]
+
+    # 재실행: 디스크 캐시에서 모두 조회
+    rerun_model = _CountingEmbeddings()
+    rerun = CachedEmbeddings(rerun_model, EvaluationCache(path)).embed_documents(["a", "bb", "ccc"])
+    assert rerun == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+    assert rerun_model.calls == []
+
+
+def test_cached_judge_reuses_responses_in_chain(tmp_path):
+    """같은 프롬프트의 LLM 평가 응답을 캐시에서 반환하고 LCEL 체인에서도 동작하는지 확인"""
+    llm = _CountingLLM()
+    judge = CachedJudge(llm, EvaluationCache(tmp_path / "cache.sqlite"))
+    chain = PromptTemplate.from_template("점수: {text}") | judge | StrOutputParser()
+
+    assert chain.invoke({"text": "응답"}) == "8"
+    assert chain.invoke({"text": "응답"}) == "8"
+    assert chain.invoke({"text": "다른 응답"}) == "8"
+    assert llm.calls == 2
@@ -0,0 +1,207 @@
+"""에이전트 LLM 응답 캐시 테스트
+
+주요 테스트 항목:
+1. temperature=0 + response_cache 설정 에이전트의 반복 호출은 캐시 적중 (LLM 호출/토큰 기록 없음)
+2. temperature가 0이 아니거나 콜백이 있는 호출은 캐시하지 않음
+3. 에이전트별 최대 항목 수 초과 시 가장 오래 사용되지 않은 항목 제거
+4. 구조화된 출력 파싱에 실패한 응답은 캐시하지 않음
+"""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from pydantic import BaseModel
+
+from common.services import agent_llm as agent_llm_module
+from common.services.agent_llm import AgentLLM
+from common.services.llm_response_cache import LLMResponseCache
+
+
+class _FakePipeline:
+    """명령을 모아 두었다가 execute 시 순서대로 실행하는 테스트용 파이프라인"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class _FakeRedis:
+    """LLMResponseCache가 사용하는 명령만 구현한 메모리 Redis"""
+
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+        self.hashes = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key, minimum, maximum):
+        zset = self.zsets.get(key, {})
+        for member in [member for member, score in zset.items() if score <= maximum]:
+            del zset[member]
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def zpopmin(self, key, count):
+        zset = self.zsets.get(key, {})
+        popped = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = fields.get(field, 0) + amount
+
+
+class _CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls += 1
+        return AIMessage(
+            content=f"응답 {self.calls}",
+            usage_metadata={"input_tokens": 30, "output_tokens": 10, "total_tokens": 40}
+        )
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    response_cache = LLMResponseCache("redis://unused", ttl=60, max_entries=2)
+    response_cache._redis = _FakeRedis()
+    monkeypatch.setattr(agent_llm_module, "get_llm_response_cache", lambda: response_cache)
+    monkeypatch.setattr(agent_llm_module.settings, "LLM_RESPONSE_CACHE_ENABLED", True)
+    return response_cache
+
+
+def _make_agent_llm(temperature: float = 0) -> AgentLLM:
+    agent = AgentLLM("test_agent")
+    agent.llm_config = {"provider": "fake", "model_name": "fake-model", "temperature": temperature, "response_cache": True}
+    agent.fallback_settings = {"enabled": False}
+    agent.llm = _CountingLLM()
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_repeated_deterministic_call_hits_cache(cache):
+    """같은 프롬프트의 반복 호출은 LLM을 다시 호출하지 않고 절약 토큰을 기록하는지 확인"""
+    agent = _make_agent_llm()
+    prompt = [HumanMessage(content="삼성전자 실적 어때?")]
+
+    first = await agent.ainvoke_with_fallback(prompt)
+    second = await agent.ainvoke_with_fallback(prompt)
+    other = await agent.ainvoke_with_fallback([HumanMessage(content="SK하이닉스 실적 어때?")])
+
+    assert agent.llm.calls == 2
+    assert second.content == first.content == "응답 1"
+    assert second.usage_metadata["total_tokens"] == 40
+    assert other.content == "응답 2"
+    stats = cache.get_stats()["test_agent"]
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["saved_total_tokens"] == 40
+
+
+@pytest.mark.asyncio
+async def test_non_deterministic_or_callback_calls_bypass_cache(cache):
+    """temperature가 0이 아니거나 콜백이 있는 호출은 캐시를 사용하지 않는지 확인"""
+    agent = _make_agent_llm(temperature=0.7)
+    await agent.ainvoke_with_fallback("질문")
+    await agent.ainvoke_with_fallback("질문")
+    assert agent.llm.calls == 2
+
+    agent = _make_agent_llm()
+    await agent.ainvoke_with_fallback("질문", callbacks=[])
+    await agent.ainvoke_with_fallback("질문", callbacks=[])
+    assert agent.llm.calls == 2
+    assert cache.get_stats() == {}
+
+
+class _ScriptedLLM:
+    """정해진 응답을 순서대로 반환하는 LLM 대체 구현"""
+
+    def __init__(self, contents):
+        self.contents = list(contents)
+        self.calls = 0
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls += 1
+        return AIMessage(content=self.contents.pop(0))
+
+
+class _Analysis(BaseModel):
+    intent: str
+
+
+@pytest.mark.asyncio
+async def test_structured_output_caches_only_parsable_responses(cache):
+    """파싱에 실패한 응답은 캐시하지 않아 다음 호출에서 LLM을 다시 호출하는지 확인"""
+    agent = _make_agent_llm()
+    agent.llm = _ScriptedLLM(["JSON이 아닌 응답", '{"intent": "실적"}'])
+    structured = agent.with_structured_output(_Analysis)
+    prompt = [HumanMessage(content="삼성전자 실적 어때?")]
+
+    first = await structured.ainvoke(prompt)
+    second = await structured.ainvoke(prompt)
+    third = await structured.ainvoke(prompt)
+
+    assert isinstance(first, AIMessage)
+    assert second.intent == third.intent == "실적"
+    assert agent.llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_cached_response_is_treated_as_miss(cache):
+    """이미 저장된 응답이 검증에 실패하면 캐시 미스로 처리하고 새 응답으로 교체하는지 확인"""
+    agent = _make_agent_llm()
+    prompt = [HumanMessage(content="질문")]
+    key = agent._make_response_cache_key((prompt,), {})
+    await cache.aset("test_agent", key, AIMessage(content="잘못된 응답"))
+
+    result = await agent.ainvoke_with_fallback(prompt, cache_validator=lambda response: response.content != "잘못된 응답")
+
+    assert result.content == "응답 1" and agent.llm.calls == 1
+    assert (await cache.aget("test_agent", key)).content == "응답 1"
+
+
+@pytest.mark.asyncio
+async def test_per_agent_size_cap_evicts_least_recently_used(cache):
+    """에이전트별 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 확인"""
+    keys = [cache.make_key("test_agent", "fake-model", (f"질문 {i}",), {}) for i in range(3)]
+    for i, key in enumerate(keys):
+        await cache.aset("test_agent", key, AIMessage(content=f"응답 {i}"))
+
+    assert await cache.aget("test_agent", keys[0]) is None
+    assert (await cache.aget("test_agent", keys[2])).content == "응답 2"
+    assert len(cache._redis.zsets[cache._index_key("test_agent")]) == 2
@@ -0,0 +1,80 @@
+"""로컬 임베딩 엔진 테스트
+
+주요 테스트 항목:
+1. 동시 요청을 한 번의 encode로 묶어 처리
+2. 길이 순 정렬 후 입력 순서로 결과 복원
+3. 추론 실패 시 대기 중인 요청에 예외 전달
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from common.services.local_embedding_engine import LocalEmbeddingEngine
+
+
+class _FakeModel:
+    """텍스트 길이를 임베딩으로 반환하는 테스트용 모델"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("encode 실패")
+        return np.array([[float(len(text))] for text in texts])
+
+
+def _make_engine(model: _FakeModel, **kwargs) -> LocalEmbeddingEngine:
+    engine = LocalEmbeddingEngine("fake-model", batch_wait_ms=20, **kwargs)
+    engine._model = model
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched():
+    """동시에 들어온 요청이 한 번의 encode로 처리되고 결과 순서가 유지되는지 확인"""
+    model = _FakeModel()
+    engine = _make_engine(model)
+
+    results = await asyncio.gather(
+        engine.encode_async(["a", "bbbb"]),
+        engine.encode_async(["cc"]),
+        engine.encode_async(["ddddddd", "e"]),
+    )
+
+    assert results == [[[1.0], [4.0]], [[2.0]], [[7.0], [1.0]]]
+    assert len(model.calls) == 1
+    # 배치 안에서는 긴 텍스트부터 정렬되어 추론
+    assert model.calls[0] == ["ddddddd", "bbbb", "cc", "a", "e"]
+    assert engine.stats["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_flushes_immediately():
+    """최대 배치 크기에 도달하면 대기 없이 나누어 처리하는지 확인"""
+    model = _FakeModel()
+    engine = _make_engine(model, max_batch_size=2)
+
+    result = await engine.encode_async(["a", "bb", "ccc"])
+
+    assert result == [[1.0], [2.0], [3.0]]
+    assert [len(call) for call in model.calls] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_encode_failure_propagates_to_callers():
+    """추론 실패 시 대기 중인 모든 요청에 예외가 전달되는지 확인"""
+    engine = _make_engine(_FakeModel(fail=True))
+
+    with pytest.raises(RuntimeError):
+        await engine.encode_async(["a", "b"])
+
+
+def test_sync_encode_keeps_order():
+    """동기 encode도 입력 순서로 결과를 반환하는지 확인"""
+    engine = _make_engine(_FakeModel())
+    assert engine.encode(["abc", "a", "ab"]) == [[3.0], [1.0], [2.0]]
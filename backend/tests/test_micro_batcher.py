@@ -0,0 +1,75 @@
+"""비동기 마이크로 배치 처리기 테스트
+
+주요 테스트 항목:
+1. 동시 요청 항목을 한 번의 배치 함수 호출로 처리하고 요청별 순서대로 결과 반환
+2. 크기 도달로 처리된 뒤에도 다음 요청은 batch_wait_ms 동안 모아 처리
+3. 동기 처리와 비동기 처리가 동시에 통계를 갱신해도 누락 없이 기록
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from common.services.micro_batcher import AsyncMicroBatcher
+
+
+def _double(items):
+    return [item * 2 for item in items]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_one_batch():
+    """동시에 들어온 요청이 하나의 배치로 처리되고 요청별 결과 순서가 유지되는지 확인"""
+    calls = []
+
+    def process(items):
+        calls.append(list(items))
+        return _double(items)
+
+    batcher = AsyncMicroBatcher(process, ThreadPoolExecutor(max_workers=1), max_batch_size=10, batch_wait_ms=20)
+    results = await asyncio.gather(batcher.submit_many([1, 2]), batcher.submit_many([3]))
+
+    assert results == [[2, 4], [6]]
+    assert calls == [[1, 2, 3]]
+    assert batcher.stats == {"batches": 1, "items": 3}
+
+
+def test_sync_runs_update_stats_under_lock():
+    """여러 스레드에서 동기 처리를 호출해도 통계가 정확히 기록되는지 확인"""
+    batcher = AsyncMicroBatcher(_double, ThreadPoolExecutor(max_workers=1), max_batch_size=10, batch_wait_ms=5,
+                                extra_stats=("requests",))
+
+    def worker():
+        for _ in range(200):
+            batcher.count("requests")
+            assert batcher.run([1, 2]) == [2, 4]
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert batcher.stats == {"batches": 800, "items": 1600, "requests": 800}
+
+
+@pytest.mark.asyncio
+async def test_size_flush_cancels_wait_timer():
+    """크기 도달로 처리된 뒤 들어온 다음 요청이 이전 대기 타이머로 일찍 처리되지 않는지 확인"""
+    calls = []
+
+    def process(items):
+        calls.append(list(items))
+        return _double(items)
+
+    batcher = AsyncMicroBatcher(process, ThreadPoolExecutor(max_workers=1), max_batch_size=3, batch_wait_ms=100)
+    first = asyncio.ensure_future(batcher.submit_many([1, 2, 3]))
+    await asyncio.sleep(0.06)
+    second = asyncio.ensure_future(batcher.submit_many([4]))
+    await asyncio.sleep(0.06)
+    third = asyncio.ensure_future(batcher.submit_many([5]))
+
+    assert await asyncio.gather(first, second, third) == [[2, 4, 6], [8], [10]]
+    assert calls == [[1, 2, 3], [4, 5]]
@@ -0,0 +1,76 @@
+"""Cross-Encoder 스코어링 서비스 테스트
+
+주요 테스트 항목:
+1. 동시 요청의 쌍을 한 번의 forward로 배치 처리
+2. (쿼리, 청크 ID) 점수 캐싱
+3. 리랭커 간 서비스 공유
+"""
+
+import asyncio
+
+import pytest
+
+from common.services.reranker import (
+    CrossEncoderRerankerConfig,
+    CrossEncoderScoringService,
+    get_cross_encoder_service,
+)
+
+
+class FakeCrossEncoder:
+    """문서 길이를 점수로 반환하는 가짜 모델"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append(len(pairs))
+        return [len(text) / 100 for _, text in pairs]
+
+
+def _make_service(**kwargs) -> CrossEncoderScoringService:
+    service = CrossEncoderScoringService(CrossEncoderRerankerConfig(batch_wait_ms=20, **kwargs))
+    service._model = FakeCrossEncoder()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_forward_pass():
+    """동시에 들어온 요청들이 하나의 배치로 추론되는지 확인"""
+    service = _make_service()
+    results = await asyncio.gather(
+        service.score("삼성전자 실적", [("a", "x" * 10), ("b", "x" * 20)]),
+        service.score("SK하이닉스 HBM", [("c", "x" * 30)]),
+    )
+
+    assert results == [[0.1, 0.2], [0.3]]
+    assert service._model.calls == [3]
+
+
+@pytest.mark.asyncio
+async def test_scores_are_cached_by_query_and_chunk():
+    """같은 쿼리와 청크는 다시 추론하지 않는지 확인"""
+    service = _make_service()
+    await service.score("삼성전자 실적", [("a", "x" * 10)])
+    scores = await service.score("삼성전자 실적", [("a", "x" * 10), ("b", "x" * 50)])
+
+    assert scores == [0.1, 0.5]
+    assert service._model.calls == [1, 1]
+    assert service.stats["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_pairs_flushes_immediately():
+    """max_batch_pairs에 도달하면 대기 없이 추론하는지 확인"""
+    service = _make_service(max_batch_pairs=2)
+    scores = await service.score("쿼리", [("a", "x"), ("b", "xx"), ("c", "xxx")])
+
+    assert scores == [0.01, 0.02, 0.03]
+    assert service._model.calls == [2, 1]
+
+
+def test_service_is_shared_per_model_configuration():
+    """같은 모델 설정이면 같은 서비스(모델)를 공유하는지 확인"""
+    config = CrossEncoderRerankerConfig(model_name="test/model")
+    assert get_cross_encoder_service(config) is get_cross_encoder_service(CrossEncoderRerankerConfig(model_name="test/model"))
+    assert get_cross_encoder_service(config) is not get_cross_encoder_service(CrossEncoderRerankerConfig(model_name="test/model", quantize=True))
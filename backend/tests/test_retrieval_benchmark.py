@@ -0,0 +1,171 @@
+"""검색 벤치마크 테스트
+
+주요 테스트 항목:
+1. 코퍼스 저장/로드 및 크기 확장
+2. 로컬 벡터 스토어 필터 검색
+3. 전체 검색기 벤치마크 실행 (외부 서비스 없이)
+4. 동기/비동기 검색 경로 부하 테스트 및 MMR 선택
+5. 테이블 모드 문서별 최소 청크 보장
+6. 품질/지연 시간 회귀 판정 (장비 속도 보정, 테이블 모드 정답 청크)
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.retrieval.corpus import RecordedCorpus
+from benchmarks.retrieval.load_test import LOAD_TEST_RETRIEVERS, run_load_test
+from benchmarks.retrieval.regression import (
+    RegressionTolerance,
+    _relevant_chunk_ids,
+    compare_to_baseline,
+    run_regression_suite,
+)
+from benchmarks.retrieval.runner import RETRIEVER_NAMES, run_benchmark
+from benchmarks.retrieval.stand_ins import HashingEmbedder, LocalVectorStoreManager
+from common.services.retrievers.semantic import SemanticRetrieverConfig
+from common.services.retrievers.tablemode_semantic import TableModeSemanticRetriever
+from common.services.vector_store_manager import mmr_select
+
+
+def test_corpus_round_trip_and_scaling(tmp_path):
+    """코퍼스 저장/로드 후 확장 시 문서 ID가 복제본별로 구분되는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=3, chunks_per_document=2, num_queries=2)
+    path = tmp_path / "corpus.json"
+    corpus.save(path)
+    loaded = RecordedCorpus.load(path)
+
+    scaled = loaded.scaled(10)
+    assert len(scaled.chunks) == 10
+    assert len(scaled.document_ids) == 5
+    assert len(loaded.scaled(4).chunks) == 4
+
+
+def test_local_vector_store_applies_document_filter():
+    """document_id $in 필터가 적용되는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=5, chunks_per_document=4, num_queries=1)
+    vs_manager = LocalVectorStoreManager(corpus, HashingEmbedder(corpus.dimension))
+
+    results = vs_manager.search("삼성전자 HBM 전망", top_k=10, filters={"document_id": {"$in": ["doc-00001"]}})
+    assert len(results) == 4
+    assert all(doc.metadata["document_id"] == "doc-00001" for doc, _ in results)
+
+    mmr_results = vs_manager.search_mmr("삼성전자 HBM 전망", top_k=2, fetch_k=4, lambda_mult=0.2)
+    assert len(mmr_results) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_for_all_retrievers():
+    """모든 검색기가 오류 없이 측정되는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=5, chunks_per_document=4, num_queries=4)
+    results = await run_benchmark(
+        corpus, corpus_sizes=[20, 40], concurrency_levels=[1, 4], num_requests=8, warmup=1
+    )
+
+    assert len(results) == len(RETRIEVER_NAMES) * 2 * 2
+    for result in results:
+        assert result.errors == 0
+        assert result.p50_ms <= result.p95_ms <= result.p99_ms
+        assert result.qps > 0
+        assert result.index_memory_mb > 0
+
+
+@pytest.mark.asyncio
+async def test_load_test_async_path_overlaps_requests():
+    """비동기 검색 경로에서 동시 요청이 겹쳐 처리되어 워커당 QPS가 높아지는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=5, chunks_per_document=4, num_queries=4)
+    results = await run_load_test(
+        corpus, concurrency_levels=[8], num_requests=16, search_latency_ms=10, embed_latency_ms=5
+    )
+
+    assert [result.retriever for result in results] == list(LOAD_TEST_RETRIEVERS)
+    for result in results:
+        assert result.qps_after > result.qps_before * 2
+
+
+def test_mmr_select_prefers_diverse_documents():
+    """MMR 선택이 쿼리와 가까우면서 서로 다른 문서를 고르는지 확인"""
+    embeddings = np.array([[1.0, 0.0], [0.99, 0.01], [0.7, 0.7]], dtype=np.float32)
+
+    assert mmr_select([1.0, 0.0], embeddings, k=2, lambda_mult=1.0) == [0, 1]
+    assert mmr_select([1.0, 0.0], embeddings, k=2, lambda_mult=0.2) == [0, 2]
+    assert mmr_select([1.0, 0.0], embeddings, k=0) == []
+
+
+@pytest.mark.asyncio
+async def test_table_mode_returns_chunks_for_every_document():
+    """테이블 모드가 한 번의 임베딩으로 모든 문서에서 최소 청크 수를 확보하는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=6, chunks_per_document=4, num_queries=1)
+    vs_manager = LocalVectorStoreManager(corpus, HashingEmbedder(corpus.dimension))
+    embed_calls = []
+    original_embed = vs_manager.create_embeddings_single_query_async
+
+    async def _counting_embed(query):
+        embed_calls.append(query)
+        return await original_embed(query)
+
+    vs_manager.create_embeddings_single_query_async = _counting_embed
+    retriever = TableModeSemanticRetriever(SemanticRetrieverConfig(min_chunks_per_document=2), vs_manager)
+    doc_ids = corpus.document_ids
+
+    result = await retriever.retrieve("매출 성장률", top_k=len(doc_ids), filters={"document_id": {"$in": doc_ids}})
+
+    counts = {}
+    for doc in result.documents:
+        counts[doc.metadata["document_id"]] = counts.get(doc.metadata["document_id"], 0) + 1
+    assert counts == {doc_id: 2 for doc_id in doc_ids}
+    assert len(embed_calls) == 1
+    assert result.query_analysis["missing_documents"] == 0
+
+
+@pytest.mark.asyncio
+async def test_regression_suite_flags_latency_and_quality_regressions():
+    """품질 지표와 지연 시간을 함께 측정하고 기준값 대비 회귀를 판정하는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=8, chunks_per_document=4, num_queries=6)
+    results = await run_regression_suite(corpus, retrievers=["semantic", "contextual_bm25"], repeats=2, warmup=1)
+
+    assert [result.retriever for result in results] == ["semantic", "contextual_bm25"]
+    for result in results:
+        assert 0.0 <= result.ndcg_at_k <= 1.0
+        assert result.p50_ms <= result.p95_ms
+    baseline = {result.retriever: result.to_dict() for result in results}
+    assert compare_to_baseline(results, baseline) == []
+
+    # 기준값보다 nDCG가 높고 p95가 훨씬 짧았던 경우 회귀로 판정
+    degraded = {
+        name: {**base, "ndcg_at_k": base["ndcg_at_k"] + 0.1, "p95_ms": base["p95_ms"] / 10}
+        for name, base in baseline.items()
+    }
+    regressions = compare_to_baseline(results, degraded, RegressionTolerance(p95_latency_floor_ms=0.0))
+    assert len(regressions) == 4
+
+
+@pytest.mark.asyncio
+async def test_regression_latency_is_scaled_by_same_run_calibration():
+    """기준값을 빠른 장비에서 기록했어도 같은 실행의 보정 시간 비율로 환산해 회귀로 판정하지 않는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=8, chunks_per_document=4, num_queries=6)
+    results = await run_regression_suite(corpus, retrievers=["semantic"], repeats=2, warmup=1)
+    assert results[0].calibration_ms > 0
+
+    # 두 배 빠른 장비에서 기록한 기준값: 보정 시간도 절반
+    fast_machine = {
+        result.retriever: {**result.to_dict(), "p95_ms": result.p95_ms / 2, "calibration_ms": result.calibration_ms / 2}
+        for result in results
+    }
+    tolerance = RegressionTolerance(p95_latency_floor_ms=0.0)
+    assert compare_to_baseline(results, fast_machine, tolerance) == []
+
+    without_calibration = {name: {**base, "calibration_ms": None} for name, base in fast_machine.items()}
+    assert len(compare_to_baseline(results, without_calibration, tolerance)) == 1
+
+
+def test_table_mode_relevance_is_limited_to_filtered_documents():
+    """합성 쿼리의 테이블 모드 대상 문서에 정답 청크가 있고, 정답은 대상 문서 안의 청크로 제한되는지 확인"""
+    corpus = RecordedCorpus.synthetic(num_documents=16, chunks_per_document=4, num_queries=10)
+    chunk_documents = {chunk.id: chunk.metadata["document_id"] for chunk in corpus.chunks}
+
+    for query in corpus.queries:
+        relevant = _relevant_chunk_ids("table_mode", query, chunk_documents)
+        assert {chunk_documents[chunk_id] for chunk_id in relevant} <= set(query.document_ids)
+        if query.relevant_chunk_ids:
+            assert relevant
+        assert _relevant_chunk_ids("semantic", query, chunk_documents) == set(query.relevant_chunk_ids)
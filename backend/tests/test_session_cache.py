@@ -0,0 +1,69 @@
+"""세션 조회 캐시 테스트
+
+주요 테스트 항목:
+1. 캐시 적중 시 DB 조회 없이 세션/사용자 정보 반환
+2. 무효화(로그아웃) 후에는 DB에서 다시 조회
+3. 세션 만료 시각이 지난 캐시 항목은 사용하지 않음
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from benchmarks.auth.session_resolution import _StandInUserService, _make_sessions, stand_in_auth
+from common.core import deps
+from common.core.config import settings
+from common.core.exceptions import AuthenticationRedirectException
+from common.services.session_cache import SessionCache
+
+
+@pytest.mark.asyncio
+async def test_cached_session_skips_db_until_invalidated():
+    """캐시된 세션은 DB 조회 없이 반환되고, 무효화 후에는 다시 DB를 조회하는지 확인"""
+    _StandInUserService.sessions = _make_sessions(1)
+    session_id = next(iter(_StandInUserService.sessions))
+    _StandInUserService.queries = 0
+    session_cache = SessionCache(redis=None, local_ttl=60)
+
+    with stand_in_auth(session_cache):
+        first = await deps.get_current_session(session_id=session_id)
+        second = await deps.get_current_session(session_id=session_id)
+        assert _StandInUserService.queries == 1
+        assert second is not first
+        assert str(second.id) == session_id
+        assert second.user.email == first.user.email
+        assert second.is_authenticated
+
+        await session_cache.invalidate(session_id)
+        del _StandInUserService.sessions[session_id]
+        with pytest.raises(AuthenticationRedirectException):
+            await deps.get_current_session(session_id=session_id)
+        assert _StandInUserService.queries == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_session_is_not_served_from_cache():
+    """세션 만료 시각이 지난 캐시 항목은 미스로 처리되는지 확인"""
+    session = next(iter(_make_sessions(1).values()))
+    session_cache = SessionCache(redis=None, local_ttl=60)
+    await session_cache.set(str(session.id), session)
+    assert await session_cache.get(str(session.id)) is not None
+
+    # 캐시된 항목의 만료 시각을 과거로 변경
+    _, data = session_cache._local[str(session.id)]
+    data["expires_at"] = (datetime.now(timezone.utc) - timedelta(seconds=1)).timestamp()
+
+    assert await session_cache.get(str(session.id)) is None
+    assert str(session.id) not in session_cache._local
+
+
+@pytest.mark.asyncio
+async def test_session_older_than_expiry_is_not_cached():
+    """이미 만료된 세션은 캐시에 저장하지 않는지 확인"""
+    session = next(iter(_make_sessions(1).values()))
+    session.last_accessed_at = datetime.now(timezone.utc) - timedelta(days=settings.SESSION_EXPIRY_DAYS + 1)
+    session_cache = SessionCache(redis=None)
+    await session_cache.set(str(session.id), session)
+    assert await session_cache.get(str(session.id)) is None
+    assert await session_cache.get(str(uuid4())) is None
@@ -0,0 +1,78 @@
+"""텍스트 유사도 커널 테스트
+
+주요 테스트 항목:
+1. 비트 병렬 LCS가 DP 결과와 일치
+2. ROUGE-L/자카드 단건 계산
+3. 일괄(pairwise) 자카드 계산이 단건 계산과 일치
+4. 긴 텍스트는 토큰화 캐시에 남기지 않음
+"""
+
+import random
+
+import numpy as np
+
+from evaluation.metrics.text_similarity import (
+    extract_phrases,
+    jaccard_similarity,
+    lcs_length,
+    pairwise_jaccard,
+    rouge_l_f1,
+    token_set,
+    tokenize
+)
+
+
+def _lcs_dp(seq1, seq2) -> int:
+    dp = [[0] * (len(seq2) + 1) for _ in range(len(seq1) + 1)]
+    for i in range(1, len(seq1) + 1):
+        for j in range(1, len(seq2) + 1):
+            if seq1[i-1] == seq2[j-1]:
+                dp[i][j] = dp[i-1][j-1] + 1
+            else:
+                dp[i][j] = max(dp[i-1][j], dp[i][j-1])
+    return dp[-1][-1]
+
+
+def test_lcs_length_matches_dp():
+    """무작위 시퀀스에서 DP 기반 LCS 길이와 일치하는지 확인"""
+    rng = random.Random(7)
+    for _ in range(200):
+        seq1 = [rng.choice("abcde") for _ in range(rng.randint(0, 40))]
+        seq2 = [rng.choice("abcde") for _ in range(rng.randint(0, 40))]
+        assert lcs_length(seq1, seq2) == _lcs_dp(seq1, seq2)
+
+
+def test_rouge_l_and_jaccard():
+    """ROUGE-L F1과 자카드 유사도 계산 확인"""
+    assert rouge_l_f1("삼성전자 영업이익 증가", "삼성전자 영업이익 증가") == 1.0
+    # LCS 2, precision 2/3, recall 2/4
+    assert abs(rouge_l_f1("삼성전자 매출 증가", "삼성전자 1분기 매출 감소") - (2 * (2/3) * (1/2) / (2/3 + 1/2))) < 1e-9
+    assert rouge_l_f1("", "삼성전자") == 0.0
+    assert jaccard_similarity("A b c", "a b d") == 0.5
+    assert extract_phrases("a b c") == ("a b", "b c", "a b c")
+
+
+def test_pairwise_jaccard_matches_single():
+    """일괄 계산 결과가 쌍별 단건 계산과 일치하는지 확인"""
+    texts1 = ["삼성전자 실적 발표", "", "하이닉스 HBM 공급"]
+    texts2 = ["삼성전자 실적", "hbm 공급 확대 하이닉스", "무관한 문장"]
+
+    matrix = pairwise_jaccard(texts1, texts2)
+
+    expected = np.array([[jaccard_similarity(a, b) for b in texts2] for a in texts1])
+    assert matrix.shape == (3, 3)
+    assert np.allclose(matrix, expected)
+    assert pairwise_jaccard([], texts2).shape == (0, 3)
+
+
+def test_long_texts_are_not_cached():
+    """검색 문서를 이어 붙인 긴 텍스트는 캐시에 저장하지 않고, 짧은 텍스트만 캐싱하는지 확인"""
+    tokenize.cache_clear()
+    token_set.cache_clear()
+    long_text = " ".join(f"문서{i} 내용" for i in range(2000))
+
+    assert len(token_set(long_text)) == 2001
+    assert tokenize.cache_info().currsize == 0 and token_set.cache_info().currsize == 0
+
+    token_set("삼성전자 실적")
+    assert tokenize.cache_info().currsize == 1 and token_set.cache_info().currsize == 1
@@ -0,0 +1,54 @@
+"""텍스트 분할기 테스트
+
+주요 테스트 항목:
+1. 같은 설정의 splitter 재사용
+2. 섹션 경계 분할
+3. 병렬 분할 결과 순서 및 청크 크기 유지
+"""
+
+from common.services import textsplitter
+from common.services.textsplitter import TextSplitter
+
+
+def _make_document(num_sections: int) -> str:
+    sections = []
+    for i in range(num_sections):
+        sentences = " ".join(f"{i}장 {j}번째 문장은 반도체 업황과 메모리 가격 추이를 설명한다." for j in range(12))
+        sections.append(f"제{i}장\n{sentences}")
+    return "\n\n".join(sections)
+
+
+def test_splitter_is_cached_per_configuration():
+    """같은 (type, size, overlap, tokenizer) 설정이면 splitter 인스턴스를 재사용하는지 확인"""
+    first = TextSplitter("recursive", 500, 50)
+    second = TextSplitter("recursive", 500, 50)
+    other = TextSplitter("recursive", 400, 50)
+
+    assert first.splitter is second.splitter
+    assert first.splitter is not other.splitter
+
+
+def test_make_sections_splits_on_blank_lines():
+    """섹션이 빈 줄 경계에서 나뉘고 원문 내용을 모두 포함하는지 확인"""
+    text = _make_document(10)
+    sections = TextSplitter._make_sections(text, 4)
+
+    assert len(sections) > 1
+    assert "\n\n".join(sections) == text
+    assert all(section.startswith("제") for section in sections)
+
+
+def test_parallel_split_keeps_order_and_chunk_size(monkeypatch):
+    """병렬 분할 결과가 원래 순서를 유지하고 chunk_size를 넘지 않는지 확인"""
+    monkeypatch.setattr(textsplitter, "PARALLEL_SPLIT_MIN_CHARS", 1000)
+    text = _make_document(20)
+    splitter = TextSplitter("recursive", 500, 50)
+
+    chunks = splitter.split_text(text, parallel=True, max_workers=2)
+    sequential = splitter.split_text(text)
+
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    # 각 장의 제목이 순서대로 등장
+    positions = [next(i for i, chunk in enumerate(chunks) if f"제{n}장" in chunk) for n in range(20)]
+    assert positions == sorted(positions)
+    assert abs(len(chunks) - len(sequential)) <= 20
@@ -0,0 +1,83 @@
+"""임베딩 토큰 카운팅 테스트
+
+주요 테스트 항목:
+1. 미리 계산한 토큰 수로 배치 구성
+2. validate_and_split_texts에서 텍스트별 토큰 수를 한 번만 계산
+3. OpenAI 배치 토큰 카운팅의 인코딩 캐시 사용
+"""
+
+from typing import List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from common.services.embedding_dispatcher import build_batches_from_counts
+from common.services.embedding_models import EmbeddingProvider, TokenCounter
+
+
+class _CountingProvider(EmbeddingProvider):
+    """토큰 카운팅 호출 횟수를 기록하는 테스트용 제공자"""
+
+    def __init__(self, max_tokens: int):
+        super().__init__("counting-model", max_tokens)
+        self.counted: List[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        self.counted.append(text)
+        return len(text)
+
+    def create_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return [[0.0] for _ in texts]
+
+    async def create_embeddings_async(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return [[0.0] for _ in texts]
+
+    def get_embeddings_obj(self) -> Tuple[Embeddings, Embeddings]:
+        return None, None
+
+
+class _FakeEncoding:
+    """tiktoken 인코딩 대체 (문자 단위 토큰)"""
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def encode(self, text: str) -> List[int]:
+        return list(range(len(text)))
+
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        self.batch_calls += 1
+        return [self.encode(text) for text in texts]
+
+
+def test_build_batches_from_counts_keeps_counts():
+    """배치별 텍스트 토큰 수와 합계가 유지되는지 확인"""
+    texts = ["a", "bb", "ccc", "dddd"]
+    batches = build_batches_from_counts(texts, [1, 2, 3, 4], max_batch_tokens=5, max_batch_size=10)
+
+    assert [batch.texts for batch in batches] == [["a", "bb"], ["ccc"], ["dddd"]]
+    assert [batch.token_counts for batch in batches] == [[1, 2], [3], [4]]
+    assert [batch.tokens for batch in batches] == [3, 3, 4]
+
+
+def test_validate_and_split_texts_counts_each_text_once():
+    """토큰 제한을 넘어 분할할 때도 텍스트별 토큰 수를 한 번만 계산하는지 확인"""
+    provider = _CountingProvider(max_tokens=6)
+    texts = ["aaa", "bbb", "  ", "cccc"]
+
+    batches = provider.validate_and_split_texts(texts)
+
+    assert batches == [["aaa", "bbb"], ["cccc"]]
+    assert sorted(provider.counted) == sorted(texts)
+
+
+def test_count_tokens_openai_batch_uses_cached_encoding():
+    """캐시된 인코딩으로 한 번에 토큰 수를 계산하는지 확인"""
+    encoding = _FakeEncoding()
+    TokenCounter._openai_encodings["fake-embedding-model"] = encoding
+    try:
+        counts = TokenCounter.count_tokens_openai_batch(["ab", "", "cde"], "fake-embedding-model")
+        assert counts == [2, 0, 3]
+        assert encoding.batch_calls == 1
+        assert TokenCounter.count_tokens_openai("abcd", "fake-embedding-model") == 4
+    finally:
+        TokenCounter._openai_encodings.pop("fake-embedding-model", None)
@@ -0,0 +1,238 @@
+"""VectorStoreManager 비동기 검색 테스트
+
+주요 테스트 항목:
+1. 비동기 검색 결과의 Document 변환 (text 메타데이터 -> page_content)
+2. 비동기 MMR 검색의 후보 조회 및 선택
+3. 네임스페이스 페이지 순회 (list + fetch, 커서 이어서 조회, 메타데이터 필터)
+4. 관리자 탐색 API의 filter 파라미터와 list 미지원(PodSpec) 인덱스 오류
+5. 비동기 생성은 워커 스레드에서 실행되고 인덱스 존재 확인(list_indexes)은 한 번만 호출
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from common.api.v1 import admin
+
+from common.services import vector_store_manager as vector_store_module
+from common.services.vector_store_manager import VectorStoreManager, match_metadata_filter
+
+
+class _FakeIndex:
+    """Pinecone 인덱스 대체 구현"""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.calls = []
+
+    def query(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"matches": self.matches[:kwargs["top_k"]]}
+
+
+def _make_manager(matches) -> VectorStoreManager:
+    manager = VectorStoreManager.__new__(VectorStoreManager)
+    manager.namespace = "test"
+    manager.index = _FakeIndex(matches)
+    manager._initialized = True
+
+    async def _embed(query):
+        return [1.0, 0.0]
+
+    manager.create_embeddings_single_query_async = _embed
+    return manager
+
+
+_MATCHES = [
+    {"id": "a", "score": 0.9, "values": [1.0, 0.0], "metadata": {"text": "A", "document_id": "d1"}},
+    {"id": "b", "score": 0.8, "values": [0.99, 0.01], "metadata": {"text": "B", "document_id": "d1"}},
+    {"id": "c", "score": 0.5, "values": [0.7, 0.7], "metadata": {"text": "C", "document_id": "d2"}},
+    {"id": "x", "score": 0.4, "values": [0.0, 1.0], "metadata": {"document_id": "d3"}},
+]
+
+
+@pytest.mark.asyncio
+async def test_search_async_converts_matches():
+    """text 메타데이터가 본문으로 변환되고 text가 없는 매치는 제외되는지 확인"""
+    manager = _make_manager(_MATCHES)
+
+    results = await manager.search_async("쿼리", top_k=4, filters={"document_id": "d1"})
+
+    assert [(doc.page_content, score) for doc, score in results] == [("A", 0.9), ("B", 0.8), ("C", 0.5)]
+    assert results[0][0].metadata == {"document_id": "d1"}
+    assert manager.index.calls[0]["filter"] == {"document_id": "d1"}
+    assert manager.index.calls[0]["include_values"] is False
+    # 원본 매치 메타데이터는 변경하지 않음
+    assert _MATCHES[0]["metadata"]["text"] == "A"
+
+
+@pytest.mark.asyncio
+async def test_search_mmr_async_selects_diverse_documents():
+    """fetch_k개 후보를 벡터와 함께 조회하고 MMR로 다양한 문서를 선택하는지 확인"""
+    manager = _make_manager(_MATCHES[:3])
+
+    results = await manager.search_mmr_async("쿼리", top_k=2, fetch_k=3, lambda_mult=0.2)
+
+    assert [doc.page_content for doc, _ in results] == ["A", "C"]
+    assert all(score == 0.0 for _, score in results)
+    assert manager.index.calls[0]["include_values"] is True
+    assert manager.index.calls[0]["top_k"] == 3
+
+
+class _FakeListingIndex:
+    """Pinecone list_paginated/fetch 대체 구현 (페이지 토큰은 다음 시작 위치)"""
+
+    def __init__(self, metadata_by_id):
+        self.metadata_by_id = metadata_by_id
+        self.fetch_sizes = []
+
+    def list_paginated(self, namespace, limit, prefix=None, pagination_token=None):
+        ids = sorted(vector_id for vector_id in self.metadata_by_id if vector_id.startswith(prefix or ""))
+        start = int(pagination_token or 0)
+        page = ids[start:start + limit]
+        next_start = start + limit
+        pagination = {"next": str(next_start)} if next_start < len(ids) else None
+        return {"vectors": [{"id": vector_id} for vector_id in page], "pagination": pagination}
+
+    def fetch(self, ids, namespace):
+        self.fetch_sizes.append(len(ids))
+        return {"vectors": {vector_id: {"id": vector_id, "metadata": self.metadata_by_id[vector_id]} for vector_id in ids}}
+
+
+@pytest.mark.asyncio
+async def test_iter_vector_pages_async_resumes_from_cursor_and_filters():
+    """페이지 단위 조회, 다음 페이지 토큰으로 이어서 조회, 메타데이터 필터 적용 확인"""
+    manager = _make_manager([])
+    manager.index = _FakeListingIndex({
+        f"doc-{i:02d}": {"document_id": f"d{i % 3}", "chunk_index": i} for i in range(7)
+    })
+
+    pages = [page async for page in manager.iter_vector_pages_async(page_size=3, filters={"document_id": "d0"})]
+    assert [[record["id"] for record in records] for records, _, _ in pages] == [["doc-00"], ["doc-03"], ["doc-06"]]
+    assert [next_token for _, next_token, _ in pages] == ["3", "6", None]
+    assert sum(scanned for _, _, scanned in pages) == 7
+    assert manager.index.fetch_sizes == [3, 3, 1]
+
+    resumed = [page async for page in manager.iter_vector_pages_async(page_size=3, pagination_token="6")]
+    assert resumed[0][0] == [{"id": "doc-06", "metadata": {"document_id": "d0", "chunk_index": 6}}]
+
+
+def test_match_metadata_filter_operators():
+    """Pinecone 필터 연산자 판정 확인"""
+    metadata = {"document_id": "d1", "chunk_index": 3, "tags": ["실적", "반도체"]}
+    assert match_metadata_filter(metadata, None)
+    assert match_metadata_filter(metadata, {"document_id": "d1", "chunk_index": {"$gte": 3, "$lt": 5}})
+    assert match_metadata_filter(metadata, {"tags": "반도체"})
+    assert match_metadata_filter(metadata, {"$or": [{"document_id": "d2"}, {"tags": {"$in": ["실적"]}}]})
+    assert match_metadata_filter(metadata, {"missing": {"$exists": False}, "document_id": {"$nin": ["d2"]}})
+    assert not match_metadata_filter(metadata, {"missing": {"$eq": 1}})
+    assert not match_metadata_filter(metadata, {"$and": [{"document_id": "d1"}, {"chunk_index": {"$gt": 3}}]})
+    with pytest.raises(ValueError):
+        match_metadata_filter(metadata, {"document_id": {"$regex": "d"}})
+
+
+class _FakeProvider:
+    def get_embeddings_obj(self):
+        return object(), object()
+
+
+class _FakeInitEmbeddingService:
+    """VectorStoreManager 초기화용 EmbeddingService 대체 구현"""
+
+    def __init__(self, model_type):
+        self.provider = _FakeProvider()
+        self.current_model_config = SimpleNamespace(name="test-index", dimension=2)
+
+
+class _FakePineconeClient:
+    """list_indexes 호출 스레드를 기록하는 Pinecone 클라이언트 대체 구현"""
+    list_threads = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def list_indexes(self):
+        self.list_threads.append(threading.current_thread())
+        return SimpleNamespace(names=lambda: ["test-index"])
+
+    def Index(self, name):
+        return _FakeIndex([])
+
+
+@pytest.mark.asyncio
+async def test_create_async_builds_off_loop_and_checks_index_once(monkeypatch):
+    """비동기 생성이 이벤트 루프 밖에서 실행되고 인덱스 존재 확인은 프로세스당 한 번만 하는지 확인"""
+    monkeypatch.setattr(vector_store_module, "EmbeddingService", _FakeInitEmbeddingService)
+    monkeypatch.setattr(vector_store_module, "PineconeClient", _FakePineconeClient)
+    monkeypatch.setattr(vector_store_module, "PineconeLangchain", lambda **kwargs: None)
+    monkeypatch.setattr(VectorStoreManager, "_verified_indexes", set())
+    monkeypatch.setattr(_FakePineconeClient, "list_threads", [])
+
+    first = await VectorStoreManager.create_async(embedding_model_type="fake", namespace="a")
+    second = await VectorStoreManager.create_async(embedding_model_type="fake", namespace="b")
+
+    assert first.index is not None and second.namespace == "b"
+    assert len(_FakePineconeClient.list_threads) == 1
+    assert _FakePineconeClient.list_threads[0] is not threading.main_thread()
+
+
+class _FakeEmbeddingService:
+    def get_model_type(self):
+        return None
+
+
+class _FakeBrowseStore:
+    """관리자 탐색 API용 VectorStoreManager 대체 구현"""
+
+    list_error = None
+    filters = []
+
+    def __init__(self, **kwargs):
+        self.index = object()
+
+    def list_ids_page(self, prefix=None, limit=100, pagination_token=None):
+        if self.list_error:
+            raise self.list_error
+        return ["v1"], None
+
+    async def iter_vector_pages_async(self, prefix=None, page_size=100, pagination_token=None, filters=None):
+        _FakeBrowseStore.filters.append(filters)
+        yield [{"id": "v1", "metadata": {"document_id": "d1"}}], None, 1
+
+
+@pytest.fixture
+def admin_client(monkeypatch):
+    monkeypatch.setattr(admin, "EmbeddingService", _FakeEmbeddingService)
+    monkeypatch.setattr(admin, "VectorStoreManager", _FakeBrowseStore)
+    monkeypatch.setattr(_FakeBrowseStore, "list_error", None)
+    monkeypatch.setattr(_FakeBrowseStore, "filters", [])
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[admin.verify_admin] = lambda: None
+    return TestClient(app)
+
+
+def test_browse_accepts_filter_query_parameter(admin_client):
+    """filter 쿼리 파라미터(별칭)로 전달한 메타데이터 필터가 페이지 순회에 적용되는지 확인"""
+    response = admin_client.get("/admin/pinecone/doceasy/browse", params={"filter": json.dumps({"document_id": "d1"})})
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {"type": "vector", "id": "v1", "metadata": {"document_id": "d1"}}
+    assert lines[-1]["type"] == "end"
+    assert _FakeBrowseStore.filters == [{"document_id": "d1"}]
+
+
+def test_browse_returns_clear_error_for_pod_index(admin_client):
+    """list를 지원하지 않는 PodSpec 인덱스는 스트리밍 전에 400 오류를 반환하는지 확인"""
+    _FakeBrowseStore.list_error = RuntimeError("(400) Bad Request: list is not supported for pod-based indexes")
+
+    response = admin_client.get("/admin/pinecone/stockeasy/browse")
+
+    assert response.status_code == 400
+    assert "PodSpec" in response.json()["detail"]
+    assert _FakeBrowseStore.filters == []